@@ -0,0 +1,11 @@
+"""
+Handler benchmarks on moto.
+
+Seeds synthetic units (profiles, campaigns, shares, orders with line items)
+into the same tables the unit tests use, drives Lambda handler entry points
+at several scales, and reports wall time, AWS call counts, and peak memory
+as JSON. Run from the repository root:
+
+    uv run python -m benchmarks.run                      # compare against benchmarks/baseline.json
+    uv run python -m benchmarks.run --update-baseline    # record a new baseline
+"""
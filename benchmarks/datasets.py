@@ -0,0 +1,186 @@
+"""
+Synthetic unit datasets for handler benchmarks.
+
+A unit is N sellers (profiles), each owned by a different parent account and
+shared READ with the unit leader who runs the reports. Every seller has
+`seasons` campaigns (only the first one belongs to the benchmarked unit
+campaign) and `orders_per_campaign` orders with `line_items` products each.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List
+
+UNIT_TYPE = "Pack"
+UNIT_NUMBER = 158
+CITY = "Springfield"
+STATE = "IL"
+CAMPAIGN_NAME = "Fall"
+CAMPAIGN_YEAR = 2025
+CATALOG_ID = "CATALOG#bench"
+LEADER_ACCOUNT_ID = "bench-leader"
+CREATED_AT = "2025-09-01T00:00:00+00:00"
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a seeded unit."""
+
+    name: str
+    sellers: int
+    seasons: int
+    orders_per_campaign: int
+    line_items: int
+
+
+SCALES: Dict[str, Scale] = {
+    "small": Scale("small", sellers=5, seasons=1, orders_per_campaign=10, line_items=3),
+    "medium": Scale("medium", sellers=20, seasons=2, orders_per_campaign=20, line_items=5),
+    "large": Scale("large", sellers=50, seasons=2, orders_per_campaign=30, line_items=8),
+}
+
+
+@dataclass
+class UnitDataset:
+    """Identifiers of a seeded unit, used to build handler events."""
+
+    scale: Scale
+    profile_ids: List[str] = field(default_factory=list)
+    # Unit-campaign campaign ID per profile
+    campaign_ids: Dict[str, str] = field(default_factory=dict)
+    # Every campaign per profile (all seasons)
+    all_campaign_ids: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _products(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "productId": f"PRODUCT#{i}",
+            "productName": f"Popcorn {i}",
+            "description": f"Benchmark product {i}",
+            "price": Decimal("10.00") + i,
+            "sortOrder": i,
+        }
+        for i in range(count)
+    ]
+
+
+def _order(campaign_id: str, profile_id: str, index: int, products: List[Dict[str, Any]]) -> Dict[str, Any]:
+    line_items = [
+        {
+            "productId": product["productId"],
+            "productName": product["productName"],
+            "quantity": 1 + (index + n) % 3,
+            "pricePerUnit": product["price"],
+            "subtotal": product["price"] * (1 + (index + n) % 3),
+        }
+        for n, product in enumerate(products)
+    ]
+    return {
+        "campaignId": campaign_id,
+        "orderId": f"ORDER#{campaign_id.removeprefix('CAMPAIGN#')}-{index:04d}",
+        "profileId": profile_id,
+        "customerName": f"Customer {index}",
+        "customerPhone": f"555-{index:04d}",
+        "customerAddress": {"street": f"{index} Main St", "city": CITY, "state": STATE, "zipCode": "62701"},
+        "orderDate": CREATED_AT,
+        "createdAt": CREATED_AT,
+        "updatedAt": CREATED_AT,
+        "paymentMethod": "Cash",
+        "lineItems": line_items,
+        "totalAmount": sum((item["subtotal"] for item in line_items), Decimal("0")),
+    }
+
+
+def seed_unit(tables: Dict[str, Any], scale: Scale) -> UnitDataset:
+    """
+    Write a synthetic unit into tables created by tests.unit.table_schemas.create_all_tables.
+
+    Args:
+        tables: Mapping of table key (e.g. "profiles") to boto3 Table
+        scale: Size of the unit
+
+    Returns:
+        UnitDataset describing what was written
+    """
+    dataset = UnitDataset(scale=scale)
+    products = _products(scale.line_items)
+    tables["catalogs"].put_item(
+        Item={
+            "catalogId": CATALOG_ID,
+            "catalogName": "Benchmark Catalog",
+            "catalogType": "PUBLIC",
+            "isPublic": "true",
+            "ownerAccountId": f"ACCOUNT#{LEADER_ACCOUNT_ID}",
+            "products": products,
+            "createdAt": CREATED_AT,
+            "updatedAt": CREATED_AT,
+        }
+    )
+
+    with (
+        tables["profiles"].batch_writer() as profiles,
+        tables["campaigns"].batch_writer() as campaigns,
+        tables["shares"].batch_writer() as shares,
+        tables["orders"].batch_writer() as orders,
+    ):
+        for seller in range(scale.sellers):
+            owner_account_id = f"ACCOUNT#bench-parent-{seller:03d}"
+            profile_id = f"PROFILE#bench-seller-{seller:03d}"
+            dataset.profile_ids.append(profile_id)
+            profiles.put_item(
+                Item={
+                    "ownerAccountId": owner_account_id,
+                    "profileId": profile_id,
+                    "sellerName": f"Seller {seller}",
+                    "unitType": UNIT_TYPE,
+                    "unitNumber": UNIT_NUMBER,
+                    "createdAt": CREATED_AT,
+                    "updatedAt": CREATED_AT,
+                }
+            )
+            shares.put_item(
+                Item={
+                    "profileId": profile_id,
+                    "targetAccountId": f"ACCOUNT#{LEADER_ACCOUNT_ID}",
+                    "ownerAccountId": owner_account_id,
+                    "permissions": ["READ"],
+                    "createdAt": CREATED_AT,
+                }
+            )
+
+            for season in range(scale.seasons):
+                campaign_id = f"CAMPAIGN#bench-{seller:03d}-{season}"
+                year = CAMPAIGN_YEAR - season
+                dataset.all_campaign_ids.setdefault(profile_id, []).append(campaign_id)
+                if season == 0:
+                    dataset.campaign_ids[profile_id] = campaign_id
+                campaigns.put_item(
+                    Item={
+                        "profileId": profile_id,
+                        "campaignId": campaign_id,
+                        "campaignName": CAMPAIGN_NAME,
+                        "campaignYear": year,
+                        "catalogId": CATALOG_ID,
+                        "unitType": UNIT_TYPE,
+                        "unitNumber": UNIT_NUMBER,
+                        "city": CITY,
+                        "state": STATE,
+                        "unitCampaignKey": f"{UNIT_TYPE}#{UNIT_NUMBER}#{CITY}#{STATE}#{CAMPAIGN_NAME}#{year}",
+                        "createdAt": CREATED_AT,
+                        "updatedAt": CREATED_AT,
+                    }
+                )
+                for index in range(scale.orders_per_campaign):
+                    orders.put_item(Item=_order(campaign_id, profile_id, index, products))
+
+    return dataset
+
+
+def restore_orders(tables: Dict[str, Any], dataset: UnitDataset, profile_id: str) -> None:
+    """Re-write every order of one seller (after a benchmark deleted them)."""
+    products = _products(dataset.scale.line_items)
+    with tables["orders"].batch_writer() as orders:
+        for campaign_id in dataset.all_campaign_ids[profile_id]:
+            for index in range(dataset.scale.orders_per_campaign):
+                orders.put_item(Item=_order(campaign_id, profile_id, index, products))
@@ -0,0 +1,340 @@
+"""
+Run handler benchmarks and compare them against a stored baseline.
+
+Usage (from the repository root):
+    uv run python -m benchmarks.run [--scales small,medium] [--scenarios get_unit_report]
+        [--repeats 3] [--output benchmarks/report.json] [--baseline benchmarks/baseline.json]
+        [--update-baseline]
+
+For every scale a fresh moto account is created with
+tests.unit.table_schemas.create_all_tables and seeded once. Each scenario
+then runs:
+    - once under tracemalloc, recording peak memory and the AWS calls counted
+      by utils.metrics (this run also absorbs one-time costs such as lazy imports)
+    - `repeats` more times without tracing; the fastest wall time is reported
+
+Call counts are deterministic, so any increase over the baseline is a
+regression. Wall time and memory are compared with a tolerance because they
+depend on the machine. Exits 1 when a regression is found.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import boto3
+from moto import mock_aws
+
+from benchmarks.datasets import (
+    CAMPAIGN_NAME,
+    CAMPAIGN_YEAR,
+    CATALOG_ID,
+    CITY,
+    LEADER_ACCOUNT_ID,
+    SCALES,
+    STATE,
+    UNIT_NUMBER,
+    UNIT_TYPE,
+    Scale,
+    UnitDataset,
+    restore_orders,
+    seed_unit,
+)
+from tests.unit.table_schemas import create_all_tables
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARKS_DIR, "report.json")
+
+DEFAULT_REPEATS = 3
+# Relative slack before wall time / peak memory count as regressions
+DEFAULT_WALL_TOLERANCE = 1.0
+DEFAULT_MEMORY_TOLERANCE = 0.25
+# Differences below this are noise regardless of the relative change
+MIN_WALL_DELTA_MS = 25.0
+
+BENCHMARK_ENV = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SECURITY_TOKEN": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "ACCOUNTS_TABLE_NAME": "kernelworx-accounts-ue1-dev",
+    "CATALOGS_TABLE_NAME": "kernelworx-catalogs-ue1-dev",
+    "CATALOG_VERSIONS_TABLE_NAME": "kernelworx-catalog-versions-ue1-dev",
+    "PROFILES_TABLE_NAME": "kernelworx-profiles-v2-ue1-dev",
+    "CAMPAIGNS_TABLE_NAME": "kernelworx-campaigns-v2-ue1-dev",
+    "ORDERS_TABLE_NAME": "kernelworx-orders-v2-ue1-dev",
+    "SHARES_TABLE_NAME": "kernelworx-shares-ue1-dev",
+    "INVITES_TABLE_NAME": "kernelworx-invites-ue1-dev",
+    "SHARED_CAMPAIGNS_TABLE_NAME": "kernelworx-shared-campaigns-ue1-dev",
+    "CUSTOMER_INDEX_TABLE_NAME": "kernelworx-customer-index-ue1-dev",
+    "EXPORTS_BUCKET": "kernelworx-exports-ue1-dev",
+    # Keep handler logs out of the benchmark output
+    "LOG_LEVEL": "ERROR",
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One handler invocation to benchmark."""
+
+    name: str
+    handler: Callable[[Dict[str, Any], Any], Any]
+    event: Callable[[UnitDataset], Dict[str, Any]]
+    # Undo the handler's writes so the next run sees the same data
+    restore: Optional[Callable[[Dict[str, Any], UnitDataset], None]] = None
+
+
+def _identity() -> Dict[str, Any]:
+    return {"sub": LEADER_ACCOUNT_ID}
+
+
+def _unit_arguments() -> Dict[str, Any]:
+    return {
+        "unitType": UNIT_TYPE,
+        "unitNumber": UNIT_NUMBER,
+        "city": CITY,
+        "state": STATE,
+        "campaignName": CAMPAIGN_NAME,
+        "campaignYear": CAMPAIGN_YEAR,
+    }
+
+
+def _report_event(report_format: str) -> Callable[[UnitDataset], Dict[str, Any]]:
+    def build(dataset: UnitDataset) -> Dict[str, Any]:
+        campaign_id = dataset.campaign_ids[dataset.profile_ids[0]]
+        return {"identity": _identity(), "arguments": {"input": {"campaignId": campaign_id, "format": report_format}}}
+
+    return build
+
+
+def _cascade_event(dataset: UnitDataset) -> Dict[str, Any]:
+    profile_id = dataset.profile_ids[0]
+    return {
+        "identity": _identity(),
+        "arguments": {"profileId": profile_id},
+        "stash": {"campaignsToDelete": [{"campaignId": c} for c in dataset.all_campaign_ids[profile_id]]},
+    }
+
+
+def _restore_cascade(tables: Dict[str, Any], dataset: UnitDataset) -> None:
+    restore_orders(tables, dataset, dataset.profile_ids[0])
+
+
+def scenarios() -> List[Scenario]:
+    """Return the benchmarked handler entry points (imported here so env vars are set first)."""
+    from src.handlers.campaign_reporting import get_unit_report
+    from src.handlers.dashboard import get_my_dashboard
+    from src.handlers.delete_profile_orders_cascade import lambda_handler as delete_profile_orders_cascade
+    from src.handlers.list_unit_catalogs import list_unit_campaign_catalogs, list_unit_catalogs
+    from src.handlers.profile_sharing import list_my_shares
+    from src.handlers.report_generation import request_campaign_report
+
+    return [
+        Scenario(
+            "get_unit_report",
+            get_unit_report,
+            lambda d: {"identity": _identity(), "arguments": {**_unit_arguments(), "catalogId": CATALOG_ID}},
+        ),
+        Scenario(
+            "list_unit_catalogs",
+            list_unit_catalogs,
+            lambda d: {"identity": _identity(), "arguments": _unit_arguments()},
+        ),
+        Scenario(
+            "list_unit_campaign_catalogs",
+            list_unit_campaign_catalogs,
+            lambda d: {"identity": _identity(), "arguments": _unit_arguments()},
+        ),
+        Scenario("list_my_shares", list_my_shares, lambda d: {"identity": _identity(), "arguments": {}}),
+        Scenario("get_my_dashboard", get_my_dashboard, lambda d: {"identity": _identity(), "arguments": {}}),
+        Scenario("request_campaign_report_xlsx", request_campaign_report, _report_event("xlsx")),
+        Scenario("request_campaign_report_csv", request_campaign_report, _report_event("csv")),
+        Scenario(
+            "delete_profile_orders_cascade", delete_profile_orders_cascade, _cascade_event, restore=_restore_cascade
+        ),
+    ]
+
+
+def _invoke(scenario: Scenario, dataset: UnitDataset, tables: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a scenario once and return its metrics summary and per-operation call counts."""
+    from src.utils.metrics import capture_metrics
+
+    with capture_metrics() as records:
+        scenario.handler(scenario.event(dataset), None)
+    if scenario.restore is not None:
+        scenario.restore(tables, dataset)
+    return {
+        "summary": records[0],
+        "operations": {f"{r['Service']}:{r['Operation']}": r["Calls"] for r in records[1:]},
+    }
+
+
+def run_scenario(scenario: Scenario, dataset: UnitDataset, tables: Dict[str, Any], repeats: int) -> Dict[str, Any]:
+    """Benchmark one scenario against an already seeded dataset."""
+    tracemalloc.start()
+    try:
+        traced = _invoke(scenario, dataset, tables)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    wall_times: List[float] = []
+    for _ in range(max(repeats, 1)):
+        started = time.perf_counter()
+        _invoke(scenario, dataset, tables)
+        wall_times.append((time.perf_counter() - started) * 1000)
+
+    summary = traced["summary"]
+    return {
+        "scenario": scenario.name,
+        "scale": dataset.scale.name,
+        "wallMs": round(min(wall_times), 3),
+        "dynamodbCalls": summary["DynamoDBCalls"],
+        "dynamodbItemsRead": summary["DynamoDBItemsRead"],
+        "s3Calls": summary["S3Calls"],
+        "peakKiB": round(peak_bytes / 1024, 1),
+        "operations": traced["operations"],
+    }
+
+
+def run_scale(scale: Scale, selected: List[Scenario], repeats: int) -> List[Dict[str, Any]]:
+    """Seed one scale in a fresh moto account and run the selected scenarios."""
+    from src.utils.aws_clients import reset_clients
+
+    with mock_aws():
+        reset_clients()
+        tables = create_all_tables(boto3.resource("dynamodb", region_name=BENCHMARK_ENV["AWS_DEFAULT_REGION"]))
+        boto3.client("s3", region_name=BENCHMARK_ENV["AWS_DEFAULT_REGION"]).create_bucket(
+            Bucket=BENCHMARK_ENV["EXPORTS_BUCKET"]
+        )
+        dataset = seed_unit(tables, scale)
+        try:
+            return [run_scenario(scenario, dataset, tables, repeats) for scenario in selected]
+        finally:
+            reset_clients()
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    wall_tolerance: float = DEFAULT_WALL_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compare results with a baseline run.
+
+    Returns:
+        {"regressions": [...], "improvements": [...]} with one entry per changed metric
+    """
+    previous = {(entry["scenario"], entry["scale"]): entry for entry in baseline}
+    regressions: List[Dict[str, Any]] = []
+    improvements: List[Dict[str, Any]] = []
+
+    for result in results:
+        base = previous.get((result["scenario"], result["scale"]))
+        if base is None:
+            continue
+
+        wall_delta = result["wallMs"] - base["wallMs"]
+        checks = [
+            (metric, result[metric] > base[metric], result[metric] < base[metric])
+            for metric in ("dynamodbCalls", "s3Calls")
+        ]
+        checks.append(
+            (
+                "wallMs",
+                wall_delta > MIN_WALL_DELTA_MS and result["wallMs"] > base["wallMs"] * (1 + wall_tolerance),
+                -wall_delta > MIN_WALL_DELTA_MS and result["wallMs"] < base["wallMs"] / (1 + wall_tolerance),
+            )
+        )
+        checks.append(
+            (
+                "peakKiB",
+                result["peakKiB"] > base["peakKiB"] * (1 + memory_tolerance),
+                result["peakKiB"] < base["peakKiB"] / (1 + memory_tolerance),
+            )
+        )
+
+        for metric, worse, better in checks:
+            change = {
+                "scenario": result["scenario"],
+                "scale": result["scale"],
+                "metric": metric,
+                "baseline": base[metric],
+                "current": result[metric],
+            }
+            if worse:
+                regressions.append(change)
+            elif better:
+                improvements.append(change)
+
+    return {"regressions": regressions, "improvements": improvements}
+
+
+def _print_summary(results: List[Dict[str, Any]], comparison: Dict[str, List[Dict[str, Any]]]) -> None:
+    print(f"{'scenario':<32} {'scale':<8} {'wall ms':>10} {'ddb calls':>10} {'s3 calls':>9} {'peak KiB':>10}")
+    for r in results:
+        print(
+            f"{r['scenario']:<32} {r['scale']:<8} {r['wallMs']:>10.1f} {r['dynamodbCalls']:>10} "
+            f"{r['s3Calls']:>9} {r['peakKiB']:>10.1f}"
+        )
+    for label, changes in (("Improved", comparison["improvements"]), ("REGRESSED", comparison["regressions"])):
+        for c in changes:
+            print(f"{label}: {c['scenario']} [{c['scale']}] {c['metric']} {c['baseline']} -> {c['current']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default=",".join(SCALES), help="comma-separated scales to run")
+    parser.add_argument("--scenarios", default="", help="comma-separated scenario names (default: all)")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="timed runs per scenario")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON report")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON report to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--wall-tolerance", type=float, default=DEFAULT_WALL_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    for name, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(name, value)
+
+    wanted = {name for name in args.scenarios.split(",") if name}
+    selected = [s for s in scenarios() if not wanted or s.name in wanted]
+    results: List[Dict[str, Any]] = []
+    for scale_name in args.scales.split(","):
+        results.extend(run_scale(SCALES[scale_name], selected, args.repeats))
+
+    baseline: List[Dict[str, Any]] = []
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    comparison = compare(results, baseline, args.wall_tolerance, args.memory_tolerance)
+
+    report = {
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+        "comparison": comparison,
+    }
+    output = args.baseline if args.update_baseline else args.output
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report if not args.update_baseline else {**report, "comparison": None}, f, indent=2)
+        f.write("\n")
+
+    _print_summary(results, comparison)
+    print(f"Report written to {output}")
+    return 1 if comparison["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
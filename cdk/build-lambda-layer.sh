@@ -9,30 +9,56 @@ echo "🔨 Building Lambda Layer..."
 # Navigate to CDK directory
 cd "$(dirname "$0")"
 
-# Create layer directory structure
+# Layers:
+#   lambda-layer/          shared dependencies, attached to every function
+#   lambda-layer-reports/  openpyxl (report Lambda only)
+#   lambda-layer-images/   Pillow (payment-method QR code Lambdas only)
+# cdk/lambda_bundling.py decides which optional layers a function needs from its imports.
 LAYER_DIR="lambda-layer/python"
-rm -rf lambda-layer
-mkdir -p "$LAYER_DIR"
+REPORTS_LAYER_DIR="lambda-layer-reports/python"
+IMAGES_LAYER_DIR="lambda-layer-images/python"
+rm -rf lambda-layer lambda-layer-reports lambda-layer-images
+mkdir -p "$LAYER_DIR" "$REPORTS_LAYER_DIR" "$IMAGES_LAYER_DIR"
 
-# Install dependencies into the layer
+# Install dependencies into the layers
 # Lambda expects Python packages in python/ subdirectory
 echo "📦 Installing Python dependencies..."
 pip install \
     boto3 \
+    -t "$LAYER_DIR" \
+    --upgrade \
+    --quiet
+
+pip install \
     openpyxl \
     defusedxml \
-    -t "$LAYER_DIR" \
+    -t "$REPORTS_LAYER_DIR" \
+    --upgrade \
+    --quiet
+
+# Pillow ships compiled extensions, so always fetch the Lambda (manylinux) wheel
+# regardless of the build host platform
+pip install \
+    pillow \
+    -t "$IMAGES_LAYER_DIR" \
+    --platform manylinux2014_x86_64 \
+    --implementation cp \
+    --python-version 3.13 \
+    --only-binary=:all: \
     --upgrade \
     --quiet
 
 # Remove unnecessary files to reduce size
 echo "🧹 Cleaning up unnecessary files..."
-find "$LAYER_DIR" -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
-find "$LAYER_DIR" -type d -name "*.dist-info" -exec rm -rf {} + 2>/dev/null || true
-find "$LAYER_DIR" -type d -name "tests" -exec rm -rf {} + 2>/dev/null || true
-find "$LAYER_DIR" -type f -name "*.pyc" -delete 2>/dev/null || true
-find "$LAYER_DIR" -type f -name "*.pyo" -delete 2>/dev/null || true
-
-LAYER_SIZE=$(du -sh lambda-layer | cut -f1)
-echo "✅ Lambda layer built successfully (Size: $LAYER_SIZE)"
-echo "   Location: lambda-layer/"
+for DIR in "$LAYER_DIR" "$REPORTS_LAYER_DIR" "$IMAGES_LAYER_DIR"; do
+    find "$DIR" -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
+    find "$DIR" -type d -name "*.dist-info" -exec rm -rf {} + 2>/dev/null || true
+    find "$DIR" -type d -name "tests" -exec rm -rf {} + 2>/dev/null || true
+    find "$DIR" -type f -name "*.pyc" -delete 2>/dev/null || true
+    find "$DIR" -type f -name "*.pyo" -delete 2>/dev/null || true
+done
+
+for LAYER in lambda-layer lambda-layer-reports lambda-layer-images; do
+    LAYER_SIZE=$(du -sh "$LAYER" | cut -f1)
+    echo "✅ $LAYER built successfully (Size: $LAYER_SIZE)"
+done
@@ -4,7 +4,7 @@ AppSync GraphQL API module for kernelworx.
 This module orchestrates the creation of the complete AppSync GraphQL API infrastructure.
 The implementation is split across multiple modules for better organization:
 
-- api.py: API and custom domain creation
+- api.py: API, API cache and custom domain creation
 - datasources.py: Data source creation (DynamoDB, Lambda, NONE)
 - functions/: AppSync function definitions organized by domain
   - sharing.py: Profile sharing and authorization functions
@@ -26,7 +26,7 @@ from typing import TYPE_CHECKING, Any
 from aws_cdk import aws_appsync as appsync
 from constructs import Construct
 
-from .api import create_appsync_api, create_appsync_custom_domain
+from .api import create_appsync_api, create_appsync_api_cache, create_appsync_custom_domain
 from .datasources import (
     create_dynamodb_datasources,
     create_lambda_datasources,
@@ -51,6 +51,7 @@ class AppSyncResources:
     none_datasource: appsync.NoneDataSource
     functions: dict[str, appsync.AppsyncFunction]
     profile_delete_functions: dict[str, appsync.AppsyncFunction]
+    api_cache: appsync.CfnApiCache | None
     domain_name: appsync.CfnDomainName | None
     domain_association: Any | None
     dns_record: Any | None
@@ -97,6 +98,9 @@ def setup_appsync(
         hosted_zone=hosted_zone,
     )
 
+    # Create the API cache used by resolvers with a caching config
+    api_cache = create_appsync_api_cache(scope, api, env_name)
+
     # Create DynamoDB data sources
     dynamodb_datasources = create_dynamodb_datasources(scope, api, tables)
 
@@ -124,6 +128,7 @@ def setup_appsync(
         lambda_datasources=lambda_datasources,
         functions=functions,
         profile_delete_functions=profile_delete_functions,
+        api_cache=api_cache,
     )
 
     # Create custom domain (if certificate available)
@@ -142,6 +147,7 @@ def setup_appsync(
         none_datasource=none_datasource,
         functions=functions,
         profile_delete_functions=profile_delete_functions,
+        api_cache=api_cache,
         domain_name=domain_name,
         domain_association=domain_association,
         dns_record=dns_record,
@@ -85,6 +85,41 @@ def create_appsync_api(
     return api
 
 
+def create_appsync_api_cache(scope: Construct, api: appsync.GraphqlApi, env_name: str) -> appsync.CfnApiCache | None:
+    """
+    Create the AppSync API cache used by per-resolver caching.
+
+    Only resolvers given a caching config (see ResolverBuilder) are cached;
+    everything else still goes to its data source on every request. The cache
+    is billed by the hour, so it is only on by default in prod; set
+    ENABLE_APPSYNC_CACHE=true or false to override. Without a cache the
+    resolvers' caching configs are dropped.
+
+    Args:
+        scope: CDK construct scope
+        api: The AppSync GraphQL API
+        env_name: Environment name (dev, prod, etc.)
+
+    Returns:
+        The API cache, or None if caching is disabled
+    """
+    default = "true" if env_name == "prod" else "false"
+    if os.getenv("ENABLE_APPSYNC_CACHE", default).lower() != "true":
+        return None
+
+    return appsync.CfnApiCache(
+        scope,
+        "ApiCache",
+        api_id=api.api_id,
+        api_caching_behavior="PER_RESOLVER_CACHING",
+        type="SMALL",
+        # Upper bound only; each cached resolver sets its own TTL
+        ttl=300,
+        transit_encryption_enabled=True,
+        at_rest_encryption_enabled=True,
+    )
+
+
 def create_appsync_custom_domain(
     scope: Construct,
     api: appsync.GraphqlApi,
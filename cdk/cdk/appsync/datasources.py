@@ -33,12 +33,14 @@ def create_dynamodb_datasources(
     table_configs = [
         ("accounts", "AccountsDataSource"),
         ("catalogs", "CatalogsDataSource"),
+        ("catalog_versions", "CatalogVersionsDataSource"),
         ("profiles", "ProfilesDataSource"),
         ("campaigns", "CampaignsDataSource"),
         ("orders", "OrdersDataSource"),
         ("shares", "SharesDataSource"),
         ("invites", "InvitesDataSource"),
         ("shared_campaigns", "SharedCampaignsDataSource"),
+        ("order_tombstones", "OrderTombstonesDataSource"),
     ]
 
     for table_key, ds_name in table_configs:
@@ -53,6 +55,13 @@ def create_dynamodb_datasources(
             )
             datasources[table_key] = ds
 
+    # Shared campaign create/delete transactions also update the creator's
+    # sharedCampaignCount on the accounts table (the rate-limit counter)
+    if "shared_campaigns" in datasources and "accounts" in tables:
+        tables["accounts"].grant_read_write_data(datasources["shared_campaigns"])
+        api.add_environment_variable("ACCOUNTS_TABLE_NAME", tables["accounts"].table_name)
+        api.add_environment_variable("SHARED_CAMPAIGNS_TABLE_NAME", tables["shared_campaigns"].table_name)
+
     return datasources
 
 
@@ -79,12 +88,17 @@ def create_lambda_datasources(
 
     lambda_ds_configs = [
         ("list_my_shares", "ListMySharesDS"),
+        ("get_my_dashboard", "GetMyDashboardDS"),
+        ("search_customers", "SearchCustomersDS"),
         ("create_profile", "CreateProfileDS"),
         ("request_campaign_report", "RequestCampaignReportDS"),
         ("unit_reporting", "UnitReportingDS"),
         ("list_unit_catalogs", "ListUnitCatalogsDS"),
         ("list_unit_campaign_catalogs", "ListUnitCampaignCatalogsDS"),
         ("campaign_operations", "CampaignOperationsDS"),
+        ("order_operations", "OrderOperationsDS"),
+        ("request_order_import", "RequestOrderImportDS"),
+        ("get_order_import_report", "GetOrderImportReportDS"),
         ("delete_profile_orders_cascade", "DeleteProfileOrdersCascadeDS"),
         ("update_my_account", "UpdateMyAccountDS"),
         ("transfer_ownership", "TransferOwnershipDS"),
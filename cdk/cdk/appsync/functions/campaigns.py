@@ -137,17 +137,6 @@ def create_campaign_functions(
 
     # === SHARED CAMPAIGN FUNCTIONS ===
 
-    # CountUserSharedCampaignsFn
-    functions["count_user_shared_campaigns"] = appsync.AppsyncFunction(
-        scope,
-        "CountUserSharedCampaignsFn",
-        name=f"CountUserSharedCampaignsFn_{env_name}",
-        api=api,
-        data_source=datasources["shared_campaigns"],
-        runtime=appsync.FunctionRuntime.JS_1_0_0,
-        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "count_user_shared_campaigns_fn.js")),
-    )
-
     # GetCatalogForSharedCampaignFn
     functions["get_catalog_for_shared_campaign"] = appsync.AppsyncFunction(
         scope,
@@ -35,6 +35,28 @@ def create_catalog_functions(
 
     # === CATALOG FUNCTIONS ===
 
+    # PutCatalogVersionFn - writes the version for createCatalog and updateCatalog
+    functions["put_catalog_version"] = appsync.AppsyncFunction(
+        scope,
+        "PutCatalogVersionFn",
+        name=f"PutCatalogVersionFn_{env_name}",
+        api=api,
+        data_source=datasources["catalog_versions"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "put_catalog_version_fn.js")),
+    )
+
+    # CheckCatalogOwnerFn - first step of updateCatalog, before any version is written
+    functions["check_catalog_owner"] = appsync.AppsyncFunction(
+        scope,
+        "CheckCatalogOwnerFn",
+        name=f"CheckCatalogOwnerFn_{env_name}",
+        api=api,
+        data_source=datasources["catalogs"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "check_catalog_owner_fn.js")),
+    )
+
     # CreateCatalogFn
     functions["create_catalog"] = appsync.AppsyncFunction(
         scope,
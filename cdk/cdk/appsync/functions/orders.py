@@ -103,6 +103,17 @@ def create_order_functions(
         code=appsync.Code.from_asset(str(RESOLVERS_DIR / "delete_order_fn.js")),
     )
 
+    # RecordOrderTombstoneFn - lets ordersChangedSince report the deletion
+    functions["record_order_tombstone"] = appsync.AppsyncFunction(
+        scope,
+        "RecordOrderTombstoneFn",
+        name=f"RecordOrderTombstoneFn_{env_name}",
+        api=api,
+        data_source=datasources["order_tombstones"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "record_order_tombstone_fn.js")),
+    )
+
     # GetCampaignForOrderFn
     functions["get_campaign_for_order"] = appsync.AppsyncFunction(
         scope,
@@ -125,15 +136,15 @@ def create_order_functions(
         code=appsync.Code.from_asset(str(RESOLVERS_DIR / "ensure_catalog_for_order_fn.js")),
     )
 
-    # GetCatalogFn
-    functions["get_catalog"] = appsync.AppsyncFunction(
+    # GetCatalogVersionForOrderFn - the stashed catalog's current version (precomputed productsById)
+    functions["get_catalog_version_for_order"] = appsync.AppsyncFunction(
         scope,
-        "GetCatalogFn",
-        name=f"GetCatalogFn_{env_name}",
+        "GetCatalogVersionForOrderFn",
+        name=f"GetCatalogVersionForOrderFn_{env_name}",
         api=api,
-        data_source=datasources["catalogs"],
+        data_source=datasources["catalog_versions"],
         runtime=appsync.FunctionRuntime.JS_1_0_0,
-        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "get_catalog_fn.js")),
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "get_catalog_version_for_order_fn.js")),
     )
 
     # GetCatalogTryRawFn - try raw catalogId before prefixed lookup
@@ -270,4 +281,48 @@ def create_order_functions(
         code=appsync.Code.from_asset(str(RESOLVERS_DIR / "query_orders_by_profile_fn.js")),
     )
 
+    # QueryOrdersPageByCampaignFn
+    functions["query_orders_page_by_campaign"] = appsync.AppsyncFunction(
+        scope,
+        "QueryOrdersPageByCampaignFn",
+        name=f"QueryOrdersPageByCampaignFn_{env_name}",
+        api=api,
+        data_source=datasources["orders"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "query_orders_page_by_campaign_fn.js")),
+    )
+
+    # QueryOrdersPageByProfileFn
+    functions["query_orders_page_by_profile"] = appsync.AppsyncFunction(
+        scope,
+        "QueryOrdersPageByProfileFn",
+        name=f"QueryOrdersPageByProfileFn_{env_name}",
+        api=api,
+        data_source=datasources["orders"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "query_orders_page_by_profile_fn.js")),
+    )
+
+    # QueryOrdersChangedSinceFn
+    functions["query_orders_changed_since"] = appsync.AppsyncFunction(
+        scope,
+        "QueryOrdersChangedSinceFn",
+        name=f"QueryOrdersChangedSinceFn_{env_name}",
+        api=api,
+        data_source=datasources["orders"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "query_orders_changed_since_fn.js")),
+    )
+
+    # QueryOrderTombstonesFn
+    functions["query_order_tombstones"] = appsync.AppsyncFunction(
+        scope,
+        "QueryOrderTombstonesFn",
+        name=f"QueryOrderTombstonesFn_{env_name}",
+        api=api,
+        data_source=datasources["order_tombstones"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "query_order_tombstones_fn.js")),
+    )
+
     return functions
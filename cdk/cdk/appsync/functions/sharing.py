@@ -195,6 +195,17 @@ def create_sharing_functions(
         code=appsync.Code.from_asset(str(RESOLVERS_DIR / "create_share_fn.js")),
     )
 
+    # BumpShareVersionFn - invalidates cached permission decisions in Lambdas
+    functions["bump_share_version"] = appsync.AppsyncFunction(
+        scope,
+        "BumpShareVersionFn",
+        name=f"BumpShareVersionFn_{env_name}",
+        api=api,
+        data_source=datasources["profiles"],
+        runtime=appsync.FunctionRuntime.JS_1_0_0,
+        code=appsync.Code.from_asset(str(RESOLVERS_DIR / "bump_share_version_fn.js")),
+    )
+
     # === INVITE REDEMPTION FUNCTIONS ===
 
     # LookupInviteFn
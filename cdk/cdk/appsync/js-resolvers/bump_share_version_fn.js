@@ -0,0 +1,33 @@
+import { util, runtime } from '@aws-appsync/utils';
+
+// Increment the profile's shareVersion after a share is created, updated or revoked.
+// Lambda permission caches (utils/auth.py) drop decisions made under an older version.
+export function request(ctx) {
+    const profile = ctx.stash.profile;
+    const invite = ctx.stash.invite;
+    const ownerAccountId = (profile && profile.ownerAccountId) || (invite && invite.ownerAccountId);
+    const profileId = (profile && profile.profileId) || (invite && invite.profileId);
+
+    if (!ownerAccountId || !profileId) {
+        return runtime.earlyReturn(ctx.prev.result);
+    }
+
+    const dbProfileId = profileId.startsWith('PROFILE#') ? profileId : `PROFILE#${profileId}`;
+    return {
+        operation: 'UpdateItem',
+        key: util.dynamodb.toMapValues({ ownerAccountId: ownerAccountId, profileId: dbProfileId }),
+        update: {
+            expression: 'ADD shareVersion :one',
+            expressionValues: util.dynamodb.toMapValues({ ':one': 1 })
+        },
+        condition: { expression: 'attribute_exists(profileId)' }
+    };
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+    // Keep the share/revoke result as the pipeline result
+    return ctx.prev.result;
+}
@@ -0,0 +1,20 @@
+import { extensions } from '@aws-appsync/utils';
+
+/**
+ * Pipeline resolver for createCatalog and updateCatalog.
+ * Orchestrates: PutCatalogVersion -> CreateCatalog, or
+ *              CheckCatalogOwner -> PutCatalogVersion -> UpdateCatalog
+ *
+ * Evicts the cached Campaign.catalog and SharedCampaign.catalog reads of the
+ * catalog (see resolvers/fields.py).
+ */
+export function request(ctx) {
+    return {};
+}
+
+export function response(ctx) {
+    const catalogId = ctx.stash.catalogId;
+    extensions.evictFromApiCache('Campaign', 'catalog', { 'ctx.source.catalogId': catalogId });
+    extensions.evictFromApiCache('SharedCampaign', 'catalog', { 'ctx.source.catalogId': catalogId });
+    return ctx.prev.result;
+}
@@ -0,0 +1,26 @@
+import { util } from '@aws-appsync/utils';
+
+/**
+ * First step of updateCatalog: only the catalog's owner may go on to write a
+ * new catalog version. UpdateCatalogFn repeats the owner check in its condition.
+ */
+export function request(ctx) {
+    const rawCatalogId = ctx.args.catalogId;
+    const catalogId = rawCatalogId.startsWith('CATALOG#') ? rawCatalogId : `CATALOG#${rawCatalogId}`;
+    return {
+        operation: 'GetItem',
+        key: util.dynamodb.toMapValues({ catalogId: catalogId }),
+        consistentRead: true
+    };
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+    // Same error as UpdateCatalogFn's failed condition, so a missing catalog and someone else's look alike
+    if (!ctx.result || ctx.result.ownerAccountId !== `ACCOUNT#${ctx.identity.sub}`) {
+        util.error("Catalog not found or access denied", "Forbidden");
+    }
+    return {};
+}
@@ -1,41 +1,20 @@
 import { util } from '@aws-appsync/utils';
 
 /**
- * Creates a new catalog with products.
- * Validates products array is not empty and generates IDs for catalog and products.
+ * Creates a new catalog pointing at the version PutCatalogVersionFn just wrote.
+ * The catalog id, product ids and timestamp come from the stash.
  */
 export function request(ctx) {
     const input = ctx.args.input;
-    
-    // Validate products array is not empty
-    if (!input.products || input.products.length === 0) {
-        util.error("Products array cannot be empty", "ValidationException");
-    }
-    
-    const catalogId = `CATALOG#${util.autoId()}`;
-    const now = util.time.nowISO8601();
-    
-    // Add productId to each product
-    const productsWithIds = input.products.map(product => {
-        const productWithId = {
-            productId: `PRODUCT#${util.autoId()}`,
-            productName: product.productName,
-            price: product.price,
-            sortOrder: product.sortOrder
-        };
-        if (product.description) {
-            productWithId.description = product.description;
-        }
-        return productWithId;
-    });
-    
+    const now = ctx.stash.now;
+
     // Convert isPublic boolean to string for GSI
     const isPublicStr = input.isPublic ? "true" : "false";
     
     return {
         operation: 'PutItem',
         key: util.dynamodb.toMapValues({
-            catalogId: catalogId
+            catalogId: ctx.stash.catalogId
         }),
         attributeValues: util.dynamodb.toMapValues({
             catalogName: input.catalogName,
@@ -43,10 +22,12 @@ export function request(ctx) {
             ownerAccountId: `ACCOUNT#${ctx.identity.sub}`,
             isPublic: input.isPublic,
             isPublicStr: isPublicStr,
-            products: productsWithIds,
+            products: ctx.stash.products,
+            currentVersion: ctx.stash.catalogVersion,
             createdAt: now,
             updatedAt: now
-        })
+        }),
+        condition: { expression: 'attribute_not_exists(catalogId)' }
     };
 }
 
@@ -46,10 +46,15 @@ export function request(ctx) {
             util.error('Order must have at least one line item', 'BadRequest');
         }
         
-        // Build products lookup map and enrich line items as normal
-        const productsMap = {};
-        for (const product of catalog.products || []) {
-            productsMap[product.productId] = product;
+        // Price against the catalog's current version (its map is precomputed);
+        // catalogs written before versioning only have the products list
+        const catalogVersion = ctx.stash.catalogVersion;
+        let productsMap = catalogVersion && catalogVersion.productsById;
+        if (!productsMap) {
+            productsMap = {};
+            for (const product of catalog.products || []) {
+                productsMap[product.productId] = product;
+            }
         }
         
         // Enrich line items with product details
@@ -113,6 +118,10 @@ export function request(ctx) {
     if (input.notes) {
         orderItem.notes = input.notes;
     }
+    // The catalog version the line items were priced from
+    if (catalog && ctx.stash.catalogVersion) {
+        orderItem.catalogVersion = ctx.stash.catalogVersion.version;
+    }
     
     // V2 schema: composite key (campaignId, orderId) - use normalized campaignId
     // Validate key attributes and sanitize line items to avoid malformed attribute shapes
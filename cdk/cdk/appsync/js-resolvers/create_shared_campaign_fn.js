@@ -1,5 +1,8 @@
 import { util } from '@aws-appsync/utils';
 
+// Rate limit: 50 shared campaigns per user, counted on the creator's account item
+const MAX_SHARED_CAMPAIGNS_PER_ACCOUNT = 50;
+
 export function request(ctx) {
     const input = ctx.args.input;
     const account = ctx.stash.account;
@@ -52,25 +55,55 @@ export function request(ctx) {
         item.description = input.description;
     }
     
+    ctx.stash.sharedCampaign = item;
+
+    // The put and the counter increment commit together, so concurrent creates
+    // cannot both pass the limit check
     return {
-        operation: 'PutItem',
-        key: util.dynamodb.toMapValues({ sharedCampaignCode: sharedCampaignCode }),
-        attributeValues: util.dynamodb.toMapValues(item),
-        condition: {
-            expression: 'attribute_not_exists(sharedCampaignCode)'
-        }
+        operation: 'TransactWriteItems',
+        transactItems: [
+            {
+                table: ctx.env.SHARED_CAMPAIGNS_TABLE_NAME,
+                operation: 'PutItem',
+                key: util.dynamodb.toMapValues({ sharedCampaignCode: sharedCampaignCode }),
+                attributeValues: util.dynamodb.toMapValues(item),
+                condition: {
+                    expression: 'attribute_not_exists(sharedCampaignCode)'
+                }
+            },
+            {
+                table: ctx.env.ACCOUNTS_TABLE_NAME,
+                operation: 'UpdateItem',
+                key: util.dynamodb.toMapValues({ accountId: `ACCOUNT#${ctx.identity.sub}` }),
+                update: {
+                    expression: 'ADD sharedCampaignCount :one',
+                    expressionValues: util.dynamodb.toMapValues({ ':one': 1 })
+                },
+                condition: {
+                    expression: 'attribute_exists(accountId) AND (attribute_not_exists(sharedCampaignCount) OR sharedCampaignCount < :limit)',
+                    expressionValues: util.dynamodb.toMapValues({ ':limit': MAX_SHARED_CAMPAIGNS_PER_ACCOUNT })
+                }
+            }
+        ]
     };
 }
 
 export function response(ctx) {
     if (ctx.error) {
-        if (ctx.error.type === 'DynamoDB:ConditionalCheckFailedException') {
-            util.error('A Shared Campaign with this code already exists. Please try again.', 'ConflictException');
+        if (ctx.error.type === 'DynamoDB:TransactionCanceledException') {
+            const reasons = ctx.result.cancellationReasons || [];
+            if (reasons[0] && reasons[0].type === 'ConditionalCheckFailed') {
+                util.error('A Shared Campaign with this code already exists. Please try again.', 'ConflictException');
+            }
+            if (reasons[1] && reasons[1].type === 'ConditionalCheckFailed') {
+                util.error('Rate limit exceeded: Maximum 50 campaign shared campaigns per user', 'RateLimitExceeded');
+            }
         }
         util.error(ctx.error.message, ctx.error.type);
     }
+    // TransactWriteItems returns only keys; respond with the item that was written
+    const result = ctx.stash.sharedCampaign;
     // Normalize createdBy: strip ACCOUNT# prefix for GraphQL ID type
-    const result = ctx.result;
     if (result && result.createdBy && result.createdBy.startsWith('ACCOUNT#')) {
         result.createdBy = result.createdBy.substring(8);
     }
@@ -1,4 +1,4 @@
-import { util } from '@aws-appsync/utils';
+import { util, extensions } from '@aws-appsync/utils';
 
 /**
  * Pipeline resolver for deleteCatalog mutation.
@@ -12,6 +12,10 @@ export function response(ctx) {
     if (ctx.error) {
         util.error(ctx.error.message, ctx.error.type);
     }
+    // Evict the cached reads of the deleted catalog
+    const catalogId = ctx.args.catalogId.startsWith('CATALOG#') ? ctx.args.catalogId : `CATALOG#${ctx.args.catalogId}`;
+    extensions.evictFromApiCache('Campaign', 'catalog', { 'ctx.source.catalogId': catalogId });
+    extensions.evictFromApiCache('SharedCampaign', 'catalog', { 'ctx.source.catalogId': catalogId });
     // Return true on successful deletion
     return ctx.prev.result || true;
 }
@@ -1,14 +1,45 @@
 import { util } from '@aws-appsync/utils';
 
 export function request(ctx) {
+    const createdBy = `ACCOUNT#${ctx.identity.sub}`;
+    // Delete and counter decrement commit together; the condition stops a
+    // repeated delete from decrementing twice
     return {
-        operation: 'DeleteItem',
-        key: util.dynamodb.toMapValues({ sharedCampaignCode: ctx.args.sharedCampaignCode })
+        operation: 'TransactWriteItems',
+        transactItems: [
+            {
+                table: ctx.env.SHARED_CAMPAIGNS_TABLE_NAME,
+                operation: 'DeleteItem',
+                key: util.dynamodb.toMapValues({ sharedCampaignCode: ctx.args.sharedCampaignCode }),
+                condition: {
+                    expression: 'createdBy = :createdBy',
+                    expressionValues: util.dynamodb.toMapValues({ ':createdBy': createdBy })
+                }
+            },
+            {
+                table: ctx.env.ACCOUNTS_TABLE_NAME,
+                operation: 'UpdateItem',
+                key: util.dynamodb.toMapValues({ accountId: createdBy }),
+                update: {
+                    expression: 'ADD sharedCampaignCount :minusOne',
+                    expressionValues: util.dynamodb.toMapValues({ ':minusOne': -1 })
+                },
+                condition: {
+                    expression: 'attribute_exists(accountId)'
+                }
+            }
+        ]
     };
 }
 
 export function response(ctx) {
     if (ctx.error) {
+        if (ctx.error.type === 'DynamoDB:TransactionCanceledException') {
+            const reasons = ctx.result.cancellationReasons || [];
+            if (reasons[0] && reasons[0].type === 'ConditionalCheckFailed') {
+                util.error('Shared Campaign not found', 'NotFound');
+            }
+        }
         util.error(ctx.error.message, ctx.error.type);
     }
     return true;
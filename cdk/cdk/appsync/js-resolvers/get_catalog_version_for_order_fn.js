@@ -0,0 +1,45 @@
+import { util } from '@aws-appsync/utils';
+
+/**
+ * Loads the version of the stashed catalog that orders are priced against
+ * (the catalog's currentVersion) and stashes it for CreateOrderFn.
+ * Catalogs written before versioning have no currentVersion; CreateOrderFn
+ * then prices from the catalog's own products.
+ * Fails with NotFound when the campaign's catalog or its current version is
+ * missing, so an order is never stored unpriced.
+ */
+export function request(ctx) {
+    const catalog = ctx.stash.catalog;
+    // The catalog lookups pass the campaign through when neither id matched
+    if (!catalog || catalog.campaignId) {
+        util.error('Catalog not found for id: ' + ctx.stash.catalogId, 'NotFound');
+    }
+    if (!catalog.currentVersion) {
+        // Return harmless NOOP GetItem so we don't return null from a data-source-bound function
+        return {
+            operation: 'GetItem',
+            key: util.dynamodb.toMapValues({ catalogId: 'NOOP', version: 'NOOP' })
+        };
+    }
+
+    // Consistent, like the catalog read: the version may have been written a moment ago
+    return {
+        operation: 'GetItem',
+        key: util.dynamodb.toMapValues({ catalogId: catalog.catalogId, version: catalog.currentVersion }),
+        consistentRead: true
+    };
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+    const catalog = ctx.stash.catalog;
+    if (catalog.currentVersion && !ctx.result) {
+        util.error('Catalog version ' + catalog.currentVersion + ' not found for id: ' + catalog.catalogId, 'NotFound');
+    }
+    if (ctx.result) {
+        ctx.stash.catalogVersion = ctx.result;
+    }
+    return ctx.result;
+}
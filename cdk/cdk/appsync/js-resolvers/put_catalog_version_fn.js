@@ -0,0 +1,73 @@
+import { util } from '@aws-appsync/utils';
+
+/**
+ * Writes the immutable catalog version for createCatalog / updateCatalog (the
+ * latter only after CheckCatalogOwnerFn has confirmed the caller owns the catalog).
+ *
+ * Every catalog write stores a new version (catalogId + version) holding the
+ * products and a precomputed productId -> product map, then the next function
+ * points the catalog's currentVersion at it. Versions are never modified, so
+ * orders can record the version they were priced against and readers can
+ * cache a version forever. A version whose catalog write then fails is simply
+ * never referenced.
+ */
+export function request(ctx) {
+    const input = ctx.args.input;
+    const rawCatalogId = ctx.args.catalogId;
+
+    // Validate products array is not empty
+    if (!rawCatalogId && (!input.products || input.products.length === 0)) {
+        util.error("Products array cannot be empty", "ValidationException");
+    }
+
+    // updateCatalog passes the id; createCatalog generates one
+    const catalogId = !rawCatalogId
+        ? `CATALOG#${util.autoId()}`
+        : rawCatalogId.startsWith('CATALOG#') ? rawCatalogId : `CATALOG#${rawCatalogId}`;
+    const now = util.time.nowISO8601();
+
+    // Preserve existing productIds on update; otherwise generate new ones
+    const products = input.products.map(product => {
+        const productWithId = {
+            productId: (rawCatalogId && product.productId) || `PRODUCT#${util.autoId()}`,
+            productName: product.productName,
+            price: product.price,
+            sortOrder: product.sortOrder
+        };
+        if (product.description) {
+            productWithId.description = product.description;
+        }
+        return productWithId;
+    });
+    const productsById = {};
+    for (const product of products) {
+        productsById[product.productId] = product;
+    }
+
+    // ULIDs sort by creation time, so a catalog's versions list oldest first
+    const version = util.autoUlid();
+    ctx.stash.catalogId = catalogId;
+    ctx.stash.catalogVersion = version;
+    ctx.stash.products = products;
+    ctx.stash.now = now;
+
+    return {
+        operation: 'PutItem',
+        key: util.dynamodb.toMapValues({ catalogId: catalogId, version: version }),
+        attributeValues: util.dynamodb.toMapValues({
+            catalogName: input.catalogName,
+            ownerAccountId: `ACCOUNT#${ctx.identity.sub}`,
+            products: products,
+            productsById: productsById,
+            createdAt: now
+        }),
+        condition: { expression: 'attribute_not_exists(version)' }
+    };
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+    return ctx.result;
+}
@@ -0,0 +1,58 @@
+import { util, runtime } from '@aws-appsync/utils';
+
+// Orders written just before a sync may not be in campaignId-updatedAt-index yet,
+// so the next watermark trails the current time; clients upsert by orderId and
+// simply see those few orders again
+const WATERMARK_LAG_MS = 30 * 1000;
+
+export function request(ctx) {
+    const changes = ctx.prev.result;
+
+    // Early-returned result (unauthorized/full resync) or more order pages to come:
+    // deletions are reported with the last page only
+    if (!ctx.stash.cursorScope || changes.nextToken) {
+        return runtime.earlyReturn(changes);
+    }
+
+    return {
+        operation: 'Query',
+        query: {
+            expression: 'campaignId = :campaignId',
+            expressionValues: util.dynamodb.toMapValues({ ':campaignId': ctx.args.campaignId })
+        },
+        filter: {
+            expression: 'deletedAt > :since',
+            expressionValues: util.dynamodb.toMapValues({ ':since': ctx.stash.since })
+        }
+    };
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+
+    const changes = ctx.prev.result;
+    const watermarkMs = util.time.nowEpochMilliSeconds() - WATERMARK_LAG_MS;
+
+    // More tombstones than one Query page: rather than report a partial list and move
+    // the watermark past the rest, make the client refetch the campaign (as for a
+    // `since` older than the tombstone retention)
+    if (ctx.result.nextToken) {
+        return {
+            orders: [],
+            deletedOrderIds: [],
+            nextToken: null,
+            watermark: util.time.epochMilliSecondsToISO8601(watermarkMs),
+            fullResyncRequired: true
+        };
+    }
+
+    const tombstones = ctx.result.items || [];
+    const sinceMs = util.time.parseISO8601ToEpochMilliSeconds(ctx.stash.since);
+
+    changes.deletedOrderIds = tombstones.map(tombstone => tombstone.orderId);
+    // Never move the watermark backwards past what the client already asked for
+    changes.watermark = util.time.epochMilliSecondsToISO8601(Math.max(watermarkMs, sinceMs));
+    return changes;
+}
@@ -0,0 +1,89 @@
+import { util, runtime } from '@aws-appsync/utils';
+
+const DEFAULT_LIMIT = 50;
+const MAX_LIMIT = 100;
+// Must match TOMBSTONE_RETENTION_DAYS in record_order_tombstone_fn.js
+const TOMBSTONE_RETENTION_DAYS = 90;
+// Must match WATERMARK_LAG_MS in query_order_tombstones_fn.js
+const WATERMARK_LAG_MS = 30 * 1000;
+
+function pageLimit(limit) {
+    if (limit === undefined || limit === null) {
+        return DEFAULT_LIMIT;
+    }
+    if (limit < 1 || limit > MAX_LIMIT) {
+        util.error(`limit must be between 1 and ${MAX_LIMIT}`, 'ValidationException');
+    }
+    return limit;
+}
+
+// Same cursor format as the paginated order lists: AppSync's token bound to the query
+function decodeCursor(nextToken, scope) {
+    if (!nextToken) {
+        return null;
+    }
+    const decoded = util.base64Decode(nextToken);
+    const prefix = `v1|${scope}|`;
+    if (!decoded.startsWith(prefix) || decoded.length === prefix.length) {
+        util.error('Invalid nextToken for this query', 'ValidationException');
+    }
+    return decoded.substring(prefix.length);
+}
+
+function emptyChanges(watermark, fullResyncRequired) {
+    return { orders: [], deletedOrderIds: [], nextToken: null, watermark: watermark, fullResyncRequired: fullResyncRequired };
+}
+
+export function request(ctx) {
+    const args = ctx.args;
+    // Normalize the watermark so it compares correctly with stored ISO-8601 UTC timestamps
+    const sinceMs = util.time.parseISO8601ToEpochMilliSeconds(args.since);
+    const since = util.time.epochMilliSecondsToISO8601(sinceMs);
+    ctx.stash.since = since;
+
+    // If campaign not found or not authorized, report no changes
+    if (ctx.stash.campaignNotFound || !ctx.stash.authorized) {
+        return runtime.earlyReturn(emptyChanges(since, false));
+    }
+
+    // Deletions older than the tombstone retention are gone; the client must refetch everything
+    // (the returned watermark is taken before that refetch, so nothing in between is lost)
+    const nowMs = util.time.nowEpochMilliSeconds();
+    const retentionMs = TOMBSTONE_RETENTION_DAYS * 24 * 60 * 60 * 1000;
+    if (sinceMs < nowMs - retentionMs) {
+        return runtime.earlyReturn(emptyChanges(util.time.epochMilliSecondsToISO8601(nowMs - WATERMARK_LAG_MS), true));
+    }
+
+    const scope = `changes:${args.campaignId}:${since}`;
+    ctx.stash.cursorScope = scope;
+
+    const query = {
+        operation: 'Query',
+        index: 'campaignId-updatedAt-index',
+        query: {
+            expression: 'campaignId = :campaignId AND updatedAt > :since',
+            expressionValues: util.dynamodb.toMapValues({ ':campaignId': args.campaignId, ':since': since })
+        },
+        limit: pageLimit(args.limit)
+    };
+    const token = decodeCursor(args.nextToken, scope);
+    if (token) {
+        query.nextToken = token;
+    }
+    return query;
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+
+    const token = ctx.result.nextToken;
+    return {
+        orders: ctx.result.items || [],
+        deletedOrderIds: [],
+        nextToken: token ? util.base64Encode(`v1|${ctx.stash.cursorScope}|${token}`) : null,
+        watermark: ctx.stash.since,
+        fullResyncRequired: false
+    };
+}
@@ -0,0 +1,92 @@
+import { util, runtime } from '@aws-appsync/utils';
+
+const DEFAULT_LIMIT = 50;
+const MAX_LIMIT = 100;
+
+// Cursors wrap AppSync's opaque DynamoDB token with the query they belong to,
+// so a token reused with another campaign or createdAt range is rejected instead
+// of silently paging the wrong results. The prefix is not signed: it catches
+// client mistakes, while the wrapped token is encrypted by AppSync and access
+// is always checked against the query arguments, never the cursor.
+function cursorScope(args) {
+    return `campaign:${args.campaignId}:${args.createdAfter || ''}:${args.createdBefore || ''}`;
+}
+
+function decodeCursor(nextToken, scope) {
+    if (!nextToken) {
+        return null;
+    }
+    const decoded = util.base64Decode(nextToken);
+    const prefix = `v1|${scope}|`;
+    if (!decoded.startsWith(prefix) || decoded.length === prefix.length) {
+        util.error('Invalid nextToken for this query', 'ValidationException');
+    }
+    return decoded.substring(prefix.length);
+}
+
+function pageLimit(limit) {
+    if (limit === undefined || limit === null) {
+        return DEFAULT_LIMIT;
+    }
+    if (limit < 1 || limit > MAX_LIMIT) {
+        util.error(`limit must be between 1 and ${MAX_LIMIT}`, 'ValidationException');
+    }
+    return limit;
+}
+
+export function request(ctx) {
+    // If campaign not found or not authorized, return an empty page
+    if (ctx.stash.campaignNotFound || !ctx.stash.authorized) {
+        return runtime.earlyReturn({ items: [], nextToken: null });
+    }
+
+    const args = ctx.args;
+    const scope = cursorScope(args);
+    ctx.stash.cursorScope = scope;
+
+    const query = {
+        operation: 'Query',
+        query: {
+            expression: 'campaignId = :campaignId',
+            expressionValues: util.dynamodb.toMapValues({ ':campaignId': args.campaignId })
+        },
+        limit: pageLimit(args.limit)
+    };
+
+    const token = decodeCursor(args.nextToken, scope);
+    if (token) {
+        query.nextToken = token;
+    }
+
+    // The table's sort key is orderId, so the createdAt range is a filter
+    const conditions = [];
+    const values = {};
+    if (args.createdAfter) {
+        conditions.push('createdAt >= :createdAfter');
+        values[':createdAfter'] = args.createdAfter;
+    }
+    if (args.createdBefore) {
+        conditions.push('createdAt <= :createdBefore');
+        values[':createdBefore'] = args.createdBefore;
+    }
+    if (conditions.length > 0) {
+        query.filter = {
+            expression: conditions.join(' AND '),
+            expressionValues: util.dynamodb.toMapValues(values)
+        };
+    }
+
+    return query;
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+
+    const token = ctx.result.nextToken;
+    return {
+        items: ctx.result.items || [],
+        nextToken: token ? util.base64Encode(`v1|${ctx.stash.cursorScope}|${token}`) : null
+    };
+}
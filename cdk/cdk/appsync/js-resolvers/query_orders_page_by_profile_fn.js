@@ -0,0 +1,95 @@
+import { util, runtime } from '@aws-appsync/utils';
+
+const DEFAULT_LIMIT = 50;
+const MAX_LIMIT = 100;
+
+// Cursors wrap AppSync's opaque DynamoDB token with the query they belong to,
+// so a token reused with another profile or createdAt range is rejected instead
+// of silently paging the wrong results. The prefix is not signed: it catches
+// client mistakes, while the wrapped token is encrypted by AppSync and access
+// is always checked against the query arguments, never the cursor.
+function cursorScope(dbProfileId, args) {
+    return `profile:${dbProfileId}:${args.createdAfter || ''}:${args.createdBefore || ''}`;
+}
+
+function decodeCursor(nextToken, scope) {
+    if (!nextToken) {
+        return null;
+    }
+    const decoded = util.base64Decode(nextToken);
+    const prefix = `v1|${scope}|`;
+    if (!decoded.startsWith(prefix) || decoded.length === prefix.length) {
+        util.error('Invalid nextToken for this query', 'ValidationException');
+    }
+    return decoded.substring(prefix.length);
+}
+
+function pageLimit(limit) {
+    if (limit === undefined || limit === null) {
+        return DEFAULT_LIMIT;
+    }
+    if (limit < 1 || limit > MAX_LIMIT) {
+        util.error(`limit must be between 1 and ${MAX_LIMIT}`, 'ValidationException');
+    }
+    return limit;
+}
+
+export function request(ctx) {
+    // If not authorized, return an empty page
+    if (!ctx.stash.authorized) {
+        return runtime.earlyReturn({ items: [], nextToken: null });
+    }
+
+    const args = ctx.args;
+    const profileId = args.profileId;
+    // Normalize profileId to PROFILE# for query
+    const dbProfileId = profileId && profileId.startsWith('PROFILE#') ? profileId : `PROFILE#${profileId}`;
+    const scope = cursorScope(dbProfileId, args);
+    ctx.stash.cursorScope = scope;
+
+    // createdAt is the profileId-index sort key, so the range narrows the key condition
+    let expression = 'profileId = :profileId';
+    const values = { ':profileId': dbProfileId };
+    if (args.createdAfter && args.createdBefore) {
+        expression += ' AND createdAt BETWEEN :createdAfter AND :createdBefore';
+        values[':createdAfter'] = args.createdAfter;
+        values[':createdBefore'] = args.createdBefore;
+    } else if (args.createdAfter) {
+        expression += ' AND createdAt >= :createdAfter';
+        values[':createdAfter'] = args.createdAfter;
+    } else if (args.createdBefore) {
+        expression += ' AND createdAt <= :createdBefore';
+        values[':createdBefore'] = args.createdBefore;
+    }
+
+    const query = {
+        operation: 'Query',
+        index: 'profileId-index',
+        query: {
+            expression: expression,
+            expressionValues: util.dynamodb.toMapValues(values)
+        },
+        // Newest orders first
+        scanIndexForward: false,
+        limit: pageLimit(args.limit)
+    };
+
+    const token = decodeCursor(args.nextToken, scope);
+    if (token) {
+        query.nextToken = token;
+    }
+
+    return query;
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+
+    const token = ctx.result.nextToken;
+    return {
+        items: ctx.result.items || [],
+        nextToken: token ? util.base64Encode(`v1|${ctx.stash.cursorScope}|${token}`) : null
+    };
+}
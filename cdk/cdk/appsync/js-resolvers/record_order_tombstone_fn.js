@@ -0,0 +1,32 @@
+import { util, runtime } from '@aws-appsync/utils';
+
+// Keep tombstones long enough for any regularly syncing device; older watermarks
+// get fullResyncRequired from ordersChangedSince instead
+const TOMBSTONE_RETENTION_DAYS = 90;
+
+export function request(ctx) {
+    const order = ctx.stash.order;
+
+    // Nothing was deleted (idempotent delete of a missing order)
+    if (!order || ctx.stash.skipDelete) {
+        return runtime.earlyReturn(ctx.prev.result);
+    }
+
+    const nowSeconds = util.time.nowEpochSeconds();
+    return {
+        operation: 'PutItem',
+        key: util.dynamodb.toMapValues({ campaignId: order.campaignId, orderId: order.orderId }),
+        attributeValues: util.dynamodb.toMapValues({
+            profileId: order.profileId,
+            deletedAt: util.time.nowISO8601(),
+            expiresAt: nowSeconds + TOMBSTONE_RETENTION_DAYS * 24 * 60 * 60
+        })
+    };
+}
+
+export function response(ctx) {
+    if (ctx.error) {
+        util.error(ctx.error.message, ctx.error.type);
+    }
+    return ctx.prev.result;
+}
@@ -1,35 +1,12 @@
 import { util } from '@aws-appsync/utils';
 
 /**
- * Updates an existing catalog with new data.
- * Preserves existing productIds or generates new ones.
+ * Updates an existing catalog and points it at the version PutCatalogVersionFn
+ * just wrote (product ids and timestamp come from the stash).
  * Only allows the owner to update the catalog.
  */
 export function request(ctx) {
-    const catalogId = ctx.args.catalogId;
-    // Normalize catalogId to ensure CATALOG# prefix
-    const dbCatalogId = catalogId && catalogId.startsWith('CATALOG#') ? catalogId : `CATALOG#${catalogId}`;
     const input = ctx.args.input;
-    const now = util.time.nowISO8601();
-    
-    // Add productId to each product if not present
-    const productsWithIds = input.products.map(product => {
-        const productWithId = {
-            productName: product.productName,
-            price: product.price,
-            sortOrder: product.sortOrder
-        };
-        // Preserve existing productId or generate new one
-        if (product.productId) {
-            productWithId.productId = product.productId;
-        } else {
-            productWithId.productId = `PRODUCT#${util.autoId()}`;
-        }
-        if (product.description) {
-            productWithId.description = product.description;
-        }
-        return productWithId;
-    });
     
     // Convert isPublic boolean to string for GSI
     const isPublicStr = input.isPublic ? "true" : "false";
@@ -38,16 +15,17 @@ export function request(ctx) {
     return {
         operation: 'UpdateItem',
         key: util.dynamodb.toMapValues({
-            catalogId: dbCatalogId
+            catalogId: ctx.stash.catalogId
         }),
         update: {
-            expression: "SET catalogName = :catalogName, isPublic = :isPublic, isPublicStr = :isPublicStr, products = :products, updatedAt = :updatedAt",
+            expression: "SET catalogName = :catalogName, isPublic = :isPublic, isPublicStr = :isPublicStr, products = :products, currentVersion = :currentVersion, updatedAt = :updatedAt",
             expressionValues: util.dynamodb.toMapValues({
                 ":catalogName": input.catalogName,
                 ":isPublic": input.isPublic,
                 ":isPublicStr": isPublicStr,
-                ":products": productsWithIds,
-                ":updatedAt": now
+                ":products": ctx.stash.products,
+                ":currentVersion": ctx.stash.catalogVersion,
+                ":updatedAt": ctx.stash.now
             })
         },
         condition: {
@@ -37,10 +37,15 @@ export function request(ctx) {
         util.error('Catalog not loaded for lineItems update', 'InternalError');
         }
         
-        // Build products lookup map
-        const productsMap = {};
+        // Price against the catalog's current version (its map is precomputed);
+        // catalogs written before versioning only have the products list
+        const catalogVersion = ctx.stash.catalogVersion;
+        let productsMap = catalogVersion && catalogVersion.productsById;
+        if (!productsMap) {
+        productsMap = {};
         for (const product of catalog.products || []) {
-        productsMap[product.productId] = product;
+            productsMap[product.productId] = product;
+        }
         }
         
         // Enrich line items with product details
@@ -80,6 +85,12 @@ export function request(ctx) {
         // Also update totalAmount
         updates.push('totalAmount = :totalAmount');
         exprValues[':totalAmount'] = totalAmount;
+
+        // The catalog version the line items were priced from
+        if (catalogVersion) {
+        updates.push('catalogVersion = :catalogVersion');
+        exprValues[':catalogVersion'] = catalogVersion.version;
+        }
     }
     
     if (input.notes !== undefined) {
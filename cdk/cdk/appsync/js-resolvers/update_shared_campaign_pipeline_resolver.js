@@ -1,7 +1,13 @@
+import { extensions } from '@aws-appsync/utils';
+
 export function request(ctx) {
     return {};
 }
 
 export function response(ctx) {
+    // getSharedCampaign is cached by code (see resolvers/queries.py)
+    extensions.evictFromApiCache('Query', 'getSharedCampaign', {
+        'ctx.args.sharedCampaignCode': ctx.args.input.sharedCampaignCode,
+    });
     return ctx.prev.result;
 }
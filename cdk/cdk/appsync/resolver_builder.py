@@ -3,6 +3,11 @@ Builder pattern for AppSync resolvers.
 
 Simplifies creation of different resolver types (VTL, JS, Pipeline, Lambda).
 Reduces boilerplate and ensures consistent patterns across resolvers.
+
+Every create method takes an optional ``caching`` config (TTL and caching
+keys) for AppSync per-resolver caching. It only takes effect when the API
+has a cache (see api.create_appsync_api_cache); without one it is dropped,
+so the same resolver definitions deploy with or without a cache.
 """
 
 from pathlib import Path
@@ -41,6 +46,15 @@ class ResolverBuilder:
             datasource_name="profiles",
             code_file=RESOLVERS_DIR / "list_my_profiles_fn.js",
         )
+
+        # Cache a read for 5 minutes per argument value
+        builder.create_vtl_resolver(
+            ...,
+            caching=appsync.CachingConfig(
+                ttl=Duration.minutes(5),
+                caching_keys=["$context.arguments.sharedCampaignCode"],
+            ),
+        )
     """
 
     def __init__(
@@ -49,6 +63,7 @@ class ResolverBuilder:
         datasources: dict[str, Any],
         lambda_datasources: dict[str, appsync.LambdaDataSource],
         scope: Construct,
+        api_cache: appsync.CfnApiCache | None = None,
     ):
         """
         Initialize the resolver builder.
@@ -58,11 +73,25 @@ class ResolverBuilder:
             datasources: Dictionary of AppSync data sources (keyed by name)
             lambda_datasources: Dictionary of Lambda data sources (keyed by name)
             scope: CDK construct scope for creating resources
+            api_cache: The API's cache, if provisioned (caching configs are ignored without one)
         """
         self.api = api
         self.datasources = datasources
         self.lambda_datasources = lambda_datasources
         self.scope = scope
+        self.api_cache = api_cache
+
+    def _caching_config(self, caching: appsync.CachingConfig | None) -> appsync.CachingConfig | None:
+        """The caching config to deploy: none unless the API has a cache."""
+        return caching if self.api_cache is not None else None
+
+    def _depend_on_cache(
+        self, resolver: appsync.Resolver, caching_config: appsync.CachingConfig | None
+    ) -> appsync.Resolver:
+        """A cached resolver can only be deployed once the API cache exists."""
+        if caching_config is not None and self.api_cache is not None:
+            resolver.node.add_dependency(self.api_cache)
+        return resolver
 
     def create_vtl_resolver(
         self,
@@ -72,6 +101,7 @@ class ResolverBuilder:
         request_template: Path,
         response_template: Path,
         id_suffix: str | None = None,
+        caching: appsync.CachingConfig | None = None,
     ) -> appsync.Resolver:
         """
         Create a VTL resolver with request/response mapping templates.
@@ -83,11 +113,13 @@ class ResolverBuilder:
             request_template: Path to request VTL template file
             response_template: Path to response VTL template file
             id_suffix: Optional custom CDK construct ID suffix
+            caching: Optional per-resolver caching (TTL and caching keys)
 
         Returns:
             The created resolver
         """
         resolver_id = id_suffix or f"{field_name}Resolver"
+        caching_config = self._caching_config(caching)
 
         datasource = self.datasources[datasource_name]
         resolver: appsync.Resolver = datasource.create_resolver(
@@ -96,8 +128,9 @@ class ResolverBuilder:
             field_name=field_name,
             request_mapping_template=appsync.MappingTemplate.from_file(str(request_template)),
             response_mapping_template=appsync.MappingTemplate.from_file(str(response_template)),
+            caching_config=caching_config,
         )
-        return resolver
+        return self._depend_on_cache(resolver, caching_config)
 
     def create_js_resolver(
         self,
@@ -106,6 +139,7 @@ class ResolverBuilder:
         datasource_name: str,
         code_file: Path,
         id_suffix: str | None = None,
+        caching: appsync.CachingConfig | None = None,
     ) -> appsync.Resolver:
         """
         Create a JavaScript resolver using AppSync JS runtime.
@@ -116,11 +150,13 @@ class ResolverBuilder:
             datasource_name: Key in datasources dict
             code_file: Path to JavaScript resolver code file
             id_suffix: Optional custom CDK construct ID suffix
+            caching: Optional per-resolver caching (TTL and caching keys)
 
         Returns:
             The created resolver
         """
         resolver_id = id_suffix or f"{field_name}Resolver"
+        caching_config = self._caching_config(caching)
 
         datasource = self.datasources[datasource_name]
         resolver: appsync.Resolver = datasource.create_resolver(
@@ -129,8 +165,9 @@ class ResolverBuilder:
             field_name=field_name,
             runtime=appsync.FunctionRuntime.JS_1_0_0,
             code=appsync.Code.from_asset(str(code_file)),
+            caching_config=caching_config,
         )
-        return resolver
+        return self._depend_on_cache(resolver, caching_config)
 
     def create_js_resolver_on_api(
         self,
@@ -139,6 +176,7 @@ class ResolverBuilder:
         datasource_name: str,
         code_file: Path,
         id_suffix: str | None = None,
+        caching: appsync.CachingConfig | None = None,
     ) -> appsync.Resolver:
         """
         Create a JS resolver via api.create_resolver() with explicit data_source.
@@ -152,21 +190,25 @@ class ResolverBuilder:
             datasource_name: Key in datasources dict
             code_file: Path to JavaScript resolver code file
             id_suffix: Optional custom CDK construct ID suffix
+            caching: Optional per-resolver caching (TTL and caching keys)
 
         Returns:
             The created resolver
         """
         resolver_id = id_suffix or f"{field_name}Resolver"
+        caching_config = self._caching_config(caching)
 
         datasource = self.datasources[datasource_name]
-        return self.api.create_resolver(
+        resolver: appsync.Resolver = self.api.create_resolver(
             resolver_id,
             type_name=type_name,
             field_name=field_name,
             data_source=datasource,
             runtime=appsync.FunctionRuntime.JS_1_0_0,
             code=appsync.Code.from_asset(str(code_file)),
+            caching_config=caching_config,
         )
+        return self._depend_on_cache(resolver, caching_config)
 
     def create_pipeline_resolver(
         self,
@@ -175,6 +217,7 @@ class ResolverBuilder:
         functions: list[appsync.AppsyncFunction],
         code_file: Path,
         id_suffix: str | None = None,
+        caching: appsync.CachingConfig | None = None,
     ) -> appsync.Resolver:
         """
         Create a pipeline resolver with multiple functions.
@@ -185,20 +228,24 @@ class ResolverBuilder:
             functions: List of AppsyncFunction objects to execute in order
             code_file: Path to pipeline orchestration JavaScript file
             id_suffix: Optional custom CDK construct ID suffix
+            caching: Optional per-resolver caching (TTL and caching keys)
 
         Returns:
             The created resolver
         """
         resolver_id = id_suffix or f"{field_name}PipelineResolver"
+        caching_config = self._caching_config(caching)
 
-        return self.api.create_resolver(
+        resolver: appsync.Resolver = self.api.create_resolver(
             resolver_id,
             type_name=type_name,
             field_name=field_name,
             runtime=appsync.FunctionRuntime.JS_1_0_0,
             pipeline_config=functions,
             code=appsync.Code.from_asset(str(code_file)),
+            caching_config=caching_config,
         )
+        return self._depend_on_cache(resolver, caching_config)
 
     def create_pipeline_resolver_on_scope(
         self,
@@ -207,6 +254,8 @@ class ResolverBuilder:
         functions: list[appsync.AppsyncFunction],
         code_file: Path,
         id_suffix: str | None = None,
+        scope: Construct | None = None,
+        caching: appsync.CachingConfig | None = None,
     ) -> appsync.Resolver:
         """
         Create a pipeline resolver with multiple functions, using scope as parent.
@@ -217,7 +266,8 @@ class ResolverBuilder:
 
         Use this ONLY for resolvers that were originally created before the
         ResolverBuilder migration (e.g., DeleteCatalogPipelineResolver,
-        ListInvitesByProfilePipelineResolver).
+        ListInvitesByProfilePipelineResolver), or to turn a unit resolver into
+        a pipeline in place by passing the data source it was created on.
 
         Args:
             field_name: GraphQL field name
@@ -225,14 +275,17 @@ class ResolverBuilder:
             functions: List of AppsyncFunction objects to execute in order
             code_file: Path to pipeline orchestration JavaScript file
             id_suffix: Optional custom CDK construct ID suffix
+            scope: Parent construct (defaults to the builder's scope)
+            caching: Optional per-resolver caching (TTL and caching keys)
 
         Returns:
             The created resolver
         """
         resolver_id = id_suffix or f"{field_name}PipelineResolver"
+        caching_config = self._caching_config(caching)
 
-        return appsync.Resolver(
-            self.scope,
+        resolver: appsync.Resolver = appsync.Resolver(
+            scope or self.scope,
             resolver_id,
             api=self.api,
             type_name=type_name,
@@ -240,7 +293,9 @@ class ResolverBuilder:
             runtime=appsync.FunctionRuntime.JS_1_0_0,
             pipeline_config=functions,
             code=appsync.Code.from_asset(str(code_file)),
+            caching_config=caching_config,
         )
+        return self._depend_on_cache(resolver, caching_config)
 
     def create_vtl_pipeline_resolver(
         self,
@@ -250,6 +305,7 @@ class ResolverBuilder:
         request_template: Path,
         response_template: Path,
         id_suffix: str | None = None,
+        caching: appsync.CachingConfig | None = None,
     ) -> appsync.Resolver:
         """
         Create a VTL-style pipeline resolver using appsync.Resolver construct.
@@ -264,13 +320,15 @@ class ResolverBuilder:
             request_template: Path to request VTL template file
             response_template: Path to response VTL template file
             id_suffix: Optional custom CDK construct ID suffix
+            caching: Optional per-resolver caching (TTL and caching keys)
 
         Returns:
             The created resolver
         """
         resolver_id = id_suffix or f"{field_name}Resolver"
+        caching_config = self._caching_config(caching)
 
-        return appsync.Resolver(
+        resolver: appsync.Resolver = appsync.Resolver(
             self.scope,
             resolver_id,
             api=self.api,
@@ -279,7 +337,9 @@ class ResolverBuilder:
             request_mapping_template=appsync.MappingTemplate.from_file(str(request_template)),
             response_mapping_template=appsync.MappingTemplate.from_file(str(response_template)),
             pipeline_config=functions,
+            caching_config=caching_config,
         )
+        return self._depend_on_cache(resolver, caching_config)
 
     def create_lambda_resolver(
         self,
@@ -287,6 +347,7 @@ class ResolverBuilder:
         type_name: str,
         lambda_datasource_name: str,
         id_suffix: str | None = None,
+        caching: appsync.CachingConfig | None = None,
     ) -> appsync.Resolver:
         """
         Create a Lambda resolver.
@@ -296,18 +357,22 @@ class ResolverBuilder:
             type_name: GraphQL type name
             lambda_datasource_name: Key in lambda_datasources dict
             id_suffix: Optional custom CDK construct ID suffix
+            caching: Optional per-resolver caching (TTL and caching keys)
 
         Returns:
             The created resolver
         """
         resolver_id = id_suffix or f"{field_name}Resolver"
+        caching_config = self._caching_config(caching)
 
         lambda_ds = self.lambda_datasources[lambda_datasource_name]
-        return lambda_ds.create_resolver(
+        resolver: appsync.Resolver = lambda_ds.create_resolver(
             resolver_id,
             type_name=type_name,
             field_name=field_name,
+            caching_config=caching_config,
         )
+        return self._depend_on_cache(resolver, caching_config)
 
     def create_batch_resolvers(
         self,
@@ -331,6 +396,7 @@ class ResolverBuilder:
                 - code_file: (for js, pipeline) Path to JS code file
                 - functions: (for pipeline) List of AppsyncFunction objects
                 - id_suffix: (optional) Custom CDK construct ID
+                - caching: (optional) appsync.CachingConfig
 
         Returns:
             List of created resolvers
@@ -347,6 +413,7 @@ class ResolverBuilder:
                     request_template=config["request_template"],
                     response_template=config["response_template"],
                     id_suffix=config.get("id_suffix"),
+                    caching=config.get("caching"),
                 )
             elif resolver_type == "js":
                 resolver = self.create_js_resolver(
@@ -355,6 +422,7 @@ class ResolverBuilder:
                     datasource_name=config["datasource_name"],
                     code_file=config["code_file"],
                     id_suffix=config.get("id_suffix"),
+                    caching=config.get("caching"),
                 )
             elif resolver_type == "js_on_api":
                 resolver = self.create_js_resolver_on_api(
@@ -363,6 +431,7 @@ class ResolverBuilder:
                     datasource_name=config["datasource_name"],
                     code_file=config["code_file"],
                     id_suffix=config.get("id_suffix"),
+                    caching=config.get("caching"),
                 )
             elif resolver_type == "pipeline":
                 resolver = self.create_pipeline_resolver(
@@ -371,6 +440,7 @@ class ResolverBuilder:
                     functions=config["functions"],
                     code_file=config["code_file"],
                     id_suffix=config.get("id_suffix"),
+                    caching=config.get("caching"),
                 )
             elif resolver_type == "lambda":
                 resolver = self.create_lambda_resolver(
@@ -378,6 +448,7 @@ class ResolverBuilder:
                     type_name=config["type_name"],
                     lambda_datasource_name=config["lambda_datasource_name"],
                     id_suffix=config.get("id_suffix"),
+                    caching=config.get("caching"),
                 )
             else:
                 raise ValueError(f"Unknown resolver type: {resolver_type}")
@@ -32,6 +32,7 @@ def create_resolvers(
     lambda_datasources: dict[str, appsync.LambdaDataSource],
     functions: dict[str, appsync.AppsyncFunction],
     profile_delete_functions: dict[str, appsync.AppsyncFunction],
+    api_cache: appsync.CfnApiCache | None = None,
 ) -> None:
     """
     Create all AppSync resolvers for the GraphQL API.
@@ -46,10 +47,15 @@ def create_resolvers(
         lambda_datasources: Dictionary of Lambda data sources
         functions: Dictionary of reusable AppSync functions
         profile_delete_functions: Dictionary of profile-related AppSync functions
+        api_cache: API cache for resolvers with a caching config (None if caching is disabled)
     """
     # Create all resolver types in order
     create_mutation_resolvers(
-        scope, api, env_name, datasources, lambda_datasources, functions, profile_delete_functions
+        scope, api, env_name, datasources, lambda_datasources, functions, profile_delete_functions, api_cache=api_cache
+    )
+    create_query_resolvers(
+        scope, api, env_name, datasources, lambda_datasources, functions, profile_delete_functions, api_cache=api_cache
+    )
+    create_field_resolvers(
+        scope, api, env_name, datasources, lambda_datasources, functions, profile_delete_functions, api_cache=api_cache
     )
-    create_query_resolvers(scope, api, env_name, datasources, lambda_datasources, functions, profile_delete_functions)
-    create_field_resolvers(scope, api, env_name, datasources, lambda_datasources, functions, profile_delete_functions)
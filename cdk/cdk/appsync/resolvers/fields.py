@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from aws_cdk import Duration
 from aws_cdk import aws_appsync as appsync
 from constructs import Construct
 
@@ -18,6 +19,7 @@ def create_field_resolvers(
     lambda_datasources: dict[str, appsync.LambdaDataSource],
     functions: dict[str, appsync.AppsyncFunction],
     profile_delete_functions: dict[str, appsync.AppsyncFunction],
+    api_cache: appsync.CfnApiCache | None = None,
 ) -> None:
     """
     Create all AppSync field resolvers for nested types.
@@ -30,9 +32,17 @@ def create_field_resolvers(
         lambda_datasources: Dictionary of Lambda data sources
         functions: Dictionary of reusable AppSync functions
         profile_delete_functions: Dictionary of profile-related AppSync functions
+        api_cache: API cache for resolvers with a caching config (None if caching is disabled)
     """
     # Initialize the resolver builder
-    builder = ResolverBuilder(api, datasources, lambda_datasources, scope)
+    builder = ResolverBuilder(api, datasources, lambda_datasources, scope, api_cache=api_cache)
+
+    # Catalogs are read for every campaign and shared campaign that shows one, and
+    # change rarely; catalog writes evict these entries (catalog_write_pipeline_resolver.js)
+    catalog_caching = appsync.CachingConfig(
+        ttl=Duration.minutes(5),
+        caching_keys=["$context.source.catalogId"],
+    )
 
     # === CAMPAIGN FIELD RESOLVERS ===
 
@@ -44,6 +54,7 @@ def create_field_resolvers(
         request_template=MAPPING_TEMPLATES_DIR / "campaign_catalog_request.vtl",
         response_template=MAPPING_TEMPLATES_DIR / "campaign_catalog_response.vtl",
         id_suffix="CampaignCatalogResolver",
+        caching=catalog_caching,
     )
 
     # Campaign.totalOrders (VTL)
@@ -114,6 +125,7 @@ def create_field_resolvers(
         request_template=MAPPING_TEMPLATES_DIR / "shared_campaign_catalog_request.vtl",
         response_template=MAPPING_TEMPLATES_DIR / "shared_campaign_catalog_response.vtl",
         id_suffix="SharedCampaignCatalogResolver",
+        caching=catalog_caching,
     )
 
     # === SHARE FIELD RESOLVERS ===
@@ -6,7 +6,7 @@ from aws_cdk import aws_appsync as appsync
 from constructs import Construct
 
 # Import directory paths from parent api module
-from ..api import MAPPING_TEMPLATES_DIR, RESOLVERS_DIR
+from ..api import RESOLVERS_DIR
 from ..resolver_builder import ResolverBuilder
 
 
@@ -18,6 +18,7 @@ def create_mutation_resolvers(
     lambda_datasources: dict[str, appsync.LambdaDataSource],
     functions: dict[str, appsync.AppsyncFunction],
     profile_delete_functions: dict[str, appsync.AppsyncFunction],
+    api_cache: appsync.CfnApiCache | None = None,
 ) -> None:
     """
     Create all AppSync mutation resolvers.
@@ -30,9 +31,10 @@ def create_mutation_resolvers(
         lambda_datasources: Dictionary of Lambda data sources
         functions: Dictionary of reusable AppSync functions
         profile_delete_functions: Dictionary of profile-related AppSync functions
+        api_cache: API cache for resolvers with a caching config (None if caching is disabled)
     """
     # Initialize the resolver builder
-    builder = ResolverBuilder(api, datasources, lambda_datasources, scope)
+    builder = ResolverBuilder(api, datasources, lambda_datasources, scope, api_cache=api_cache)
 
     # === SHARING & INVITATION MUTATIONS ===
 
@@ -55,6 +57,7 @@ def create_mutation_resolvers(
         functions=[
             functions["verify_profile_owner_for_revoke"],
             functions["delete_share"],
+            functions["bump_share_version"],
         ],
         code_file=RESOLVERS_DIR / "revoke_share_pipeline_resolver.js",
         id_suffix="RevokeSharePipelineResolver",
@@ -81,6 +84,7 @@ def create_mutation_resolvers(
             functions["lookup_account_by_email"],
             functions["check_existing_share"],
             functions["create_share"],
+            functions["bump_share_version"],
         ],
         code_file=RESOLVERS_DIR / "share_profile_direct_pipeline_resolver.js",
         id_suffix="ShareProfileDirectPipelineResolver",
@@ -94,6 +98,7 @@ def create_mutation_resolvers(
             functions["lookup_invite"],
             functions["check_existing_share"],
             functions["create_share"],
+            functions["bump_share_version"],
             functions["mark_invite_used"],
         ],
         code_file=RESOLVERS_DIR / "redeem_profile_invite_pipeline_resolver.js",
@@ -152,6 +157,7 @@ def create_mutation_resolvers(
             functions["check_share_permissions"],
             functions["get_catalog_for_update_order"],
             functions["fetch_catalog_for_update"],
+            functions["get_catalog_version_for_order"],
             functions["update_order"],
         ],
         code_file=RESOLVERS_DIR / "update_order_pipeline_resolver_v2.js",
@@ -167,11 +173,28 @@ def create_mutation_resolvers(
             functions["verify_profile_write_access"],
             functions["check_share_permissions"],
             functions["delete_order"],
+            functions["record_order_tombstone"],
         ],
         code_file=RESOLVERS_DIR / "delete_order_pipeline_resolver_v2.js",
         id_suffix="DeleteOrderPipelineResolverV2",
     )
 
+    # createOrders (Lambda - one auth check and catalog load for a whole offline queue)
+    builder.create_lambda_resolver(
+        field_name="createOrders",
+        type_name="Mutation",
+        lambda_datasource_name="order_operations",
+        id_suffix="CreateOrdersResolver",
+    )
+
+    # requestOrderImport (Lambda - pre-signed upload; an S3-triggered worker imports the file)
+    builder.create_lambda_resolver(
+        field_name="requestOrderImport",
+        type_name="Mutation",
+        lambda_datasource_name="request_order_import",
+        id_suffix="RequestOrderImportResolver",
+    )
+
     # createOrder Pipeline
     # Conditionally include validate_payment_method if Lambda is available
     create_order_functions = [
@@ -189,7 +212,8 @@ def create_mutation_resolvers(
         functions["get_catalog_try_raw"],
         functions["get_catalog_try_prefixed"],
         functions["ensure_catalog_final"],
-        functions["get_catalog"],
+        # The catalog itself is stashed by get_catalog_try_raw / get_catalog_try_prefixed
+        functions["get_catalog_version_for_order"],
         functions["create_order"],
         # NOTE: log_create_order_state removed to stay within 10-function AppSync limit
     ])
@@ -204,24 +228,34 @@ def create_mutation_resolvers(
 
     # === CATALOG MUTATIONS ===
 
-    # createCatalog (VTL)
-    builder.create_vtl_resolver(
+    # createCatalog / updateCatalog Pipelines: write an immutable catalog version,
+    # then create or update the catalog pointing at it (currentVersion).
+    # updateCatalog checks ownership first, so only the owner can write versions.
+    # NOTE: Scoped to the catalogs data source, where these were VTL unit
+    # resolvers, so CloudFormation updates them in place
+    builder.create_pipeline_resolver_on_scope(
         field_name="createCatalog",
         type_name="Mutation",
-        datasource_name="catalogs",
-        request_template=MAPPING_TEMPLATES_DIR / "create_catalog_request.vtl",
-        response_template=MAPPING_TEMPLATES_DIR / "create_catalog_response.vtl",
+        functions=[
+            functions["put_catalog_version"],
+            functions["create_catalog"],
+        ],
+        code_file=RESOLVERS_DIR / "catalog_write_pipeline_resolver.js",
         id_suffix="CreateCatalogResolver",
+        scope=builder.datasources["catalogs"],
     )
 
-    # updateCatalog (VTL)
-    builder.create_vtl_resolver(
+    builder.create_pipeline_resolver_on_scope(
         field_name="updateCatalog",
         type_name="Mutation",
-        datasource_name="catalogs",
-        request_template=MAPPING_TEMPLATES_DIR / "update_catalog_request.vtl",
-        response_template=MAPPING_TEMPLATES_DIR / "update_catalog_response.vtl",
+        functions=[
+            functions["check_catalog_owner"],
+            functions["put_catalog_version"],
+            functions["update_catalog"],
+        ],
+        code_file=RESOLVERS_DIR / "catalog_write_pipeline_resolver.js",
         id_suffix="UpdateCatalogResolver",
+        scope=builder.datasources["catalogs"],
     )
 
     # deleteCatalog Pipeline
@@ -295,7 +329,6 @@ def create_mutation_resolvers(
         field_name="createSharedCampaign",
         type_name="Mutation",
         functions=[
-            functions["count_user_shared_campaigns"],
             functions["get_catalog_for_shared_campaign"],
             functions["get_account_for_shared_campaign"],
             functions["create_shared_campaign"],
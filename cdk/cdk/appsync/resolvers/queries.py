@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from aws_cdk import Duration
 from aws_cdk import aws_appsync as appsync
 from constructs import Construct
 
@@ -18,6 +19,7 @@ def create_query_resolvers(
     lambda_datasources: dict[str, appsync.LambdaDataSource],
     functions: dict[str, appsync.AppsyncFunction],
     profile_delete_functions: dict[str, appsync.AppsyncFunction],
+    api_cache: appsync.CfnApiCache | None = None,
 ) -> None:
     """
     Create all AppSync query resolvers.
@@ -30,9 +32,10 @@ def create_query_resolvers(
         lambda_datasources: Dictionary of Lambda data sources
         functions: Dictionary of reusable AppSync functions
         profile_delete_functions: Dictionary of profile-related AppSync functions
+        api_cache: API cache for resolvers with a caching config (None if caching is disabled)
     """
     # Initialize the resolver builder
-    builder = ResolverBuilder(api, datasources, lambda_datasources, scope)
+    builder = ResolverBuilder(api, datasources, lambda_datasources, scope, api_cache=api_cache)
 
     # === ACCOUNT & PROFILE QUERIES ===
 
@@ -76,6 +79,14 @@ def create_query_resolvers(
         id_suffix="ListMySharesResolverV2",  # Keep same ID to do in-place update
     )
 
+    # getMyDashboard (Lambda - batched/parallel reads instead of per-profile and per-campaign resolvers)
+    builder.create_lambda_resolver(
+        field_name="getMyDashboard",
+        type_name="Query",
+        lambda_datasource_name="get_my_dashboard",
+        id_suffix="GetMyDashboardResolver",
+    )
+
     # === CAMPAIGN QUERIES ===
 
     # getCampaign Pipeline
@@ -148,6 +159,64 @@ def create_query_resolvers(
         id_suffix="ListOrdersByProfileResolver",
     )
 
+    # listOrdersByCampaignPage Pipeline (cursor-paginated)
+    builder.create_pipeline_resolver(
+        field_name="listOrdersByCampaignPage",
+        type_name="Query",
+        functions=[
+            functions["lookup_campaign_for_orders"],
+            functions["verify_profile_read_access"],
+            functions["check_share_read_permissions"],
+            functions["query_orders_page_by_campaign"],
+        ],
+        code_file=RESOLVERS_DIR / "list_orders_by_campaign_resolver.js",
+        id_suffix="ListOrdersByCampaignPageResolver",
+    )
+
+    # listOrdersByProfilePage Pipeline (cursor-paginated)
+    builder.create_pipeline_resolver(
+        field_name="listOrdersByProfilePage",
+        type_name="Query",
+        functions=[
+            functions["verify_profile_read_access"],
+            functions["check_share_read_permissions"],
+            functions["query_orders_page_by_profile"],
+        ],
+        code_file=RESOLVERS_DIR / "list_orders_by_profile_resolver.js",
+        id_suffix="ListOrdersByProfilePageResolver",
+    )
+
+    # ordersChangedSince Pipeline (delta sync)
+    builder.create_pipeline_resolver(
+        field_name="ordersChangedSince",
+        type_name="Query",
+        functions=[
+            functions["lookup_campaign_for_orders"],
+            functions["verify_profile_read_access"],
+            functions["check_share_read_permissions"],
+            functions["query_orders_changed_since"],
+            functions["query_order_tombstones"],
+        ],
+        code_file=RESOLVERS_DIR / "list_orders_by_campaign_resolver.js",
+        id_suffix="OrdersChangedSinceResolver",
+    )
+
+    # searchCustomers (Lambda - answers from the per-profile customer index, not by listing orders)
+    builder.create_lambda_resolver(
+        field_name="searchCustomers",
+        type_name="Query",
+        lambda_datasource_name="search_customers",
+        id_suffix="SearchCustomersResolver",
+    )
+
+    # getOrderImportReport (Lambda - reads the report the import worker wrote to S3)
+    builder.create_lambda_resolver(
+        field_name="getOrderImportReport",
+        type_name="Query",
+        lambda_datasource_name="get_order_import_report",
+        id_suffix="GetOrderImportReportResolver",
+    )
+
     # === SHARE & INVITE QUERIES ===
 
     # listSharesByProfile Pipeline
@@ -188,6 +257,8 @@ def create_query_resolvers(
         request_template=MAPPING_TEMPLATES_DIR / "get_catalog_request.vtl",
         response_template=MAPPING_TEMPLATES_DIR / "get_catalog_response.vtl",
         id_suffix="GetCatalogResolver",
+        # Not cached: the answer depends on the caller's access, and a write could only
+        # evict the writer's own entry, so others would still see a catalog made private
     )
 
     # listPublicCatalogs (JS)
@@ -197,6 +268,8 @@ def create_query_resolvers(
         datasource_name="catalogs",
         code_file=RESOLVERS_DIR / "list_public_catalogs_resolver.js",
         id_suffix="ListPublicCatalogsResolver",
+        # No arguments to key on and no single entry to evict, so only briefly
+        caching=appsync.CachingConfig(ttl=Duration.minutes(1)),
     )
 
     # listMyCatalogs (JS)
@@ -218,6 +291,10 @@ def create_query_resolvers(
         request_template=MAPPING_TEMPLATES_DIR / "get_shared_campaign_request.vtl",
         response_template=MAPPING_TEMPLATES_DIR / "get_shared_campaign_response.vtl",
         id_suffix="GetSharedCampaignResolver",
+        caching=appsync.CachingConfig(
+            ttl=Duration.minutes(5),
+            caching_keys=["$context.arguments.sharedCampaignCode"],
+        ),
     )
 
     # listMySharedCampaigns (JS)
@@ -236,6 +313,18 @@ def create_query_resolvers(
         datasource_name="shared_campaigns",
         code_file=RESOLVERS_DIR / "find_shared_campaigns_resolver.js",
         id_suffix="FindSharedCampaignsResolver",
+        # Not evicted when shared campaigns change, so only briefly
+        caching=appsync.CachingConfig(
+            ttl=Duration.minutes(1),
+            caching_keys=[
+                "$context.arguments.unitType",
+                "$context.arguments.unitNumber",
+                "$context.arguments.city",
+                "$context.arguments.state",
+                "$context.arguments.campaignName",
+                "$context.arguments.campaignYear",
+            ],
+        ),
     )
 
     # === REPORTING QUERIES ===
@@ -294,4 +383,3 @@ def create_query_resolvers(
             code_file=RESOLVERS_DIR / "payment_methods_for_profile_pipeline_resolver.js",
             id_suffix="PaymentMethodsForProfileResolver",
         )
-
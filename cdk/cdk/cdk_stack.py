@@ -13,15 +13,21 @@ from aws_cdk import aws_cloudfront as cloudfront
 from aws_cdk import aws_cloudfront_origins as origins
 from aws_cdk import aws_cognito as cognito
 from aws_cdk import aws_dynamodb as dynamodb
+from aws_cdk import aws_events as events
+from aws_cdk import aws_events_targets as events_targets
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as lambda_
+from aws_cdk import aws_lambda_event_sources as lambda_event_sources
 from aws_cdk import aws_route53 as route53
 from aws_cdk import aws_route53_targets as targets
 from aws_cdk import aws_s3 as s3
+from aws_cdk import aws_s3_notifications as s3n
+from aws_cdk import aws_sqs as sqs
 from constructs import Construct
 
 from .appsync import setup_appsync
 from .helpers import get_context_bool, get_domain_names, get_known_user_pool_id, get_region_abbrev
+from .lambda_bundling import OPTIONAL_LAYER_PACKAGES, find_dependencies, stage_handler_asset
 
 
 class CdkStack(Stack):  # type: ignore[misc]
@@ -41,6 +47,22 @@ class CdkStack(Stack):  # type: ignore[misc]
         """Generate resource name with region and environment suffix."""
         return f"{name}-{self.region_abbrev}-{self.env_name}"
 
+    def _handler_assets(self, handler: str) -> dict[str, Any]:
+        """
+        Return handler, code and layers for a Lambda handler string.
+
+        Each handler module gets a slim asset with only the src/ modules it
+        imports, plus the optional layers for heavy packages it uses.
+        """
+        module = handler.rsplit(".", 1)[0]
+        if module not in self._handler_bundles:
+            deps = find_dependencies(module)
+            code = lambda_.Code.from_asset(stage_handler_asset(deps))
+            layers = [self.shared_layer, *(self.optional_layers[name] for name in deps.optional_layers)]
+            self._handler_bundles[module] = (code, layers)
+        code, layers = self._handler_bundles[module]
+        return {"handler": handler, "code": code, "layers": layers}
+
     def _configure_domains(self, base_domain: str) -> None:
         """Configure domain names based on environment using helper."""
         domains = get_domain_names(base_domain, self.env_name)
@@ -214,6 +236,8 @@ class CdkStack(Stack):  # type: ignore[misc]
             table_name=catalogs_table_name,
             partition_key=dynamodb.Attribute(name="catalogId", type=dynamodb.AttributeType.STRING),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            # Triggers the public snapshot publisher (PublishSnapshotsFn)
+            stream=dynamodb.StreamViewType.KEYS_ONLY,
             point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
                 point_in_time_recovery_enabled=True
             ),
@@ -233,6 +257,25 @@ class CdkStack(Stack):  # type: ignore[misc]
             projection_type=dynamodb.ProjectionType.ALL,
         )
 
+        # Catalog Versions Table
+        # PK: catalogId, SK: version. Immutable snapshots of a catalog's products,
+        # written by createCatalog/updateCatalog before the catalog's currentVersion
+        # is pointed at them; orders record the version they were priced against.
+        catalog_versions_table_name = self._rn("kernelworx-catalog-versions")
+        self.catalog_versions_table = dynamodb.Table(
+            self,
+            "CatalogVersionsTable",
+            table_name=catalog_versions_table_name,
+            partition_key=dynamodb.Attribute(name="catalogId", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="version", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
+                point_in_time_recovery_enabled=True
+            ),
+            removal_policy=RemovalPolicy.RETAIN,
+            deletion_protection=True,
+        )
+
         # Profiles Table - stores profile METADATA only
         # NEW STRUCTURE (V2): PK=ownerAccountId, SK=profileId
         # This enables direct query for listMyProfiles (no GSI needed)
@@ -355,6 +398,8 @@ class CdkStack(Stack):  # type: ignore[misc]
             partition_key=dynamodb.Attribute(name="campaignId", type=dynamodb.AttributeType.STRING),
             sort_key=dynamodb.Attribute(name="orderId", type=dynamodb.AttributeType.STRING),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            # Feeds the customer search index (IndexCustomerOrdersFn)
+            stream=dynamodb.StreamViewType.NEW_AND_OLD_IMAGES,
             point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
                 point_in_time_recovery_enabled=True
             ),
@@ -376,6 +421,49 @@ class CdkStack(Stack):  # type: ignore[misc]
             projection_type=dynamodb.ProjectionType.ALL,
         )
 
+        # GSI for delta sync (ordersChangedSince): orders of a campaign by last change
+        self.orders_table.add_global_secondary_index(
+            index_name="campaignId-updatedAt-index",
+            partition_key=dynamodb.Attribute(name="campaignId", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="updatedAt", type=dynamodb.AttributeType.STRING),
+            projection_type=dynamodb.ProjectionType.ALL,
+        )
+
+        # Order Tombstones Table
+        # PK: campaignId, SK: orderId - one item per deleted order so ordersChangedSince
+        # can report deletions; kept out of the orders table so no order query sees them
+        # TTL: expiresAt (clients that have not synced within the retention do a full refresh)
+        order_tombstones_table_name = self._rn("kernelworx-order-tombstones")
+        self.order_tombstones_table = dynamodb.Table(
+            self,
+            "OrderTombstonesTable",
+            table_name=order_tombstones_table_name,
+            partition_key=dynamodb.Attribute(name="campaignId", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="orderId", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+        cfn_order_tombstones_table = self.order_tombstones_table.node.default_child
+        assert cfn_order_tombstones_table is not None
+        cfn_order_tombstones_table.time_to_live_specification = dynamodb.CfnTable.TimeToLiveSpecificationProperty(
+            attribute_name="expiresAt",
+            enabled=True,
+        )
+
+        # Customer Index Table
+        # PK: profileId, SK: indexKey (SHARD#<c> token shards, CUSTOMER#<key> customers)
+        # Derived from the orders table stream (see src/utils/customer_index.py), so it can be rebuilt
+        customer_index_table_name = self._rn("kernelworx-customer-index")
+        self.customer_index_table = dynamodb.Table(
+            self,
+            "CustomerIndexTable",
+            table_name=customer_index_table_name,
+            partition_key=dynamodb.Attribute(name="profileId", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="indexKey", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
         # Shared Campaigns Table
         # PK: sharedCampaignCode (enables direct lookup)
         # GSI1: createdBy + createdAt (for "my shared campaigns" listing)
@@ -434,6 +522,15 @@ class CdkStack(Stack):  # type: ignore[misc]
             encryption=s3.BucketEncryption.S3_MANAGED,
             block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
             removal_policy=RemovalPolicy.RETAIN,
+            lifecycle_rules=[
+                # cProfile captures from utils.profiling are only needed while investigating
+                s3.LifecycleRule(id="ExpireProfiles", prefix="profiles/", expiration=Duration.days(14)),
+                # Order import uploads are processed once; reports are read shortly after
+                s3.LifecycleRule(id="ExpireOrderImports", prefix="order-imports/", expiration=Duration.days(7)),
+                s3.LifecycleRule(
+                    id="ExpireOrderImportReports", prefix="order-import-reports/", expiration=Duration.days(30)
+                ),
+            ],
         )
 
         # ====================================================================
@@ -454,12 +551,14 @@ class CdkStack(Stack):  # type: ignore[misc]
         # Grant Lambda role access to new multi-table design tables
         self.accounts_table.grant_read_write_data(self.lambda_execution_role)
         self.catalogs_table.grant_read_write_data(self.lambda_execution_role)
+        self.catalog_versions_table.grant_read_write_data(self.lambda_execution_role)
         self.profiles_table.grant_read_write_data(self.lambda_execution_role)
         self.campaigns_table.grant_read_write_data(self.lambda_execution_role)
         self.orders_table.grant_read_write_data(self.lambda_execution_role)
         self.shares_table.grant_read_write_data(self.lambda_execution_role)
         self.invites_table.grant_read_write_data(self.lambda_execution_role)
         self.shared_campaigns_table.grant_read_write_data(self.lambda_execution_role)
+        self.customer_index_table.grant_read_write_data(self.lambda_execution_role)
 
         # Grant Lambda role access to new table GSI indexes
         for table in [
@@ -501,12 +600,14 @@ class CdkStack(Stack):  # type: ignore[misc]
         # Grant AppSync role access to new multi-table design tables
         self.accounts_table.grant_read_write_data(self.appsync_service_role)
         self.catalogs_table.grant_read_write_data(self.appsync_service_role)
+        self.catalog_versions_table.grant_read_write_data(self.appsync_service_role)
         self.profiles_table.grant_read_write_data(self.appsync_service_role)
         self.campaigns_table.grant_read_write_data(self.appsync_service_role)
         self.orders_table.grant_read_write_data(self.appsync_service_role)
         self.shares_table.grant_read_write_data(self.appsync_service_role)
         self.invites_table.grant_read_write_data(self.appsync_service_role)
         self.shared_campaigns_table.grant_read_write_data(self.appsync_service_role)
+        self.order_tombstones_table.grant_read_write_data(self.appsync_service_role)
 
         # Grant AppSync role access to new table GSI indexes
         for table in [
@@ -534,15 +635,25 @@ class CdkStack(Stack):  # type: ignore[misc]
             "EXPORTS_BUCKET": self.exports_bucket.bucket_name,
             "POWERTOOLS_SERVICE_NAME": "kernelworx",
             "LOG_LEVEL": "INFO",
+            "METRICS_NAMESPACE": "KernelWorx",  # EMF metrics from utils.metrics
+            # utils.profiling: deploy with -c profile_sample_rate=0.05 to capture profiles
+            "PROFILE_SAMPLE_RATE": str(self.node.try_get_context("profile_sample_rate") or "0"),
+            # utils.logging: deploy with -c log_buffering=true to write each invocation's logs at once
+            "LOG_BUFFERING": str(self.node.try_get_context("log_buffering") or "false"),
+            # utils.auth: reuse access decisions in warm containers (invalidated by shareVersion)
+            "PERMISSION_CACHE_TTL_SECONDS": "30",
             "LAMBDA_VERSION": "2026-01-12",  # Force Lambda update
             # New multi-table design table names
             "ACCOUNTS_TABLE_NAME": self.accounts_table.table_name,
             "CATALOGS_TABLE_NAME": self.catalogs_table.table_name,
+            "CATALOG_VERSIONS_TABLE_NAME": self.catalog_versions_table.table_name,
             "PROFILES_TABLE_NAME": self.profiles_table.table_name,
             "CAMPAIGNS_TABLE_NAME": self.campaigns_table.table_name,
             "ORDERS_TABLE_NAME": self.orders_table.table_name,
             "SHARES_TABLE_NAME": self.shares_table.table_name,
             "INVITES_TABLE_NAME": self.invites_table.table_name,
+            "SHARED_CAMPAIGNS_TABLE_NAME": self.shared_campaigns_table.table_name,
+            "CUSTOMER_INDEX_TABLE_NAME": self.customer_index_table.table_name,
         }
 
         # Create Lambda Layer for shared dependencies
@@ -562,17 +673,25 @@ class CdkStack(Stack):  # type: ignore[misc]
             description="Shared Python dependencies for Lambda functions",
         )
 
-        # Use only the src directory for Lambda code (not the entire repo)
-        lambda_code_path = os.path.join(os.path.dirname(__file__), "..", "..", "src")
+        # Heavy packages (openpyxl, Pillow) live in their own layers and are only
+        # attached to functions whose imports need them (build-lambda-layer.sh builds all layers)
+        self.optional_layers: dict[str, lambda_.LayerVersion] = {}
+        for layer_name in sorted(set(OPTIONAL_LAYER_PACKAGES.values())):
+            optional_layer_path = os.path.join(os.path.dirname(__file__), "..", f"lambda-layer-{layer_name}")
+            if not os.path.exists(optional_layer_path):
+                os.makedirs(optional_layer_path, exist_ok=True)
+            self.optional_layers[layer_name] = lambda_.LayerVersion(
+                self,
+                f"{layer_name.title()}DependenciesLayer",
+                layer_version_name=self._rn(f"kernelworx-deps-{layer_name}"),
+                code=lambda_.Code.from_asset(optional_layer_path),
+                compatible_runtimes=[lambda_.Runtime.PYTHON_3_13],
+                description=f"Python dependencies for {layer_name} Lambda functions",
+            )
 
-        lambda_code = lambda_.Code.from_asset(
-            lambda_code_path,
-            exclude=[
-                "__pycache__",
-                "*.pyc",
-                ".pytest_cache",
-            ],
-        )
+        # Per-handler code assets built from each handler's transitive imports
+        # (see lambda_bundling), so e.g. the Cognito triggers don't ship reporting code
+        self._handler_bundles: dict[str, tuple[lambda_.Code, list[lambda_.ILayerVersion]]] = {}
 
         # Profile Sharing Lambda Functions
         # NOTE: create_profile_invite Lambda REMOVED - replaced with JS resolver
@@ -587,9 +706,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "ListMySharesFn",
             function_name=self._rn("kernelworx-list-my-shares"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.profile_sharing.list_my_shares",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.profile_sharing.list_my_shares"),
             timeout=Duration.seconds(30),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -604,9 +721,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "CreateProfileFnV2",
             function_name=self._rn("kernelworx-create-profile"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.scout_operations.create_seller_profile",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.scout_operations.create_seller_profile"),
             timeout=Duration.seconds(30),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -618,9 +733,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "RequestCampaignReportFnV2",
             function_name=self._rn("kernelworx-request-report"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.report_generation.request_campaign_report",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.report_generation.request_campaign_report"),
             timeout=Duration.seconds(60),  # Reports may take longer
             memory_size=512,  # More memory for Excel generation
             role=self.lambda_execution_role,
@@ -632,9 +745,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "UnitReportingFnV2",
             function_name=self._rn("kernelworx-unit-reporting"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.campaign_reporting.get_unit_report",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.campaign_reporting.get_unit_report"),
             timeout=Duration.seconds(60),  # May need time for large units
             memory_size=512,  # More memory for aggregation
             role=self.lambda_execution_role,
@@ -646,9 +757,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "ListUnitCatalogsFn",
             function_name=self._rn("kernelworx-list-unit-catalogs"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.list_unit_catalogs.list_unit_catalogs",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.list_unit_catalogs.list_unit_catalogs"),
             timeout=Duration.seconds(30),
             memory_size=512,
             role=self.lambda_execution_role,
@@ -661,9 +770,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "ListUnitCampaignCatalogsFn",
             function_name=self._rn("kernelworx-list-unit-campaign-catalogs"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.list_unit_catalogs.list_unit_campaign_catalogs",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.list_unit_catalogs.list_unit_campaign_catalogs"),
             timeout=Duration.seconds(30),
             memory_size=512,
             role=self.lambda_execution_role,
@@ -676,24 +783,163 @@ class CdkStack(Stack):  # type: ignore[misc]
             "CampaignOperationsFn",
             function_name=self._rn("kernelworx-campaign-operations"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.campaign_operations.create_campaign",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.campaign_operations.create_campaign"),
+            timeout=Duration.seconds(30),
+            memory_size=512,
+            role=self.lambda_execution_role,
+            environment=lambda_env,
+        )
+
+        # Dashboard Lambda (getMyDashboard: account, profiles, campaigns and totals in one call)
+        self.get_my_dashboard_fn = lambda_.Function(
+            self,
+            "GetMyDashboardFn",
+            function_name=self._rn("kernelworx-get-my-dashboard"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.dashboard.get_my_dashboard"),
             timeout=Duration.seconds(30),
             memory_size=512,
             role=self.lambda_execution_role,
             environment=lambda_env,
         )
 
+        # Order Operations Lambda (createOrders: batch creation for offline order queues)
+        self.order_operations_fn = lambda_.Function(
+            self,
+            "OrderOperationsFn",
+            function_name=self._rn("kernelworx-order-operations"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.order_operations.create_orders"),
+            timeout=Duration.seconds(30),
+            memory_size=512,
+            role=self.lambda_execution_role,
+            environment=lambda_env,
+        )
+
+        # Customer Search Lambdas (searchCustomers query, orders stream worker that maintains the index)
+        self.search_customers_fn = lambda_.Function(
+            self,
+            "SearchCustomersFn",
+            function_name=self._rn("kernelworx-search-customers"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.customer_search.search_customers"),
+            timeout=Duration.seconds(10),
+            memory_size=256,
+            role=self.lambda_execution_role,
+            environment=lambda_env,
+        )
+
+        self.index_customer_orders_fn = lambda_.Function(
+            self,
+            "IndexCustomerOrdersFn",
+            function_name=self._rn("kernelworx-index-customer-orders"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.customer_search.index_customer_orders"),
+            timeout=Duration.seconds(60),
+            memory_size=256,
+            role=self.lambda_execution_role,
+            environment=lambda_env,
+        )
+        # Records that still fail after the retries are sent here instead of being dropped;
+        # each message names the stream shard and sequence range to redrive
+        self.index_customer_orders_dlq = sqs.Queue(
+            self,
+            "IndexCustomerOrdersDlq",
+            queue_name=self._rn("kernelworx-index-customer-orders-dlq"),
+            retention_period=Duration.days(14),
+            encryption=sqs.QueueEncryption.SQS_MANAGED,
+            enforce_ssl=True,
+        )
+        # Index updates are idempotent, so failed batches are retried (bisected to isolate a bad record)
+        self.index_customer_orders_fn.add_event_source(
+            lambda_event_sources.DynamoEventSource(
+                self.orders_table,
+                starting_position=lambda_.StartingPosition.TRIM_HORIZON,
+                batch_size=100,
+                max_batching_window=Duration.seconds(5),
+                bisect_batch_on_error=True,
+                retry_attempts=10,
+                on_failure=lambda_event_sources.SqsDlq(self.index_customer_orders_dlq),
+            )
+        )
+
+        # Public snapshots (static JSON for listPublicCatalogs, served by CloudFront)
+        self.publish_snapshots_fn = lambda_.Function(
+            self,
+            "PublishSnapshotsFn",
+            function_name=self._rn("kernelworx-publish-snapshots"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.snapshot_publisher.publish_snapshots"),
+            timeout=Duration.seconds(60),
+            memory_size=512,
+            role=self.lambda_execution_role,
+            environment={**lambda_env, "STATIC_ASSETS_BUCKET": self.static_assets_bucket.bucket_name},
+            # One rebuild at a time, so an older run never overwrites a newer manifest
+            reserved_concurrent_executions=1,
+        )
+        self.static_assets_bucket.grant_read_write(self.publish_snapshots_fn)
+        self.static_assets_bucket.grant_delete(self.publish_snapshots_fn)
+        # Every run rebuilds from the table, so the window just coalesces bursts of writes
+        self.publish_snapshots_fn.add_event_source(
+            lambda_event_sources.DynamoEventSource(
+                self.catalogs_table,
+                starting_position=lambda_.StartingPosition.LATEST,
+                batch_size=1000,
+                max_batching_window=Duration.seconds(10),
+                retry_attempts=10,
+            )
+        )
+
+        # Order Import Lambdas (requestOrderImport upload URL, S3-triggered worker, report query)
+        self.request_order_import_fn = lambda_.Function(
+            self,
+            "RequestOrderImportFn",
+            function_name=self._rn("kernelworx-request-order-import"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.order_import.request_order_import"),
+            timeout=Duration.seconds(10),
+            memory_size=256,
+            role=self.lambda_execution_role,
+            environment=lambda_env,
+        )
+
+        self.get_order_import_report_fn = lambda_.Function(
+            self,
+            "GetOrderImportReportFn",
+            function_name=self._rn("kernelworx-get-order-import-report"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.order_import.get_order_import_report"),
+            timeout=Duration.seconds(10),
+            memory_size=256,
+            role=self.lambda_execution_role,
+            environment=lambda_env,
+        )
+
+        self.process_order_import_fn = lambda_.Function(
+            self,
+            "ProcessOrderImportFn",
+            function_name=self._rn("kernelworx-process-order-import"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.order_import.process_order_import"),
+            timeout=Duration.minutes(5),  # Up to 5000 rows per file
+            memory_size=1024,  # More CPU for XLSX parsing and parallel batch writes
+            role=self.lambda_execution_role,
+            environment=lambda_env,
+        )
+
+        self.exports_bucket.add_event_notification(
+            s3.EventType.OBJECT_CREATED,
+            s3n.LambdaDestination(self.process_order_import_fn),
+            s3.NotificationKeyFilter(prefix="order-imports/"),
+        )
+
         # Delete Profile Orders Cascade Lambda (cascade delete of orders when profile is deleted)
         self.delete_profile_orders_cascade_fn = lambda_.Function(
             self,
             "DeleteProfileOrdersCascadeFn",
             function_name=self._rn("kernelworx-delete-profile-orders-cascade"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.delete_profile_orders_cascade.lambda_handler",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.delete_profile_orders_cascade.lambda_handler"),
             timeout=Duration.seconds(60),  # May take longer for profiles with many orders
             memory_size=512,
             role=self.lambda_execution_role,
@@ -706,9 +952,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "UpdateMyAccountFnV2",
             function_name=self._rn("kernelworx-update-account"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.account_operations.update_my_account",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.account_operations.update_my_account"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -721,9 +965,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "TransferProfileOwnershipFn",
             function_name=self._rn("kernelworx-transfer-ownership"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.transfer_profile_ownership.lambda_handler",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.transfer_profile_ownership.lambda_handler"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -736,9 +978,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "PostAuthenticationFnV2",
             function_name=self._rn("kernelworx-post-auth"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.post_authentication.lambda_handler",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.post_authentication.lambda_handler"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -753,9 +993,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "PreSignupFn",
             function_name=self._rn("kernelworx-pre-signup"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.pre_signup.lambda_handler",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.pre_signup.lambda_handler"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -772,9 +1010,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "RequestQRUploadFn",
             function_name=self._rn("kernelworx-request-qr-upload"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.payment_methods_handlers.request_qr_upload",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.payment_methods_handlers.request_qr_upload"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -787,11 +1023,9 @@ class CdkStack(Stack):  # type: ignore[misc]
             "ConfirmQRUploadFn",
             function_name=self._rn("kernelworx-confirm-qr-upload"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.payment_methods_handlers.confirm_qr_upload",
-            code=lambda_code,
-            layers=[self.shared_layer],
-            timeout=Duration.seconds(10),
-            memory_size=256,
+            **self._handler_assets("handlers.payment_methods_handlers.confirm_qr_upload"),
+            timeout=Duration.seconds(30),  # Re-encodes the uploaded image
+            memory_size=512,  # More CPU for image decoding
             role=self.lambda_execution_role,
             environment=lambda_env,
         )
@@ -802,9 +1036,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "GeneratePresignedURLsFn",
             function_name=self._rn("kernelworx-generate-presigned-urls"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.payment_methods_handlers.generate_presigned_urls",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.payment_methods_handlers.generate_presigned_urls"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -817,9 +1049,7 @@ class CdkStack(Stack):  # type: ignore[misc]
             "DeleteQRCodeFn",
             function_name=self._rn("kernelworx-delete-qr-code"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.payment_methods_handlers.delete_qr_code",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.payment_methods_handlers.delete_qr_code"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
@@ -832,15 +1062,35 @@ class CdkStack(Stack):  # type: ignore[misc]
             "ValidatePaymentMethodFn",
             function_name=self._rn("kernelworx-validate-payment-method"),
             runtime=lambda_.Runtime.PYTHON_3_13,
-            handler="handlers.validate_payment_method.lambda_handler",
-            code=lambda_code,
-            layers=[self.shared_layer],
+            **self._handler_assets("handlers.validate_payment_method.lambda_handler"),
             timeout=Duration.seconds(10),
             memory_size=256,
             role=self.lambda_execution_role,
             environment=lambda_env,
         )
 
+        # QR Code Cleanup Lambda - Scheduled garbage collection of orphaned QR uploads
+        self.qr_code_cleanup_fn = lambda_.Function(
+            self,
+            "QRCodeCleanupFn",
+            function_name=self._rn("kernelworx-qr-code-cleanup"),
+            runtime=lambda_.Runtime.PYTHON_3_13,
+            **self._handler_assets("handlers.qr_code_cleanup.lambda_handler"),
+            timeout=Duration.minutes(5),  # Lists the whole QR prefix and scans accounts
+            memory_size=512,
+            role=self.lambda_execution_role,
+            environment={**lambda_env, "QR_CLEANUP_GRACE_HOURS": "24"},
+        )
+
+        # Run daily during low traffic (08:00 UTC = early morning US time)
+        events.Rule(
+            self,
+            "QRCodeCleanupSchedule",
+            rule_name=self._rn("kernelworx-qr-code-cleanup"),
+            schedule=events.Schedule.cron(minute="0", hour="8"),
+            targets=[events_targets.LambdaFunction(self.qr_code_cleanup_fn)],
+        )
+
         # ====================================================================
         # Cognito User Pool - Authentication (Essentials tier)
         # ====================================================================
@@ -1156,21 +1406,28 @@ class CdkStack(Stack):  # type: ignore[misc]
             tables={
                 "accounts": self.accounts_table,
                 "catalogs": self.catalogs_table,
+                "catalog_versions": self.catalog_versions_table,
                 "profiles": self.profiles_table,
                 "campaigns": self.campaigns_table,
                 "orders": self.orders_table,
                 "shares": self.shares_table,
                 "invites": self.invites_table,
                 "shared_campaigns": self.shared_campaigns_table,
+                "order_tombstones": self.order_tombstones_table,
             },
             lambda_functions={
                 "list_my_shares": self.list_my_shares_fn,
+                "get_my_dashboard": self.get_my_dashboard_fn,
+                "search_customers": self.search_customers_fn,
                 "create_profile": self.create_profile_fn,
                 "request_campaign_report": self.request_campaign_report_fn,
                 "unit_reporting": self.unit_reporting_fn,
                 "list_unit_catalogs": self.list_unit_catalogs_fn,
                 "list_unit_campaign_catalogs": self.list_unit_campaign_catalogs_fn,
                 "campaign_operations": self.campaign_operations_fn,
+                "order_operations": self.order_operations_fn,
+                "request_order_import": self.request_order_import_fn,
+                "get_order_import_report": self.get_order_import_report_fn,
                 "delete_profile_orders_cascade": self.delete_profile_orders_cascade_fn,
                 "update_my_account": self.update_my_account_fn,
                 "transfer_ownership": self.transfer_ownership_fn,
@@ -1198,10 +1455,22 @@ class CdkStack(Stack):  # type: ignore[misc]
 
         # Grant CloudFront read access to static assets bucket
         self.static_assets_bucket.grant_read(self.origin_access_identity)
-        
+
         # Grant CloudFront read/write access to exports bucket for uploads
         self.exports_bucket.grant_read_write(self.origin_access_identity)
 
+        # Honors the origin's Cache-Control; the defaults only apply to objects without one
+        snapshots_cache_policy = cloudfront.CachePolicy(
+            self,
+            "SnapshotsCachePolicy",
+            cache_policy_name=self._rn("kernelworx-snapshots"),
+            default_ttl=Duration.minutes(1),
+            min_ttl=Duration.seconds(0),
+            max_ttl=Duration.days(365),
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
+        )
+
         # CloudFront distribution with custom domain
         self.distribution = cloudfront.Distribution(
             self,
@@ -1228,6 +1497,17 @@ class CdkStack(Stack):  # type: ignore[misc]
                     cache_policy=cloudfront.CachePolicy.CACHING_DISABLED,  # Don't cache uploads
                     compress=False,  # Don't compress binary files
                 ),
+                # Public snapshots from PublishSnapshotsFn: content-hashed files are immutable
+                # and the manifest expires in a minute; both via the publisher's Cache-Control
+                "/snapshots/*": cloudfront.BehaviorOptions(
+                    origin=origins.S3BucketOrigin.with_origin_access_identity(
+                        self.static_assets_bucket,
+                        origin_access_identity=self.origin_access_identity,
+                    ),
+                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                    cache_policy=snapshots_cache_policy,
+                    compress=True,
+                ),
                 # Note: /payment-qr-codes/* is served via signed S3 URLs, not CloudFront
             },
             default_root_object="index.html",
@@ -39,6 +39,8 @@ def create_dynamodb_tables(stack: Construct, rn: Callable[[str], str]) -> Dict[s
         table_name=rn("kernelworx-catalogs"),
         partition_key=ddb.Attribute(name="catalogId", type=ddb.AttributeType.STRING),
         billing_mode=ddb.BillingMode.PAY_PER_REQUEST,
+        # Triggers the public snapshot publisher
+        stream=ddb.StreamViewType.KEYS_ONLY,
         point_in_time_recovery_specification=ddb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
         removal_policy=RemovalPolicy.RETAIN,
         deletion_protection=True,
@@ -146,6 +148,8 @@ def create_dynamodb_tables(stack: Construct, rn: Callable[[str], str]) -> Dict[s
         partition_key=ddb.Attribute(name="campaignId", type=ddb.AttributeType.STRING),
         sort_key=ddb.Attribute(name="orderId", type=ddb.AttributeType.STRING),
         billing_mode=ddb.BillingMode.PAY_PER_REQUEST,
+        # Feeds the customer search index
+        stream=ddb.StreamViewType.NEW_AND_OLD_IMAGES,
         point_in_time_recovery_specification=ddb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
         removal_policy=RemovalPolicy.RETAIN,
         deletion_protection=True,
@@ -161,6 +165,54 @@ def create_dynamodb_tables(stack: Construct, rn: Callable[[str], str]) -> Dict[s
         sort_key=ddb.Attribute(name="createdAt", type=ddb.AttributeType.STRING),
         projection_type=ddb.ProjectionType.ALL,
     )
+    # Delta sync (ordersChangedSince): orders of a campaign by last change
+    orders_table.add_global_secondary_index(
+        index_name="campaignId-updatedAt-index",
+        partition_key=ddb.Attribute(name="campaignId", type=ddb.AttributeType.STRING),
+        sort_key=ddb.Attribute(name="updatedAt", type=ddb.AttributeType.STRING),
+        projection_type=ddb.ProjectionType.ALL,
+    )
+
+    # One item per deleted order, expired by TTL once no client should still need it
+    order_tombstones_table = ddb.Table(
+        stack,
+        "OrderTombstonesTable",
+        table_name=rn("kernelworx-order-tombstones"),
+        partition_key=ddb.Attribute(name="campaignId", type=ddb.AttributeType.STRING),
+        sort_key=ddb.Attribute(name="orderId", type=ddb.AttributeType.STRING),
+        billing_mode=ddb.BillingMode.PAY_PER_REQUEST,
+        removal_policy=RemovalPolicy.RETAIN,
+    )
+    cfn_order_tombstones = order_tombstones_table.node.default_child
+    assert cfn_order_tombstones is not None
+    cfn_order_tombstones.time_to_live_specification = ddb.CfnTable.TimeToLiveSpecificationProperty(
+        attribute_name="expiresAt",
+        enabled=True,
+    )
+
+    # Immutable catalog snapshots: PK catalogId, SK version (the catalog's currentVersion points at one)
+    catalog_versions_table = ddb.Table(
+        stack,
+        "CatalogVersionsTable",
+        table_name=rn("kernelworx-catalog-versions"),
+        partition_key=ddb.Attribute(name="catalogId", type=ddb.AttributeType.STRING),
+        sort_key=ddb.Attribute(name="version", type=ddb.AttributeType.STRING),
+        billing_mode=ddb.BillingMode.PAY_PER_REQUEST,
+        point_in_time_recovery_specification=ddb.PointInTimeRecoverySpecification(point_in_time_recovery_enabled=True),
+        removal_policy=RemovalPolicy.RETAIN,
+        deletion_protection=True,
+    )
+
+    # Customer search index, derived from the orders stream: PK profileId, SK SHARD#<c> / CUSTOMER#<key>
+    customer_index_table = ddb.Table(
+        stack,
+        "CustomerIndexTable",
+        table_name=rn("kernelworx-customer-index"),
+        partition_key=ddb.Attribute(name="profileId", type=ddb.AttributeType.STRING),
+        sort_key=ddb.Attribute(name="indexKey", type=ddb.AttributeType.STRING),
+        billing_mode=ddb.BillingMode.PAY_PER_REQUEST,
+        removal_policy=RemovalPolicy.RETAIN,
+    )
 
     shared_campaigns_table = ddb.Table(
         stack,
@@ -187,10 +239,13 @@ def create_dynamodb_tables(stack: Construct, rn: Callable[[str], str]) -> Dict[s
     return {
         "accounts_table": accounts_table,
         "catalogs_table": catalogs_table,
+        "catalog_versions_table": catalog_versions_table,
         "profiles_table": profiles_table,
         "shares_table": shares_table,
         "invites_table": invites_table,
         "campaigns_table": campaigns_table,
         "orders_table": orders_table,
+        "order_tombstones_table": order_tombstones_table,
+        "customer_index_table": customer_index_table,
         "shared_campaigns_table": shared_campaigns_table,
     }
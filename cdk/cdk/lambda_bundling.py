@@ -0,0 +1,173 @@
+"""
+Per-handler Lambda code assets.
+
+Every function used to ship the whole src/ tree, so the Cognito triggers
+carried reporting and payment-method code they never import. This module
+walks a handler's imports (including lazy, function-level ones) to find:
+- the src/ modules it transitively needs, which are staged into a minimal
+  asset directory per handler module
+- the third-party packages it needs, which decide the optional layers
+  (e.g. openpyxl -> reports layer) the function gets
+
+Both the Lambda-style absolute imports (`from utils.x import ...`) and the
+relative fallbacks (`from ..utils.x import ...`) resolve to the same files.
+"""
+
+import ast
+import os
+import shutil
+import sys
+from dataclasses import dataclass, field
+
+SRC_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".lambda-assets"))
+
+# Third-party packages shipped in an optional layer instead of the shared one.
+# Keys are top-level import names; values are layer names (lambda-layer-<name>/).
+OPTIONAL_LAYER_PACKAGES: dict[str, str] = {
+    "openpyxl": "reports",
+    "PIL": "images",
+}
+
+
+@dataclass
+class HandlerDependencies:
+    """Files and packages a handler module needs at runtime."""
+
+    module: str
+    # Paths relative to src_dir, e.g. "utils/logging.py"
+    files: set[str] = field(default_factory=set)
+    # Top-level third-party import names, e.g. "boto3", "openpyxl"
+    packages: set[str] = field(default_factory=set)
+
+    @property
+    def optional_layers(self) -> list[str]:
+        """Names of the optional layers this handler needs, sorted."""
+        return sorted({OPTIONAL_LAYER_PACKAGES[p] for p in self.packages if p in OPTIONAL_LAYER_PACKAGES})
+
+
+def _module_file(module: str, src_dir: str) -> str | None:
+    """Return the src-relative file for a dotted module name, if it is local."""
+    if not module:
+        return None
+    base = module.replace(".", "/")
+    for candidate in (f"{base}.py", f"{base}/__init__.py"):
+        if os.path.isfile(os.path.join(src_dir, candidate)):
+            return candidate
+    return None
+
+
+def _package_of(rel_file: str) -> str:
+    """Return the dotted package that contains a src-relative file."""
+    return ".".join(rel_file[: -len(".py")].split("/")[:-1])
+
+
+def _is_type_checking(node: ast.If) -> bool:
+    """Return True for `if TYPE_CHECKING:` / `if typing.TYPE_CHECKING:` blocks."""
+    test = node.test
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+        isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+    )
+
+
+def _runtime_import_nodes(tree: ast.AST) -> list[ast.Import | ast.ImportFrom]:
+    """Return import statements anywhere in a tree, skipping type-checking-only blocks."""
+    nodes: list[ast.Import | ast.ImportFrom] = []
+    pending: list[ast.AST] = [tree]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            nodes.append(node)
+        elif isinstance(node, ast.If) and _is_type_checking(node):
+            pending.extend(node.orelse)
+        else:
+            pending.extend(ast.iter_child_nodes(node))
+    return nodes
+
+
+def _imported_modules(rel_file: str, src_dir: str) -> list[str]:
+    """Return absolute dotted names imported by a file at runtime (module and function level)."""
+    with open(os.path.join(src_dir, rel_file), encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=rel_file)
+
+    package = _package_of(rel_file)
+    modules: list[str] = []
+    for node in _runtime_import_nodes(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+            continue
+        if node.level:
+            parts = package.split(".") if package else []
+            anchor = parts[: len(parts) - (node.level - 1)]
+            base = ".".join([*anchor, node.module] if node.module else anchor)
+        else:
+            base = node.module or ""
+        modules.append(base)
+        # `from pkg import name` may import a submodule
+        modules.extend(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+    return modules
+
+
+def find_dependencies(module: str, src_dir: str = SRC_DIR) -> HandlerDependencies:
+    """
+    Compute the transitive src/ files and third-party packages for a handler module.
+
+    Args:
+        module: Handler module as used in the Lambda handler string, e.g. "handlers.pre_signup"
+        src_dir: Root of the Lambda source tree
+
+    Returns:
+        HandlerDependencies for the module
+    """
+    root = _module_file(module, src_dir)
+    if root is None:
+        raise ValueError(f"Handler module {module!r} not found under {src_dir}")
+
+    local_packages = {name for name in os.listdir(src_dir) if os.path.isdir(os.path.join(src_dir, name))}
+    # Test-only fallbacks import through the source root itself (`from src.utils...`)
+    root_package = os.path.basename(os.path.normpath(src_dir))
+    deps = HandlerDependencies(module=module)
+    pending = [root]
+    while pending:
+        rel_file = pending.pop()
+        if rel_file in deps.files:
+            continue
+        deps.files.add(rel_file)
+
+        # Importing a module runs its package __init__ files too
+        package_parts = _package_of(rel_file).split(".")
+        for i in range(1, len(package_parts) + 1):
+            init = _module_file(".".join(package_parts[:i]), src_dir)
+            if init is not None:
+                pending.append(init)
+
+        for imported in _imported_modules(rel_file, src_dir):
+            if imported.split(".")[0] == root_package:
+                imported = imported.partition(".")[2]
+            top = imported.split(".")[0]
+            if top in local_packages:
+                local = _module_file(imported, src_dir)
+                if local is not None:
+                    pending.append(local)
+            elif top and top not in sys.stdlib_module_names:
+                deps.packages.add(top)
+    return deps
+
+
+def stage_handler_asset(deps: HandlerDependencies, src_dir: str = SRC_DIR, assets_dir: str = ASSETS_DIR) -> str:
+    """
+    Copy a handler module's transitive src/ files into its own asset directory.
+
+    The directory is rebuilt on every synth; CDK hashes its contents, so a
+    function is only redeployed when code it actually imports changes.
+
+    Returns:
+        Path of the staged asset directory
+    """
+    target = os.path.join(assets_dir, deps.module.rsplit(".", 1)[-1])
+    shutil.rmtree(target, ignore_errors=True)
+    for rel_file in sorted(deps.files):
+        destination = os.path.join(target, rel_file)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        shutil.copyfile(os.path.join(src_dir, rel_file), destination)
+    return target
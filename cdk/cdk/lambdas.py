@@ -4,10 +4,12 @@ This module creates all Lambda functions used by the application:
 - Post-authentication and pre-signup Cognito triggers
 - Profile operations (create profile)
 - Campaign operations (create campaign with transaction support)
-- Order operations (report generation, unit reporting)
+- Order operations (report generation, unit reporting, bulk order import)
+- Customer search (searchCustomers and the orders stream worker for its index)
 - Account operations (update account)
 - Profile sharing (list my shares)
 - Catalog operations (list unit catalogs)
+- Payment method QR code operations and scheduled QR cleanup
 """
 
 import os
@@ -18,6 +20,8 @@ from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as lambda_
 from constructs import Construct
 
+from .lambda_bundling import OPTIONAL_LAYER_PACKAGES, find_dependencies, stage_handler_asset
+
 if TYPE_CHECKING:
     from aws_cdk import aws_dynamodb as dynamodb
     from aws_cdk import aws_s3 as s3
@@ -30,12 +34,16 @@ def create_lambda_functions(
     table: "dynamodb.Table",
     accounts_table: "dynamodb.Table",
     catalogs_table: "dynamodb.Table",
+    catalog_versions_table: "dynamodb.Table",
     profiles_table: "dynamodb.Table",
     campaigns_table: "dynamodb.Table",
     orders_table: "dynamodb.Table",
     shares_table: "dynamodb.Table",
     invites_table: "dynamodb.Table",
+    shared_campaigns_table: "dynamodb.Table",
+    customer_index_table: "dynamodb.Table",
     exports_bucket: "s3.Bucket",
+    static_assets_bucket: "s3.Bucket",
 ) -> dict[str, lambda_.Function | lambda_.LayerVersion]:
     """Create all Lambda functions for the stack.
 
@@ -46,12 +54,16 @@ def create_lambda_functions(
         table: Main DynamoDB table (legacy single-table)
         accounts_table: Accounts DynamoDB table
         catalogs_table: Catalogs DynamoDB table
+        catalog_versions_table: Catalog versions DynamoDB table
         profiles_table: Profiles DynamoDB table
         campaigns_table: Campaigns DynamoDB table
         orders_table: Orders DynamoDB table
         shares_table: Shares DynamoDB table
         invites_table: Invites DynamoDB table
+        shared_campaigns_table: Shared campaigns DynamoDB table
+        customer_index_table: Customer search index DynamoDB table
         exports_bucket: S3 bucket for exports
+        static_assets_bucket: S3 bucket for the SPA and public snapshots
 
     Returns:
         Dictionary containing all Lambda functions and layer
@@ -62,14 +74,24 @@ def create_lambda_functions(
         "EXPORTS_BUCKET": exports_bucket.bucket_name,
         "POWERTOOLS_SERVICE_NAME": "kernelworx",
         "LOG_LEVEL": "INFO",
+        "METRICS_NAMESPACE": "KernelWorx",  # EMF metrics from utils.metrics
+        # utils.profiling: deploy with -c profile_sample_rate=0.05 to capture profiles
+        "PROFILE_SAMPLE_RATE": str(scope.node.try_get_context("profile_sample_rate") or "0"),
+        # utils.logging: deploy with -c log_buffering=true to write each invocation's logs at once
+        "LOG_BUFFERING": str(scope.node.try_get_context("log_buffering") or "false"),
+        # utils.auth: reuse access decisions in warm containers (invalidated by shareVersion)
+        "PERMISSION_CACHE_TTL_SECONDS": "30",
         # New multi-table design table names
         "ACCOUNTS_TABLE_NAME": accounts_table.table_name,
         "CATALOGS_TABLE_NAME": catalogs_table.table_name,
+        "CATALOG_VERSIONS_TABLE_NAME": catalog_versions_table.table_name,
         "PROFILES_TABLE_NAME": profiles_table.table_name,
         "CAMPAIGNS_TABLE_NAME": campaigns_table.table_name,
         "ORDERS_TABLE_NAME": orders_table.table_name,
         "SHARES_TABLE_NAME": shares_table.table_name,
         "INVITES_TABLE_NAME": invites_table.table_name,
+        "SHARED_CAMPAIGNS_TABLE_NAME": shared_campaigns_table.table_name,
+        "CUSTOMER_INDEX_TABLE_NAME": customer_index_table.table_name,
     }
 
     # Create Lambda Layer for shared dependencies
@@ -88,17 +110,34 @@ def create_lambda_functions(
         description="Shared Python dependencies for Lambda functions",
     )
 
-    # Use only the src directory for Lambda code (not the entire repo)
-    lambda_code_path = os.path.join(os.path.dirname(__file__), "..", "..", "src")
+    # Heavy packages (openpyxl, Pillow) live in their own layers and are only
+    # attached to functions whose imports need them
+    optional_layers: dict[str, lambda_.LayerVersion] = {}
+    for layer_name in sorted(set(OPTIONAL_LAYER_PACKAGES.values())):
+        optional_layer_path = os.path.join(os.path.dirname(__file__), "..", f"lambda-layer-{layer_name}")
+        if not os.path.exists(optional_layer_path):
+            os.makedirs(optional_layer_path, exist_ok=True)
+        optional_layers[layer_name] = lambda_.LayerVersion(
+            scope,
+            f"{layer_name.title()}DependenciesLayer",
+            layer_version_name=rn(f"kernelworx-deps-{layer_name}"),
+            code=lambda_.Code.from_asset(optional_layer_path),
+            compatible_runtimes=[lambda_.Runtime.PYTHON_3_13],
+            description=f"Python dependencies for {layer_name} Lambda functions",
+        )
 
-    lambda_code = lambda_.Code.from_asset(
-        lambda_code_path,
-        exclude=[
-            "__pycache__",
-            "*.pyc",
-            ".pytest_cache",
-        ],
-    )
+    # Per-handler code assets built from each handler's transitive imports (see lambda_bundling)
+    handler_bundles: dict[str, tuple[lambda_.Code, list[lambda_.ILayerVersion]]] = {}
+
+    def handler_assets(handler: str) -> dict[str, Any]:
+        """Return handler, slim code asset and layers for a Lambda handler string."""
+        module = handler.rsplit(".", 1)[0]
+        if module not in handler_bundles:
+            deps = find_dependencies(module)
+            code = lambda_.Code.from_asset(stage_handler_asset(deps))
+            handler_bundles[module] = (code, [shared_layer, *(optional_layers[n] for n in deps.optional_layers)])
+        code, layers = handler_bundles[module]
+        return {"handler": handler, "code": code, "layers": layers}
 
     # Profile Sharing Lambda Functions
     # NOTE: create_profile_invite Lambda REMOVED - replaced with JS resolver
@@ -113,9 +152,7 @@ def create_lambda_functions(
         "ListMySharesFn",
         function_name=rn("kernelworx-list-my-shares"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.profile_sharing.list_my_shares",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.profile_sharing.list_my_shares"),
         timeout=Duration.seconds(30),
         memory_size=256,
         role=lambda_execution_role,
@@ -130,9 +167,7 @@ def create_lambda_functions(
         "CreateProfileFnV2",
         function_name=rn("kernelworx-create-profile"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.scout_operations.create_seller_profile",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.scout_operations.create_seller_profile"),
         timeout=Duration.seconds(30),
         memory_size=256,
         role=lambda_execution_role,
@@ -144,9 +179,7 @@ def create_lambda_functions(
         "RequestCampaignReportFnV2",
         function_name=rn("kernelworx-request-report"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.report_generation.request_campaign_report",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.report_generation.request_campaign_report"),
         timeout=Duration.seconds(60),  # Reports may take longer
         memory_size=512,  # More memory for Excel generation
         role=lambda_execution_role,
@@ -158,9 +191,7 @@ def create_lambda_functions(
         "UnitReportingFnV2",
         function_name=rn("kernelworx-unit-reporting"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.campaign_reporting.get_unit_report",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.campaign_reporting.get_unit_report"),
         timeout=Duration.seconds(60),  # May need time for large units
         memory_size=512,  # More memory for aggregation
         role=lambda_execution_role,
@@ -172,9 +203,7 @@ def create_lambda_functions(
         "ListUnitCatalogsFn",
         function_name=rn("kernelworx-list-unit-catalogs"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.list_unit_catalogs.list_unit_catalogs",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.list_unit_catalogs.list_unit_catalogs"),
         timeout=Duration.seconds(30),
         memory_size=512,
         role=lambda_execution_role,
@@ -187,9 +216,7 @@ def create_lambda_functions(
         "ListUnitCampaignCatalogsFn",
         function_name=rn("kernelworx-list-unit-campaign-catalogs"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.list_unit_catalogs.list_unit_campaign_catalogs",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.list_unit_catalogs.list_unit_campaign_catalogs"),
         timeout=Duration.seconds(30),
         memory_size=512,
         role=lambda_execution_role,
@@ -202,24 +229,122 @@ def create_lambda_functions(
         "CampaignOperationsFn",
         function_name=rn("kernelworx-campaign-operations"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.campaign_operations.create_campaign",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.campaign_operations.create_campaign"),
+        timeout=Duration.seconds(30),
+        memory_size=512,
+        role=lambda_execution_role,
+        environment=lambda_env,
+    )
+
+    # Dashboard Lambda (getMyDashboard: account, profiles, campaigns and totals in one call)
+    get_my_dashboard_fn = lambda_.Function(
+        scope,
+        "GetMyDashboardFn",
+        function_name=rn("kernelworx-get-my-dashboard"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.dashboard.get_my_dashboard"),
         timeout=Duration.seconds(30),
         memory_size=512,
         role=lambda_execution_role,
         environment=lambda_env,
     )
 
+    # Order Operations Lambda (createOrders: batch creation for offline order queues)
+    order_operations_fn = lambda_.Function(
+        scope,
+        "OrderOperationsFn",
+        function_name=rn("kernelworx-order-operations"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.order_operations.create_orders"),
+        timeout=Duration.seconds(30),
+        memory_size=512,
+        role=lambda_execution_role,
+        environment=lambda_env,
+    )
+
+    # Customer Search Lambdas (the orders stream event source for the worker is wired in the stack)
+    search_customers_fn = lambda_.Function(
+        scope,
+        "SearchCustomersFn",
+        function_name=rn("kernelworx-search-customers"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.customer_search.search_customers"),
+        timeout=Duration.seconds(10),
+        memory_size=256,
+        role=lambda_execution_role,
+        environment=lambda_env,
+    )
+
+    index_customer_orders_fn = lambda_.Function(
+        scope,
+        "IndexCustomerOrdersFn",
+        function_name=rn("kernelworx-index-customer-orders"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.customer_search.index_customer_orders"),
+        timeout=Duration.seconds(60),
+        memory_size=256,
+        role=lambda_execution_role,
+        environment=lambda_env,
+    )
+
+    # Public snapshot publisher (the table stream sources are wired in the stack)
+    publish_snapshots_fn = lambda_.Function(
+        scope,
+        "PublishSnapshotsFn",
+        function_name=rn("kernelworx-publish-snapshots"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.snapshot_publisher.publish_snapshots"),
+        timeout=Duration.seconds(60),
+        memory_size=512,
+        role=lambda_execution_role,
+        environment={**lambda_env, "STATIC_ASSETS_BUCKET": static_assets_bucket.bucket_name},
+        reserved_concurrent_executions=1,
+    )
+
+    # Order Import Lambdas (the S3 notification for the worker is wired in the stack)
+    request_order_import_fn = lambda_.Function(
+        scope,
+        "RequestOrderImportFn",
+        function_name=rn("kernelworx-request-order-import"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.order_import.request_order_import"),
+        timeout=Duration.seconds(10),
+        memory_size=256,
+        role=lambda_execution_role,
+        environment=lambda_env,
+    )
+
+    get_order_import_report_fn = lambda_.Function(
+        scope,
+        "GetOrderImportReportFn",
+        function_name=rn("kernelworx-get-order-import-report"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.order_import.get_order_import_report"),
+        timeout=Duration.seconds(10),
+        memory_size=256,
+        role=lambda_execution_role,
+        environment=lambda_env,
+    )
+
+    process_order_import_fn = lambda_.Function(
+        scope,
+        "ProcessOrderImportFn",
+        function_name=rn("kernelworx-process-order-import"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.order_import.process_order_import"),
+        timeout=Duration.minutes(5),
+        memory_size=1024,
+        role=lambda_execution_role,
+        environment=lambda_env,
+    )
+
     # Account Operations Lambda Functions
     update_my_account_fn = lambda_.Function(
         scope,
         "UpdateMyAccountFnV2",
         function_name=rn("kernelworx-update-account"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.account_operations.update_my_account",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.account_operations.update_my_account"),
         timeout=Duration.seconds(10),
         memory_size=256,
         role=lambda_execution_role,
@@ -232,9 +357,7 @@ def create_lambda_functions(
         "PostAuthenticationFnV2",
         function_name=rn("kernelworx-post-auth"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.post_authentication.lambda_handler",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.post_authentication.lambda_handler"),
         timeout=Duration.seconds(10),
         memory_size=256,
         role=lambda_execution_role,
@@ -249,9 +372,7 @@ def create_lambda_functions(
         "PreSignupFn",
         function_name=rn("kernelworx-pre-signup"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.pre_signup.lambda_handler",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.pre_signup.lambda_handler"),
         timeout=Duration.seconds(10),
         memory_size=256,
         role=lambda_execution_role,
@@ -264,9 +385,7 @@ def create_lambda_functions(
         "RequestQRUploadFn",
         function_name=rn("kernelworx-request-qr-upload"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.payment_methods_handlers.request_qr_upload",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.payment_methods_handlers.request_qr_upload"),
         timeout=Duration.seconds(10),
         memory_size=256,
         role=lambda_execution_role,
@@ -278,11 +397,9 @@ def create_lambda_functions(
         "ConfirmQRUploadFn",
         function_name=rn("kernelworx-confirm-qr-upload"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.payment_methods_handlers.confirm_qr_upload",
-        code=lambda_code,
-        layers=[shared_layer],
-        timeout=Duration.seconds(10),
-        memory_size=256,
+        **handler_assets("handlers.payment_methods_handlers.confirm_qr_upload"),
+        timeout=Duration.seconds(30),  # Re-encodes the uploaded image
+        memory_size=512,  # More CPU for image decoding
         role=lambda_execution_role,
         environment=lambda_env,
     )
@@ -292,9 +409,7 @@ def create_lambda_functions(
         "GeneratePresignedURLsFn",
         function_name=rn("kernelworx-generate-presigned-urls"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.payment_methods_handlers.generate_presigned_urls",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.payment_methods_handlers.generate_presigned_urls"),
         timeout=Duration.seconds(10),
         memory_size=256,
         role=lambda_execution_role,
@@ -306,9 +421,7 @@ def create_lambda_functions(
         "DeleteQRCodeFn",
         function_name=rn("kernelworx-delete-qr-code"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.payment_methods_handlers.delete_qr_code",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.payment_methods_handlers.delete_qr_code"),
         timeout=Duration.seconds(10),
         memory_size=256,
         role=lambda_execution_role,
@@ -320,24 +433,44 @@ def create_lambda_functions(
         "ValidatePaymentMethodFn",
         function_name=rn("kernelworx-validate-payment-method"),
         runtime=lambda_.Runtime.PYTHON_3_13,
-        handler="handlers.validate_payment_method.lambda_handler",
-        code=lambda_code,
-        layers=[shared_layer],
+        **handler_assets("handlers.validate_payment_method.lambda_handler"),
         timeout=Duration.seconds(10),
         memory_size=256,
         role=lambda_execution_role,
         environment=lambda_env,
     )
 
+    # Scheduled garbage collection of orphaned QR uploads (schedule is wired in the stack)
+    qr_code_cleanup_fn = lambda_.Function(
+        scope,
+        "QRCodeCleanupFn",
+        function_name=rn("kernelworx-qr-code-cleanup"),
+        runtime=lambda_.Runtime.PYTHON_3_13,
+        **handler_assets("handlers.qr_code_cleanup.lambda_handler"),
+        timeout=Duration.minutes(5),
+        memory_size=512,
+        role=lambda_execution_role,
+        environment={**lambda_env, "QR_CLEANUP_GRACE_HOURS": "24"},
+    )
+
     return {
         "shared_layer": shared_layer,
+        **{f"{name}_layer": layer for name, layer in optional_layers.items()},
         "list_my_shares_fn": list_my_shares_fn,
+        "get_my_dashboard_fn": get_my_dashboard_fn,
+        "search_customers_fn": search_customers_fn,
+        "index_customer_orders_fn": index_customer_orders_fn,
+        "publish_snapshots_fn": publish_snapshots_fn,
         "create_profile_fn": create_profile_fn,
         "request_campaign_report_fn": request_campaign_report_fn,
         "unit_reporting_fn": unit_reporting_fn,
         "list_unit_catalogs_fn": list_unit_catalogs_fn,
         "list_unit_campaign_catalogs_fn": list_unit_campaign_catalogs_fn,
         "campaign_operations_fn": campaign_operations_fn,
+        "order_operations_fn": order_operations_fn,
+        "request_order_import_fn": request_order_import_fn,
+        "get_order_import_report_fn": get_order_import_report_fn,
+        "process_order_import_fn": process_order_import_fn,
         "update_my_account_fn": update_my_account_fn,
         "post_auth_fn": post_auth_fn,
         "pre_signup_fn": pre_signup_fn,
@@ -346,4 +479,5 @@ def create_lambda_functions(
         "generate_presigned_urls_fn": generate_presigned_urls_fn,
         "delete_qr_code_fn": delete_qr_code_fn,
         "validate_payment_method_fn": validate_payment_method_fn,
+        "qr_code_cleanup_fn": qr_code_cleanup_fn,
     }
@@ -0,0 +1,109 @@
+"""Tests for per-handler Lambda code assets."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cdk.lambda_bundling import SRC_DIR, find_dependencies, stage_handler_asset
+
+
+@pytest.fixture
+def src_tree(tmp_path: Path) -> Path:
+    """Create a small Lambda source tree mirroring src/."""
+    files = {
+        "__init__.py": "",
+        "handlers/__init__.py": "",
+        "handlers/trigger.py": (
+            "import json\n"
+            "from typing import TYPE_CHECKING\n"
+            "import boto3\n"
+            "if TYPE_CHECKING:\n"
+            "    from mypy_boto3_s3 import S3Client\n"
+            "try:\n"
+            "    from utils.logging import get_logger\n"
+            "except ModuleNotFoundError:\n"
+            "    from ..utils.logging import get_logger\n"
+        ),
+        "handlers/report.py": (
+            "try:\n"
+            "    from utils import auth\n"
+            "except ModuleNotFoundError:\n"
+            "    from src.utils import auth\n"
+            "def build():\n"
+            "    from openpyxl import Workbook\n"
+        ),
+        "utils/__init__.py": "",
+        "utils/logging.py": "import os\n",
+        "utils/auth.py": "from .errors import AppError\n",
+        "utils/errors.py": "",
+        "utils/unused.py": "from PIL import Image\n",
+    }
+    for rel_path, content in files.items():
+        path = tmp_path / "src" / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path / "src"
+
+
+class TestFindDependencies:
+    """Tests for transitive import discovery."""
+
+    def test_minimal_closure_for_trigger(self, src_tree: Path) -> None:
+        """Absolute and relative imports resolve to the same files; unused modules are left out."""
+        deps = find_dependencies("handlers.trigger", str(src_tree))
+
+        assert deps.files == {
+            "handlers/__init__.py",
+            "handlers/trigger.py",
+            "utils/__init__.py",
+            "utils/logging.py",
+        }
+        # Stdlib and TYPE_CHECKING-only imports are not runtime packages
+        assert deps.packages == {"boto3"}
+        assert deps.optional_layers == []
+
+    def test_lazy_imports_select_optional_layer(self, src_tree: Path) -> None:
+        """Function-level imports and `from pkg import submodule` are followed."""
+        deps = find_dependencies("handlers.report", str(src_tree))
+
+        assert {"utils/auth.py", "utils/errors.py"} <= deps.files
+        assert "utils/unused.py" not in deps.files
+        assert deps.packages == {"openpyxl"}
+        assert deps.optional_layers == ["reports"]
+
+    def test_unknown_module(self, src_tree: Path) -> None:
+        """A handler string that points at no file fails synth early."""
+        with pytest.raises(ValueError, match="handlers.missing"):
+            find_dependencies("handlers.missing", str(src_tree))
+
+    def test_real_cognito_trigger_is_slim(self) -> None:
+        """The pre-signup trigger ships neither reporting nor payment-method code."""
+        deps = find_dependencies("handlers.pre_signup", SRC_DIR)
+
+        assert not any("report" in f or "payment_methods" in f for f in deps.files)
+        assert deps.optional_layers == []
+
+    def test_real_report_handler_gets_reports_layer(self) -> None:
+        """Only the report Lambda needs openpyxl."""
+        assert find_dependencies("handlers.report_generation", SRC_DIR).optional_layers == ["reports"]
+
+
+class TestStageHandlerAsset:
+    """Tests for staging asset directories."""
+
+    def test_copies_only_dependencies(self, src_tree: Path, tmp_path: Path) -> None:
+        """The staged directory contains exactly the handler's files and is rebuilt each time."""
+        assets_dir = tmp_path / "assets"
+        stale = assets_dir / "trigger" / "utils" / "stale.py"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("")
+
+        deps = find_dependencies("handlers.trigger", str(src_tree))
+        target = stage_handler_asset(deps, str(src_tree), str(assets_dir))
+
+        staged = {
+            os.path.relpath(os.path.join(root, name), target) for root, _, names in os.walk(target) for name in names
+        }
+        assert target == str(assets_dir / "trigger")
+        assert staged == deps.files
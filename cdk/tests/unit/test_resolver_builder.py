@@ -253,6 +253,19 @@ class TestCreatePipelineResolverOnScope:
         call_args = mock_appsync.Resolver.call_args
         assert call_args[0][1] == "DeleteCatalogPipelineResolver"
 
+    def test_create_pipeline_resolver_on_scope_with_custom_scope(self, builder, mock_datasources):
+        """Pipeline resolver on scope can be created under another construct."""
+        with patch("cdk.appsync.resolver_builder.appsync") as mock_appsync:
+            builder.create_pipeline_resolver_on_scope(
+                field_name="createCatalog",
+                type_name="Mutation",
+                functions=[],
+                code_file=Path("/path/to/pipeline.js"),
+                scope=mock_datasources["catalogs"],
+            )
+
+        assert mock_appsync.Resolver.call_args[0][0] is mock_datasources["catalogs"]
+
 
 class TestCreateVtlPipelineResolver:
     """Tests for VTL pipeline resolver creation."""
@@ -476,3 +489,89 @@ class TestCreateBatchResolvers:
 
         call_args = builder.lambda_datasources["campaign_operations"].create_resolver.call_args
         assert call_args[0][0] == "CustomCampaignResolver"
+
+
+class TestResolverCaching:
+    """Tests for per-resolver caching."""
+
+    def test_caching_is_dropped_without_api_cache(self, builder):
+        """Without an API cache, resolvers are created uncached."""
+        caching = MagicMock(name="caching")
+
+        resolver = builder.create_lambda_resolver(
+            field_name="getUnitReport",
+            type_name="Query",
+            lambda_datasource_name="request_campaign_report",
+            caching=caching,
+        )
+
+        call_kwargs = builder.lambda_datasources["request_campaign_report"].create_resolver.call_args[1]
+        assert call_kwargs["caching_config"] is None
+        resolver.node.add_dependency.assert_not_called()
+
+    def test_caching_is_applied_with_api_cache(self, mock_api, mock_datasources, mock_lambda_datasources, mock_scope):
+        """With an API cache, the caching config is passed through and the resolver depends on the cache."""
+        api_cache = MagicMock(name="api_cache")
+        builder = ResolverBuilder(mock_api, mock_datasources, mock_lambda_datasources, mock_scope, api_cache=api_cache)
+        caching = MagicMock(name="caching")
+
+        with patch("cdk.appsync.resolver_builder.appsync") as mock_appsync:
+            mock_appsync.MappingTemplate.from_file.side_effect = lambda x: f"template:{x}"
+
+            resolver = builder.create_vtl_resolver(
+                field_name="getSharedCampaign",
+                type_name="Query",
+                datasource_name="campaigns",
+                request_template=Path("/path/to/request.vtl"),
+                response_template=Path("/path/to/response.vtl"),
+                caching=caching,
+            )
+
+        call_kwargs = mock_datasources["campaigns"].create_resolver.call_args[1]
+        assert call_kwargs["caching_config"] is caching
+        resolver.node.add_dependency.assert_called_once_with(api_cache)
+
+    def test_uncached_resolver_does_not_depend_on_api_cache(
+        self, mock_api, mock_datasources, mock_lambda_datasources, mock_scope
+    ):
+        """Resolvers without a caching config are unaffected by the API cache."""
+        builder = ResolverBuilder(
+            mock_api, mock_datasources, mock_lambda_datasources, mock_scope, api_cache=MagicMock(name="api_cache")
+        )
+
+        with patch("cdk.appsync.resolver_builder.appsync") as mock_appsync:
+            mock_appsync.Code.from_asset.return_value = "js_code"
+
+            resolver = builder.create_js_resolver_on_api(
+                field_name="listMyCatalogs",
+                type_name="Query",
+                datasource_name="catalogs",
+                code_file=Path("/path/to/resolver.js"),
+            )
+
+        assert mock_api.create_resolver.call_args[1]["caching_config"] is None
+        resolver.node.add_dependency.assert_not_called()
+
+    def test_create_batch_resolvers_passes_caching(
+        self, mock_api, mock_datasources, mock_lambda_datasources, mock_scope
+    ):
+        """Batch creation passes each config's caching through."""
+        builder = ResolverBuilder(
+            mock_api, mock_datasources, mock_lambda_datasources, mock_scope, api_cache=MagicMock(name="api_cache")
+        )
+        caching = MagicMock(name="caching")
+
+        builder.create_batch_resolvers(
+            [
+                {
+                    "type": "lambda",
+                    "field_name": "createCampaign",
+                    "type_name": "Mutation",
+                    "lambda_datasource_name": "campaign_operations",
+                    "caching": caching,
+                }
+            ]
+        )
+
+        call_kwargs = mock_lambda_datasources["campaign_operations"].create_resolver.call_args[1]
+        assert call_kwargs["caching_config"] is caching
@@ -195,7 +195,8 @@ npm run build
 # ============================================================
 echo ""
 echo "☁️  Uploading to S3..."
-aws s3 sync dist "s3://${S3_BUCKET}" --delete --region "$REGION"
+# snapshots/ is owned by the snapshot publisher Lambda, not the build
+aws s3 sync dist "s3://${S3_BUCKET}" --delete --exclude "snapshots/*" --region "$REGION"
 
 # ============================================================
 # Step 5: Invalidate CloudFront cache
@@ -0,0 +1,125 @@
+"""One-off migration: give existing catalogs an immutable version.
+
+Usage:
+    uv run python scripts/backfill_catalog_versions.py [--dry-run]
+
+Prereqs:
+- AWS credentials for the target account
+- Environment variables CATALOGS_TABLE_NAME and CATALOG_VERSIONS_TABLE_NAME set
+
+createCatalog and updateCatalog now write each catalog's products to a new
+item in the catalog versions table and point the catalog's currentVersion at
+it; orders record that version. Catalogs written before then have no
+currentVersion and are priced from their own products. This script writes a
+version for each of them and points the catalog at it. The pointer update is
+conditional on the catalog not having been updated since it was read, so a
+catalog edited during the backfill keeps the version its edit wrote (the
+backfill's version is then simply unreferenced). Safe to re-run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import secrets
+import time
+from typing import Any, Dict, Iterator
+
+import boto3
+from botocore.exceptions import ClientError
+
+CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _ulid() -> str:
+    """A ULID like AppSync's util.autoUlid(): 48-bit millisecond time + 80 random bits."""
+    value = (int(time.time() * 1000) << 80) | secrets.randbits(80)
+    return "".join(CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+
+def _scan(table: Any, **params: Any) -> Iterator[Dict[str, Any]]:
+    last_key: Dict[str, Any] | None = None
+    while True:
+        if last_key:
+            params["ExclusiveStartKey"] = last_key
+        response = table.scan(**params)
+        yield from response.get("Items", [])
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+
+
+def _version_item(catalog: Dict[str, Any], version: str) -> Dict[str, Any]:
+    products = catalog.get("products") or []
+    item = {
+        "catalogId": catalog["catalogId"],
+        "version": version,
+        "catalogName": catalog.get("catalogName"),
+        "products": products,
+        "productsById": {product["productId"]: product for product in products},
+        "createdAt": catalog.get("updatedAt") or catalog.get("createdAt"),
+    }
+    if catalog.get("ownerAccountId"):
+        item["ownerAccountId"] = catalog["ownerAccountId"]
+    return item
+
+
+def migrate(catalogs_table_name: str, catalog_versions_table_name: str, dry_run: bool) -> None:
+    dynamodb = boto3.resource("dynamodb")
+    catalogs = dynamodb.Table(catalogs_table_name)
+    catalog_versions = dynamodb.Table(catalog_versions_table_name)
+
+    scanned = versioned = skipped = 0
+    for catalog in _scan(catalogs, FilterExpression="attribute_not_exists(currentVersion)"):
+        scanned += 1
+        version = _ulid()
+        if dry_run:
+            print(f"[dry-run] {catalog['catalogId']}: {len(catalog.get('products') or [])} products -> {version}")
+            continue
+
+        # Version first: the catalog must never point at a version that does not exist
+        catalog_versions.put_item(
+            Item=_version_item(catalog, version), ConditionExpression="attribute_not_exists(version)"
+        )
+        condition = "attribute_not_exists(currentVersion) AND "
+        values: Dict[str, Any] = {":version": version}
+        if "updatedAt" in catalog:
+            condition += "updatedAt = :seen"
+            values[":seen"] = catalog["updatedAt"]
+        else:
+            condition += "attribute_not_exists(updatedAt)"
+        try:
+            catalogs.update_item(
+                Key={"catalogId": catalog["catalogId"]},
+                UpdateExpression="SET currentVersion = :version",
+                ConditionExpression=condition,
+                ExpressionAttributeValues=values,
+            )
+            versioned += 1
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+            # Updated (and so versioned) or deleted since the scan read it
+            print(f"Skipping {catalog['catalogId']}: changed during backfill")
+            skipped += 1
+
+    print(f"Scanned {scanned} unversioned catalogs; versioned {versioned}, skipped {skipped}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them")
+    args = parser.parse_args()
+
+    catalogs_table_name = os.getenv("CATALOGS_TABLE_NAME")
+    if not catalogs_table_name:
+        raise RuntimeError("CATALOGS_TABLE_NAME is not set; aborting migration")
+    catalog_versions_table_name = os.getenv("CATALOG_VERSIONS_TABLE_NAME")
+    if not catalog_versions_table_name:
+        raise RuntimeError("CATALOG_VERSIONS_TABLE_NAME is not set; aborting migration")
+
+    migrate(catalogs_table_name, catalog_versions_table_name, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
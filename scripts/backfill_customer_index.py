@@ -0,0 +1,97 @@
+"""One-off migration: build the customer search index from existing orders.
+
+Usage (dev only):
+    uv run python scripts/backfill_customer_index.py [--dry-run]
+
+Prereqs:
+- AWS credentials for the target account
+- Environment variables ORDERS_TABLE_NAME and CUSTOMER_INDEX_TABLE_NAME set
+
+The index is maintained from the orders table stream, which only carries
+writes made after it was enabled. This script scans the orders table and
+indexes every order as if it had just been created. Index updates are
+idempotent, so it is safe to run while the stream worker is live and to run
+again after an interruption. Run it again to redrive orders whose stream
+records landed in the IndexCustomerOrders failure queue, and to add the
+per-token order sets to customers indexed before shard items held only
+markers (the old one-character SHARD#<c> items are no longer read).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import boto3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.customer_index import IndexEntry, index_order_change  # noqa: E402
+
+ORDER_ATTRIBUTES = (
+    "campaignId",
+    "orderId",
+    "profileId",
+    "customerName",
+    "customerPhone",
+    "customerAddress",
+    "orderDate",
+    "createdAt",
+)
+
+
+def migrate(orders_table_name: str, index_table_name: str, dry_run: bool) -> None:
+    dynamodb = boto3.resource("dynamodb")
+    orders = dynamodb.Table(orders_table_name)
+    index = dynamodb.Table(index_table_name)
+
+    scanned = 0
+    indexed = 0
+    last_key: Dict[str, Any] | None = None
+
+    while True:
+        params: Dict[str, Any] = {
+            "ProjectionExpression": ", ".join(f"#a{i}" for i in range(len(ORDER_ATTRIBUTES))),
+            "ExpressionAttributeNames": {f"#a{i}": name for i, name in enumerate(ORDER_ATTRIBUTES)},
+        }
+        if last_key:
+            params["ExclusiveStartKey"] = last_key
+
+        response = orders.scan(**params)
+        items = response.get("Items", [])
+        scanned += len(items)
+
+        for order in items:
+            if IndexEntry.from_order(order) is None:
+                continue
+            indexed += 1
+            if dry_run:
+                continue
+            index_order_change(index, None, order)
+
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            break
+
+    action = "would index" if dry_run else "indexed"
+    print(f"Scanned {scanned} orders; {action} {indexed} orders with a customer name")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--dry-run", action="store_true", help="Count orders to index without writing")
+    args = parser.parse_args()
+
+    orders_table_name = os.getenv("ORDERS_TABLE_NAME")
+    index_table_name = os.getenv("CUSTOMER_INDEX_TABLE_NAME")
+    if not orders_table_name or not index_table_name:
+        raise RuntimeError("ORDERS_TABLE_NAME and CUSTOMER_INDEX_TABLE_NAME must be set; aborting migration")
+
+    migrate(orders_table_name, index_table_name, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
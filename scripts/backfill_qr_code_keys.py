@@ -0,0 +1,114 @@
+"""One-off migration: record the real S3 key on every payment method with a QR code.
+
+Usage (dev only):
+    uv run python scripts/backfill_qr_code_keys.py [--dry-run]
+
+Prereqs:
+- AWS credentials for the target account
+- Environment variables ACCOUNTS_TABLE_NAME and EXPORTS_BUCKET set
+
+Older payment methods stored a presigned URL (or another non-key value) in
+qrCodeUrl, while the QR image itself lived under a slug-based key
+(payment-qr-codes/{account_id}/{slug}.{ext}). Reads then had to probe S3 for the
+file. This script scans the accounts table, resolves each legacy QR image with a
+single prefix listing, and stores the key in qrCodeUrl so that later reads and
+deletes use the stored key directly. Methods whose image no longer exists have
+qrCodeUrl cleared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.payment_methods import find_legacy_qr_key, is_qr_s3_key  # noqa: E402
+
+
+def backfill_methods(account_id: str, methods: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Return updated payment methods, or None if nothing needs to change."""
+    changed = False
+    updated: List[Dict[str, Any]] = []
+
+    for method in methods:
+        method_copy = dict(method)
+        stored = method_copy.get("qrCodeUrl")
+        if stored and not is_qr_s3_key(stored):
+            method_copy["qrCodeUrl"] = find_legacy_qr_key(account_id, method_copy.get("name", ""))
+            changed = True
+        updated.append(method_copy)
+
+    return updated if changed else None
+
+
+def migrate(table_name: str, dry_run: bool) -> None:
+    table = boto3.resource("dynamodb").Table(table_name)
+
+    updated = 0
+    scanned = 0
+    last_key: Dict[str, Any] | None = None
+
+    while True:
+        params: Dict[str, Any] = {"ProjectionExpression": "accountId, preferences"}
+        if last_key:
+            params["ExclusiveStartKey"] = last_key
+
+        response = table.scan(**params)
+        items = response.get("Items", [])
+        scanned += len(items)
+
+        for item in items:
+            methods = item.get("preferences", {}).get("paymentMethods", [])
+            account_key = item["accountId"]
+            account_id = account_key.removeprefix("ACCOUNT#")
+
+            new_methods = backfill_methods(account_id, methods)
+            if new_methods is None:
+                continue
+
+            if dry_run:
+                print(f"[dry-run] {account_key}: {[m.get('qrCodeUrl') for m in new_methods]}")
+                updated += 1
+                continue
+
+            try:
+                table.update_item(
+                    Key={"accountId": account_key},
+                    UpdateExpression="SET preferences.paymentMethods = :methods",
+                    ConditionExpression="attribute_exists(accountId)",
+                    ExpressionAttributeValues={":methods": new_methods},
+                )
+                updated += 1
+            except ClientError as e:
+                print(f"Failed to update {account_key}: {e}")
+
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            break
+
+    print(f"Scanned {scanned} accounts; updated {updated} accounts with legacy QR code references")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them")
+    args = parser.parse_args()
+
+    table_name = os.getenv("ACCOUNTS_TABLE_NAME")
+    if not table_name:
+        raise RuntimeError("ACCOUNTS_TABLE_NAME is not set; aborting migration")
+    if not os.getenv("EXPORTS_BUCKET"):
+        raise RuntimeError("EXPORTS_BUCKET is not set; aborting migration")
+
+    migrate(table_name, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
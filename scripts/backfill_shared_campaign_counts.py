@@ -0,0 +1,142 @@
+"""One-off migration: seed the per-account shared campaign counter.
+
+Usage:
+    uv run python scripts/backfill_shared_campaign_counts.py [--dry-run]
+
+Prereqs:
+- AWS credentials for the target account
+- Environment variables ACCOUNTS_TABLE_NAME and SHARED_CAMPAIGNS_TABLE_NAME set
+
+createSharedCampaign enforces the 50-per-user limit with a sharedCampaignCount
+attribute on the creator's account item, incremented in the same transaction
+as the shared campaign put and decremented on delete. Accounts that created
+shared campaigns before the counter existed have no count (or a drifted one
+if they deleted in between). This script counts each creator's shared
+campaigns and stores the result. Each write is conditional on the counter not
+having changed since it was read, so a create or delete racing the backfill
+makes that account retry instead of being overwritten. Safe to re-run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from collections import Counter
+from typing import Any, Dict, Iterator, Optional, Set
+
+import boto3
+from botocore.exceptions import ClientError
+
+MAX_ATTEMPTS = 5
+
+
+def _scan(table: Any, **params: Any) -> Iterator[Dict[str, Any]]:
+    last_key: Dict[str, Any] | None = None
+    while True:
+        if last_key:
+            params["ExclusiveStartKey"] = last_key
+        response = table.scan(**params)
+        yield from response.get("Items", [])
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+
+
+def _count_created(shared_campaigns: Any, account_key: str) -> int:
+    """Shared campaigns created by an account (GSI1: createdBy + createdAt)."""
+    count = 0
+    params: Dict[str, Any] = {
+        "IndexName": "GSI1",
+        "KeyConditionExpression": "createdBy = :createdBy",
+        "ExpressionAttributeValues": {":createdBy": account_key},
+        "Select": "COUNT",
+    }
+    while True:
+        response = shared_campaigns.query(**params)
+        count += response.get("Count", 0)
+        if "LastEvaluatedKey" not in response:
+            return count
+        params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _seed(accounts: Any, shared_campaigns: Any, account_key: str, dry_run: bool) -> Optional[int]:
+    """Store an account's counted shared campaigns; returns the count, or None if the account is missing."""
+    for _ in range(MAX_ATTEMPTS):
+        account = accounts.get_item(
+            Key={"accountId": account_key}, ProjectionExpression="accountId, sharedCampaignCount", ConsistentRead=True
+        ).get("Item")
+        if not account:
+            return None
+        seen = account.get("sharedCampaignCount")
+        count = _count_created(shared_campaigns, account_key)
+        if seen == count:
+            return count
+        if dry_run:
+            print(f"[dry-run] {account_key}: {seen} -> {count}")
+            return count
+
+        condition = "sharedCampaignCount = :seen" if seen is not None else "attribute_not_exists(sharedCampaignCount)"
+        values: Dict[str, Any] = {":count": count}
+        if seen is not None:
+            values[":seen"] = seen
+        try:
+            accounts.update_item(
+                Key={"accountId": account_key},
+                UpdateExpression="SET sharedCampaignCount = :count",
+                ConditionExpression=f"attribute_exists(accountId) AND {condition}",
+                ExpressionAttributeValues=values,
+            )
+            return count
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+            # The account created or deleted a shared campaign meanwhile; count again
+    raise RuntimeError(f"{account_key} kept changing; re-run the backfill")
+
+
+def migrate(accounts_table_name: str, shared_campaigns_table_name: str, dry_run: bool) -> None:
+    dynamodb = boto3.resource("dynamodb")
+    accounts = dynamodb.Table(accounts_table_name)
+    shared_campaigns = dynamodb.Table(shared_campaigns_table_name)
+
+    creators = Counter(
+        item["createdBy"] for item in _scan(shared_campaigns, ProjectionExpression="createdBy") if item.get("createdBy")
+    )
+    # Accounts that already carry a counter are re-checked too, in case it drifted to a creator with none left
+    counted: Set[str] = {
+        item["accountId"]
+        for item in _scan(
+            accounts,
+            ProjectionExpression="accountId",
+            FilterExpression="attribute_exists(sharedCampaignCount)",
+        )
+    }
+
+    seeded = 0
+    for account_key in sorted(set(creators) | counted):
+        count = _seed(accounts, shared_campaigns, account_key, dry_run)
+        if count is None:
+            print(f"Skipping {account_key}: account not found ({creators[account_key]} shared campaigns)")
+            continue
+        seeded += 1
+
+    print(f"Scanned {sum(creators.values())} shared campaigns; seeded counters for {seeded} accounts")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them")
+    args = parser.parse_args()
+
+    accounts_table_name = os.getenv("ACCOUNTS_TABLE_NAME")
+    if not accounts_table_name:
+        raise RuntimeError("ACCOUNTS_TABLE_NAME is not set; aborting migration")
+    shared_campaigns_table_name = os.getenv("SHARED_CAMPAIGNS_TABLE_NAME")
+    if not shared_campaigns_table_name:
+        raise RuntimeError("SHARED_CAMPAIGNS_TABLE_NAME is not set; aborting migration")
+
+    migrate(accounts_table_name, shared_campaigns_table_name, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
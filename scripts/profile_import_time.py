@@ -0,0 +1,137 @@
+"""Measure Lambda cold-start import time for every handler module.
+
+Usage:
+    uv run python scripts/profile_import_time.py [--runs 5] [--budget-ms 400]
+        [--handler-budget report_generation=600] [--top 10] [--json]
+
+Each handler module listed in cdk/cdk/cdk_stack.py is imported in a fresh
+interpreter with `python -X importtime`, from src/ the way the Lambda runtime
+loads it (`handlers.<module>` with `utils` on the path). The fastest of
+several runs is kept to damp noise, and the slowest imports are listed so
+regressions are easy to attribute (e.g. a heavy dependency moved to module
+level). Exits non-zero when any handler exceeds its budget, so CI can catch
+cold-start regressions.
+
+Heavy, rarely used dependencies (openpyxl, PIL) are imported inside the
+functions that need them and must not show up here.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+CDK_STACK = ROOT / "cdk" / "cdk" / "cdk_stack.py"
+
+DEFAULT_BUDGET_MS = 400.0
+DEFAULT_RUNS = 5
+
+_HANDLER_RE = re.compile(r'"handlers\.([a-z_]+)\.[a-z_]+"')
+# "import time:       123 |       4567 |   package.module"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def handler_modules() -> List[str]:
+    """Return the handler modules deployed by the CDK stack, in a stable order."""
+    return sorted(set(_HANDLER_RE.findall(CDK_STACK.read_text())))
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, float]]:
+    """Import handlers.<module> in a fresh interpreter.
+
+    Returns:
+        (cumulative ms for the handler module, self ms per imported module)
+    """
+    target = f"handlers.{module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{result.stderr[-2000:]}")
+
+    cumulative_ms = 0.0
+    self_ms: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        own_us, cumulative_us, _, name = match.groups()
+        self_ms[name] = int(own_us) / 1000
+        if name == target:
+            cumulative_ms = int(cumulative_us) / 1000
+    return cumulative_ms, self_ms
+
+
+def profile(module: str, runs: int) -> Tuple[float, Dict[str, float]]:
+    """Return the fastest of several import runs."""
+    return min((import_profile(module) for _ in range(runs)), key=lambda run: run[0])
+
+
+def parse_budgets(values: List[str]) -> Dict[str, float]:
+    """Parse --handler-budget module=ms overrides."""
+    budgets: Dict[str, float] = {}
+    for value in values:
+        module, _, ms = value.partition("=")
+        if not module or not ms:
+            raise argparse.ArgumentTypeError(f"Expected module=ms, got {value!r}")
+        budgets[module] = float(ms)
+    return budgets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="imports per handler (fastest is kept)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="default per-handler budget")
+    parser.add_argument(
+        "--handler-budget", action="append", default=[], metavar="MODULE=MS", help="per-handler budget override"
+    )
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list per handler")
+    parser.add_argument("--json", action="store_true", help="print a JSON report instead of text")
+    parser.add_argument("modules", nargs="*", help="handler modules to profile (default: all deployed handlers)")
+    args = parser.parse_args()
+
+    budgets = parse_budgets(args.handler_budget)
+    report = []
+    for module in args.modules or handler_modules():
+        cumulative_ms, self_ms = profile(module, args.runs)
+        budget = budgets.get(module, args.budget_ms)
+        top = sorted(self_ms.items(), key=lambda item: item[1], reverse=True)[: args.top]
+        report.append(
+            {
+                "handler": module,
+                "importMs": round(cumulative_ms, 1),
+                "budgetMs": budget,
+                "overBudget": cumulative_ms > budget,
+                "topImports": [{"module": name, "selfMs": round(ms, 1)} for name, ms in top],
+            }
+        )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for entry in report:
+            status = "OVER" if entry["overBudget"] else "ok"
+            print(f"{entry['handler']:<36} {entry['importMs']:>8.1f} ms  (budget {entry['budgetMs']:.0f} ms) {status}")
+            for top_import in entry["topImports"]:
+                print(f"    {top_import['selfMs']:>8.1f} ms  {top_import['module']}")
+
+    over = [entry["handler"] for entry in report if entry["overBudget"]]
+    if over:
+        print(f"Import-time budget exceeded: {', '.join(over)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
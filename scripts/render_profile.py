@@ -0,0 +1,61 @@
+"""Render a handler profile captured by utils.profiling.
+
+Usage:
+    uv run python scripts/render_profile.py s3://<exports-bucket>/profiles/<handler>/<date>/<file>.pstats > stacks.txt
+    uv run python scripts/render_profile.py profile.pstats --format top --limit 30
+
+Profiles are written when a Lambda runs with PROFILE_SAMPLE_RATE set; the S3
+key is in the "Profile captured" log line. The default output is collapsed
+stacks ("a;b;c <microseconds>"), which flamegraph.pl, speedscope and
+inferno read directly:
+    flamegraph.pl stacks.txt > profile.svg
+
+`--format top` prints the usual pstats table instead, and `--save` keeps a
+local copy of a downloaded profile for snakeviz and friends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pstats
+import sys
+import tempfile
+from pathlib import Path
+
+import boto3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.profiling import collapsed_stacks  # noqa: E402
+
+
+def fetch_profile(source: str, save: str | None) -> str:
+    """Return a local path for a profile given as a file path or s3:// URL."""
+    if not source.startswith("s3://"):
+        return source
+    bucket, _, key = source[len("s3://") :].partition("/")
+    target = save or tempfile.NamedTemporaryFile(suffix=".pstats", delete=False).name
+    boto3.client("s3").download_file(bucket, key, target)
+    return target
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="local .pstats file or s3://bucket/key")
+    parser.add_argument("--format", choices=("collapsed", "top"), default="collapsed")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key for --format top")
+    parser.add_argument("--limit", type=int, default=25, help="rows to print for --format top")
+    parser.add_argument("--max-depth", type=int, default=64, help="deepest stack to emit for --format collapsed")
+    parser.add_argument("--save", help="where to keep a profile downloaded from S3")
+    args = parser.parse_args()
+
+    stats = pstats.Stats(fetch_profile(args.source, args.save), stream=sys.stdout)
+    if args.format == "top":
+        stats.sort_stats(args.sort).print_stats(args.limit)
+    else:
+        sys.stdout.write("\n".join(collapsed_stacks(stats, max_depth=args.max_depth)) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
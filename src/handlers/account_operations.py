@@ -4,7 +4,6 @@ Account operations Lambda handlers.
 Handles user account management including updating DynamoDB account metadata.
 """
 
-import json
 from datetime import datetime, timezone
 from typing import Any, Dict
 
@@ -15,11 +14,13 @@ try:  # pragma: no cover
     from utils.dynamodb import tables
     from utils.errors import AppError, ErrorCode
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
     from utils.validation import validate_unit_number
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.dynamodb import tables
     from ..utils.errors import AppError, ErrorCode
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
     from ..utils.validation import validate_unit_number
 
 logger = get_logger(__name__)
@@ -60,6 +61,7 @@ def _build_update_expressions(
     return update_expressions, expression_attribute_names, expression_attribute_values
 
 
+@handler_middleware
 def update_my_account(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Update the authenticated user's account metadata in DynamoDB.
@@ -105,7 +107,8 @@ def update_my_account(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
 
         updated_item = response["Attributes"]
-        logger.info(f"Updated account: {json.dumps(updated_item, default=str)}")
+        logger.info("Updated account", account_id=account_id)
+        logger.debug("Updated account item: %s", updated_item)
 
         return {
             "accountId": updated_item.get("accountId"),
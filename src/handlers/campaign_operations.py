@@ -4,8 +4,6 @@ import os
 import uuid
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import boto3
-
 if TYPE_CHECKING:  # pragma: no cover
     from mypy_boto3_dynamodb.client import DynamoDBClient
     from mypy_boto3_dynamodb.type_defs import TransactWriteItemsOutputTypeDef
@@ -13,33 +11,39 @@ if TYPE_CHECKING:  # pragma: no cover
 # Handle both Lambda (absolute) and unit test (relative) imports
 try:  # pragma: no cover
     from utils.auth import check_profile_access
-    from utils.dynamodb import tables
+    from utils.aws_clients import get_dynamodb_client
+    from utils.dynamodb import cached_query_first, tables
     from utils.ids import ensure_catalog_id, ensure_profile_id
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
     from utils.validation import validate_required_fields, validate_unit_fields
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.auth import check_profile_access
-    from ..utils.dynamodb import tables
+    from ..utils.aws_clients import get_dynamodb_client
+    from ..utils.dynamodb import cached_query_first, tables
     from ..utils.ids import ensure_catalog_id, ensure_profile_id
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
     from ..utils.validation import validate_required_fields, validate_unit_fields
 
 logger = get_logger(__name__)
 
 
 def _get_dynamodb_client() -> "DynamoDBClient":
-    return boto3.client("dynamodb")
+    client: "DynamoDBClient" = get_dynamodb_client()
+    return client
 
 
-# Expose a module-level client proxy so unit tests can patch methods like transact_write_items
+# Expose a module-level client proxy so unit tests can patch methods like transact_write_items.
+# The client is resolved on use so importing the module does not build one.
 class _DynamoClientProxy:
-    def __init__(self) -> None:
-        self._client = _get_dynamodb_client()
-        # Expose the client's exceptions so tests can set exception types
-        self.exceptions = self._client.exceptions
+    @property
+    def exceptions(self) -> Any:
+        """The client's exception classes (tests may set exception types)."""
+        return _get_dynamodb_client().exceptions
 
     def transact_write_items(self, *args: Any, **kwargs: Any) -> "TransactWriteItemsOutputTypeDef":
-        return self._client.transact_write_items(*args, **kwargs)
+        return _get_dynamodb_client().transact_write_items(*args, **kwargs)
 
 
 # Default proxy instance (tests may monkeypatch methods on this object)
@@ -80,14 +84,11 @@ def _get_profile(profile_id: str) -> Optional[Dict[str, Any]]:
         # Ensure we query the profile GSI with the PROFILE# prefix
         db_profile_id = profile_id if profile_id.startswith("PROFILE#") else f"PROFILE#{profile_id}"
 
-        response = tables.profiles.query(
-            IndexName="profileId-index",
-            KeyConditionExpression="profileId = :profileId",
-            ExpressionAttributeValues={":profileId": db_profile_id},
-            Limit=1,
+        # Usually already read by the access check earlier in this request
+        profile: Optional[Dict[str, Any]] = cached_query_first(
+            tables.profiles, "profileId-index", "profileId", db_profile_id
         )
-        items = response.get("Items", [])
-        return items[0] if items else None
+        return profile
     except Exception as e:
         logger.error(f"Error fetching profile {profile_id}: {str(e)}")
         return None
@@ -312,6 +313,7 @@ def _maybe_build_share_item(
     return _build_share_item(profile, shared_campaign, caller_account_id, now)
 
 
+@handler_middleware
 def create_campaign(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Create a new campaign with optional shared campaign support."""
     from datetime import datetime, timezone
@@ -7,12 +7,14 @@ from boto3.dynamodb.conditions import Key
 # Handle both Lambda (absolute) and unit test (relative) imports
 try:  # pragma: no cover
     from utils.auth import check_profile_access
-    from utils.dynamodb import tables
+    from utils.dynamodb import cached_query_first, tables
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.auth import check_profile_access
-    from ..utils.dynamodb import tables
+    from ..utils.dynamodb import cached_query_first, tables
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
 
 logger = get_logger(__name__)
 
@@ -58,15 +60,10 @@ def _get_accessible_profiles(profile_ids: list[str], caller_account_id: str) ->
             required_permission="READ",
         )
         if has_access:
-            profile_response = tables.profiles.query(
-                IndexName="profileId-index",
-                KeyConditionExpression="profileId = :profileId",
-                ExpressionAttributeValues={":profileId": profile_id},
-                Limit=1,
-            )
-            profile_items = profile_response.get("Items", [])
-            if profile_items:
-                accessible_profiles[profile_id] = profile_items[0]
+            # Served from the request cache when the access check already looked it up
+            profile = cached_query_first(tables.profiles, "profileId-index", "profileId", profile_id)
+            if profile is not None:
+                accessible_profiles[profile_id] = profile
     return accessible_profiles
 
 
@@ -115,6 +112,7 @@ def _get_seller_data(profile_id: str, profile: Dict[str, Any], campaigns: List[D
     }
 
 
+@handler_middleware
 def get_unit_report(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Generate unit-level popcorn sales report using unitCampaignKey-index queries.
@@ -136,72 +134,67 @@ def get_unit_report(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         UnitReport with seller summaries and order details
     """
-    try:
-        # Extract parameters
-        unit_type = event["arguments"]["unitType"]
-        unit_number = int(event["arguments"]["unitNumber"])
-        city = event["arguments"].get("city", "")
-        state = event["arguments"].get("state", "")
-        campaign_name = event["arguments"]["campaignName"]
-        campaign_year = int(event["arguments"]["campaignYear"])
-        catalog_id = event["arguments"]["catalogId"]
-        caller_account_id = event["identity"]["sub"]
-
-        logger.info(
-            f"Generating unit report for {unit_type} {unit_number} in {city}, {state}, "
-            f"campaign {campaign_name} {campaign_year}, catalog {catalog_id}"
-        )
+    # Extract parameters
+    unit_type = event["arguments"]["unitType"]
+    unit_number = int(event["arguments"]["unitNumber"])
+    city = event["arguments"].get("city", "")
+    state = event["arguments"].get("state", "")
+    campaign_name = event["arguments"]["campaignName"]
+    campaign_year = int(event["arguments"]["campaignYear"])
+    catalog_id = event["arguments"]["catalogId"]
+    caller_account_id = event["identity"]["sub"]
+
+    logger.info(
+        f"Generating unit report for {unit_type} {unit_number} in {city}, {state}, "
+        f"campaign {campaign_name} {campaign_year}, catalog {catalog_id}"
+    )
+
+    # Step 1: Query campaigns by unit+campaign key
+    unit_campaign_key = _build_unit_campaign_key(unit_type, unit_number, city, state, campaign_name, campaign_year)
+    campaigns_response = tables.campaigns.query(
+        IndexName="unitCampaignKey-index",
+        KeyConditionExpression=Key("unitCampaignKey").eq(unit_campaign_key),
+        FilterExpression="catalogId = :cid",
+        ExpressionAttributeValues={":cid": catalog_id},
+    )
+    unit_campaigns = campaigns_response.get("Items", [])
+    logger.info(f"Found {len(unit_campaigns)} campaigns")
+
+    if not unit_campaigns:
+        return _empty_report(unit_type, unit_number, campaign_name, campaign_year)
+
+    # Step 2: Group campaigns by profile
+    profile_campaigns = _group_campaigns_by_profile(unit_campaigns)
+
+    # Step 3: Get accessible profiles
+    accessible_profiles = _get_accessible_profiles(list(profile_campaigns.keys()), caller_account_id)
+    logger.info(f"Caller has access to {len(accessible_profiles)} of {len(profile_campaigns)} profiles")
+
+    if not accessible_profiles:
+        return _empty_report(unit_type, unit_number, campaign_name, campaign_year)
+
+    # Step 4: Build seller data
+    sellers: List[Dict[str, Any]] = []
+    total_unit_sales = 0.0
+    total_unit_orders = 0
+
+    for profile_id, profile in accessible_profiles.items():
+        seller_data = _get_seller_data(profile_id, profile, profile_campaigns[profile_id])
+        if seller_data["orders"] or seller_data["totalSales"] > 0:
+            sellers.append(seller_data)
+            total_unit_sales += seller_data["totalSales"]
+            total_unit_orders += seller_data["orderCount"]
+
+    sellers.sort(key=lambda s: s["totalSales"], reverse=True)
+
+    logger.info(f"Report complete: {len(sellers)} sellers, ${total_unit_sales:.2f}, {total_unit_orders} orders")
 
-        # Step 1: Query campaigns by unit+campaign key
-        unit_campaign_key = _build_unit_campaign_key(unit_type, unit_number, city, state, campaign_name, campaign_year)
-        campaigns_response = tables.campaigns.query(
-            IndexName="unitCampaignKey-index",
-            KeyConditionExpression=Key("unitCampaignKey").eq(unit_campaign_key),
-            FilterExpression="catalogId = :cid",
-            ExpressionAttributeValues={":cid": catalog_id},
-        )
-        unit_campaigns = campaigns_response.get("Items", [])
-        logger.info(f"Found {len(unit_campaigns)} campaigns")
-
-        if not unit_campaigns:
-            return _empty_report(unit_type, unit_number, campaign_name, campaign_year)
-
-        # Step 2: Group campaigns by profile
-        profile_campaigns = _group_campaigns_by_profile(unit_campaigns)
-
-        # Step 3: Get accessible profiles
-        accessible_profiles = _get_accessible_profiles(list(profile_campaigns.keys()), caller_account_id)
-        logger.info(f"Caller has access to {len(accessible_profiles)} of {len(profile_campaigns)} profiles")
-
-        if not accessible_profiles:
-            return _empty_report(unit_type, unit_number, campaign_name, campaign_year)
-
-        # Step 4: Build seller data
-        sellers: List[Dict[str, Any]] = []
-        total_unit_sales = 0.0
-        total_unit_orders = 0
-
-        for profile_id, profile in accessible_profiles.items():
-            seller_data = _get_seller_data(profile_id, profile, profile_campaigns[profile_id])
-            if seller_data["orders"] or seller_data["totalSales"] > 0:
-                sellers.append(seller_data)
-                total_unit_sales += seller_data["totalSales"]
-                total_unit_orders += seller_data["orderCount"]
-
-        sellers.sort(key=lambda s: s["totalSales"], reverse=True)
-
-        logger.info(f"Report complete: {len(sellers)} sellers, ${total_unit_sales:.2f}, {total_unit_orders} orders")
-
-        return {
-            "unitType": unit_type,
-            "unitNumber": unit_number,
-            "campaignName": campaign_name,
-            "campaignYear": campaign_year,
-            "sellers": sellers,
-            "totalSales": total_unit_sales,
-            "totalOrders": total_unit_orders,
-        }
-
-    except Exception as e:
-        logger.error(f"Error generating unit report: {str(e)}", exc_info=True)
-        raise
+    return {
+        "unitType": unit_type,
+        "unitNumber": unit_number,
+        "campaignName": campaign_name,
+        "campaignYear": campaign_year,
+        "sellers": sellers,
+        "totalSales": total_unit_sales,
+        "totalOrders": total_unit_orders,
+    }
@@ -0,0 +1,174 @@
+"""
+Customer search for sellers (searchCustomers) and the stream worker that keeps its index.
+
+index_customer_orders consumes the orders table stream, so orders written by
+the AppSync resolvers, createOrders, imports and cascade deletes are all
+indexed. search_customers answers from the index (see utils.customer_index)
+with at most two batched reads for a prefix, instead of listing the profile's
+orders.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from boto3.dynamodb.types import TypeDeserializer
+
+# Handle both Lambda (absolute) and unit test (relative) imports
+try:  # pragma: no cover
+    from utils.auth import check_profile_access
+    from utils.customer_index import (
+        CUSTOMER_PREFIX,
+        SHARD_PREFIX,
+        customer_response,
+        index_order_change,
+        match_prefix,
+        normalize_words,
+        shards_for_word,
+    )
+    from utils.dynamodb import batch_get_items, tables
+    from utils.errors import AppError, ErrorCode
+    from utils.ids import ensure_profile_id
+    from utils.logging import get_logger
+    from utils.middleware import handler_middleware
+except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.auth import check_profile_access
+    from ..utils.customer_index import (
+        CUSTOMER_PREFIX,
+        SHARD_PREFIX,
+        customer_response,
+        index_order_change,
+        match_prefix,
+        normalize_words,
+        shards_for_word,
+    )
+    from ..utils.dynamodb import batch_get_items, tables
+    from ..utils.errors import AppError, ErrorCode
+    from ..utils.ids import ensure_profile_id
+    from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
+
+logger = get_logger(__name__)
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+_deserializer = TypeDeserializer()
+
+
+def _image(record: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    image = record.get("dynamodb", {}).get(name)
+    if not image:
+        return None
+    return {attribute: _deserializer.deserialize(value) for attribute, value in image.items()}
+
+
+@handler_middleware
+def index_customer_orders(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Apply a batch of orders table stream records to the customer index.
+
+    Index updates are idempotent, so a failed batch is simply retried by the
+    event source mapping (which bisects it to isolate a bad record).
+
+    Args:
+        event: DynamoDB stream event (NEW_AND_OLD_IMAGES)
+        context: Lambda context (unused)
+
+    Returns:
+        Count of records processed
+    """
+    table = tables.customer_index
+    records = event.get("Records", [])
+    for record in records:
+        index_order_change(table, _image(record, "OldImage"), _image(record, "NewImage"))
+    logger.info("Indexed order changes", records=len(records))
+    return {"recordsProcessed": len(records)}
+
+
+def _lapsed(item: Dict[str, Any], lapsed_in_year: Optional[int]) -> bool:
+    """True if the customer ordered the year before lapsed_in_year but not in it (always True without a year)."""
+    if lapsed_in_year is None:
+        return True
+    return bool(item.get(f"y{lapsed_in_year - 1}")) and not item.get(f"y{lapsed_in_year}")
+
+
+def _prefix_matches(profile_id: str, words: List[str]) -> List[Dict[str, Any]]:
+    table = tables.customer_index
+    shards = batch_get_items(
+        table,
+        [
+            {"profileId": profile_id, "indexKey": f"{SHARD_PREFIX}{shard}"}
+            for shard in sorted({shard for word in words for shard in shards_for_word(word)})
+        ],
+    )
+    keys = match_prefix(shards, words)
+    customers: List[Dict[str, Any]] = batch_get_items(
+        table, [{"profileId": profile_id, "indexKey": f"{CUSTOMER_PREFIX}{key}"} for key in keys]
+    )
+    return customers
+
+
+def _lapsed_customers(profile_id: str, lapsed_in_year: int) -> List[Dict[str, Any]]:
+    table = tables.customer_index
+    kwargs: Dict[str, Any] = {
+        "KeyConditionExpression": "profileId = :profileId AND begins_with(indexKey, :customer)",
+        "FilterExpression": "attribute_exists(#previous) AND attribute_not_exists(#current)",
+        "ExpressionAttributeNames": {"#previous": f"y{lapsed_in_year - 1}", "#current": f"y{lapsed_in_year}"},
+        "ExpressionAttributeValues": {":profileId": profile_id, ":customer": CUSTOMER_PREFIX},
+    }
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = table.query(**kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+@handler_middleware(error_message="Failed to search customers")
+def search_customers(event: Dict[str, Any], context: Any) -> List[Dict[str, Any]]:
+    """
+    Find a profile's customers by name, phone or address prefix.
+
+    Args:
+        event: AppSync event with arguments.profileId and at least one of
+            arguments.prefix (words are matched as prefixes, all must match)
+            and arguments.lapsedInYear (only customers who ordered the year
+            before but not in that year), plus optional arguments.limit
+        context: Lambda context (unused)
+
+    Returns:
+        Matching customers, most recent order first
+
+    Raises:
+        AppError: If neither filter is given, limit is below 1 or the caller cannot read the profile
+    """
+    caller_account_id = event["identity"]["sub"]
+    args = event["arguments"]
+    profile_id = ensure_profile_id(args.get("profileId"))
+    words = normalize_words(args.get("prefix"))
+    lapsed_in_year: Optional[int] = args.get("lapsedInYear")
+    limit = args.get("limit")
+    if limit is None:
+        limit = DEFAULT_SEARCH_LIMIT
+    if limit < 1:
+        raise AppError(ErrorCode.INVALID_INPUT, "limit must be at least 1")
+    limit = min(limit, MAX_SEARCH_LIMIT)
+    if not profile_id:
+        raise AppError(ErrorCode.INVALID_INPUT, "profileId is required")
+    if not check_profile_access(caller_account_id, profile_id, "READ"):
+        raise AppError(ErrorCode.FORBIDDEN, "You do not have access to this profile")
+
+    if words:
+        items = [item for item in _prefix_matches(profile_id, words) if _lapsed(item, lapsed_in_year)]
+    elif lapsed_in_year is not None:
+        items = _lapsed_customers(profile_id, lapsed_in_year)
+    else:
+        raise AppError(ErrorCode.INVALID_INPUT, "A prefix or lapsedInYear is required")
+
+    customers = sorted(
+        (customer_response(item) for item in items),
+        key=lambda c: (c["lastOrderDate"] or "", c["customerName"]),
+        reverse=True,
+    )
+    logger.info("Searched customers", words=len(words), lapsed_in_year=lapsed_in_year, matches=len(customers))
+    return customers[:limit]
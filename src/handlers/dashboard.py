@@ -0,0 +1,193 @@
+"""
+Lambda resolver for getMyDashboard: the home screen's data in one call.
+
+Replaces getMyAccount + listMyProfiles + listMyShares + listCampaignsByProfile
+per profile, plus the Campaign.catalog/totalOrders/totalRevenue field
+resolvers per campaign. Reads are batched where DynamoDB allows it
+(shared profiles, catalogs) and the per-partition queries (campaigns per
+profile, orders per campaign) run in parallel.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+# Handle both Lambda (absolute) and unit test (relative) imports
+try:  # pragma: no cover
+    from utils.dynamodb import batch_get_items, cached_get_item, tables
+    from utils.ids import ensure_catalog_id
+    from utils.logging import get_logger
+    from utils.middleware import handler_middleware
+    from utils.responses import build_account_response, build_campaign_response, build_profile_response
+except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.dynamodb import batch_get_items, cached_get_item, tables
+    from ..utils.ids import ensure_catalog_id
+    from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
+    from ..utils.responses import build_account_response, build_campaign_response, build_profile_response
+
+logger = get_logger(__name__)
+
+# Concurrent DynamoDB requests per invocation (each thread uses its own cached resource)
+DASHBOARD_READ_WORKERS = 8
+
+OWNER_PERMISSIONS = ["READ", "WRITE"]
+
+
+def _query_all(table_name: str, **kwargs: Any) -> List[Dict[str, Any]]:
+    """Run a query to completion. Takes a table name so worker threads build their own Table."""
+    table = getattr(tables, table_name)
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = table.query(**kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _get_account(account_key: str) -> Optional[Dict[str, Any]]:
+    account: Optional[Dict[str, Any]] = cached_get_item(tables.accounts, {"accountId": account_key})
+    return account
+
+
+def _owned_profiles(account_key: str) -> List[Dict[str, Any]]:
+    return _query_all(
+        "profiles",
+        KeyConditionExpression="ownerAccountId = :ownerAccountId",
+        ExpressionAttributeValues={":ownerAccountId": account_key},
+    )
+
+
+def _shares(account_key: str) -> List[Dict[str, Any]]:
+    return _query_all(
+        "shares",
+        IndexName="targetAccountId-index",
+        KeyConditionExpression="targetAccountId = :targetAccountId",
+        ExpressionAttributeValues={":targetAccountId": account_key},
+    )
+
+
+def _campaigns(profile_id: str) -> List[Dict[str, Any]]:
+    return _query_all(
+        "campaigns",
+        KeyConditionExpression="profileId = :profileId",
+        ExpressionAttributeValues={":profileId": profile_id},
+    )
+
+
+def _campaign_totals(campaign_id: str) -> Tuple[int, Decimal]:
+    """Order count and revenue for a campaign, reading only totalAmount."""
+    orders = _query_all(
+        "orders",
+        KeyConditionExpression="campaignId = :campaignId",
+        ExpressionAttributeValues={":campaignId": campaign_id},
+        ProjectionExpression="totalAmount",
+    )
+    return len(orders), sum((Decimal(str(order.get("totalAmount", 0))) for order in orders), Decimal(0))
+
+
+def _catalog_names(catalog_ids: List[str]) -> Dict[str, str]:
+    keys = [{"catalogId": catalog_id} for catalog_id in catalog_ids]
+    catalogs = batch_get_items(tables.catalogs, keys, attributes=("catalogId", "catalogName"))
+    return {catalog["catalogId"]: catalog.get("catalogName", "") for catalog in catalogs}
+
+
+def _shared_profiles(shares: List[Dict[str, Any]], owned_ids: set[str]) -> List[Dict[str, Any]]:
+    """Hydrate shared profiles with one BatchGetItem, attaching the share's permissions."""
+    permissions_by_profile: Dict[str, List[str]] = {}
+    keys = []
+    for share in shares:
+        profile_id, owner = share.get("profileId"), share.get("ownerAccountId")
+        if not profile_id or not owner or profile_id in owned_ids or profile_id in permissions_by_profile:
+            continue
+        permissions_by_profile[profile_id] = list(share.get("permissions", []))
+        keys.append({"ownerAccountId": owner, "profileId": profile_id})
+
+    profiles = batch_get_items(tables.profiles, keys)
+    return [
+        build_profile_response(profile, is_owner=False, permissions=permissions_by_profile[profile["profileId"]])
+        for profile in profiles
+        # Same data-quality filter as listMyShares
+        if profile.get("sellerName") and profile.get("createdAt") and profile.get("updatedAt")
+    ]
+
+
+@handler_middleware(error_message="Failed to load dashboard")
+def get_my_dashboard(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Return the caller's account, owned and shared profiles, their campaigns and campaign totals.
+
+    AppSync Lambda resolver for the getMyDashboard query. Access follows the
+    list queries it replaces: owned profiles come from the profiles table
+    partition and shared ones from the caller's shares.
+
+    Args:
+        event: AppSync event with identity.sub
+        context: Lambda context (unused)
+
+    Returns:
+        Dashboard with account and profiles (owned first, then shared, each by
+        sellerName); each profile has its campaigns, newest first
+    """
+    caller_account_id = event["identity"]["sub"]
+    account_key = f"ACCOUNT#{caller_account_id}"
+
+    with ThreadPoolExecutor(max_workers=DASHBOARD_READ_WORKERS) as executor:
+        account_future = executor.submit(_get_account, account_key)
+        owned_future = executor.submit(_owned_profiles, account_key)
+        shares_future = executor.submit(_shares, account_key)
+
+        # Same filter as listMyProfiles: skip incomplete/deleted records
+        owned_profiles = [
+            build_profile_response(profile, is_owner=True, permissions=OWNER_PERMISSIONS)
+            for profile in owned_future.result()
+            if profile.get("createdAt")
+        ]
+        owned_ids = {profile["profileId"] for profile in owned_profiles}
+        shared_profiles = _shared_profiles(shares_future.result(), owned_ids)
+
+        # Owned profiles are only filtered on createdAt, so sellerName may be null
+        profiles = sorted(owned_profiles, key=lambda p: p["sellerName"] or "") + sorted(
+            shared_profiles, key=lambda p: p["sellerName"] or ""
+        )
+        profile_ids = [profile["profileId"] for profile in profiles]
+        campaigns_by_profile = dict(zip(profile_ids, executor.map(_campaigns, profile_ids), strict=True))
+
+        all_campaigns = [campaign for campaigns in campaigns_by_profile.values() for campaign in campaigns]
+        catalog_ids = sorted({ensure_catalog_id(c["catalogId"]) for c in all_campaigns if c.get("catalogId")})
+        catalogs_future = executor.submit(_catalog_names, catalog_ids)
+        campaign_ids = [campaign["campaignId"] for campaign in all_campaigns]
+        totals = dict(zip(campaign_ids, executor.map(_campaign_totals, campaign_ids), strict=True))
+        catalog_names = catalogs_future.result()
+        account = account_future.result()
+
+    result_profiles = []
+    for profile in profiles:
+        campaigns = []
+        for campaign in campaigns_by_profile[profile["profileId"]]:
+            total_orders, total_revenue = totals[campaign["campaignId"]]
+            catalog_id = ensure_catalog_id(campaign["catalogId"]) if campaign.get("catalogId") else None
+            campaigns.append(
+                {
+                    **build_campaign_response(campaign),
+                    "catalogName": catalog_names.get(catalog_id) if catalog_id else None,
+                    "totalOrders": total_orders,
+                    "totalRevenue": float(total_revenue),
+                }
+            )
+        campaigns.sort(key=lambda c: (c["campaignYear"], c["createdAt"]), reverse=True)
+        result_profiles.append({**profile, "campaigns": campaigns})
+
+    logger.info(
+        "Built dashboard",
+        profiles=len(result_profiles),
+        shared_profiles=len(shared_profiles),
+        campaigns=len(all_campaigns),
+    )
+    return {
+        "account": (
+            {**build_account_response(account), "preferences": account.get("preferences")} if account else None
+        ),
+        "profiles": result_profiles,
+    }
@@ -10,14 +10,17 @@ try:  # pragma: no cover
     from utils.dynamodb import tables
     from utils.ids import ensure_profile_id
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.dynamodb import tables
     from ..utils.ids import ensure_profile_id
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
 
 logger = get_logger(__name__)
 
 
+@handler_middleware
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Delete all orders for all campaigns in a profile.
 
@@ -9,10 +9,12 @@ try:  # pragma: no cover
     from utils.auth import check_profile_access
     from utils.dynamodb import tables
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.auth import check_profile_access
     from ..utils.dynamodb import tables
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
 
 logger = get_logger(__name__)
 
@@ -58,6 +60,7 @@ def _fetch_catalogs(catalog_ids: Set[str]) -> List[Dict[str, Any]]:
     return catalogs
 
 
+@handler_middleware
 def list_unit_catalogs(event: Dict[str, Any], context: Any) -> List[Dict[str, Any]]:
     """
     List all catalogs used by scouts in a unit (that the caller has access to).
@@ -73,48 +76,43 @@ def list_unit_catalogs(event: Dict[str, Any], context: Any) -> List[Dict[str, An
     Returns:
         List of Catalog objects
     """
-    try:
-        unit_type = event["arguments"]["unitType"]
-        unit_number = int(event["arguments"]["unitNumber"])
-        campaign_name = event["arguments"]["campaignName"]
-        campaign_year = int(event["arguments"]["campaignYear"])
-        caller_account_id = event["identity"]["sub"]
-
-        logger.info(f"Listing catalogs for {unit_type} {unit_number}, campaign {campaign_name} {campaign_year}")
-
-        # Step 1: Find all profiles in this unit
-        profiles_response = tables.profiles.scan(
-            FilterExpression="unitType = :ut AND unitNumber = :un",
-            ExpressionAttributeValues={":ut": unit_type, ":un": unit_number},
-        )
-        unit_profiles = profiles_response.get("Items", [])
-        logger.info(f"Found {len(unit_profiles)} profiles")
-
-        if not unit_profiles:
-            return []
-
-        # Step 2: Filter to accessible profiles
-        accessible_profiles = _filter_accessible_profiles(unit_profiles, caller_account_id)
-        logger.info(f"Caller has access to {len(accessible_profiles)} of {len(unit_profiles)} profiles")
-
-        if not accessible_profiles:
-            return []
-
-        # Step 3: Collect catalog IDs from matching campaigns
-        catalog_ids = _collect_catalog_ids(accessible_profiles, campaign_name, campaign_year)
-        logger.info(f"Found {len(catalog_ids)} unique catalogs")
-
-        if not catalog_ids:
-            return []
-
-        # Step 4: Fetch and return catalog details
-        catalogs = _fetch_catalogs(catalog_ids)
-        logger.info(f"Returning {len(catalogs)} catalogs")
-        return catalogs
-
-    except Exception as e:
-        logger.error(f"Error listing unit catalogs: {str(e)}", exc_info=True)
-        raise
+    unit_type = event["arguments"]["unitType"]
+    unit_number = int(event["arguments"]["unitNumber"])
+    campaign_name = event["arguments"]["campaignName"]
+    campaign_year = int(event["arguments"]["campaignYear"])
+    caller_account_id = event["identity"]["sub"]
+
+    logger.info(f"Listing catalogs for {unit_type} {unit_number}, campaign {campaign_name} {campaign_year}")
+
+    # Step 1: Find all profiles in this unit
+    profiles_response = tables.profiles.scan(
+        FilterExpression="unitType = :ut AND unitNumber = :un",
+        ExpressionAttributeValues={":ut": unit_type, ":un": unit_number},
+    )
+    unit_profiles = profiles_response.get("Items", [])
+    logger.info(f"Found {len(unit_profiles)} profiles")
+
+    if not unit_profiles:
+        return []
+
+    # Step 2: Filter to accessible profiles
+    accessible_profiles = _filter_accessible_profiles(unit_profiles, caller_account_id)
+    logger.info(f"Caller has access to {len(accessible_profiles)} of {len(unit_profiles)} profiles")
+
+    if not accessible_profiles:
+        return []
+
+    # Step 3: Collect catalog IDs from matching campaigns
+    catalog_ids = _collect_catalog_ids(accessible_profiles, campaign_name, campaign_year)
+    logger.info(f"Found {len(catalog_ids)} unique catalogs")
+
+    if not catalog_ids:
+        return []
+
+    # Step 4: Fetch and return catalog details
+    catalogs = _fetch_catalogs(catalog_ids)
+    logger.info(f"Returning {len(catalogs)} catalogs")
+    return catalogs
 
 
 def _build_unit_campaign_key(
@@ -136,6 +134,7 @@ def _collect_catalog_ids_from_campaigns(campaigns: List[Dict[str, Any]], caller_
     return catalog_ids
 
 
+@handler_middleware
 def list_unit_campaign_catalogs(event: Dict[str, Any], context: Any) -> List[Dict[str, Any]]:
     """
     List all catalogs used by scouts in a unit+campaign using unitCampaignKey-index.
@@ -155,41 +154,36 @@ def list_unit_campaign_catalogs(event: Dict[str, Any], context: Any) -> List[Dic
     Returns:
         List of Catalog objects
     """
-    try:
-        unit_type = event["arguments"]["unitType"]
-        unit_number = int(event["arguments"]["unitNumber"])
-        city = event["arguments"]["city"]
-        state = event["arguments"]["state"]
-        campaign_name = event["arguments"]["campaignName"]
-        campaign_year = int(event["arguments"]["campaignYear"])
-        caller_account_id = event["identity"]["sub"]
-
-        logger.info(f"Listing catalogs for {unit_type} {unit_number} in {city}, {state}, campaign {campaign_name}")
-
-        # Step 1: Query unitCampaignKey-index
-        unit_campaign_key = _build_unit_campaign_key(unit_type, unit_number, city, state, campaign_name, campaign_year)
-        campaigns_response = tables.campaigns.query(
-            IndexName="unitCampaignKey-index",
-            KeyConditionExpression=Key("unitCampaignKey").eq(unit_campaign_key),
-        )
-        unit_campaigns = campaigns_response.get("Items", [])
-        logger.info(f"Found {len(unit_campaigns)} campaigns")
-
-        if not unit_campaigns:
-            return []
-
-        # Step 2: Collect catalog IDs from accessible campaigns
-        catalog_ids = _collect_catalog_ids_from_campaigns(unit_campaigns, caller_account_id)
-        logger.info(f"Found {len(catalog_ids)} unique catalogs in accessible campaigns")
-
-        if not catalog_ids:
-            return []
-
-        # Step 3: Fetch and return catalog details
-        catalogs = _fetch_catalogs(catalog_ids)
-        logger.info(f"Returning {len(catalogs)} catalogs")
-        return catalogs
-
-    except Exception as e:
-        logger.error(f"Error listing unit campaign catalogs: {str(e)}", exc_info=True)
-        raise
+    unit_type = event["arguments"]["unitType"]
+    unit_number = int(event["arguments"]["unitNumber"])
+    city = event["arguments"]["city"]
+    state = event["arguments"]["state"]
+    campaign_name = event["arguments"]["campaignName"]
+    campaign_year = int(event["arguments"]["campaignYear"])
+    caller_account_id = event["identity"]["sub"]
+
+    logger.info(f"Listing catalogs for {unit_type} {unit_number} in {city}, {state}, campaign {campaign_name}")
+
+    # Step 1: Query unitCampaignKey-index
+    unit_campaign_key = _build_unit_campaign_key(unit_type, unit_number, city, state, campaign_name, campaign_year)
+    campaigns_response = tables.campaigns.query(
+        IndexName="unitCampaignKey-index",
+        KeyConditionExpression=Key("unitCampaignKey").eq(unit_campaign_key),
+    )
+    unit_campaigns = campaigns_response.get("Items", [])
+    logger.info(f"Found {len(unit_campaigns)} campaigns")
+
+    if not unit_campaigns:
+        return []
+
+    # Step 2: Collect catalog IDs from accessible campaigns
+    catalog_ids = _collect_catalog_ids_from_campaigns(unit_campaigns, caller_account_id)
+    logger.info(f"Found {len(catalog_ids)} unique catalogs in accessible campaigns")
+
+    if not catalog_ids:
+        return []
+
+    # Step 3: Fetch and return catalog details
+    catalogs = _fetch_catalogs(catalog_ids)
+    logger.info(f"Returning {len(catalogs)} catalogs")
+    return catalogs
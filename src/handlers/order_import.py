@@ -0,0 +1,506 @@
+"""
+Bulk order import from CSV/XLSX files uploaded to S3.
+
+requestOrderImport returns a pre-signed POST for
+order-imports/{accountId}/{campaignId}/{importId}.{csv|xlsx}. The upload
+triggers process_order_import, which streams the file row by row, validates
+and prices each row against the campaign's catalog, writes orders in
+parallel BatchWriteItem chunks and stores a per-row report at
+order-import-reports/{accountId}/{importId}.json for getOrderImportReport.
+
+The header row names the columns: customer fields (Customer Name, Phone,
+Street, City, State, Zip, Payment Method, Order Date, Notes) and one quantity
+column per product, headed by its product name or productId.
+
+Order IDs are derived from the upload key and row number, so a redelivered
+S3 event overwrites the same orders instead of duplicating them.
+"""
+
+import codecs
+import csv
+import json
+import re
+import shutil
+import tempfile
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote_plus
+
+from botocore.exceptions import ClientError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3.client import S3Client
+
+# Handle both Lambda (absolute) and unit test (relative) imports
+try:  # pragma: no cover
+    from utils.auth import check_profile_access
+    from utils.aws_clients import get_s3_client
+    from utils.dynamodb import get_required_env, tables
+    from utils.errors import AppError, ErrorCode
+    from utils.ids import ensure_campaign_id, strip_prefix
+    from utils.logging import get_logger
+    from utils.middleware import handler_middleware, has_time_remaining
+    from utils.orders import (
+        CampaignOrderContext,
+        batch_put_items,
+        build_order_item,
+        load_campaign_context,
+        order_timestamp,
+    )
+    from utils.validation import normalize_phone, validate_address
+except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.auth import check_profile_access
+    from ..utils.aws_clients import get_s3_client
+    from ..utils.dynamodb import get_required_env, tables
+    from ..utils.errors import AppError, ErrorCode
+    from ..utils.ids import ensure_campaign_id, strip_prefix
+    from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware, has_time_remaining
+    from ..utils.orders import (
+        CampaignOrderContext,
+        batch_put_items,
+        build_order_item,
+        load_campaign_context,
+        order_timestamp,
+    )
+    from ..utils.validation import normalize_phone, validate_address
+
+logger = get_logger(__name__)
+
+ORDER_IMPORT_PREFIX = "order-imports"
+ORDER_IMPORT_REPORT_PREFIX = "order-import-reports"
+ORDER_IMPORT_KEY_PATTERN = re.compile(rf"^{ORDER_IMPORT_PREFIX}/([^/]+)/([^/]+)/([0-9a-f]{{32}})\.(csv|xlsx)$")
+
+# GraphQL OrderImportFormat -> (file extension, upload Content-Type)
+IMPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "XLSX": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+MAX_IMPORT_BYTES = 10 * 1024 * 1024
+MAX_IMPORT_ROWS = 5000
+
+# Orders buffered before a flush, and BatchWriteItem chunks written concurrently per flush
+IMPORT_WRITE_BUFFER = 250
+IMPORT_WRITE_WORKERS = 8
+
+# XLSX is a zip archive, so it is spooled (to /tmp past this size) before openpyxl reads it
+XLSX_SPOOL_BYTES = 2 * 1024 * 1024
+
+# Normalized header -> customer field
+COLUMN_FIELDS = {
+    "customername": "customerName",
+    "customer": "customerName",
+    "name": "customerName",
+    "phone": "customerPhone",
+    "phonenumber": "customerPhone",
+    "customerphone": "customerPhone",
+    "street": "street",
+    "address": "street",
+    "streetaddress": "street",
+    "city": "city",
+    "state": "state",
+    "zip": "zip",
+    "zipcode": "zip",
+    "postalcode": "zip",
+    "paymentmethod": "paymentMethod",
+    "payment": "paymentMethod",
+    "orderdate": "orderDate",
+    "date": "orderDate",
+    "notes": "notes",
+    "note": "notes",
+}
+
+US_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y")
+
+
+def _column_key(header: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", header.lower())
+
+
+def _report_key(account_id: str, import_id: str) -> str:
+    return f"{ORDER_IMPORT_REPORT_PREFIX}/{account_id}/{import_id}.json"
+
+
+def _row_error(row: Optional[int], error: AppError) -> Dict[str, Any]:
+    return {"row": row, "errorCode": error.error_code, "message": error.message}
+
+
+def _require_write_access(account_id: str, context: CampaignOrderContext) -> None:
+    if not check_profile_access(account_id, context.campaign["profileId"], "WRITE"):
+        raise AppError(ErrorCode.FORBIDDEN, "You do not have permission to create orders for this campaign")
+
+
+@handler_middleware(error_message="Failed to generate upload URL")
+def request_order_import(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Generate a pre-signed POST for an order import file.
+
+    AppSync Lambda resolver for the requestOrderImport mutation. The campaign,
+    its catalog and the caller's write access are checked here so problems
+    surface before the upload; the worker checks them again when it runs.
+
+    Args:
+        event: AppSync event with arguments.campaignId and arguments.format
+        context: Lambda context (unused)
+
+    Returns:
+        OrderImportUpload with importId, uploadUrl, fields and s3Key
+
+    Raises:
+        AppError: If the format is unknown, the campaign cannot take orders,
+            or the caller cannot write to its profile
+    """
+    caller_id = event.get("identity", {}).get("sub")
+    if not caller_id:
+        raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
+
+    arguments = event.get("arguments", {})
+    file_format = IMPORT_FORMATS.get(arguments.get("format", ""))
+    if file_format is None:
+        raise AppError(ErrorCode.INVALID_INPUT, "format must be CSV or XLSX")
+    extension, content_type = file_format
+
+    campaign_context = load_campaign_context(arguments.get("campaignId", ""))
+    _require_write_access(caller_id, campaign_context)
+
+    import_id = uuid.uuid4().hex
+    campaign_uuid = strip_prefix(campaign_context.campaign["campaignId"])
+    s3_key = f"{ORDER_IMPORT_PREFIX}/{caller_id}/{campaign_uuid}/{import_id}.{extension}"
+
+    presigned_post = get_s3_client().generate_presigned_post(
+        Bucket=get_required_env("EXPORTS_BUCKET"),
+        Key=s3_key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, MAX_IMPORT_BYTES],
+        ],
+        ExpiresIn=900,  # 15 minutes
+    )
+
+    logger.info("Generated order import upload", account_id=caller_id, s3_key=s3_key)
+    return {
+        "importId": import_id,
+        "uploadUrl": presigned_post["url"],
+        "fields": presigned_post["fields"],
+        "s3Key": s3_key,
+    }
+
+
+@handler_middleware(error_message="Failed to load import report")
+def get_order_import_report(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Return the report of one of the caller's order imports.
+
+    AppSync Lambda resolver for the getOrderImportReport query. Reports are
+    stored under the caller's account, so callers only ever see their own.
+
+    Returns:
+        OrderImportReport; status PENDING until the worker has finished
+    """
+    caller_id = event.get("identity", {}).get("sub")
+    if not caller_id:
+        raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
+
+    import_id = event.get("arguments", {}).get("importId", "")
+    if not re.fullmatch(r"[0-9a-f]{32}", import_id):
+        raise AppError(ErrorCode.INVALID_INPUT, "Invalid importId")
+
+    try:
+        response = get_s3_client().get_object(
+            Bucket=get_required_env("EXPORTS_BUCKET"), Key=_report_key(caller_id, import_id)
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "NoSuchKey":
+            raise
+        return {
+            "importId": import_id,
+            "status": "PENDING",
+            "campaignId": None,
+            "rowsProcessed": 0,
+            "ordersCreated": 0,
+            "rowsFailed": 0,
+            "errors": [],
+            "completedAt": None,
+        }
+
+    report: Dict[str, Any] = json.loads(response["Body"].read())
+    return report
+
+
+def _cell_text(value: Any) -> str:
+    """Render an XLSX cell value the way it would appear in a CSV export."""
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _iter_csv_rows(body: Any) -> Iterator[List[str]]:
+    # utf-8-sig drops the BOM Excel puts at the start of "CSV UTF-8" exports
+    yield from csv.reader(codecs.getreader("utf-8-sig")(body))
+
+
+def _iter_xlsx_rows(body: Any) -> Iterator[List[str]]:
+    from openpyxl import load_workbook
+
+    with tempfile.SpooledTemporaryFile(max_size=XLSX_SPOOL_BYTES) as spool:
+        shutil.copyfileobj(body, spool)
+        spool.seek(0)
+        # read_only streams rows from the sheet XML instead of building the whole workbook
+        workbook = load_workbook(spool, read_only=True, data_only=True)
+        try:
+            for values in workbook.worksheets[0].iter_rows(values_only=True):
+                yield [_cell_text(value) for value in values]
+        finally:
+            workbook.close()
+
+
+class _Columns:
+    """Column index -> customer field / productId, built from the header row."""
+
+    def __init__(self, header: List[str], context: CampaignOrderContext) -> None:
+        product_keys: Dict[str, str] = {}
+        for product_id, product in context.products.items():
+            for name in (product_id, str(product.get("productName") or "")):
+                product_keys[_column_key(name)] = product_id
+
+        self.fields: Dict[int, str] = {}
+        self.products: Dict[int, str] = {}
+        seen: Dict[str, str] = {}
+        for index, title in enumerate(header):
+            key = _column_key(title)
+            if not key:
+                continue
+            target = COLUMN_FIELDS.get(key) or product_keys.get(key)
+            if target is None:
+                raise AppError(ErrorCode.INVALID_INPUT, f"Unknown column '{title}': not a customer field or product")
+            if target in seen:
+                raise AppError(ErrorCode.INVALID_INPUT, f"Columns '{seen[target]}' and '{title}' are the same field")
+            seen[target] = title
+            if key in COLUMN_FIELDS:
+                self.fields[index] = target
+            else:
+                self.products[index] = target
+
+        if "customerName" not in self.fields.values():
+            raise AppError(ErrorCode.INVALID_INPUT, "Missing 'Customer Name' column")
+        if not self.products:
+            raise AppError(ErrorCode.INVALID_INPUT, "No product columns: head quantity columns with product names")
+
+
+def _parse_quantity(text: str, product_id: str) -> int:
+    try:
+        quantity = Decimal(text)
+    except InvalidOperation:
+        quantity = Decimal(-1)
+    if quantity < 0 or quantity != quantity.to_integral_value():
+        raise AppError(ErrorCode.INVALID_INPUT, f"Quantity '{text}' for {product_id} must be a whole number")
+    return int(quantity)
+
+
+def _parse_order_date(text: str, default: str) -> str:
+    if not text:
+        return default
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        for date_format in US_DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(text, date_format)
+                break
+            except ValueError:
+                continue
+        else:
+            raise AppError(ErrorCode.INVALID_INPUT, f"Order date '{text}' is not YYYY-MM-DD or MM/DD/YYYY")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    timestamp: str = order_timestamp(parsed)
+    return timestamp
+
+
+def _row_order_input(values: List[str], columns: _Columns, now: str) -> Dict[str, Any]:
+    """Turn one data row into a CreateOrderInput-shaped dict, validating customer fields."""
+
+    def cell(index: int) -> str:
+        return values[index].strip() if index < len(values) else ""
+
+    fields = {field: cell(index) for index, field in columns.fields.items()}
+    line_items = []
+    for index, product_id in columns.products.items():
+        text = cell(index)
+        quantity = _parse_quantity(text, product_id) if text else 0
+        if quantity:
+            line_items.append({"productId": product_id, "quantity": quantity})
+
+    if not fields.get("customerName"):
+        raise AppError(ErrorCode.INVALID_INPUT, "Customer name is required")
+    if not line_items:
+        raise AppError(ErrorCode.INVALID_INPUT, "Row has no product quantities")
+    if not fields.get("paymentMethod"):
+        raise AppError(ErrorCode.INVALID_INPUT, "Payment method is required")
+
+    order_input: Dict[str, Any] = {
+        "customerName": fields["customerName"],
+        "paymentMethod": fields["paymentMethod"],
+        "orderDate": _parse_order_date(fields.get("orderDate", ""), now),
+        "lineItems": line_items,
+        "notes": fields.get("notes"),
+    }
+    if fields.get("customerPhone"):
+        order_input["customerPhone"] = normalize_phone(fields["customerPhone"])
+
+    address = {part: fields.get(part, "") for part in ("street", "city", "state", "zip")}
+    if any(address.values()):
+        validate_address(address)
+        order_input["customerAddress"] = {
+            "street": address["street"],
+            "city": address["city"],
+            "state": address["state"],
+            "zipCode": address["zip"],
+        }
+    return order_input
+
+
+class _ImportRun:
+    """Counters, row errors and the write buffer for one import file."""
+
+    def __init__(self, s3_key: str, context: CampaignOrderContext) -> None:
+        self.s3_key = s3_key
+        self.context = context
+        self.now = order_timestamp()
+        self.rows_processed = 0
+        self.orders_created = 0
+        self.errors: List[Dict[str, Any]] = []
+        self._pending: List[Tuple[int, Dict[str, Any]]] = []
+
+    def add_row(self, row: int, values: List[str], columns: _Columns) -> None:
+        self.rows_processed += 1
+        order_id = f"ORDER#{uuid.uuid5(uuid.NAMESPACE_URL, f'{self.s3_key}#{row}')}"
+        try:
+            order_input = _row_order_input(values, columns, self.now)
+            item = build_order_item(order_input, self.context, self.now, order_id=order_id)
+        except AppError as e:
+            self.errors.append(_row_error(row, e))
+            return
+        self._pending.append((row, item))
+        if len(self._pending) >= IMPORT_WRITE_BUFFER:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        items = [item for _, item in self._pending]
+        unwritten = {item["orderId"] for item in batch_put_items(tables.orders, items, IMPORT_WRITE_WORKERS)}
+        for row, item in self._pending:
+            if item["orderId"] in unwritten:
+                self.errors.append(_row_error(row, AppError(ErrorCode.DATABASE_ERROR, "Order could not be saved")))
+        self.orders_created += len(items) - len(unwritten)
+        self._pending = []
+
+
+def _import_rows(run: _ImportRun, rows: Iterator[List[str]]) -> None:
+    """
+    Import every data row, stopping early at the row cap or when time runs low.
+
+    Raises:
+        AppError: For file-level problems (bad header, row cap, time limit)
+    """
+    header = next(rows, None)
+    if header is None:
+        raise AppError(ErrorCode.INVALID_INPUT, "File is empty")
+    columns = _Columns(header, run.context)
+
+    # Spreadsheet row numbers: the header is row 1
+    for row, values in enumerate(rows, start=2):
+        if not any(value.strip() for value in values):
+            continue
+        if run.rows_processed >= MAX_IMPORT_ROWS:
+            raise AppError(
+                ErrorCode.INVALID_INPUT, f"File has more than {MAX_IMPORT_ROWS} rows; row {row} on were skipped"
+            )
+        if run.rows_processed % IMPORT_WRITE_BUFFER == 0 and not has_time_remaining():
+            raise AppError(ErrorCode.INTERNAL_ERROR, f"Import stopped at row {row}: time limit reached")
+        run.add_row(row, values, columns)
+
+
+def _run_import(s3: "S3Client", bucket: str, s3_key: str, match: "re.Match[str]") -> Dict[str, Any]:
+    """Import one uploaded file and return its report."""
+    account_id, campaign_uuid, import_id, extension = match.groups()
+    report: Dict[str, Any] = {
+        "importId": import_id,
+        "status": "COMPLETED",
+        "campaignId": ensure_campaign_id(campaign_uuid),
+        "rowsProcessed": 0,
+        "ordersCreated": 0,
+        "rowsFailed": 0,
+        "errors": [],
+    }
+    run: Optional[_ImportRun] = None
+    try:
+        context = load_campaign_context(report["campaignId"])
+        _require_write_access(account_id, context)
+        run = _ImportRun(s3_key, context)
+        body = s3.get_object(Bucket=bucket, Key=s3_key)["Body"]
+        _import_rows(run, _iter_xlsx_rows(body) if extension == "xlsx" else _iter_csv_rows(body))
+    except AppError as e:
+        report["status"] = "FAILED"
+        report["errors"].append(_row_error(None, e))
+    except Exception as e:
+        # Malformed files surface as csv/zip/openpyxl/decoding errors
+        logger.warning("Order import file could not be read", s3_key=s3_key, error=str(e))
+        report["status"] = "FAILED"
+        report["errors"].append(_row_error(None, AppError(ErrorCode.INVALID_INPUT, "File could not be read")))
+
+    if run is not None:
+        run.flush()
+        report["rowsProcessed"] = run.rows_processed
+        report["ordersCreated"] = run.orders_created
+        report["rowsFailed"] = run.rows_processed - run.orders_created
+        report["errors"] = sorted(run.errors, key=lambda error: error["row"]) + report["errors"]
+    report["completedAt"] = order_timestamp()
+    return report
+
+
+@handler_middleware
+def process_order_import(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Import orders from files uploaded under order-imports/.
+
+    Invoked by S3 ObjectCreated notifications. Each file gets a report, even
+    when it fails as a whole (unknown campaign, lost access, bad header).
+
+    Returns:
+        Number of files imported
+    """
+    s3 = get_s3_client()
+    imported = 0
+    for record in event.get("Records", []):
+        bucket = record["s3"]["bucket"]["name"]
+        s3_key = unquote_plus(record["s3"]["object"]["key"])
+        match = ORDER_IMPORT_KEY_PATTERN.match(s3_key)
+        if match is None:
+            logger.warning("Ignoring object outside the order import layout", s3_key=s3_key)
+            continue
+
+        report = _run_import(s3, bucket, s3_key, match)
+        s3.put_object(
+            Bucket=bucket,
+            Key=_report_key(match.group(1), report["importId"]),
+            Body=json.dumps(report).encode("utf-8"),
+            ContentType="application/json",
+        )
+        logger.info(
+            "Order import finished",
+            s3_key=s3_key,
+            status=report["status"],
+            rows_processed=report["rowsProcessed"],
+            orders_created=report["ordersCreated"],
+            rows_failed=report["rowsFailed"],
+        )
+        imported += 1
+    return {"imported": imported}
@@ -0,0 +1,177 @@
+"""Lambda resolver for bulk order creation (createOrders)."""
+
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Handle both Lambda (absolute) and unit test (relative) imports
+try:  # pragma: no cover
+    from utils.auth import check_profile_access
+    from utils.dynamodb import batch_get_items, tables
+    from utils.errors import AppError, ErrorCode
+    from utils.ids import ensure_campaign_id, ensure_profile_id
+    from utils.logging import get_logger
+    from utils.middleware import handler_middleware
+    from utils.orders import (
+        CampaignOrderContext,
+        batch_put_items,
+        build_order_item,
+        load_campaign_context,
+        order_response,
+        order_timestamp,
+    )
+except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.auth import check_profile_access
+    from ..utils.dynamodb import batch_get_items, tables
+    from ..utils.errors import AppError, ErrorCode
+    from ..utils.ids import ensure_campaign_id, ensure_profile_id
+    from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
+    from ..utils.orders import (
+        CampaignOrderContext,
+        batch_put_items,
+        build_order_item,
+        load_campaign_context,
+        order_response,
+        order_timestamp,
+    )
+
+logger = get_logger(__name__)
+
+# Largest offline queue accepted in one call (keeps the Lambda well inside its timeout)
+MAX_ORDERS_PER_REQUEST = 100
+
+
+class _OrderBatch:
+    """Per-request memo of access checks and campaign contexts, so each is done once."""
+
+    def __init__(self, caller_account_id: str) -> None:
+        self.caller_account_id = caller_account_id
+        self._access: Dict[str, Optional[AppError]] = {}
+        self._contexts: Dict[str, Union[CampaignOrderContext, AppError]] = {}
+
+    def require_write_access(self, db_profile_id: str) -> None:
+        if db_profile_id not in self._access:
+            try:
+                allowed = check_profile_access(self.caller_account_id, db_profile_id, "WRITE")
+                self._access[db_profile_id] = (
+                    None
+                    if allowed
+                    else AppError(ErrorCode.FORBIDDEN, "You do not have permission to create orders for this profile")
+                )
+            except AppError as e:
+                self._access[db_profile_id] = e
+        error = self._access[db_profile_id]
+        if error is not None:
+            raise error
+
+    def campaign_context(self, db_campaign_id: str) -> CampaignOrderContext:
+        if db_campaign_id not in self._contexts:
+            try:
+                self._contexts[db_campaign_id] = load_campaign_context(db_campaign_id)
+            except AppError as e:
+                self._contexts[db_campaign_id] = e
+        context = self._contexts[db_campaign_id]
+        if isinstance(context, AppError):
+            raise context
+        return context
+
+    def prepare(self, order_input: Dict[str, Any], now: str) -> Dict[str, Any]:
+        """Authorize and build one order item. Raises AppError for this order only."""
+        db_profile_id = ensure_profile_id(order_input.get("profileId"))
+        db_campaign_id = ensure_campaign_id(order_input.get("campaignId"))
+        if not db_profile_id or not db_campaign_id:
+            raise AppError(ErrorCode.INVALID_INPUT, "profileId and campaignId are required")
+
+        self.require_write_access(db_profile_id)
+        context = self.campaign_context(db_campaign_id)
+        if context.campaign["profileId"] != db_profile_id:
+            raise AppError(ErrorCode.INVALID_INPUT, f"Campaign {db_campaign_id} does not belong to this profile")
+        idempotency_key = order_input.get("idempotencyKey")
+        order_id = (
+            f"ORDER#{uuid.uuid5(uuid.NAMESPACE_URL, f'{db_campaign_id}#{idempotency_key}')}"
+            if idempotency_key
+            else None
+        )
+        item: Dict[str, Any] = build_order_item(order_input, context, now, order_id=order_id)
+        return item
+
+
+def _existing_orders(items: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Orders already stored under the given items' keys, by (campaignId, orderId)."""
+    keys = [{"campaignId": item["campaignId"], "orderId": item["orderId"]} for item in items]
+    return {(item["campaignId"], item["orderId"]): item for item in batch_get_items(tables.orders, keys)}
+
+
+def _failure(index: int, error: AppError) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "success": False,
+        "order": None,
+        "errorCode": error.error_code,
+        "errorMessage": error.message,
+    }
+
+
+@handler_middleware
+def create_orders(event: Dict[str, Any], context: Any) -> List[Dict[str, Any]]:
+    """
+    Create a batch of orders, e.g. a seller's offline queue.
+
+    Access is checked once per profile and each campaign's catalog and payment
+    methods are loaded once, instead of once per order as in createOrder.
+    Orders are validated independently: an invalid order is reported and the
+    rest are still written. An order with an idempotencyKey gets an orderId
+    derived from it, so a retried flush returns the order already stored
+    instead of writing a duplicate.
+
+    Args:
+        event: AppSync event with arguments.input (list of CreateOrderInput)
+        context: Lambda context (unused)
+
+    Returns:
+        One CreateOrderResult per input, in input order
+
+    Raises:
+        AppError: If the batch is larger than MAX_ORDERS_PER_REQUEST
+    """
+    caller_account_id = event["identity"]["sub"]
+    order_inputs: List[Dict[str, Any]] = event["arguments"].get("input") or []
+    if len(order_inputs) > MAX_ORDERS_PER_REQUEST:
+        raise AppError(ErrorCode.INVALID_INPUT, f"At most {MAX_ORDERS_PER_REQUEST} orders can be created at once")
+
+    batch = _OrderBatch(caller_account_id)
+    now = order_timestamp()
+    results: List[Dict[str, Any]] = [{} for _ in order_inputs]
+    pending: List[Tuple[int, Dict[str, Any]]] = []
+    for index, order_input in enumerate(order_inputs):
+        try:
+            pending.append((index, batch.prepare(order_input, now)))
+        except AppError as e:
+            results[index] = _failure(index, e)
+
+    existing = _existing_orders([item for index, item in pending if order_inputs[index].get("idempotencyKey")])
+    # A key repeated within the batch is written once
+    to_write: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for _, item in pending:
+        order_key = (item["campaignId"], item["orderId"])
+        if order_key not in existing:
+            to_write.setdefault(order_key, item)
+
+    unwritten = {item["orderId"] for item in batch_put_items(tables.orders, list(to_write.values()))}
+    for index, item in pending:
+        order_key = (item["campaignId"], item["orderId"])
+        stored = existing.get(order_key) or to_write[order_key]
+        if stored["orderId"] in unwritten:
+            results[index] = _failure(index, AppError(ErrorCode.DATABASE_ERROR, "Order could not be saved, retry it"))
+        else:
+            results[index] = {"index": index, "success": True, "order": order_response(stored)}
+
+    logger.info(
+        "Created orders",
+        requested=len(order_inputs),
+        created=len(to_write) - len(unwritten),
+        rejected=len(order_inputs) - len(pending),
+        already_created=len(pending) - len(to_write),
+        unwritten=len(unwritten),
+    )
+    return results
@@ -6,17 +6,17 @@ and confirmations. They integrate with AppSync pipeline resolvers.
 """
 
 import json
-import os
 from typing import Any, Dict
 
-import boto3
 from botocore.exceptions import ClientError
 
 # Handle both Lambda (absolute) and unit test (relative) imports
 try:  # pragma: no cover
+    from utils.aws_clients import get_s3_client
     from utils.dynamodb import get_required_env, tables
     from utils.errors import AppError, ErrorCode
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
     from utils.payment_methods import (
         delete_qr_by_key,
         delete_qr_from_s3,
@@ -24,15 +24,19 @@ try:  # pragma: no cover
         generate_qr_code_s3_key,
         get_payment_methods,
         get_qr_code_s3_key,
+        is_qr_s3_key,
         is_reserved_name,
         slugify,
+        store_optimized_qr,
         update_payment_method,
         validate_qr_s3_key,
     )
 except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.aws_clients import get_s3_client
     from ..utils.dynamodb import get_required_env, tables
     from ..utils.errors import AppError, ErrorCode
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
     from ..utils.payment_methods import (
         delete_qr_by_key,
         delete_qr_from_s3,
@@ -40,13 +44,16 @@ except ModuleNotFoundError:  # pragma: no cover
         generate_qr_code_s3_key,
         get_payment_methods,
         get_qr_code_s3_key,
+        is_qr_s3_key,
         is_reserved_name,
         slugify,
+        store_optimized_qr,
         update_payment_method,
         validate_qr_s3_key,
     )
 
 
+@handler_middleware(error_message="Failed to generate upload URL")
 def request_qr_upload(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Generate pre-signed POST URL for QR code upload.
@@ -65,69 +72,61 @@ def request_qr_upload(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     logger = get_logger(__name__)
 
-    try:
-        # Extract caller identity
-        identity = event.get("identity", {})
-        caller_id = identity.get("sub")
+    # Extract caller identity
+    identity = event.get("identity", {})
+    caller_id = identity.get("sub")
 
-        if not caller_id:
-            raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
+    if not caller_id:
+        raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
 
-        # Extract arguments
-        arguments = event.get("arguments", {})
-        payment_method_name = arguments.get("paymentMethodName", "").strip()
+    # Extract arguments
+    arguments = event.get("arguments", {})
+    payment_method_name = arguments.get("paymentMethodName", "").strip()
 
-        if not payment_method_name:
-            raise AppError(ErrorCode.INVALID_INPUT, "Payment method name is required")
+    if not payment_method_name:
+        raise AppError(ErrorCode.INVALID_INPUT, "Payment method name is required")
 
-        # Validate not reserved
-        if is_reserved_name(payment_method_name):
-            raise AppError(
-                ErrorCode.INVALID_INPUT, f"Cannot upload QR code for reserved method '{payment_method_name}'"
-            )
+    # Validate not reserved
+    if is_reserved_name(payment_method_name):
+        raise AppError(ErrorCode.INVALID_INPUT, f"Cannot upload QR code for reserved method '{payment_method_name}'")
 
-        # Verify payment method exists
-        methods = get_payment_methods(caller_id)
-        method_exists = any(m.get("name") == payment_method_name for m in methods)
-
-        if not method_exists:
-            raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
-
-        # Generate UUID-based S3 key to avoid collisions from similar payment method names
-        s3_key = generate_qr_code_s3_key(caller_id, "png")
-
-        # Generate pre-signed POST URL (must use direct S3, not CloudFront)
-        # CloudFront vanity domain is only used for downloads (GET), not uploads (POST)
-        bucket_name = get_required_env("EXPORTS_BUCKET")
-        s3_client = boto3.client("s3", endpoint_url=os.getenv("S3_ENDPOINT"))
-
-        presigned_post = s3_client.generate_presigned_post(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Fields={"Content-Type": "image/png"},
-            Conditions=[
-                {"Content-Type": "image/png"},
-                ["content-length-range", 1, 5 * 1024 * 1024],  # 1 byte to 5MB
-            ],
-            ExpiresIn=900,  # 15 minutes
-        )
-
-        logger.info(
-            "Generated pre-signed POST URL",
-            account_id=caller_id,
-            payment_method=payment_method_name,
-            s3_key=s3_key,
-        )
-
-        return {"uploadUrl": presigned_post["url"], "fields": presigned_post["fields"], "s3Key": s3_key}
-
-    except AppError:
-        raise
-    except Exception as e:
-        logger.error("Failed to generate pre-signed POST URL", error=str(e))
-        raise AppError(ErrorCode.INTERNAL_ERROR, "Failed to generate upload URL")
+    # Verify payment method exists
+    methods = get_payment_methods(caller_id)
+    method_exists = any(m.get("name") == payment_method_name for m in methods)
+
+    if not method_exists:
+        raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
+
+    # Generate UUID-based S3 key to avoid collisions from similar payment method names
+    s3_key = generate_qr_code_s3_key(caller_id, "png")
+
+    # Generate pre-signed POST URL (must use direct S3, not CloudFront)
+    # CloudFront vanity domain is only used for downloads (GET), not uploads (POST)
+    bucket_name = get_required_env("EXPORTS_BUCKET")
+    s3_client = get_s3_client()
+
+    presigned_post = s3_client.generate_presigned_post(
+        Bucket=bucket_name,
+        Key=s3_key,
+        Fields={"Content-Type": "image/png"},
+        Conditions=[
+            {"Content-Type": "image/png"},
+            ["content-length-range", 1, 5 * 1024 * 1024],  # 1 byte to 5MB
+        ],
+        ExpiresIn=900,  # 15 minutes
+    )
+
+    logger.info(
+        "Generated pre-signed POST URL",
+        account_id=caller_id,
+        payment_method=payment_method_name,
+        s3_key=s3_key,
+    )
 
+    return {"uploadUrl": presigned_post["url"], "fields": presigned_post["fields"], "s3Key": s3_key}
 
+
+@handler_middleware(error_message="Failed to confirm upload")
 def confirm_qr_upload(event: Dict[str, Any], context: Any) -> Dict[str, Any]:  # noqa: C901
     """
     Confirm QR code upload and generate pre-signed GET URL.
@@ -147,88 +146,89 @@ def confirm_qr_upload(event: Dict[str, Any], context: Any) -> Dict[str, Any]:  #
     """
     logger = get_logger(__name__)
 
-    try:
-        # Extract caller identity
-        identity = event.get("identity", {})
-        caller_id = identity.get("sub")
+    # Extract caller identity
+    identity = event.get("identity", {})
+    caller_id = identity.get("sub")
 
-        if not caller_id:
-            raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
+    if not caller_id:
+        raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
 
-        # Extract arguments
-        arguments = event.get("arguments", {})
-        payment_method_name = arguments.get("paymentMethodName", "").strip()
-        s3_key = arguments.get("s3Key", "").strip()
+    # Extract arguments
+    arguments = event.get("arguments", {})
+    payment_method_name = arguments.get("paymentMethodName", "").strip()
+    s3_key = arguments.get("s3Key", "").strip()
 
-        if not payment_method_name or not s3_key:
-            raise AppError(ErrorCode.INVALID_INPUT, "Payment method name and s3Key are required")
+    if not payment_method_name or not s3_key:
+        raise AppError(ErrorCode.INVALID_INPUT, "Payment method name and s3Key are required")
 
-        # Security: Validate s3_key belongs to this caller's account
-        # Prevents users from claiming QR codes they don't own
-        if not validate_qr_s3_key(s3_key, caller_id):
-            raise AppError(ErrorCode.FORBIDDEN, "Invalid S3 key - access denied")
+    # Security: Validate s3_key belongs to this caller's account
+    # Prevents users from claiming QR codes they don't own
+    if not validate_qr_s3_key(s3_key, caller_id):
+        raise AppError(ErrorCode.FORBIDDEN, "Invalid S3 key - access denied")
 
-        # Validate S3 object exists
-        bucket_name = get_required_env("EXPORTS_BUCKET")
-        s3_client = boto3.client("s3", endpoint_url=os.getenv("S3_ENDPOINT"))
+    # Validate S3 object exists
+    bucket_name = get_required_env("EXPORTS_BUCKET")
+    s3_client = get_s3_client()
 
-        try:
-            s3_client.head_object(Bucket=bucket_name, Key=s3_key)
-        except ClientError as e:
-            if e.response.get("Error", {}).get("Code") == "404":
-                raise AppError(ErrorCode.NOT_FOUND, "Upload not found. Please upload the file first.")
-            raise
-
-        # Update DynamoDB with s3_key (store in qrCodeUrl field temporarily)
-        # Note: The actual pre-signed URL will be generated on read
-        # For now, we'll update the payment method record to indicate QR exists
-        account_id_key = f"ACCOUNT#{caller_id}"
-        response = tables.accounts.get_item(Key={"accountId": account_id_key})
-
-        if "Item" not in response:
-            raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
-
-        existing_methods = response["Item"].get("preferences", {}).get("paymentMethods", [])
-
-        # Find and update method
-        method_updated = None
-        for method in existing_methods:
-            if method.get("name") == payment_method_name:
-                method["qrCodeUrl"] = s3_key  # Store S3 key, not URL
-                method_updated = method
-                break
-
-        if not method_updated:
-            raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
-
-        # Save updated methods
-        preferences = response.get("Item", {}).get("preferences", {})
-        preferences["paymentMethods"] = existing_methods
-        tables.accounts.update_item(
-            Key={"accountId": account_id_key},
-            UpdateExpression="SET preferences = :prefs",
-            ExpressionAttributeValues={":prefs": preferences},
-        )
-
-        # Generate pre-signed GET URL
-        presigned_url = generate_presigned_get_url(caller_id, payment_method_name, s3_key, expiry_seconds=900)
-
-        logger.info(
-            "Confirmed QR code upload",
-            account_id=caller_id,
-            payment_method=payment_method_name,
-            s3_key=s3_key,
-        )
-
-        return {"name": payment_method_name, "qrCodeUrl": presigned_url}
-
-    except AppError:
+    try:
+        s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "404":
+            raise AppError(ErrorCode.NOT_FOUND, "Upload not found. Please upload the file first.")
         raise
-    except Exception as e:
-        logger.error("Failed to confirm QR code upload", error=str(e))
-        raise AppError(ErrorCode.INTERNAL_ERROR, "Failed to confirm upload")
 
+    # Re-encode a small optimized copy next to the original (best-effort)
+    optimized_key = store_optimized_qr(s3_key)
+
+    # Update DynamoDB with s3_key (store in qrCodeUrl field temporarily)
+    # Note: The actual pre-signed URL will be generated on read
+    # For now, we'll update the payment method record to indicate QR exists
+    account_id_key = f"ACCOUNT#{caller_id}"
+    response = tables.accounts.get_item(Key={"accountId": account_id_key})
+
+    if "Item" not in response:
+        raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
+
+    existing_methods = response["Item"].get("preferences", {}).get("paymentMethods", [])
+
+    # Find and update method
+    method_updated = None
+    for method in existing_methods:
+        if method.get("name") == payment_method_name:
+            method["qrCodeUrl"] = s3_key  # Store S3 key, not URL
+            method["qrCodeOptimizedKey"] = optimized_key
+            method_updated = method
+            break
+
+    if not method_updated:
+        raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
+
+    # Save updated methods
+    preferences = response.get("Item", {}).get("preferences", {})
+    preferences["paymentMethods"] = existing_methods
+    tables.accounts.update_item(
+        Key={"accountId": account_id_key},
+        UpdateExpression="SET preferences = :prefs",
+        ExpressionAttributeValues={":prefs": preferences},
+    )
+
+    # Generate pre-signed GET URL (optimized copy when available)
+    presigned_url = generate_presigned_get_url(
+        caller_id, payment_method_name, optimized_key or s3_key, expiry_seconds=900
+    )
+
+    logger.info(
+        "Confirmed QR code upload",
+        account_id=caller_id,
+        payment_method=payment_method_name,
+        s3_key=s3_key,
+        optimized_key=optimized_key,
+    )
+
+    return {"name": payment_method_name, "qrCodeUrl": presigned_url}
 
+
+@handler_middleware(error_message="Failed to generate QR code URLs")
 def generate_presigned_urls(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Generate pre-signed GET URLs for payment methods with QR codes.
@@ -248,116 +248,113 @@ def generate_presigned_urls(event: Dict[str, Any], context: Any) -> Dict[str, An
     """
     logger = get_logger(__name__)
 
-    try:
-        # Get payload from AppSync Lambda resolver request
-        payload = event.get("payload", event)
-        # Get previous result from pipeline
-        prev_result = payload.get("prev", {}).get("result", {})
-        methods = prev_result.get("paymentMethods", [])
-        owner_account_id = prev_result.get("ownerAccountId")
-
-        if not owner_account_id:
-            raise AppError(ErrorCode.INVALID_INPUT, "Owner account ID is required")
-
-        # Generate pre-signed URLs for methods with QR codes
-        updated_methods = []
-        for method in methods:
-            method_copy = dict(method)
-            s3_key = method_copy.get("qrCodeUrl")
-
-            if s3_key and not s3_key.startswith("http"):
-                # It's an S3 key, generate pre-signed URL
-                presigned_url = generate_presigned_get_url(
-                    owner_account_id, method_copy.get("name", ""), s3_key, expiry_seconds=900
-                )
-                method_copy["qrCodeUrl"] = presigned_url
-            elif not s3_key:
-                method_copy["qrCodeUrl"] = None
-
-            updated_methods.append(method_copy)
-
-        logger.info("Generated pre-signed URLs", owner_account_id=owner_account_id, count=len(updated_methods))
-
-        return {"paymentMethods": updated_methods, "ownerAccountId": owner_account_id}
-
-    except AppError:
-        raise
-    except Exception as e:
-        logger.error("Failed to generate pre-signed URLs", error=str(e))
-        raise AppError(ErrorCode.INTERNAL_ERROR, "Failed to generate QR code URLs")
+    # Get payload from AppSync Lambda resolver request
+    payload = event.get("payload", event)
+    # Get previous result from pipeline
+    prev_result = payload.get("prev", {}).get("result", {})
+    methods = prev_result.get("paymentMethods", [])
+    owner_account_id = prev_result.get("ownerAccountId")
+
+    if not owner_account_id:
+        raise AppError(ErrorCode.INVALID_INPUT, "Owner account ID is required")
+
+    # Generate pre-signed URLs for methods with QR codes
+    updated_methods = []
+    for method in methods:
+        method_copy = dict(method)
+        s3_key = method_copy.get("qrCodeUrl")
+        # Serve the optimized copy when one was produced on upload confirm
+        optimized_key = method_copy.pop("qrCodeOptimizedKey", None)
+
+        if s3_key and not s3_key.startswith("http"):
+            # It's an S3 key, generate pre-signed URL
+            presigned_url = generate_presigned_get_url(
+                owner_account_id, method_copy.get("name", ""), optimized_key or s3_key, expiry_seconds=900
+            )
+            method_copy["qrCodeUrl"] = presigned_url
+        elif not s3_key:
+            method_copy["qrCodeUrl"] = None
+
+        updated_methods.append(method_copy)
 
+    logger.info("Generated pre-signed URLs", owner_account_id=owner_account_id, count=len(updated_methods))
 
+    return {"paymentMethods": updated_methods, "ownerAccountId": owner_account_id}
+
+
+@handler_middleware(error_message="Failed to delete QR code")
 def delete_qr_code(event: Dict[str, Any], context: Any) -> bool:  # noqa: C901
     """
     Delete QR code from S3 and clear qrCodeUrl in DynamoDB for a payment method.
     """
     logger = get_logger(__name__)
 
-    try:
-        identity = event.get("identity", {})
-        caller_id = identity.get("sub")
-        if not caller_id:
-            raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
-
-        arguments = event.get("arguments", {})
-        payment_method_name = arguments.get("paymentMethodName", "").strip()
-        if not payment_method_name:
-            raise AppError(ErrorCode.INVALID_INPUT, "Payment method name is required")
-
-        if is_reserved_name(payment_method_name):
-            raise AppError(ErrorCode.INVALID_INPUT, "Cannot delete QR for reserved methods")
-
-        methods = get_payment_methods(caller_id)
-        target = next((m for m in methods if m.get("name") == payment_method_name), None)
-        if not target:
-            raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
-
-        # Get the stored s3_key from the payment method (if it exists)
-        stored_qr_key = target.get("qrCodeUrl")
-
-        # Delete QR from S3 using the stored key (if it's a valid s3 path, not a URL)
-        if stored_qr_key and stored_qr_key.startswith("payment-qr-codes/"):
-            try:
-                delete_qr_by_key(stored_qr_key)
-            except Exception as e:
-                # S3 delete is idempotent - if object doesn't exist, that's fine
-                logger.info("S3 delete completed (object may not have existed)", error=str(e))
-        elif stored_qr_key:
-            # Fallback: Legacy slug-based key or HTTP URL - try the old method
-            try:
-                delete_qr_from_s3(caller_id, payment_method_name)
-            except Exception as e:
-                logger.info("S3 delete completed (object may not have existed)", error=str(e))
-
-        # Update payment method to clear QR code URL
-        account_id_key = f"ACCOUNT#{caller_id}"
-        response = tables.accounts.get_item(Key={"accountId": account_id_key})
-
-        if "Item" not in response:
-            raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
-
-        preferences = response["Item"].get("preferences", {})
-        existing_methods = preferences.get("paymentMethods", [])
-        updated_methods = []
-        for m in existing_methods:
-            method_copy = dict(m)
-            if method_copy.get("name") == payment_method_name:
-                method_copy["qrCodeUrl"] = None
-            updated_methods.append(method_copy)
-
-        preferences = response["Item"].get("preferences", {})
-        preferences["paymentMethods"] = updated_methods
-        tables.accounts.update_item(
-            Key={"accountId": account_id_key},
-            UpdateExpression="SET preferences = :prefs",
-            ExpressionAttributeValues={":prefs": preferences},
-        )
-
-        logger.info("Deleted QR code", account_id=caller_id, payment_method=payment_method_name)
-        return True
-
-    except AppError:
-        raise
-    except Exception as e:  # pragma: no cover - generic catch
-        logger.error("Failed to delete QR code", error=str(e))
-        raise AppError(ErrorCode.INTERNAL_ERROR, "Failed to delete QR code")
+    identity = event.get("identity", {})
+    caller_id = identity.get("sub")
+    if not caller_id:
+        raise AppError(ErrorCode.UNAUTHORIZED, "Authentication required")
+
+    arguments = event.get("arguments", {})
+    payment_method_name = arguments.get("paymentMethodName", "").strip()
+    if not payment_method_name:
+        raise AppError(ErrorCode.INVALID_INPUT, "Payment method name is required")
+
+    if is_reserved_name(payment_method_name):
+        raise AppError(ErrorCode.INVALID_INPUT, "Cannot delete QR for reserved methods")
+
+    methods = get_payment_methods(caller_id)
+    target = next((m for m in methods if m.get("name") == payment_method_name), None)
+    if not target:
+        raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
+
+    # Get the stored s3_key from the payment method (if it exists)
+    stored_qr_key = target.get("qrCodeUrl")
+    optimized_qr_key = target.get("qrCodeOptimizedKey")
+
+    # Delete QR from S3 using the stored key (if it's a valid s3 path, not a URL)
+    if is_qr_s3_key(stored_qr_key):
+        try:
+            delete_qr_by_key(stored_qr_key)
+        except Exception as e:
+            # S3 delete is idempotent - if object doesn't exist, that's fine
+            logger.info("S3 delete completed (object may not have existed)", error=str(e))
+    elif stored_qr_key:
+        # Fallback: Legacy slug-based key or HTTP URL - try the old method
+        try:
+            delete_qr_from_s3(caller_id, payment_method_name)
+        except Exception as e:
+            logger.info("S3 delete completed (object may not have existed)", error=str(e))
+
+    if optimized_qr_key:
+        try:
+            delete_qr_by_key(optimized_qr_key)
+        except Exception as e:
+            logger.info("S3 delete completed (object may not have existed)", error=str(e))
+
+    # Update payment method to clear QR code URL
+    account_id_key = f"ACCOUNT#{caller_id}"
+    response = tables.accounts.get_item(Key={"accountId": account_id_key})
+
+    if "Item" not in response:
+        raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{payment_method_name}' not found")
+
+    preferences = response["Item"].get("preferences", {})
+    existing_methods = preferences.get("paymentMethods", [])
+    updated_methods = []
+    for m in existing_methods:
+        method_copy = dict(m)
+        if method_copy.get("name") == payment_method_name:
+            method_copy["qrCodeUrl"] = None
+            method_copy.pop("qrCodeOptimizedKey", None)
+        updated_methods.append(method_copy)
+
+    preferences = response["Item"].get("preferences", {})
+    preferences["paymentMethods"] = updated_methods
+    tables.accounts.update_item(
+        Key={"accountId": account_id_key},
+        UpdateExpression="SET preferences = :prefs",
+        ExpressionAttributeValues={":prefs": preferences},
+    )
+
+    logger.info("Deleted QR code", account_id=caller_id, payment_method=payment_method_name)
+    return True
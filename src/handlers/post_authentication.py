@@ -9,27 +9,38 @@ Event: After user signs in (including first-time social login)
 """
 
 import logging
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
+from botocore.exceptions import ClientError
+
 # Handle both Lambda (absolute) and unit test (relative) imports
 try:  # pragma: no cover
     from utils.dynamodb import tables
     from utils.ids import ensure_account_id
+    from utils.metrics import track_metrics
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.dynamodb import tables
     from ..utils.ids import ensure_account_id
+    from ..utils.metrics import track_metrics
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Logins within this many seconds of the last refresh skip the write entirely
+DEFAULT_REFRESH_WINDOW_SECONDS = 300
+
 
+@track_metrics
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Post-Authentication Lambda Trigger Handler
 
-    Creates or updates Account record in DynamoDB after successful authentication.
+    Creates or updates Account record in DynamoDB after successful authentication
+    with a single conditional update_item. Re-logins within
+    ACCOUNT_REFRESH_WINDOW_SECONDS (default 300) of the last refresh are skipped.
 
     Event structure:
     {
@@ -72,46 +83,45 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Build the accountId key with prefix using centralized utility
         account_id_key = ensure_account_id(account_id) or ""
 
-        # Check if Account already exists (multi-table design: accountId is only key)
-        existing_account = tables.accounts.get_item(Key={"accountId": account_id_key}).get("Item")
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
+        window_seconds = int(os.getenv("ACCOUNT_REFRESH_WINDOW_SECONDS", DEFAULT_REFRESH_WINDOW_SECONDS))
+        refresh_threshold = (now - timedelta(seconds=window_seconds)).isoformat()
 
-        timestamp = datetime.now(timezone.utc).isoformat()
-
-        if existing_account:
-            # Update existing account (email might have changed, update timestamp)
-            # Note: isAdmin is NOT stored in DynamoDB - it comes from JWT cognito:groups claim
-            logger.info(f"Updating existing account: {account_id}")
+        # Single upsert: defaults are only written when the account is new (if_not_exists),
+        # email and updatedAt are refreshed on every write.
+        # Note: isAdmin is NOT stored in DynamoDB - it comes from JWT cognito:groups claim
+        try:
             tables.accounts.update_item(
                 Key={"accountId": account_id_key},
-                UpdateExpression="SET email = :email, updatedAt = :updated",
+                UpdateExpression=(
+                    "SET email = :email, updatedAt = :now, "
+                    "createdAt = if_not_exists(createdAt, :now), "
+                    "givenName = if_not_exists(givenName, :givenName), "
+                    "familyName = if_not_exists(familyName, :familyName), "
+                    "city = if_not_exists(city, :empty), "
+                    "#state = if_not_exists(#state, :empty), "
+                    "unitType = if_not_exists(unitType, :empty), "
+                    "preferences = if_not_exists(preferences, :preferences)"
+                ),
+                # Skip the write for bursty re-logins unless the email changed
+                ConditionExpression=("attribute_not_exists(updatedAt) OR updatedAt < :threshold OR email <> :email"),
+                ExpressionAttributeNames={"#state": "state"},
                 ExpressionAttributeValues={
                     ":email": email,
-                    ":updated": timestamp,
+                    ":now": timestamp,
+                    ":threshold": refresh_threshold,
+                    ":givenName": user_attributes.get("given_name", ""),
+                    ":familyName": user_attributes.get("family_name", ""),
+                    ":empty": "",
+                    ":preferences": {"paymentMethods": []},
                 },
             )
-        else:
-            # Create new Account record (multi-table design: simpler schema)
-            # Note: isAdmin is NOT stored in DynamoDB - it comes from JWT cognito:groups claim
-            logger.info(f"Creating new account: {account_id}")
-
-            account_item = {
-                "accountId": account_id_key,  # PK: ACCOUNT#uuid
-                "email": email,  # GSI: email
-                "givenName": user_attributes.get("given_name", ""),  # Optional metadata
-                "familyName": user_attributes.get("family_name", ""),  # Optional metadata
-                "city": "",  # Will be set via updateMyAccount if provided
-                "state": "",  # Will be set via updateMyAccount if provided
-                "unitType": "",  # Will be set via updateMyAccount if provided
-                "preferences": {  # Initialize preferences with empty paymentMethods
-                    "paymentMethods": []
-                },
-                "createdAt": timestamp,
-                "updatedAt": timestamp,
-            }
-
-            tables.accounts.put_item(Item=account_item)
-
-            logger.info(f"Account created successfully: {account_id}, email={email}")
+            logger.info(f"Account upserted: {account_id}")
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+            logger.info(f"Account refreshed within the last {window_seconds}s, skipping write: {account_id}")
 
         # IMPORTANT: Must return the event for Cognito to continue
         return event
@@ -15,17 +15,83 @@ How it works:
 4. If so, it links the federated identity to the existing user
 5. Then raises an exception to prevent duplicate user creation
 6. The user is then signed in with the existing account
+
+The Cognito client is created once per container with adaptive retries, since
+ListUsers has a low account-wide rate limit and signup bursts hit it first.
+Emails already checked in a warm container are cached briefly so retried
+sign-ups for the same identity skip the lookup.
 """
 
 import logging
-from typing import Any, Dict
+import os
+import time
+from typing import Any, Dict, Tuple
 
 import boto3
+from botocore.config import Config
+
+# Handle both Lambda (absolute) and unit test (relative) imports
+try:  # pragma: no cover
+    from utils.metrics import track_metrics
+except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.metrics import track_metrics
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Adaptive mode backs off and rate-limits client-side on TooManyRequestsException
+COGNITO_RETRY_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 5})
+
+# Module-level client reused across warm invocations (tests reset it to None)
+cognito_client: Any = None
+
+# How long a "no existing user" lookup result is trusted
+DEFAULT_NEGATIVE_CACHE_SECONDS = 60
+
+# Upper bound on cached lookups per container
+NEGATIVE_CACHE_MAX_ENTRIES = 1024
+
+# email -> (federated username that was checked, expiry on the monotonic clock)
+_negative_cache: Dict[str, Tuple[str, float]] = {}
+
+
+def _get_cognito_client() -> Any:
+    """Return the shared cognito-idp client, creating it on first use."""
+    global cognito_client
+    if cognito_client is None:
+        cognito_client = boto3.client("cognito-idp", config=COGNITO_RETRY_CONFIG)
+    return cognito_client
+
+
+def _is_known_new_user(email: str, username: str) -> bool:
+    """Return True if this identity's email was recently checked and had no existing user."""
+    entry = _negative_cache.get(email.lower())
+    if entry is None:
+        return False
+    cached_username, expires_at = entry
+    # Only the identity that was checked may reuse the result; a second provider
+    # for the same email must see the user the first sign-up created.
+    if cached_username != username or expires_at <= time.monotonic():
+        _negative_cache.pop(email.lower(), None)
+        return False
+    return True
+
+
+def _remember_new_user(email: str, username: str) -> None:
+    """Cache a negative lookup result for a short TTL."""
+    ttl = float(os.getenv("PRE_SIGNUP_NEGATIVE_CACHE_SECONDS", DEFAULT_NEGATIVE_CACHE_SECONDS))
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    if len(_negative_cache) >= NEGATIVE_CACHE_MAX_ENTRIES:
+        for key in [key for key, (_, expires_at) in _negative_cache.items() if expires_at <= now]:
+            del _negative_cache[key]
+        if len(_negative_cache) >= NEGATIVE_CACHE_MAX_ENTRIES:
+            # Still full of live entries: drop the oldest insertion
+            del _negative_cache[next(iter(_negative_cache))]
+    _negative_cache[email.lower()] = (username, now + ttl)
+
 
 def _auto_confirm_event(event: Dict[str, Any]) -> Dict[str, Any]:
     """Auto-confirm and auto-verify email for new federated sign-ups."""
@@ -76,6 +142,7 @@ def _handle_signup_exception(e: Exception, email: str, event: Dict[str, Any]) ->
     return event
 
 
+@track_metrics
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Pre-Sign-Up Lambda Trigger Handler
@@ -139,13 +206,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
 def _process_federated_signup(event: Dict[str, Any], user_pool_id: str, username: str, email: str) -> Dict[str, Any]:
     """Process federated sign-up, linking to existing user if found."""
+    if _is_known_new_user(email, username):
+        logger.info(f"No existing user for {email} (cached), allowing federated sign-up")
+        return _auto_confirm_event(event)
+
     try:
-        cognito = boto3.client("cognito-idp")
+        cognito = _get_cognito_client()
         response = cognito.list_users(UserPoolId=user_pool_id, Filter=f'email = "{email}"', Limit=1)
         existing_users = response.get("Users", [])
 
         if not existing_users:
             logger.info(f"No existing user for {email}, allowing federated sign-up")
+            _remember_new_user(email, username)
             return _auto_confirm_event(event)
 
         _handle_existing_user(cognito, user_pool_id, email, username, existing_users[0])
@@ -29,11 +29,13 @@ try:  # pragma: no cover
     from utils.dynamodb import get_dynamodb_resource, tables
     from utils.errors import AppError, ErrorCode
     from utils.logging import StructuredLogger, get_correlation_id
+    from utils.middleware import handler_middleware
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.auth import is_profile_owner
     from ..utils.dynamodb import get_dynamodb_resource, tables
     from ..utils.errors import AppError, ErrorCode
     from ..utils.logging import StructuredLogger, get_correlation_id
+    from ..utils.middleware import handler_middleware
 
 
 # Expose a module-level proxy for test monkeypatching (tests patch ``profile_sharing.dynamodb.batch_get_item``)
@@ -190,6 +192,7 @@ def _build_shared_profile_result(
     }
 
 
+@handler_middleware(error_message="Failed to list shared profiles")
 def list_my_shares(event: Dict[str, Any], context: Any) -> List[Dict[str, Any]]:
     """
     List profiles shared with the current user with full profile data.
@@ -217,52 +220,45 @@ def list_my_shares(event: Dict[str, Any], context: Any) -> List[Dict[str, Any]]:
 
     logger.info("Listing shared profiles", caller_account_id=caller_account_id)
 
-    try:
-        # Step 1: Query shares table GSI to get all shares for this user
-        # Shares are stored with ACCOUNT# prefix on targetAccountId
-        target_account_id_with_prefix = (
-            caller_account_id if caller_account_id.startswith("ACCOUNT#") else f"ACCOUNT#{caller_account_id}"
-        )
-        response = tables.shares.query(
-            IndexName="targetAccountId-index",
-            KeyConditionExpression="targetAccountId = :targetAccountId",
-            ExpressionAttributeValues={":targetAccountId": target_account_id_with_prefix},
-        )
-        shares = response.get("Items", [])
-
-        if not shares:
-            logger.info("No shares found")
-            return []
+    # Step 1: Query shares table GSI to get all shares for this user
+    # Shares are stored with ACCOUNT# prefix on targetAccountId
+    target_account_id_with_prefix = (
+        caller_account_id if caller_account_id.startswith("ACCOUNT#") else f"ACCOUNT#{caller_account_id}"
+    )
+    response = tables.shares.query(
+        IndexName="targetAccountId-index",
+        KeyConditionExpression="targetAccountId = :targetAccountId",
+        ExpressionAttributeValues={":targetAccountId": target_account_id_with_prefix},
+    )
+    shares = response.get("Items", [])
 
-        # Deduplicate by profileId (in case of duplicate shares)
-        shares_by_profile = _deduplicate_shares(shares)
+    if not shares:
+        logger.info("No shares found")
+        return []
 
-        logger.info("Found shares", count=len(shares_by_profile))
+    # Deduplicate by profileId (in case of duplicate shares)
+    shares_by_profile = _deduplicate_shares(shares)
 
-        # Step 2: BatchGetItem to get full profile data
-        profile_keys = [
-            {"ownerAccountId": s["ownerAccountId"], "profileId": s["profileId"]} for s in shares_by_profile.values()
-        ]
-        all_profiles = _batch_get_profiles(profile_keys, tables.profiles, logger)
+    logger.info("Found shares", count=len(shares_by_profile))
 
-        logger.info("Retrieved profiles", count=len(all_profiles))
+    # Step 2: BatchGetItem to get full profile data
+    profile_keys = [
+        {"ownerAccountId": s["ownerAccountId"], "profileId": s["profileId"]} for s in shares_by_profile.values()
+    ]
+    all_profiles = _batch_get_profiles(profile_keys, tables.profiles, logger)
 
-        # Step 3: Merge profile data with share permissions
-        caller_account_id_with_prefix = f"ACCOUNT#{caller_account_id}"
-        result: List[Dict[str, Any]] = []
-        for profile in all_profiles:  # pragma: no branch
-            profile_result = _build_shared_profile_result(profile, shares_by_profile, caller_account_id_with_prefix)
-            if profile_result:
-                result.append(profile_result)
+    logger.info("Retrieved profiles", count=len(all_profiles))
 
-        logger.info("Returning shared profiles", count=len(result))
-        return result
+    # Step 3: Merge profile data with share permissions
+    caller_account_id_with_prefix = f"ACCOUNT#{caller_account_id}"
+    result: List[Dict[str, Any]] = []
+    for profile in all_profiles:  # pragma: no branch
+        profile_result = _build_shared_profile_result(profile, shares_by_profile, caller_account_id_with_prefix)
+        if profile_result:
+            result.append(profile_result)
 
-    except AppError:
-        raise
-    except Exception as e:
-        logger.error("Failed to list shared profiles", error=str(e))
-        raise AppError(ErrorCode.INTERNAL_ERROR, "Failed to list shared profiles")
+    logger.info("Returning shared profiles", count=len(result))
+    return result
 
 
 def create_profile_invite(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
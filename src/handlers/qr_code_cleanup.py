@@ -0,0 +1,252 @@
+"""
+Scheduled garbage collector for orphaned payment QR codes.
+
+request_qr_upload mints a fresh S3 key on every request, so uploads that are
+never confirmed and images replaced by re-uploads are left behind under
+payment-qr-codes/. This job deletes every object under that prefix which no
+payment method references and which is older than a grace period.
+
+The grace period must comfortably exceed the presigned upload window (15 min)
+so in-flight uploads are never collected. Confirming an upload does not
+change its LastModified, so the owning accounts are re-read just before each
+delete batch and keys confirmed since the initial scan are kept.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Set, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_s3.client import S3Client
+    from mypy_boto3_s3.type_defs import ObjectTypeDef
+
+# Handle both Lambda (absolute) and unit test (relative) imports
+try:  # pragma: no cover
+    from utils.aws_clients import get_s3_client
+    from utils.dynamodb import batch_get_items, get_required_env, tables
+    from utils.logging import get_logger
+    from utils.middleware import handler_middleware, has_time_remaining
+    from utils.payment_methods import QR_CODE_S3_PREFIX, get_legacy_qr_keys, is_qr_s3_key
+except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.aws_clients import get_s3_client
+    from ..utils.dynamodb import batch_get_items, get_required_env, tables
+    from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware, has_time_remaining
+    from ..utils.payment_methods import QR_CODE_S3_PREFIX, get_legacy_qr_keys, is_qr_s3_key
+
+logger = get_logger(__name__)
+
+# Module-level proxy that tests can monkeypatch
+s3_client: "S3Client | None" = None
+
+# Objects younger than this are never deleted (covers in-flight uploads)
+DEFAULT_GRACE_HOURS = 24
+
+# Parallel scan segments for the accounts table
+DEFAULT_SCAN_SEGMENTS = 4
+
+# delete_objects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
+
+def _get_s3_client() -> "S3Client":
+    """Return the S3 client (module-level override for tests, otherwise the container-cached client)."""
+    global s3_client
+    if s3_client is not None:
+        return s3_client
+    client: "S3Client" = get_s3_client()
+    return client
+
+
+def _referenced_keys_for_account(item: Dict[str, Any]) -> Set[str]:
+    """Return every QR object key an account's payment methods still point at."""
+    account_id = str(item.get("accountId", "")).removeprefix("ACCOUNT#")
+    methods = item.get("preferences", {}).get("paymentMethods", [])
+    keys: Set[str] = set()
+
+    for method in methods:
+        stored = method.get("qrCodeUrl")
+        if is_qr_s3_key(stored):
+            keys.add(stored)
+        elif stored:
+            # Legacy value (URL): the image still lives under its slug-based key
+            keys.update(get_legacy_qr_keys(account_id, method.get("name", "")))
+        if is_qr_s3_key(method.get("qrCodeOptimizedKey")):
+            keys.add(method["qrCodeOptimizedKey"])
+
+    return keys
+
+
+def _scan_segment(segment: int, total_segments: int) -> Set[str]:
+    """Collect referenced QR keys from one parallel scan segment of the accounts table."""
+    # Each worker gets its own table resource; boto3 resources are not thread-safe
+    accounts_table = tables.accounts
+    keys: Set[str] = set()
+    scan_kwargs: Dict[str, Any] = {
+        "ProjectionExpression": "accountId, preferences.paymentMethods",
+        "Segment": segment,
+        "TotalSegments": total_segments,
+    }
+
+    while True:
+        response = accounts_table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            keys.update(_referenced_keys_for_account(item))
+
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        if last_evaluated_key is None:
+            return keys
+        scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+
+def collect_referenced_keys(total_segments: int = DEFAULT_SCAN_SEGMENTS) -> Set[str]:
+    """
+    Build the set of QR keys referenced by any payment method.
+
+    Args:
+        total_segments: Number of parallel scan segments
+
+    Returns:
+        Set of referenced S3 keys
+    """
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        segment_keys = executor.map(lambda segment: _scan_segment(segment, total_segments), range(total_segments))
+        return set().union(*segment_keys)
+
+
+def _referenced_now(keys: List[str]) -> Set[str]:
+    """Re-read the accounts owning these keys and return the ones a payment method references."""
+    # Keys are payment-qr-codes/<accountId>/<file>
+    account_ids = {parts[1] for parts in (key.split("/") for key in keys) if len(parts) >= 3}
+    account_keys = [{"accountId": f"ACCOUNT#{account_id}"} for account_id in account_ids]
+    accounts = batch_get_items(tables.accounts, account_keys, ("accountId", "preferences"))
+    return set().union(*(_referenced_keys_for_account(item) for item in accounts)) & set(keys)
+
+
+def _iter_qr_object_pages(s3: "S3Client", bucket_name: str) -> Iterator[List["ObjectTypeDef"]]:
+    """Stream list_objects_v2 pages for the QR code prefix."""
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=f"{QR_CODE_S3_PREFIX}/"):
+        yield page.get("Contents", [])
+
+
+def _delete_batch(s3: "S3Client", bucket_name: str, keys: List[str]) -> int:
+    """Delete a batch of keys, returning the number of failures."""
+    response = s3.delete_objects(
+        Bucket=bucket_name,
+        Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+    )
+    errors = response.get("Errors", [])
+    for error in errors:
+        logger.warning("Failed to delete orphaned QR code", s3_key=error.get("Key"), error=error.get("Message"))
+    return len(errors)
+
+
+def _delete_orphans(
+    s3: "S3Client", bucket_name: str, orphans: List[Tuple[str, int]]
+) -> Tuple[List[Tuple[str, int]], int]:
+    """
+    Delete (key, size) orphans, keeping any key referenced since the initial scan.
+
+    Returns:
+        The orphans kept because they are now referenced, and the number of delete failures
+    """
+    referenced = _referenced_now([key for key, _ in orphans])
+    kept = [orphan for orphan in orphans if orphan[0] in referenced]
+    for key in referenced:
+        logger.info("QR code referenced since the scan, keeping it", s3_key=key)
+    keys = [key for key, _ in orphans if key not in referenced]
+    return kept, _delete_batch(s3, bucket_name, keys) if keys else 0
+
+
+@handler_middleware
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Delete orphaned QR code objects from the exports bucket.
+
+    Invoked on a schedule by EventBridge. Configuration comes from the event
+    first, then the environment:
+        - dryRun / QR_CLEANUP_DRY_RUN: report orphans without deleting them
+        - graceHours / QR_CLEANUP_GRACE_HOURS: minimum object age before deletion
+        - scanSegments / QR_CLEANUP_SCAN_SEGMENTS: parallel accounts scan segments
+
+    Listing stops early (truncated=True) when the invocation runs low on time.
+
+    Returns:
+        Throughput metrics for the run
+    """
+    event = event or {}
+    dry_run = str(event.get("dryRun", os.getenv("QR_CLEANUP_DRY_RUN", "false"))).lower() == "true"
+    grace_hours = float(event.get("graceHours", os.getenv("QR_CLEANUP_GRACE_HOURS", DEFAULT_GRACE_HOURS)))
+    total_segments = int(event.get("scanSegments", os.getenv("QR_CLEANUP_SCAN_SEGMENTS", DEFAULT_SCAN_SEGMENTS)))
+
+    started = time.monotonic()
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=grace_hours)
+    bucket_name = get_required_env("EXPORTS_BUCKET")
+    s3 = _get_s3_client()
+
+    referenced = collect_referenced_keys(total_segments)
+    scan_seconds = time.monotonic() - started
+
+    objects_scanned = 0
+    orphans_found = 0
+    objects_deleted = 0
+    bytes_reclaimed = 0
+    delete_errors = 0
+    referenced_since_scan = 0
+    truncated = False
+    # (key, size) of orphans waiting to be deleted
+    pending: List[Tuple[str, int]] = []
+
+    for page in _iter_qr_object_pages(s3, bucket_name):
+        if not has_time_remaining():
+            # Stop before the Lambda timeout; the next scheduled run picks up the rest
+            truncated = True
+            break
+        objects_scanned += len(page)
+        for obj in page:
+            if obj["Key"] in referenced or obj["LastModified"] >= cutoff:
+                continue
+            orphans_found += 1
+            bytes_reclaimed += int(obj.get("Size", 0))
+            if dry_run:
+                logger.info("Orphaned QR code (dry run)", s3_key=obj["Key"])
+                continue
+            pending.append((obj["Key"], int(obj.get("Size", 0))))
+
+        # Flush full batches as pages stream in so memory stays bounded
+        while len(pending) >= DELETE_BATCH_SIZE:
+            batch, pending = pending[:DELETE_BATCH_SIZE], pending[DELETE_BATCH_SIZE:]
+            kept, failures = _delete_orphans(s3, bucket_name, batch)
+            objects_deleted += len(batch) - len(kept) - failures
+            referenced_since_scan += len(kept)
+            bytes_reclaimed -= sum(size for _, size in kept)
+            delete_errors += failures
+
+    if pending:
+        kept, failures = _delete_orphans(s3, bucket_name, pending)
+        objects_deleted += len(pending) - len(kept) - failures
+        referenced_since_scan += len(kept)
+        bytes_reclaimed -= sum(size for _, size in kept)
+        delete_errors += failures
+
+    duration_seconds = time.monotonic() - started
+    metrics = {
+        "dryRun": dry_run,
+        "truncated": truncated,
+        "graceHours": grace_hours,
+        "referencedKeys": len(referenced),
+        "objectsScanned": objects_scanned,
+        "orphansFound": orphans_found,
+        "objectsDeleted": objects_deleted,
+        "deleteErrors": delete_errors,
+        "referencedSinceScan": referenced_since_scan,
+        "bytesReclaimed": bytes_reclaimed,
+        "accountsScanSeconds": round(scan_seconds, 3),
+        "durationSeconds": round(duration_seconds, 3),
+        "objectsPerSecond": round(objects_scanned / max(duration_seconds, 0.001), 1),
+    }
+    logger.info("QR code cleanup complete", **metrics)
+    return metrics
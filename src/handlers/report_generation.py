@@ -5,27 +5,28 @@ Implements:
 - requestCampaignReport: Generate Excel/CSV report for campaign data
 """
 
-import os
 from datetime import datetime, timedelta, timezone
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Dict
 
-import boto3
-
 if TYPE_CHECKING:  # pragma: no cover
     from mypy_boto3_s3.client import S3Client
 
 # Handle both Lambda (absolute) and unit test (relative) imports
 try:  # pragma: no cover
     from utils.auth import check_profile_access
+    from utils.aws_clients import get_s3_client
     from utils.dynamodb import get_required_env, tables
     from utils.errors import AppError, ErrorCode
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.auth import check_profile_access
+    from ..utils.aws_clients import get_s3_client
     from ..utils.dynamodb import get_required_env, tables
     from ..utils.errors import AppError, ErrorCode
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
 
 
 # Module-level proxy that tests can monkeypatch
@@ -33,13 +34,15 @@ s3_client: "S3Client | None" = None
 
 
 def _get_s3_client() -> "S3Client":
-    """Return the S3 client (module-level override for tests, otherwise a fresh boto3 client)."""
+    """Return the S3 client (module-level override for tests, otherwise the container-cached client)."""
     global s3_client
     if s3_client is not None:
         return s3_client
-    return boto3.client("s3", endpoint_url=os.getenv("S3_ENDPOINT"))
+    client: "S3Client" = get_s3_client()
+    return client
 
 
+@handler_middleware
 def request_campaign_report(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Generate a campaign report and upload to S3.
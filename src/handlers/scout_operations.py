@@ -4,19 +4,22 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-import boto3
-
 # Handle both Lambda (absolute) and unit test (relative) imports
 try:  # pragma: no cover
+    from utils.aws_clients import get_dynamodb_client
     from utils.dynamodb import tables
     from utils.logging import get_logger
+    from utils.middleware import handler_middleware
 except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.aws_clients import get_dynamodb_client
     from ..utils.dynamodb import tables
     from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
 
 logger = get_logger(__name__)
 
 
+@handler_middleware
 def create_seller_profile(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Create a new seller profile.
@@ -81,7 +84,7 @@ def create_seller_profile(event: Dict[str, Any], context: Any) -> Dict[str, Any]
         # - PK: ownerAccountId (ACCOUNT#sub) - enables listMyProfiles via PK query
         # - SK: profileId (PROFILE#uuid) - unique profile identifier
         # - GSI: profileId-index - enables getProfile and authorization lookups
-        dynamodb_client = boto3.client("dynamodb")
+        dynamodb_client = get_dynamodb_client()
         dynamodb_client.transact_write_items(
             TransactItems=[
                 {
@@ -0,0 +1,186 @@
+"""
+Publisher of the public read snapshots served from the site's CloudFront distribution.
+
+listPublicCatalogs returns the same data to every caller, so instead of a
+GraphQL round trip per visit the site can read static JSON from its own
+domain, cached at the edge. This worker consumes the catalogs table stream
+and regenerates, in the static assets bucket:
+
+    snapshots/manifest.json                  where the current file is (short cache)
+    snapshots/public-catalogs.<hash>.json    public catalogs, newest first
+
+Shared campaigns are deliberately not published: anyone can read these files,
+while getSharedCampaign needs a signed-in caller who already has the code, and
+join codes are built from the unit, campaign and state, so even a file per
+hashed code could be found by guessing.
+
+Data files are named by a hash of their content, so they never change once
+written and CloudFront can cache them for a year; only the small manifest
+needs to expire. Files dropped from the manifest are deleted after
+RETIRE_AFTER, once no cached manifest can still point at them.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+# Handle both Lambda (absolute) and unit test (relative) imports
+try:  # pragma: no cover
+    from utils.aws_clients import get_s3_client
+    from utils.dynamodb import get_required_env, tables
+    from utils.logging import get_logger
+    from utils.middleware import handler_middleware
+except ModuleNotFoundError:  # pragma: no cover
+    from ..utils.aws_clients import get_s3_client
+    from ..utils.dynamodb import get_required_env, tables
+    from ..utils.logging import get_logger
+    from ..utils.middleware import handler_middleware
+
+logger = get_logger(__name__)
+
+SNAPSHOT_PREFIX = "snapshots/"
+MANIFEST_KEY = f"{SNAPSHOT_PREFIX}manifest.json"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MANIFEST_CACHE_CONTROL = "public, max-age=60"
+# Well past the manifest's max-age, so browsers and edges holding an old manifest still find its files
+RETIRE_AFTER = timedelta(hours=1)
+
+# Only fields an anonymous visitor needs; account ids stay out of public files
+CATALOG_FIELDS = ("catalogId", "catalogName", "catalogType", "isPublic", "products", "createdAt", "updatedAt")
+PRODUCT_FIELDS = ("productId", "productName", "description", "price", "sortOrder")
+
+
+def _json_default(value: Decimal) -> Any:
+    """DynamoDB numbers come back as Decimal; everything else in these items is JSON already."""
+    return int(value) if value == value.to_integral_value() else float(value)
+
+
+def _encode(document: Any) -> bytes:
+    """Canonical JSON, so equal content always hashes to the same file name."""
+    return json.dumps(document, default=_json_default, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _content_key(name: str, body: bytes) -> str:
+    return f"{SNAPSHOT_PREFIX}{name}.{hashlib.sha256(body).hexdigest()[:16]}.json"
+
+
+def _public_catalog(item: Dict[str, Any]) -> Dict[str, Any]:
+    catalog = {field: item.get(field) for field in CATALOG_FIELDS}
+    catalog["products"] = [
+        {field: product.get(field) for field in PRODUCT_FIELDS} for product in item.get("products") or []
+    ]
+    return catalog
+
+
+def _public_catalogs() -> List[Dict[str, Any]]:
+    """Same items as listPublicCatalogs: public, not deleted, newest first."""
+    kwargs: Dict[str, Any] = {
+        "IndexName": "isPublic-createdAt-index",
+        "KeyConditionExpression": "isPublicStr = :isPublicStr",
+        "FilterExpression": "attribute_not_exists(isDeleted) OR isDeleted = :false",
+        "ExpressionAttributeValues": {":isPublicStr": "true", ":false": False},
+        "ScanIndexForward": False,
+    }
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = tables.catalogs.query(**kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return [_public_catalog(item) for item in items]
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _read_manifest(bucket: str) -> Dict[str, Any]:
+    try:
+        response = get_s3_client().get_object(Bucket=bucket, Key=MANIFEST_KEY)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "NoSuchKey":
+            raise
+        return {}
+    manifest: Dict[str, Any] = json.loads(response["Body"].read())
+    return manifest
+
+
+def _put(bucket: str, key: str, body: bytes, cache_control: str) -> None:
+    get_s3_client().put_object(
+        Bucket=bucket, Key=key, Body=body, ContentType="application/json", CacheControl=cache_control
+    )
+
+
+def publish_snapshots_now(bucket: str, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Regenerate the public catalogs snapshot and point the manifest at it.
+
+    A file whose content is unchanged keeps its key and is not rewritten;
+    the manifest is only rewritten when it changes.
+
+    Args:
+        bucket: Static assets bucket
+        now: Current time (for tests)
+
+    Returns:
+        Counts of files written and deleted
+    """
+    now = now or datetime.now(timezone.utc)
+    previous = _read_manifest(bucket)
+    previous_key = previous.get("publicCatalogs")
+
+    catalogs_body = _encode(_public_catalogs())
+    public_catalogs_key = _content_key("public-catalogs", catalogs_body)
+    written = 0
+    if public_catalogs_key != previous_key:
+        _put(bucket, public_catalogs_key, catalogs_body, IMMUTABLE_CACHE_CONTROL)
+        written += 1
+
+    # Dropped files wait out RETIRE_AFTER; files referenced again are simply un-retired
+    retired: Dict[str, str] = {
+        key: retired_at for key, retired_at in previous.get("retired", {}).items() if key != public_catalogs_key
+    }
+    if previous_key and previous_key != public_catalogs_key:
+        retired.setdefault(previous_key, now.isoformat())
+    expired = sorted(
+        key for key, retired_at in retired.items() if now - datetime.fromisoformat(retired_at) >= RETIRE_AFTER
+    )
+    for key in expired:
+        del retired[key]
+
+    manifest = {"publicCatalogs": public_catalogs_key, "retired": retired}
+    unchanged = {k: previous.get(k) for k in manifest} == manifest
+    if not unchanged:
+        _put(bucket, MANIFEST_KEY, _encode({**manifest, "generatedAt": now.isoformat()}), MANIFEST_CACHE_CONTROL)
+    # Only after the new manifest is live, so nothing current ever points at a deleted file
+    if expired:
+        get_s3_client().delete_objects(Bucket=bucket, Delete={"Objects": [{"Key": key} for key in expired]})
+
+    logger.info(
+        "Published snapshots",
+        written=written,
+        deleted=len(expired),
+        manifest_changed=not unchanged,
+    )
+    return {"written": written, "deleted": len(expired)}
+
+
+@handler_middleware
+def publish_snapshots(event: Dict[str, Any], context: Any) -> Dict[str, int]:
+    """
+    Republish the public snapshots after catalog writes.
+
+    Triggered by the catalogs table stream. Every run
+    rebuilds from the tables rather than applying the records, so a batch of
+    any size costs one rebuild and a retried batch converges to the same
+    files. The function runs with a concurrency of one, so manifests are
+    never written out of order.
+
+    Args:
+        event: DynamoDB stream event (records are only a trigger)
+        context: Lambda context (unused)
+
+    Returns:
+        Counts of files written and deleted
+    """
+    return publish_snapshots_now(get_required_env("STATIC_ASSETS_BUCKET"))
@@ -16,11 +16,14 @@ from boto3.dynamodb.conditions import Key
 try:  # pragma: no cover
     from utils.dynamodb import tables
     from utils.ids import ensure_account_id, ensure_profile_id
+    from utils.middleware import handler_middleware
 except ModuleNotFoundError:  # pragma: no cover
     from ..utils.dynamodb import tables
     from ..utils.ids import ensure_account_id, ensure_profile_id
+    from ..utils.middleware import handler_middleware
 
 
+@handler_middleware
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Transfer profile ownership."""
     caller_account_id = event["identity"]["sub"]
@@ -60,8 +63,10 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     # Delete old profile
     tables.profiles.delete_item(Key=old_key)
 
-    # Create new profile with updated owner
+    # Create new profile with updated owner; bumping shareVersion invalidates
+    # permission decisions cached for the previous owner (utils.auth)
     profile["ownerAccountId"] = db_new_owner_id
+    profile["shareVersion"] = int(profile.get("shareVersion", 0)) + 1
     tables.profiles.put_item(Item=profile)
 
     # 4. Delete the share (new owner doesn't need it anymore)
@@ -2,14 +2,26 @@
 Authorization utilities for checking profile and resource access.
 
 Implements owner-based and share-based authorization model.
+
+check_profile_access() can keep its decisions in a warm-container cache
+(enabled by PERMISSION_CACHE_TTL_SECONDS). Every profile carries a
+shareVersion counter that the share/revoke pipelines and ownership transfer
+increment, and a cached decision is only reused while the profile's current
+shareVersion matches the one it was made under. A repeat check then costs a
+single profileId-index read, which the request read cache also reuses for
+any later profile lookup in the same invocation.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import Table
 
-from .dynamodb import tables
+from .dynamodb import cached_get_item, cached_query_first, tables
 from .errors import AppError, ErrorCode
 from .ids import ensure_account_id, ensure_profile_id
 from .logging import get_logger
@@ -17,24 +29,79 @@ from .logging import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
+DEFAULT_PERMISSION_CACHE_MAX_ENTRIES = 1024
+
+# (caller account ID, PROFILE# id, permission)
+PermissionKey = Tuple[str, str, str]
+
+
+class PermissionCache:
+    """Bounded LRU of access decisions, each valid until a deadline and for one profile shareVersion."""
+
+    def __init__(self, max_entries: int = DEFAULT_PERMISSION_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[PermissionKey, Tuple[bool, int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: PermissionKey, share_version: int) -> Optional[bool]:
+        """Return the cached decision, or None if absent, expired, or made under another shareVersion."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            allowed, cached_version, expires_at = entry
+            if cached_version != share_version or expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return allowed
+
+    def put(self, key: PermissionKey, share_version: int, allowed: bool, ttl_seconds: float) -> None:
+        """Remember a decision (negative ones too), evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (allowed, share_version, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_permission_cache = PermissionCache()
+
+
+def _permission_cache_ttl() -> float:
+    """Seconds a cached decision stays valid (0 disables the cache)."""
+    try:
+        return max(float(os.getenv("PERMISSION_CACHE_TTL_SECONDS", "0") or 0), 0.0)
+    except ValueError:
+        return 0.0
+
+
+def reset_permission_cache() -> None:
+    """Drop all cached access decisions (for tests and cold-start measurements)."""
+    _permission_cache.clear()
+
 
 def _is_profile_owner(profiles_table: "Table", caller_account_id: str, db_profile_id: str) -> bool:
     """Check if caller is the profile owner via direct lookup."""
-    direct_response = profiles_table.get_item(
-        Key={"ownerAccountId": f"ACCOUNT#{caller_account_id}", "profileId": db_profile_id}
+    profile = cached_get_item(
+        profiles_table,
+        {"ownerAccountId": f"ACCOUNT#{caller_account_id}", "profileId": db_profile_id},
+        # The owner's profile is also the answer to a later profileId-index lookup
+        index_aliases=[("profileId-index", "profileId")],
     )
-    return "Item" in direct_response
+    return profile is not None
 
 
 def _profile_exists(profiles_table: "Table", db_profile_id: str) -> bool:
     """Check if profile exists via GSI query."""
-    response = profiles_table.query(
-        IndexName="profileId-index",
-        KeyConditionExpression="profileId = :profileId",
-        ExpressionAttributeValues={":profileId": db_profile_id},
-        Limit=1,
-    )
-    return bool(response.get("Items", []))
+    return cached_query_first(profiles_table, "profileId-index", "profileId", db_profile_id) is not None
 
 
 def _normalize_permissions(permissions: Any) -> list[str]:
@@ -54,10 +121,9 @@ def _check_share_permissions(
     shares_table: "Table", db_profile_id: str, db_caller_id: str, required_permission: str
 ) -> bool:
     """Check if caller has required permission via share."""
-    share_response = shares_table.get_item(Key={"profileId": db_profile_id, "targetAccountId": db_caller_id})
-    if "Item" not in share_response:
+    share = cached_get_item(shares_table, {"profileId": db_profile_id, "targetAccountId": db_caller_id})
+    if share is None:
         return False
-    share = share_response["Item"]
     permissions = _normalize_permissions(share.get("permissions", []))
     if required_permission == "READ" and ("READ" in permissions or "WRITE" in permissions):
         return True
@@ -66,10 +132,44 @@ def _check_share_permissions(
     return False
 
 
+def _check_profile_access_cached(
+    caller_account_id: str, db_profile_id: str, required_permission: str, ttl_seconds: float
+) -> Optional[bool]:
+    """
+    Decide access from the profile's index entry and the permission cache.
+
+    Returns:
+        The decision, or None when the profile is not (yet) visible in profileId-index,
+        in which case the caller falls back to the strongly consistent checks
+    """
+    profile = cached_query_first(tables.profiles, "profileId-index", "profileId", db_profile_id)
+    if profile is None:
+        return None
+
+    share_version = int(profile.get("shareVersion", 0))
+    key = (caller_account_id, db_profile_id, required_permission)
+    allowed = _permission_cache.get(key, share_version)
+    if allowed is not None:
+        return allowed
+
+    if profile.get("ownerAccountId") == f"ACCOUNT#{caller_account_id}":
+        allowed = True
+    else:
+        db_caller_id = ensure_account_id(caller_account_id)
+        assert db_caller_id is not None
+        allowed = _check_share_permissions(tables.shares, db_profile_id, db_caller_id, required_permission)
+    _permission_cache.put(key, share_version, allowed, ttl_seconds)
+    return allowed
+
+
 def check_profile_access(caller_account_id: str, profile_id: str, required_permission: str = "READ") -> bool:
     """
     Check if caller has access to profile.
 
+    With PERMISSION_CACHE_TTL_SECONDS set, decisions (including "no access") are
+    reused across invocations of a warm container until they expire or the
+    profile's shareVersion changes.
+
     Args:
         caller_account_id: Cognito sub (Account ID) of the caller
         profile_id: Profile ID to check access for
@@ -86,6 +186,12 @@ def check_profile_access(caller_account_id: str, profile_id: str, required_permi
     # ensure_profile_id returns Optional[str], but we know profile_id is not None here
     assert db_profile_id is not None
 
+    ttl_seconds = _permission_cache_ttl()
+    if ttl_seconds > 0:
+        cached = _check_profile_access_cached(caller_account_id, db_profile_id, required_permission, ttl_seconds)
+        if cached is not None:
+            return cached
+
     # Check if caller is owner (faster, strongly consistent)
     if _is_profile_owner(tables.profiles, caller_account_id, db_profile_id):
         return True
@@ -140,19 +246,11 @@ def is_profile_owner(caller_account_id: str, profile_id: str) -> bool:
 
     # Multi-table design V2: Query profileId-index GSI
     # Profile table structure: PK=ownerAccountId, SK=profileId, GSI=profileId-index
-    response = tables.profiles.query(
-        IndexName="profileId-index",
-        KeyConditionExpression="profileId = :profileId",
-        ExpressionAttributeValues={":profileId": db_profile_id},
-        Limit=1,
-    )
-
-    items = response.get("Items", [])
-    if not items:
+    profile = cached_query_first(tables.profiles, "profileId-index", "profileId", db_profile_id)
+    if profile is None:
         raise AppError(ErrorCode.NOT_FOUND, f"Profile {profile_id} not found")
 
-    profile = items[0]
-    stored_owner = profile.get("ownerAccountId", "")
+    stored_owner: str = profile.get("ownerAccountId", "")
     # Handle both with and without prefix for backward compatibility
     return stored_owner == caller_account_id or stored_owner == f"ACCOUNT#{caller_account_id}"
 
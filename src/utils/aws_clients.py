@@ -0,0 +1,68 @@
+"""
+Cached boto3 clients and resources.
+
+Building a boto3 client or resource costs 10-20 ms (service model loading,
+endpoint resolution), and a Lambda container serves many invocations, so
+each one is created on first use and reused afterwards. The cache is
+per-thread because boto3 resources are not thread-safe, and it is keyed by
+endpoint URL so LocalStack overrides (DYNAMODB_ENDPOINT, S3_ENDPOINT) still
+apply.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import boto3
+
+from .metrics import install_hooks
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_dynamodb import DynamoDBClient, DynamoDBServiceResource
+    from mypy_boto3_s3.client import S3Client
+
+_local = threading.local()
+
+
+def _cache() -> Dict[Tuple[str, str, Optional[str]], Any]:
+    cache: Optional[Dict[Tuple[str, str, Optional[str]], Any]] = getattr(_local, "cache", None)
+    if cache is None:
+        cache = {}
+        _local.cache = cache
+    return cache
+
+
+def _cached(kind: str, service: str, endpoint_env: str) -> Any:
+    """Return the cached client/resource for this thread, creating it on first use."""
+    endpoint_url = os.getenv(endpoint_env)
+    cache = _cache()
+    key = (kind, service, endpoint_url)
+    if key not in cache:
+        # Clients copy the session's event hooks when built, so register ours first
+        install_hooks()
+        factory = boto3.client if kind == "client" else boto3.resource
+        cache[key] = factory(service, endpoint_url=endpoint_url)  # type: ignore[call-overload]
+    return cache[key]
+
+
+def get_dynamodb_service_resource() -> "DynamoDBServiceResource":
+    """Return the shared DynamoDB service resource."""
+    resource: "DynamoDBServiceResource" = _cached("resource", "dynamodb", "DYNAMODB_ENDPOINT")
+    return resource
+
+
+def get_dynamodb_client() -> "DynamoDBClient":
+    """Return the shared low-level DynamoDB client."""
+    client: "DynamoDBClient" = _cached("client", "dynamodb", "DYNAMODB_ENDPOINT")
+    return client
+
+
+def get_s3_client() -> "S3Client":
+    """Return the shared S3 client."""
+    client: "S3Client" = _cached("client", "s3", "S3_ENDPOINT")
+    return client
+
+
+def reset_clients() -> None:
+    """Drop this thread's cached clients (for test isolation)."""
+    _cache().clear()
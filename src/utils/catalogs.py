@@ -0,0 +1,118 @@
+"""
+Immutable catalog versions.
+
+createCatalog and updateCatalog (put_catalog_version_fn.js) store every
+catalog write as a new item in the catalog versions table, keyed by catalogId
+and version, holding the products and a precomputed productId -> product
+map, and then point the catalog's currentVersion at it. A version is never
+modified, so it can be cached for the life of a warm container without any
+invalidation, and an order that records its catalogVersion can always be
+re-priced against exactly the products it was priced from.
+
+Catalogs written before versioning have no currentVersion; their products
+are read from the catalog item itself.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .dynamodb import tables
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_VERSION_CACHE_MAX_ENTRIES = 256
+
+# (CATALOG# id, version)
+VersionKey = Tuple[str, str]
+
+
+class CatalogVersionCache:
+    """
+    Bounded LRU of catalog versions; entries never go stale, they are only evicted.
+
+    Entries are copied in and out, so a caller that modifies a version it was
+    given cannot change what later callers see.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_VERSION_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[VersionKey, Dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: VersionKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            version = self._entries.get(key)
+            if version is not None:
+                self._entries.move_to_end(key)
+        return copy.deepcopy(version)
+
+    def put(self, key: VersionKey, version: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = copy.deepcopy(version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_version_cache = CatalogVersionCache()
+
+
+def reset_catalog_version_cache() -> None:
+    """Drop all cached catalog versions (for tests and cold-start measurements)."""
+    _version_cache.clear()
+
+
+def get_catalog_version(catalog_id: str, version: str) -> Optional[Dict[str, Any]]:
+    """
+    Return a catalog version, reading it at most once per container.
+
+    Args:
+        catalog_id: Catalog ID (CATALOG# prefixed)
+        version: Version ID (a catalog's currentVersion or an order's catalogVersion)
+
+    Returns:
+        The version item, or None if it does not exist (missing versions are not cached)
+    """
+    key = (catalog_id, version)
+    cached = _version_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Consistent: the version may have been written just before the catalog pointed at it
+    response = tables.catalog_versions.get_item(Key={"catalogId": catalog_id, "version": version}, ConsistentRead=True)
+    item = response.get("Item")
+    if item is None:
+        return None
+    _version_cache.put(key, item)
+    return item
+
+
+def catalog_products(catalog: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Dict[str, Any]]]:
+    """
+    Products of a catalog's current version, by productId.
+
+    Args:
+        catalog: Catalog item
+
+    Returns:
+        (version, products by productId); version is None for catalogs written
+        before versioning, whose products come from the catalog item
+    """
+    version_id = catalog.get("currentVersion")
+    if version_id:
+        version = get_catalog_version(catalog["catalogId"], version_id)
+        if version is not None:
+            products: Dict[str, Dict[str, Any]] = version["productsById"]
+            return version_id, products
+        logger.warning("Catalog version not found", catalog_id=catalog["catalogId"], version=version_id)
+    return None, {product["productId"]: product for product in catalog.get("products", [])}
@@ -0,0 +1,290 @@
+"""
+Per-profile customer search index, maintained from order writes.
+
+Orders carry free-text customer details. To find a returning customer, this
+module groups a profile's orders by customer (normalized name + phone) and
+indexes the words of the name, phone and address. All items live in the
+customer index table under the profile's partition (PK profileId, SK indexKey):
+
+    SHARD#<cc>        one item per first two characters of a token; each
+                      attribute "<token>|<customerKey>" is a marker (true)
+                      that the customer has that token
+    CUSTOMER#<key>    customer details, orderRefs ("<orderDate>|<campaignId>|<orderId>"),
+                      one y<year> string set of orderIds per order year and one
+                      t:<token> string set of the orderIds that contributed each token
+
+Order ids are only kept on the customer item, so a shard item grows by a few
+dozen bytes per customer token and every write to it stays cheap, however
+many orders the profile has. Customer item writes are set ADDs or DELETEs
+keyed by orderId, so replaying a stream record or two writers touching the
+same customer cannot double count, and an empty set disappears on its own
+when the last order leaves it; a token's marker is removed once its set is
+gone.
+
+A prefix search reads the shards for the query's words (one BatchGetItem)
+and then the matching customers (a second BatchGetItem).
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_dynamodb.service_resource import Table
+
+SHARD_PREFIX = "SHARD#"
+CUSTOMER_PREFIX = "CUSTOMER#"
+TOKEN_PREFIX = "t:"
+
+# Shorter words match too many customers to be worth storing (prefix search still finds longer ones)
+MIN_TOKEN_LENGTH = 2
+# Tokens are sharded by their first characters; every token is at least this long
+SHARD_LENGTH = MIN_TOKEN_LENGTH
+SHARD_CHARACTERS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize_words(text: Optional[str]) -> List[str]:
+    """Lowercase alphanumeric words of a text."""
+    return _WORD.findall((text or "").lower())
+
+
+def _digits(text: Optional[str]) -> str:
+    return re.sub(r"\D", "", text or "")
+
+
+def customer_key(order: Dict[str, Any]) -> Optional[str]:
+    """Stable key for the customer of an order, or None if the order has no customer name."""
+    name = " ".join(normalize_words(order.get("customerName")))
+    if not name:
+        return None
+    # Last 10 digits so "+1 555..." and "555..." are the same customer
+    identity = f"{name}|{_digits(order.get('customerPhone'))[-10:]}"
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+def order_tokens(order: Dict[str, Any]) -> Set[str]:
+    """Searchable tokens of an order's customer: name, phone and address words."""
+    tokens = set(normalize_words(order.get("customerName")))
+    phone = _digits(order.get("customerPhone"))
+    if phone:
+        tokens.update({phone[-10:], phone[-7:]})
+    address = order.get("customerAddress") or {}
+    for field in ("street", "city", "state", "zipCode"):
+        tokens.update(normalize_words(address.get(field)))
+    return {token for token in tokens if len(token) >= MIN_TOKEN_LENGTH}
+
+
+def order_ref(order: Dict[str, Any]) -> str:
+    return f"{order.get('orderDate', '')}|{order['campaignId']}|{order['orderId']}"
+
+
+def order_year(order: Dict[str, Any]) -> Optional[str]:
+    year = str(order.get("orderDate") or order.get("createdAt") or "")[:4]
+    return year if year.isdigit() else None
+
+
+class IndexEntry(NamedTuple):
+    """What one order contributes to its profile's customer index."""
+
+    profile_id: str
+    customer_key: str
+    tokens: frozenset[str]
+    ref: str
+    year: Optional[str]
+
+    @classmethod
+    def from_order(cls, order: Optional[Dict[str, Any]]) -> Optional["IndexEntry"]:
+        if not order or not order.get("profileId") or not order.get("orderId"):
+            return None
+        key = customer_key(order)
+        if key is None:
+            return None
+        return cls(order["profileId"], key, frozenset(order_tokens(order)), order_ref(order), order_year(order))
+
+
+def shards_for_word(word: str) -> List[str]:
+    """Shards holding the tokens that start with a query word (all of them after its first character if shorter)."""
+    if len(word) >= SHARD_LENGTH:
+        return [word[:SHARD_LENGTH]]
+    return [word + character for character in SHARD_CHARACTERS]
+
+
+def _shard_attribute(token: str, key: str) -> str:
+    return f"{token}|{key}"
+
+
+def _token_attribute(token: str) -> str:
+    return f"{TOKEN_PREFIX}{token}"
+
+
+def _update_set_attributes(table: "Table", key: Dict[str, str], action: str, values: Dict[str, str]) -> Dict[str, Any]:
+    """ADD or DELETE one value to/from several string-set attributes of an item."""
+    names = {f"#a{i}": attribute for i, attribute in enumerate(values)}
+    value_names = {f":v{i}": {value} for i, value in enumerate(values.values())}
+    expression = f"{action} " + ", ".join(f"{name} {value}" for name, value in zip(names, value_names, strict=True))
+    response = table.update_item(
+        Key=key,
+        UpdateExpression=expression,
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=value_names,
+        ReturnValues="ALL_NEW",
+    )
+    attributes: Dict[str, Any] = response.get("Attributes", {})
+    return attributes
+
+
+def _mark_shards(table: "Table", profile_id: str, customer: str, tokens: Iterable[str], present: bool) -> None:
+    """Set (or remove) the customer's marker for each token, one UpdateItem per shard."""
+    by_shard: Dict[str, List[str]] = defaultdict(list)
+    for token in sorted(tokens):
+        by_shard[token[:SHARD_LENGTH]].append(_shard_attribute(token, customer))
+    for shard, attributes in sorted(by_shard.items()):
+        names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+        kwargs: Dict[str, Any] = {}
+        if present:
+            expression = "SET " + ", ".join(f"{name} = :marker" for name in names)
+            kwargs["ExpressionAttributeValues"] = {":marker": True}
+        else:
+            expression = "REMOVE " + ", ".join(names)
+        table.update_item(
+            Key={"profileId": profile_id, "indexKey": f"{SHARD_PREFIX}{shard}"},
+            UpdateExpression=expression,
+            ExpressionAttributeNames=names,
+            **kwargs,
+        )
+
+
+def _order_id(entry: IndexEntry) -> str:
+    return entry.ref.rsplit("|", 1)[1]
+
+
+def _customer_sets(entry: IndexEntry) -> Dict[str, str]:
+    """String-set attributes of the customer item that hold this order."""
+    sets = {"orderRefs": entry.ref}
+    if entry.year:
+        sets[f"y{entry.year}"] = _order_id(entry)
+    return sets
+
+
+def _details(order: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: order.get(field) for field in ("customerName", "customerPhone", "customerAddress")}
+
+
+def _customer_key(entry: IndexEntry) -> Dict[str, str]:
+    return {"profileId": entry.profile_id, "indexKey": f"{CUSTOMER_PREFIX}{entry.customer_key}"}
+
+
+def _add(table: "Table", entry: IndexEntry, tokens: Iterable[str], order: Dict[str, Any]) -> None:
+    tokens = list(tokens)
+    order_id = _order_id(entry)
+    sets = {**_customer_sets(entry), **{_token_attribute(token): order_id for token in tokens}}
+    # Details follow the customer's latest written order
+    details = _details(order)
+    names = {f"#d{i}": field for i, field in enumerate(details)}
+    values = {f":d{i}": value for i, value in enumerate(details.values())}
+    set_names = {f"#a{i}": attribute for i, attribute in enumerate(sets)}
+    set_values = {f":v{i}": {value} for i, value in enumerate(sets.values())}
+    table.update_item(
+        Key=_customer_key(entry),
+        UpdateExpression="SET "
+        + ", ".join(f"{name} = {value}" for name, value in zip(names, values, strict=True))
+        + " ADD "
+        + ", ".join(f"{name} {value}" for name, value in zip(set_names, set_values, strict=True)),
+        ExpressionAttributeNames={**names, **set_names},
+        ExpressionAttributeValues={**values, **set_values},
+    )
+    # Markers only after the customer item holds the order, so a concurrent removal re-checks correctly
+    _mark_shards(table, entry.profile_id, entry.customer_key, tokens, present=True)
+
+
+def _remove(table: "Table", entry: IndexEntry, tokens: Iterable[str], whole_order: bool) -> None:
+    """Remove the order's tokens (and with whole_order, the order itself) from its customer."""
+    tokens = list(tokens)
+    order_id = _order_id(entry)
+    sets = {_token_attribute(token): order_id for token in tokens}
+    if whole_order:
+        sets.update(_customer_sets(entry))
+    if not sets:
+        return
+    remaining = _update_set_attributes(table, _customer_key(entry), "DELETE", sets)
+
+    unused = [token for token in tokens if not remaining.get(_token_attribute(token))]
+    if unused:
+        _mark_shards(table, entry.profile_id, entry.customer_key, unused, present=False)
+        # Another order may have added one of these tokens after our DELETE but set its marker
+        # before our REMOVE; its set is already on the customer item, so restore those markers
+        current = table.get_item(Key=_customer_key(entry), ConsistentRead=True).get("Item", {})
+        readded = [token for token in unused if current.get(_token_attribute(token))]
+        if readded:
+            _mark_shards(table, entry.profile_id, entry.customer_key, readded, present=True)
+
+    if whole_order and not remaining.get("orderRefs"):
+        # Last order gone; the condition keeps a customer that a concurrent write just re-added
+        try:
+            table.delete_item(Key=_customer_key(entry), ConditionExpression="attribute_not_exists(orderRefs)")
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            pass
+
+
+def index_order_change(table: "Table", old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+    """
+    Update the customer index for one order write.
+
+    Args:
+        table: Customer index table
+        old: Order before the write (None for a new order)
+        new: Order after the write (None for a deleted order)
+    """
+    old_entry, new_entry = IndexEntry.from_order(old), IndexEntry.from_order(new)
+    if new_entry is not None and new is not None and old_entry is not None and old is not None:
+        if old_entry == new_entry and _details(old) == _details(new):
+            # Most order edits (line items, payment, notes) do not touch the index
+            return
+        if old_entry._replace(tokens=new_entry.tokens) == new_entry:
+            # Same customer and order ref: only tokens and details can differ
+            _add(table, new_entry, new_entry.tokens - old_entry.tokens, new)
+            _remove(table, old_entry, old_entry.tokens - new_entry.tokens, whole_order=False)
+            return
+    if old_entry is not None:
+        _remove(table, old_entry, old_entry.tokens, whole_order=True)
+    if new_entry is not None and new is not None:
+        _add(table, new_entry, new_entry.tokens, new)
+
+
+def match_prefix(shards: Iterable[Dict[str, Any]], words: List[str]) -> Set[str]:
+    """Customer keys that have, for every query word, a token starting with that word."""
+    keys_by_word: Dict[str, Set[str]] = {word: set() for word in words}
+    for shard in shards:
+        for attribute in shard:
+            token, separator, key = attribute.partition("|")
+            if not separator:
+                continue
+            for word in words:
+                if token.startswith(word):
+                    keys_by_word[word].add(key)
+    matched: Optional[Set[str]] = None
+    for keys in keys_by_word.values():
+        matched = keys if matched is None else matched & keys
+    return matched or set()
+
+
+def customer_response(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a Customer response from a customer index item."""
+    refs = sorted((ref.split("|", 2) for ref in item.get("orderRefs", set())), reverse=True)
+    years = sorted((int(attribute[1:]) for attribute in item if re.fullmatch(r"y\d{4}", attribute)), reverse=True)
+    return {
+        "customerKey": item["indexKey"].removeprefix(CUSTOMER_PREFIX),
+        "customerName": item.get("customerName") or "",
+        "customerPhone": item.get("customerPhone"),
+        "customerAddress": item.get("customerAddress"),
+        "orderCount": len(refs),
+        "lastOrderDate": refs[0][0] if refs and refs[0][0] else None,
+        "orderYears": years,
+        "orders": [
+            {"orderDate": date or None, "campaignId": campaign_id, "orderId": order_id}
+            for date, campaign_id, order_id in refs
+        ],
+    }
@@ -2,13 +2,26 @@
 Centralized DynamoDB table access utilities.
 
 Provides singleton-pattern table accessors with lazy initialization
-and test monkeypatch support.
+and test monkeypatch support, plus a request-scoped read cache: inside
+request_read_cache() (opened by @handler_middleware for every invocation),
+cached_get_item() and cached_query_first() serve repeat lookups of the same
+item from memory. The cache is dropped when the invocation ends, so nothing
+is shared between requests; use it only for items the request does not
+modify.
+
+batch_get_items() reads many items by primary key in BatchGetItem requests.
 """
 
+import copy
 import os
-from typing import TYPE_CHECKING, Any, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
 
-import boto3
+from .aws_clients import get_dynamodb_service_resource
+from .errors import AppError, ErrorCode
+from .metrics import record_saved_read
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb import DynamoDBServiceResource
@@ -42,8 +55,8 @@ def get_required_env(name: str, default: Optional[str] = None) -> str:
 
 
 def _get_dynamodb() -> "DynamoDBServiceResource":
-    """Get DynamoDB resource with optional endpoint override for LocalStack."""
-    return boto3.resource("dynamodb", endpoint_url=os.getenv("DYNAMODB_ENDPOINT"))
+    """Get the container-cached DynamoDB resource (honours DYNAMODB_ENDPOINT for LocalStack)."""
+    return get_dynamodb_service_resource()
 
 
 def get_dynamodb_resource() -> "DynamoDBServiceResource":
@@ -113,6 +126,14 @@ class TableAccessor:
         table_name = get_required_env("CATALOGS_TABLE_NAME")
         return _get_dynamodb().Table(table_name)
 
+    @property
+    def catalog_versions(self) -> "Table":
+        """Get catalog versions table instance (see utils.catalogs)."""
+        if override := _table_overrides.get("catalog_versions"):
+            return override
+        table_name = get_required_env("CATALOG_VERSIONS_TABLE_NAME")
+        return _get_dynamodb().Table(table_name)
+
     @property
     def invites(self) -> "Table":
         """Get invites table instance."""
@@ -129,6 +150,14 @@ class TableAccessor:
         table_name = get_required_env("SHARED_CAMPAIGNS_TABLE_NAME")
         return _get_dynamodb().Table(table_name)
 
+    @property
+    def customer_index(self) -> "Table":
+        """Get customer search index table instance (see utils.customer_index)."""
+        if override := _table_overrides.get("customer_index"):
+            return override
+        table_name = get_required_env("CUSTOMER_INDEX_TABLE_NAME")
+        return _get_dynamodb().Table(table_name)
+
 
 # Singleton instance for import
 tables = TableAccessor()
@@ -148,3 +177,161 @@ def clear_all_overrides() -> None:
 def reset_singleton() -> None:
     """Reset the singleton instance (for testing isolation)."""
     TableAccessor._instance = None
+
+
+class RequestReadCache:
+    """Items read during one invocation, keyed by table and key (or index and key value)."""
+
+    def __init__(self) -> None:
+        self._items: Dict[Hashable, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, cache_key: Hashable) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Return (found, item); a cached None means the item is known not to exist."""
+        with self._lock:
+            if cache_key not in self._items:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            item = self._items[cache_key]
+        record_saved_read()
+        # Callers may mutate what they get back; keep the cached copy pristine
+        return True, copy.deepcopy(item)
+
+    def store(self, cache_key: Hashable, item: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._items[cache_key] = copy.deepcopy(item)
+
+
+# Cache for the invocation in progress (None outside request_read_cache())
+_request_cache: Optional[RequestReadCache] = None
+
+
+@contextmanager
+def request_read_cache() -> Iterator[RequestReadCache]:
+    """Open a read cache for the current request; nested calls share the outer one."""
+    global _request_cache
+    outer = _request_cache
+    cache = outer or RequestReadCache()
+    _request_cache = cache
+    try:
+        yield cache
+    finally:
+        _request_cache = outer
+
+
+def _primary_cache_key(table: "Table", key: Dict[str, Any]) -> Hashable:
+    return (table.name, None, tuple(sorted(key.items())))
+
+
+def _index_cache_key(table: "Table", index_name: str, attribute: str, value: Any) -> Hashable:
+    return (table.name, index_name, ((attribute, value),))
+
+
+def cached_get_item(
+    table: "Table", key: Dict[str, Any], index_aliases: Sequence[Tuple[str, str]] = ()
+) -> Optional[Dict[str, Any]]:
+    """
+    get_item through the request read cache.
+
+    Args:
+        table: Table to read
+        key: Full primary key
+        index_aliases: (index name, attribute) pairs under which a found item is
+            also remembered, so a later cached_query_first() on that index hits
+
+    Returns:
+        The item, or None if it does not exist
+    """
+    cache = _request_cache
+    cache_key = _primary_cache_key(table, key)
+    if cache is not None:
+        found, item = cache.lookup(cache_key)
+        if found:
+            return item
+
+    response = table.get_item(Key=key)
+    item = response["Item"] if "Item" in response else None
+    if cache is not None:
+        cache.store(cache_key, item)
+        for index_name, attribute in index_aliases:
+            if item is not None and attribute in item:
+                cache.store(_index_cache_key(table, index_name, attribute, item[attribute]), item)
+    return item
+
+
+def cached_query_first(table: "Table", index_name: str, attribute: str, value: Any) -> Optional[Dict[str, Any]]:
+    """
+    Return the first item whose index partition key equals value, through the request read cache.
+
+    For indexes that map a key to a single item (e.g. profileId-index).
+    """
+    cache = _request_cache
+    cache_key = _index_cache_key(table, index_name, attribute, value)
+    if cache is not None:
+        found, item = cache.lookup(cache_key)
+        if found:
+            return item
+
+    response = table.query(
+        IndexName=index_name,
+        KeyConditionExpression=f"{attribute} = :{attribute}",
+        ExpressionAttributeValues={f":{attribute}": value},
+        Limit=1,
+    )
+    items = response.get("Items", [])
+    item = items[0] if items else None
+    if cache is not None:
+        cache.store(cache_key, item)
+    return item
+
+
+# DynamoDB BatchGetItem limit
+BATCH_GET_SIZE = 100
+
+# Requests per chunk while DynamoDB keeps returning UnprocessedKeys
+BATCH_GET_MAX_ATTEMPTS = 5
+BATCH_GET_BACKOFF_SECONDS = 0.05
+
+
+def batch_get_items(
+    table: "Table", keys: Sequence[Dict[str, Any]], attributes: Sequence[str] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Read items by primary key with BatchGetItem, 100 keys per request.
+
+    Args:
+        table: Table to read
+        keys: Full primary keys; duplicates are sent once
+        attributes: Attributes to project (all attributes when empty)
+
+    Returns:
+        The items that exist, in no particular order
+
+    Raises:
+        AppError: If DynamoDB still returns unprocessed keys after the last retry
+    """
+    unique_keys = list({tuple(sorted(key.items())): key for key in keys}.values())
+    request: Dict[str, Any] = {}
+    if attributes:
+        names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+        request["ProjectionExpression"] = ", ".join(names)
+        request["ExpressionAttributeNames"] = names
+
+    items: List[Dict[str, Any]] = []
+    for start in range(0, len(unique_keys), BATCH_GET_SIZE):
+        pending: List[Any] = unique_keys[start : start + BATCH_GET_SIZE]
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(BATCH_GET_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            chunk_request: Any = {**request, "Keys": pending}
+            response: Any = _get_dynamodb().batch_get_item(RequestItems={table.name: chunk_request})
+            items.extend(response.get("Responses", {}).get(table.name, []))
+            pending = list(response.get("UnprocessedKeys", {}).get(table.name, {}).get("Keys", []))
+            if not pending:
+                break
+        else:
+            raise AppError(ErrorCode.DATABASE_ERROR, f"Could not read {len(pending)} items from {table.name}")
+    return items
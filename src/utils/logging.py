@@ -2,14 +2,98 @@
 Logging utilities for Lambda functions.
 
 Provides structured JSON logging with correlation IDs for tracing requests.
+
+Records below LOG_LEVEL are dropped before any formatting work, and message
+arguments are interpolated lazily (logger.debug("Item %s", item)) so disabled
+levels cost a single integer comparison. With LOG_BUFFERING=true,
+handler_middleware wraps each invocation in buffered_logging() so all of its
+records are written with one stdout write at the end.
 """
 
 import json
 import logging
 import os
+import sys
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+LEVELS: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# Compact separators and str() fallback (Decimal, datetime) without per-call setup
+_encoder = json.JSONEncoder(separators=(",", ":"), default=str)
+
+# Per-invocation buffer shared by every logger; None when buffering is off
+_buffer: Optional[List[str]] = None
+
+# Correlation ID of the invocation in progress (set by utils.middleware)
+_invocation_correlation_id: Optional[str] = None
+
+
+def _resolve_level(value: Optional[str]) -> int:
+    """Map a LOG_LEVEL value to a logging level number (INFO when unset or unknown)."""
+    return LEVELS.get((value or "INFO").upper(), logging.INFO)
+
+
+def _emit(line: str) -> None:
+    """Write one JSON line, or hold it in the invocation buffer."""
+    if _buffer is not None:
+        _buffer.append(line)
+    else:
+        sys.stdout.write(line + "\n")
+
+
+def set_correlation_id(correlation_id: Optional[str]) -> None:
+    """Set the correlation ID used by loggers created without an explicit one."""
+    global _invocation_correlation_id
+    _invocation_correlation_id = correlation_id
+
+
+def log_buffering_enabled() -> bool:
+    """Return True when LOG_BUFFERING asks handlers to buffer each invocation's log lines."""
+    return os.getenv("LOG_BUFFERING", "").lower() == "true"
+
+
+def start_log_buffer() -> None:
+    """Start holding log lines in memory until flush_log_buffer() is called."""
+    global _buffer
+    if _buffer is None:
+        _buffer = []
+
+
+def flush_log_buffer() -> None:
+    """Write buffered log lines with a single stdout write and stop buffering."""
+    global _buffer
+    lines, _buffer = _buffer, None
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+@contextmanager
+def buffered_logging() -> Iterator[None]:
+    """
+    Buffer all structured log lines for the duration of the block.
+
+    The buffer is flushed even if the block raises; a nested block leaves the
+    flush to the outermost one. Lines are lost if the Lambda times out
+    mid-invocation, so only buffer handlers that finish well inside their
+    timeout.
+    """
+    outermost = _buffer is None
+    start_log_buffer()
+    try:
+        yield
+    finally:
+        if outermost:
+            flush_log_buffer()
 
 
 class StructuredLogger:
@@ -19,43 +103,57 @@ class StructuredLogger:
     Example:
         logger = StructuredLogger(__name__)
         logger.info("Processing order", order_id="ORDER#123", profile_id="PROFILE#456")
+        logger.debug("Loaded item %s", item)  # formatted only when DEBUG is enabled
     """
 
     def __init__(self, name: str, correlation_id: Optional[str] = None) -> None:
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
-        self.correlation_id = correlation_id or str(uuid.uuid4())
+        self.level = _resolve_level(os.getenv("LOG_LEVEL"))
+        self.logger.setLevel(self.level)
+        self._correlation_id = correlation_id
+        self._fallback_correlation_id = str(uuid.uuid4())
 
-    def _log(self, level: str, message: str, **kwargs: Any) -> None:
+    @property
+    def correlation_id(self) -> str:
+        """Explicit ID, else the current invocation's ID, else a per-logger UUID."""
+        return self._correlation_id or _invocation_correlation_id or self._fallback_correlation_id
+
+    def _log(self, level_name: str, message: str, args: Any, kwargs: Dict[str, Any]) -> None:
         """Internal method to emit structured JSON logs."""
+        if args:
+            message = message % args
+
         log_entry: Dict[str, Any] = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "level": level,
+            "level": level_name,
             "message": message,
             "correlationId": self.correlation_id,
-            **kwargs,
         }
+        # Drop None values
+        for key, value in kwargs.items():
+            if value is not None:
+                log_entry[key] = value
 
-        # Remove None values
-        log_entry = {k: v for k, v in log_entry.items() if v is not None}
-
-        print(json.dumps(log_entry))
+        _emit(_encoder.encode(log_entry))
 
-    def info(self, message: str, **kwargs: Any) -> None:
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log info level message."""
-        self._log("INFO", message, **kwargs)
+        if self.level <= logging.INFO:
+            self._log("INFO", message, args, kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log warning level message."""
-        self._log("WARNING", message, **kwargs)
+        if self.level <= logging.WARNING:
+            self._log("WARNING", message, args, kwargs)
 
-    def error(self, message: str, **kwargs: Any) -> None:
-        """Log error level message."""
-        self._log("ERROR", message, **kwargs)
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log error level message (ERROR is the highest level, so never filtered)."""
+        self._log("ERROR", message, args, kwargs)
 
-    def debug(self, message: str, **kwargs: Any) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug level message."""
-        self._log("DEBUG", message, **kwargs)
+        if self.level <= logging.DEBUG:
+            self._log("DEBUG", message, args, kwargs)
 
 
 def get_correlation_id(event: Dict[str, Any]) -> str:
@@ -0,0 +1,274 @@
+"""
+CloudWatch Embedded Metric Format (EMF) metrics for Lambda handlers.
+
+Wrap a handler with @track_metrics to emit, once per invocation:
+    - Duration (ms), ColdStart, Errors
+    - DynamoDBCalls, DynamoDBLatency, DynamoDBItemsRead, DynamoDBConsumedCapacity
+    - DynamoDBReadsSaved (reads served by the request cache in utils.dynamodb)
+    - S3Calls, S3Latency
+    - one record per AWS operation with Calls and Latency
+
+AWS calls are counted through botocore event hooks registered on the default
+boto3 session, so clients created inside the handler are tracked without any
+changes at the call sites. While a handler is tracked, DynamoDB requests ask
+for ReturnConsumedCapacity=TOTAL unless the caller already set it.
+
+Records are JSON lines on stdout: CloudWatch Logs extracts the metrics in
+Lambda, and locally they are just log lines. Tests use capture_metrics().
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, cast
+
+import boto3
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_NAMESPACE = "KernelWorx"
+
+# Services whose calls are counted
+TRACKED_SERVICES = ("dynamodb", "s3")
+
+_HOOK_ID = "kernelworx-metrics"
+
+# Recorder for the invocation in progress (None outside tracked handlers)
+_current: Optional["MetricsRecorder"] = None
+
+# Replaced by capture_metrics() in tests
+_sink: Optional[Callable[[Dict[str, Any]], None]] = None
+
+# True until the first tracked invocation in this container starts
+_cold_start = True
+
+
+def is_cold_start() -> bool:
+    """Return True until the first tracked invocation in this container has started."""
+    return _cold_start
+
+
+class MetricsRecorder:
+    """Accumulates AWS call metrics for one handler invocation."""
+
+    def __init__(self, handler_name: str) -> None:
+        self.handler_name = handler_name
+        self.operations: Dict[str, Dict[str, float]] = {}
+        self.items_read = 0
+        self.consumed_capacity = 0.0
+        self.reads_saved = 0
+        # Handlers may fan out AWS calls across threads (e.g. parallel scans)
+        self._lock = threading.Lock()
+
+    def record_call(self, service: str, operation: str, latency_ms: float, parsed: Dict[str, Any]) -> None:
+        """Record one completed AWS call."""
+        items = _items_read(operation, parsed) if service == "dynamodb" else 0
+        capacity = _consumed_capacity(parsed) if service == "dynamodb" else 0.0
+
+        with self._lock:
+            stats = self.operations.setdefault(f"{service}:{operation}", {"Calls": 0, "Latency": 0.0})
+            stats["Calls"] += 1
+            stats["Latency"] += latency_ms
+            self.items_read += items
+            self.consumed_capacity += capacity
+
+    def record_saved_read(self) -> None:
+        """Record one read served without an AWS call."""
+        with self._lock:
+            self.reads_saved += 1
+
+    def service_totals(self, service: str) -> Dict[str, float]:
+        """Sum calls and latency across a service's operations."""
+        calls = 0.0
+        latency = 0.0
+        for key, stats in self.operations.items():
+            if key.startswith(f"{service}:"):
+                calls += stats["Calls"]
+                latency += stats["Latency"]
+        return {"Calls": calls, "Latency": latency}
+
+
+def record_saved_read() -> None:
+    """Count a DynamoDB read served from memory instead of a round-trip."""
+    recorder = _current
+    if recorder is not None:
+        recorder.record_saved_read()
+
+
+def _items_read(operation: str, parsed: Dict[str, Any]) -> int:
+    """Return the number of items a DynamoDB response carried back."""
+    if "Count" in parsed:
+        return int(parsed["Count"])
+    if operation == "GetItem":
+        return 1 if "Item" in parsed else 0
+    if operation == "BatchGetItem":
+        return sum(len(items) for items in parsed.get("Responses", {}).values())
+    if operation == "TransactGetItems":
+        return sum(1 for response in parsed.get("Responses", []) if "Item" in response)
+    return 0
+
+
+def _consumed_capacity(parsed: Dict[str, Any]) -> float:
+    """Sum CapacityUnits from a DynamoDB response (single dict or per-table list)."""
+    consumed = parsed.get("ConsumedCapacity")
+    if consumed is None:
+        return 0.0
+    entries = consumed if isinstance(consumed, list) else [consumed]
+    return float(sum(float(entry.get("CapacityUnits", 0)) for entry in entries))
+
+
+def _request_consumed_capacity(params: Dict[str, Any], model: Any, **kwargs: Any) -> None:
+    """Ask DynamoDB for consumed capacity while a handler is being tracked."""
+    if _current is not None and "ReturnConsumedCapacity" in model.input_shape.members:
+        params.setdefault("ReturnConsumedCapacity", "TOTAL")
+
+
+def _before_call(context: Dict[str, Any], **kwargs: Any) -> None:
+    """Stamp the request start time."""
+    if _current is not None:
+        context["metrics_started"] = time.perf_counter()
+
+
+def _after_call(parsed: Dict[str, Any], model: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+    """Record the completed call against the current invocation."""
+    recorder = _current
+    started = context.get("metrics_started")
+    if recorder is None or started is None:
+        return
+    service = model.service_model.endpoint_prefix
+    recorder.record_call(service, model.name, (time.perf_counter() - started) * 1000, parsed)
+
+
+def install_hooks() -> None:
+    """Register the call-tracking hooks on the default boto3 session (idempotent)."""
+    events = boto3._get_default_session().events
+    for service in TRACKED_SERVICES:
+        events.register(f"before-call.{service}", _before_call, unique_id=f"{_HOOK_ID}-before-{service}")
+        events.register(f"after-call.{service}", _after_call, unique_id=f"{_HOOK_ID}-after-{service}")
+    events.register("before-parameter-build.dynamodb", _request_consumed_capacity, unique_id=f"{_HOOK_ID}-capacity")
+
+
+def _emf_record(
+    namespace: str, dimensions: Dict[str, str], metrics: Dict[str, Any], units: Dict[str, str]
+) -> Dict[str, Any]:
+    """Build one EMF JSON document."""
+    return {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": namespace,
+                    "Dimensions": [list(dimensions)],
+                    "Metrics": [{"Name": name, "Unit": units.get(name, "Count")} for name in metrics],
+                }
+            ],
+        },
+        **dimensions,
+        **metrics,
+    }
+
+
+def _write(record: Dict[str, Any]) -> None:
+    """Send a record to the capture sink or stdout."""
+    if _sink is not None:
+        _sink(record)
+    else:
+        sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def emit_metrics(recorder: MetricsRecorder, duration_ms: float, cold_start: bool, error: bool) -> None:
+    """Write the invocation summary and per-operation EMF records."""
+    namespace = os.getenv("METRICS_NAMESPACE", DEFAULT_NAMESPACE)
+    handler = {"Handler": recorder.handler_name}
+    dynamodb = recorder.service_totals("dynamodb")
+    s3 = recorder.service_totals("s3")
+
+    _write(
+        _emf_record(
+            namespace,
+            handler,
+            {
+                "Duration": round(duration_ms, 3),
+                "ColdStart": int(cold_start),
+                "Errors": int(error),
+                "DynamoDBCalls": int(dynamodb["Calls"]),
+                "DynamoDBLatency": round(dynamodb["Latency"], 3),
+                "DynamoDBItemsRead": recorder.items_read,
+                "DynamoDBConsumedCapacity": recorder.consumed_capacity,
+                "DynamoDBReadsSaved": recorder.reads_saved,
+                "S3Calls": int(s3["Calls"]),
+                "S3Latency": round(s3["Latency"], 3),
+            },
+            {"Duration": "Milliseconds", "DynamoDBLatency": "Milliseconds", "S3Latency": "Milliseconds"},
+        )
+    )
+
+    for key, stats in sorted(recorder.operations.items()):
+        service, operation = key.split(":", 1)
+        _write(
+            _emf_record(
+                namespace,
+                {**handler, "Service": service, "Operation": operation},
+                {"Calls": int(stats["Calls"]), "Latency": round(stats["Latency"], 3)},
+                {"Latency": "Milliseconds"},
+            )
+        )
+
+
+def track_metrics(func: F) -> F:
+    """
+    Decorator that records and emits EMF metrics for each handler invocation.
+
+    Example:
+        @track_metrics
+        def lambda_handler(event, context):
+            ...
+    """
+    handler_name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        global _current, _cold_start
+        install_hooks()
+        cold_start, _cold_start = _cold_start, False
+        # Nested tracked calls report into the outermost invocation
+        outer = _current
+        recorder = outer or MetricsRecorder(handler_name)
+        _current = recorder
+        started = time.perf_counter()
+        error = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            error = True
+            raise
+        finally:
+            _current = outer
+            if outer is None:
+                emit_metrics(recorder, (time.perf_counter() - started) * 1000, cold_start, error)
+
+    return cast(F, wrapper)
+
+
+@contextmanager
+def capture_metrics() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Capture emitted EMF records instead of printing them (for tests).
+
+    Example:
+        with capture_metrics() as records:
+            lambda_handler(event, context)
+        assert records[0]["DynamoDBCalls"] == 1
+    """
+    global _sink
+    records: List[Dict[str, Any]] = []
+    previous = _sink
+    _sink = records.append
+    try:
+        yield records
+    finally:
+        _sink = previous
@@ -0,0 +1,164 @@
+"""
+Common middleware for Lambda handlers.
+
+@handler_middleware does what every handler otherwise repeats:
+    - sets the invocation correlation ID (get_correlation_id) on all loggers
+    - times the invocation and flags cold starts
+    - records EMF metrics (utils.metrics.track_metrics)
+    - opens a request-scoped DynamoDB read cache (utils.dynamodb.request_read_cache)
+    - profiles sampled invocations when PROFILE_SAMPLE_RATE is set (utils.profiling)
+    - writes the invocation's log lines in one stdout write when LOG_BUFFERING=true
+      (utils.logging.buffered_logging)
+    - logs AppErrors and maps unexpected exceptions to AppError(INTERNAL_ERROR)
+
+Long-running loops call has_time_remaining() to stop gracefully before the
+Lambda timeout instead of being killed mid-write.
+
+Example:
+    @handler_middleware(error_message="Failed to generate upload URL")
+    def request_qr_upload(event, context):
+        ...
+"""
+
+import time
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, TypeVar, cast, overload
+
+from .dynamodb import request_read_cache
+from .errors import AppError, ErrorCode
+from .logging import buffered_logging, get_correlation_id, get_logger, log_buffering_enabled, set_correlation_id
+from .metrics import is_cold_start, track_metrics
+from .profiling import profile_sample_rate, run_profiled, should_profile
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Time kept in reserve for returning a response and flushing logs/metrics
+DEFAULT_TIME_RESERVE_MS = 5000
+
+logger = get_logger(__name__)
+
+# Invocation in progress (None outside wrapped handlers)
+_current: Optional["Invocation"] = None
+
+
+class Invocation:
+    """Per-invocation context shared with the code a handler calls."""
+
+    def __init__(self, handler_name: str, correlation_id: str, cold_start: bool, context: Any) -> None:
+        self.handler_name = handler_name
+        self.correlation_id = correlation_id
+        self.cold_start = cold_start
+        self.context = context
+        self.started = time.perf_counter()
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the handler started."""
+        return (time.perf_counter() - self.started) * 1000
+
+    def remaining_ms(self) -> Optional[int]:
+        """Milliseconds before the Lambda timeout, or None when there is no Lambda context."""
+        get_remaining = getattr(self.context, "get_remaining_time_in_millis", None)
+        remaining = get_remaining() if callable(get_remaining) else None
+        return remaining if isinstance(remaining, int) else None
+
+
+def current_invocation() -> Optional[Invocation]:
+    """Return the invocation in progress, if any."""
+    return _current
+
+
+def has_time_remaining(reserve_ms: int = DEFAULT_TIME_RESERVE_MS) -> bool:
+    """
+    Return False once fewer than reserve_ms remain before the Lambda timeout.
+
+    Always True outside a wrapped handler or without a real Lambda context
+    (local runs and tests), so loops behave as before.
+    """
+    remaining = _current.remaining_ms() if _current is not None else None
+    return remaining is None or remaining > reserve_ms
+
+
+def _wrap(func: F, error_message: Optional[str]) -> F:
+    handler_name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+    tracked = track_metrics(func)
+    # Read once per container; 0 keeps profiling entirely off the hot path
+    profile_rate = profile_sample_rate(handler_name)
+    buffer_logs = log_buffering_enabled()
+
+    @wraps(func)
+    def wrapper(event: Dict[str, Any], context: Any) -> Any:
+        with buffered_logging() if buffer_logs else nullcontext():
+            return invoke(event, context)
+
+    def invoke(event: Dict[str, Any], context: Any) -> Any:
+        global _current
+        # track_metrics clears the flag when the handler starts
+        invocation = Invocation(handler_name, get_correlation_id(event or {}), is_cold_start(), context)
+        previous, _current = _current, invocation
+        set_correlation_id(invocation.correlation_id)
+
+        try:
+            with request_read_cache():
+                if profile_rate and should_profile(profile_rate):
+                    result = run_profiled(handler_name, invocation.correlation_id, tracked, event, context)
+                else:
+                    result = tracked(event, context)
+        except AppError as e:
+            logger.warning(
+                "Handler failed",
+                handler=handler_name,
+                error_code=e.error_code,
+                error=e.message,
+                duration_ms=round(invocation.elapsed_ms(), 3),
+            )
+            raise
+        except Exception as e:
+            logger.error(
+                "Unhandled handler error",
+                handler=handler_name,
+                error=str(e),
+                error_type=type(e).__name__,
+                duration_ms=round(invocation.elapsed_ms(), 3),
+            )
+            if error_message is None:
+                raise
+            raise AppError(ErrorCode.INTERNAL_ERROR, error_message) from e
+        finally:
+            _current = previous
+            set_correlation_id(previous.correlation_id if previous is not None else None)
+
+        logger.debug(
+            "Handler completed",
+            handler=handler_name,
+            duration_ms=round(invocation.elapsed_ms(), 3),
+            cold_start=invocation.cold_start,
+        )
+        return result
+
+    return cast(F, wrapper)
+
+
+@overload
+def handler_middleware(func: F) -> F: ...  # pragma: no cover
+
+
+@overload
+def handler_middleware(*, error_message: Optional[str] = None) -> Callable[[F], F]: ...  # pragma: no cover
+
+
+def handler_middleware(func: Optional[F] = None, *, error_message: Optional[str] = None) -> Any:
+    """
+    Wrap a Lambda handler with correlation, timing, metrics, and error mapping.
+
+    Args:
+        func: Handler when used as a bare decorator
+        error_message: If set, unexpected (non-AppError) exceptions are re-raised as
+            AppError(INTERNAL_ERROR, error_message); otherwise they propagate unchanged
+
+    Returns:
+        Wrapped handler, or a decorator when called with keyword arguments
+    """
+    if func is not None:
+        return _wrap(func, error_message)
+    return lambda f: _wrap(f, error_message)
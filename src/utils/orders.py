@@ -0,0 +1,224 @@
+"""
+Order building and bulk writes for the Python order writers.
+
+Mirrors the createOrder pipeline (create_order_fn.js and the functions before
+it): an order is priced against its campaign's catalog, its payment method
+must exist for the profile owner's account, and it is stored with the same
+attributes, so orders written here and by AppSync are indistinguishable.
+
+Campaign, catalog and payment methods are loaded once per campaign into a
+CampaignOrderContext (products from the catalog's current version, see
+utils.catalogs), then any number of orders are built against it and
+written with batch_put_items() in BatchWriteItem chunks of 25, optionally
+several chunks at a time.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, cast
+from uuid import uuid4
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mypy_boto3_dynamodb.service_resource import Table
+
+from .catalogs import catalog_products
+from .dynamodb import cached_get_item, cached_query_first, get_dynamodb_resource, tables
+from .errors import AppError, ErrorCode
+from .ids import ensure_campaign_id, ensure_catalog_id, strip_prefix
+from .logging import get_logger
+from .payment_methods import RESERVED_NAMES, get_payment_methods
+
+logger = get_logger(__name__)
+
+# DynamoDB BatchWriteItem limit
+BATCH_WRITE_SIZE = 25
+
+# Attempts per chunk while DynamoDB keeps returning UnprocessedItems
+BATCH_WRITE_MAX_ATTEMPTS = 5
+BATCH_WRITE_BACKOFF_SECONDS = 0.05
+
+OPTIONAL_ORDER_FIELDS = ("customerPhone", "customerAddress", "notes")
+
+
+@dataclass
+class CampaignOrderContext:
+    """What pricing and validating orders for one campaign needs, loaded once."""
+
+    campaign: Dict[str, Any]
+    # productId -> catalog product
+    products: Dict[str, Dict[str, Any]]
+    # Lower-cased payment method names the profile owner can use
+    payment_methods: Set[str]
+    # Catalog version the products come from (None for unversioned catalogs)
+    catalog_version: Optional[str] = None
+
+
+def order_timestamp(now: Optional[datetime] = None) -> str:
+    """ISO-8601 UTC timestamp in the format AppSync's util.time.nowISO8601() writes."""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def load_campaign_context(campaign_id: str) -> CampaignOrderContext:
+    """
+    Load a campaign with its catalog and its owner's payment methods.
+
+    Raises:
+        AppError: If the campaign, its profile or its catalog cannot be found
+    """
+    db_campaign_id = ensure_campaign_id(campaign_id)
+    campaign = cached_query_first(tables.campaigns, "campaignId-index", "campaignId", db_campaign_id)
+    if campaign is None:
+        raise AppError(ErrorCode.NOT_FOUND, f"Campaign {campaign_id} not found")
+    if not campaign.get("catalogId"):
+        raise AppError(ErrorCode.INVALID_INPUT, "Campaign has no catalog assigned")
+
+    catalog_id = ensure_catalog_id(campaign["catalogId"])
+    catalog = cached_get_item(tables.catalogs, {"catalogId": catalog_id})
+    if catalog is None:
+        raise AppError(ErrorCode.NOT_FOUND, f"Catalog not found for id: {catalog_id}")
+
+    profile = cached_query_first(tables.profiles, "profileId-index", "profileId", campaign["profileId"])
+    if profile is None:
+        raise AppError(ErrorCode.NOT_FOUND, f"Profile {campaign['profileId']} not found")
+    owner_account_id = strip_prefix(profile["ownerAccountId"])
+    # The reserved names are the global methods every account has
+    payment_methods = RESERVED_NAMES | {method["name"].lower() for method in get_payment_methods(owner_account_id)}
+
+    catalog_version, products = catalog_products(catalog)
+    return CampaignOrderContext(
+        campaign=campaign,
+        products=products,
+        payment_methods=payment_methods,
+        catalog_version=catalog_version,
+    )
+
+
+def _enrich_line_items(line_items: List[Dict[str, Any]], products: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if not line_items:
+        raise AppError(ErrorCode.INVALID_INPUT, "Order must have at least one line item")
+
+    enriched = []
+    for line_item in line_items:
+        product_id = line_item.get("productId")
+        quantity = int(line_item.get("quantity", 0))
+        if quantity < 1:
+            raise AppError(ErrorCode.INVALID_INPUT, f"Quantity must be at least 1 (got {quantity})")
+        product = products.get(str(product_id))
+        if product is None:
+            raise AppError(ErrorCode.INVALID_INPUT, f"Product {product_id} not found in catalog")
+
+        price = Decimal(str(product["price"]))
+        product_name = product.get("productName")
+        enriched.append(
+            {
+                "productId": product_id,
+                "productName": product_name if isinstance(product_name, str) else None,
+                "quantity": quantity,
+                "pricePerUnit": price,
+                "subtotal": price * quantity,
+            }
+        )
+    return enriched
+
+
+def build_order_item(
+    order_input: Dict[str, Any], context: CampaignOrderContext, now: str, order_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Validate an order input against its campaign and build the orders-table item.
+
+    order_id defaults to a fresh ORDER#<uuid4>; pass a deterministic one to make
+    a retried write overwrite the same order instead of duplicating it.
+
+    Raises:
+        AppError: If a line item or the payment method is invalid
+    """
+    payment_method = order_input.get("paymentMethod") or ""
+    if payment_method.lower() not in context.payment_methods:
+        raise AppError(ErrorCode.INVALID_INPUT, f"Payment method '{payment_method}' does not exist for this account")
+
+    line_items = _enrich_line_items(order_input.get("lineItems") or [], context.products)
+    item: Dict[str, Any] = {
+        "orderId": order_id or f"ORDER#{uuid4()}",
+        "profileId": context.campaign["profileId"],
+        "campaignId": context.campaign["campaignId"],
+        "customerName": order_input.get("customerName"),
+        "orderDate": order_input.get("orderDate"),
+        "paymentMethod": payment_method,
+        "lineItems": line_items,
+        "totalAmount": sum((line["subtotal"] for line in line_items), Decimal(0)),
+        "createdAt": now,
+        "updatedAt": now,
+    }
+    for field in OPTIONAL_ORDER_FIELDS:
+        if order_input.get(field):
+            item[field] = order_input[field]
+    if context.catalog_version:
+        item["catalogVersion"] = context.catalog_version
+    return item
+
+
+def order_response(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a stored order to its GraphQL shape (Decimals to numbers)."""
+    return {
+        **item,
+        "totalAmount": float(item["totalAmount"]),
+        "lineItems": [
+            {
+                **line,
+                "quantity": int(line["quantity"]),
+                "pricePerUnit": float(line["pricePerUnit"]),
+                "subtotal": float(line["subtotal"]),
+            }
+            for line in item["lineItems"]
+        ],
+    }
+
+
+def _write_chunk(table_name: str, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Write up to 25 items, retrying unprocessed ones; return the items that were not written."""
+    requests: List[Any] = [{"PutRequest": {"Item": item}} for item in chunk]
+    for attempt in range(BATCH_WRITE_MAX_ATTEMPTS):
+        if attempt:
+            time.sleep(BATCH_WRITE_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        try:
+            response = get_dynamodb_resource().batch_write_item(RequestItems={table_name: requests})
+        except Exception as e:
+            logger.error("Batch write failed", table=table_name, items=len(requests), error=str(e))
+            break
+        requests = list(response.get("UnprocessedItems", {}).get(table_name, []))
+        if not requests:
+            return []
+    return [cast(Dict[str, Any], request["PutRequest"]["Item"]) for request in requests]
+
+
+def batch_put_items(table: "Table", items: List[Dict[str, Any]], max_workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Put items in BatchWriteItem chunks of 25.
+
+    Unprocessed items are retried with backoff. A chunk whose request fails
+    outright is not retried.
+
+    Args:
+        table: Table to write to
+        items: Items to put
+        max_workers: Chunks written concurrently (each thread uses its own
+            cached DynamoDB resource)
+
+    Returns:
+        The items that could not be written (empty on full success)
+    """
+    chunks = [items[start : start + BATCH_WRITE_SIZE] for start in range(0, len(items), BATCH_WRITE_SIZE)]
+    if max_workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            unwritten = list(executor.map(lambda chunk: _write_chunk(table.name, chunk), chunks))
+    else:
+        unwritten = [_write_chunk(table.name, chunk) for chunk in chunks]
+    failed = [item for chunk_failed in unwritten for item in chunk_failed]
+    if failed:
+        logger.warning("Items not written", table=table.name, failed=len(failed), total=len(items))
+    return failed
@@ -5,13 +5,12 @@ Handles CRUD operations for custom payment methods (user preferences)
 and S3 QR code management.
 """
 
-import os
 import re
 import uuid
+from io import BytesIO
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from urllib.parse import quote
 
-import boto3
 from botocore.exceptions import ClientError
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -19,10 +18,12 @@ if TYPE_CHECKING:  # pragma: no cover
 
 # Handle both Lambda (absolute) and unit test (relative) imports
 try:  # pragma: no cover
+    from utils.aws_clients import get_s3_client
     from utils.dynamodb import get_required_env, tables
     from utils.errors import AppError, ErrorCode
     from utils.logging import get_logger
 except ModuleNotFoundError:  # pragma: no cover
+    from .aws_clients import get_s3_client
     from .dynamodb import get_required_env, tables
     from .errors import AppError, ErrorCode
     from .logging import get_logger
@@ -46,6 +47,21 @@ ALLOWED_QR_MIME_TYPES = {"image/png", "image/jpeg", "image/webp"}
 # QR code S3 path prefix
 QR_CODE_S3_PREFIX = "payment-qr-codes"
 
+# Extensions used by legacy slug-based QR keys, in lookup order
+LEGACY_QR_EXTENSIONS = ("png", "jpg", "webp")
+
+# Optimized QR codes are re-encoded as grayscale PNGs no larger than this on either side
+QR_OPTIMIZED_MAX_DIMENSION = 512
+
+# Pixels darker than this (0-255 grayscale) count as QR content when cropping whitespace
+QR_CONTENT_THRESHOLD = 200
+
+# Quiet zone kept around the cropped QR code, as a fraction of its longest side
+QR_QUIET_ZONE_RATIO = 0.08
+
+# Suffix for the optimized copy stored next to the original upload
+QR_OPTIMIZED_KEY_SUFFIX = "-optimized.png"
+
 
 def get_qr_code_s3_key(account_id: str, payment_method_name: str, extension: str = "png") -> str:
     """Generate S3 key for a payment method QR code.
@@ -116,12 +132,18 @@ def validate_qr_s3_key(s3_key: str, account_id: str) -> bool:
     return True
 
 
+def is_qr_s3_key(value: Optional[str]) -> bool:
+    """Return True if a stored qrCodeUrl value is an S3 key (not a legacy URL)."""
+    return bool(value) and str(value).startswith(f"{QR_CODE_S3_PREFIX}/")
+
+
 def _get_s3_client() -> "S3Client":
-    """Return the S3 client (module-level override for tests, otherwise a fresh boto3 client)."""
+    """Return the S3 client (module-level override for tests, otherwise the container-cached client)."""
     global s3_client
     if s3_client is not None:
         return s3_client
-    return boto3.client("s3", endpoint_url=os.getenv("S3_ENDPOINT"))
+    client: "S3Client" = get_s3_client()
+    return client
 
 
 def slugify(text: str) -> str:
@@ -256,7 +278,7 @@ def validate_payment_method_exists(account_id: str, payment_method_name: str) ->
         AppError: If payment method does not exist for this account
     """
     # Check if it's a global method (always valid)
-    if payment_method_name.lower() in {"cash", "check"}:
+    if payment_method_name.lower() in RESERVED_NAMES:
         return
 
     # Check custom payment methods
@@ -447,10 +469,16 @@ def delete_payment_method(account_id: str, name: str) -> None:
         if not method_to_delete:  # pragma: no branch
             raise AppError(ErrorCode.NOT_FOUND, f"Payment method '{name}' not found")
 
-        # Delete QR code from S3 if exists
-        if method_to_delete.get("qrCodeUrl"):
+        # Delete QR code from S3 if exists (stored key first, legacy slug-based keys otherwise)
+        stored_qr_key = method_to_delete.get("qrCodeUrl")
+        if stored_qr_key:
             try:
-                delete_qr_from_s3(account_id, name)
+                if is_qr_s3_key(stored_qr_key):
+                    delete_qr_by_key(stored_qr_key)
+                else:
+                    delete_qr_from_s3(account_id, name)
+                if method_to_delete.get("qrCodeOptimizedKey"):
+                    delete_qr_by_key(method_to_delete["qrCodeOptimizedKey"])
             except Exception as e:
                 logger.warning("Failed to delete QR code, continuing with method deletion", error=str(e))
 
@@ -562,6 +590,129 @@ def delete_qr_by_key(s3_key: str) -> None:
         raise AppError(ErrorCode.INTERNAL_ERROR, "Failed to delete QR code")
 
 
+def get_optimized_qr_key(s3_key: str) -> str:
+    """Return the key of the optimized copy stored next to an uploaded QR code.
+
+    Args:
+        s3_key: S3 key of the original upload
+
+    Returns:
+        S3 key in format: payment-qr-codes/{account_id}/{file_id}-optimized.png
+    """
+    base, _, _ = s3_key.rpartition(".")
+    return f"{base or s3_key}{QR_OPTIMIZED_KEY_SUFFIX}"
+
+
+def optimize_qr_image(file_bytes: bytes) -> bytes:
+    """
+    Re-encode an uploaded QR code as a small grayscale PNG.
+
+    Applies EXIF orientation, flattens transparency onto white, crops surrounding
+    whitespace (keeping a quiet zone so scanners still lock on), and downscales to
+    QR_OPTIMIZED_MAX_DIMENSION.
+
+    Args:
+        file_bytes: Original image bytes (PNG, JPG, or WEBP)
+
+    Returns:
+        Optimized PNG bytes
+
+    Raises:
+        OSError: If the image cannot be decoded
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(BytesIO(file_bytes)) as original:
+        # JPEG decoders can scale down while decoding, which skips most of the work for phone photos
+        original.draft("RGB", (QR_OPTIMIZED_MAX_DIMENSION * 2, QR_OPTIMIZED_MAX_DIMENSION * 2))
+        image = ImageOps.exif_transpose(original)
+
+        if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+            background = Image.new("RGBA", image.size, "white")
+            background.alpha_composite(image.convert("RGBA"))
+            image = background
+
+        gray = image.convert("L")
+
+    content_box = gray.point(lambda value: 255 if value < QR_CONTENT_THRESHOLD else 0).getbbox()
+    if content_box:
+        gray = gray.crop(content_box)
+        quiet_zone = max(1, int(max(gray.size) * QR_QUIET_ZONE_RATIO))
+        gray = ImageOps.expand(gray, border=quiet_zone, fill=255)
+
+    gray.thumbnail((QR_OPTIMIZED_MAX_DIMENSION, QR_OPTIMIZED_MAX_DIMENSION), Image.Resampling.LANCZOS)
+
+    output = BytesIO()
+    gray.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def store_optimized_qr(s3_key: str) -> Optional[str]:
+    """
+    Create the optimized copy of an uploaded QR code next to the original.
+
+    Optimization is best-effort: if the image cannot be decoded or S3 fails,
+    the original upload is still served.
+
+    Args:
+        s3_key: S3 key of the original upload
+
+    Returns:
+        S3 key of the optimized copy, or None if optimization failed
+    """
+    logger = get_logger(__name__)
+    bucket_name = get_required_env("EXPORTS_BUCKET")
+    optimized_key = get_optimized_qr_key(s3_key)
+
+    try:
+        s3 = _get_s3_client()
+        original = s3.get_object(Bucket=bucket_name, Key=s3_key)["Body"].read()
+        optimized = optimize_qr_image(original)
+        s3.put_object(Bucket=bucket_name, Key=optimized_key, Body=optimized, ContentType="image/png")
+    except Exception as e:
+        logger.warning("Failed to optimize QR code, serving original upload", s3_key=s3_key, error=str(e))
+        return None
+
+    logger.info(
+        "Stored optimized QR code",
+        s3_key=s3_key,
+        optimized_key=optimized_key,
+        original_bytes=len(original),
+        optimized_bytes=len(optimized),
+    )
+    return optimized_key
+
+
+def get_legacy_qr_keys(account_id: str, payment_method_name: str) -> List[str]:
+    """Return the slug-based QR keys a legacy upload may live under, in lookup order."""
+    return [get_qr_code_s3_key(account_id, payment_method_name, ext) for ext in LEGACY_QR_EXTENSIONS]
+
+
+def find_legacy_qr_key(account_id: str, payment_method_name: str) -> Optional[str]:
+    """
+    Find a legacy slug-based QR code with a single prefix listing.
+
+    Legacy uploads were stored as payment-qr-codes/{account_id}/{slug}.{ext}, so one
+    list_objects_v2 call on "{slug}." replaces probing every extension with head_object.
+
+    Args:
+        account_id: Account ID
+        payment_method_name: Payment method name
+
+    Returns:
+        S3 key of the legacy QR code, or None if no legacy file exists
+    """
+    bucket_name = get_required_env("EXPORTS_BUCKET")
+    slug = slugify(payment_method_name)
+    s3 = _get_s3_client()
+
+    response = s3.list_objects_v2(Bucket=bucket_name, Prefix=f"{QR_CODE_S3_PREFIX}/{account_id}/{slug}.")
+    existing_keys = {obj["Key"] for obj in response.get("Contents", [])}
+
+    # Preserve the original png -> jpg -> webp preference
+    return next((key for key in get_legacy_qr_keys(account_id, payment_method_name) if key in existing_keys), None)
+
+
 def delete_qr_from_s3(account_id: str, payment_method_name: str) -> None:
     """
     Delete QR code from S3.
@@ -569,7 +720,8 @@ def delete_qr_from_s3(account_id: str, payment_method_name: str) -> None:
     DEPRECATED: Use delete_qr_by_key() when you have the stored s3_key.
     This function remains for backwards compatibility with slug-based keys.
 
-    Deletes all possible file extensions (png, jpg, webp) to ensure cleanup.
+    Deletes all possible file extensions (png, jpg, webp) in a single
+    delete_objects batch to ensure cleanup.
 
     Args:
         account_id: Account ID
@@ -580,27 +732,22 @@ def delete_qr_from_s3(account_id: str, payment_method_name: str) -> None:
     """
     logger = get_logger(__name__)
 
-    slug = slugify(payment_method_name)
     bucket_name = get_required_env("EXPORTS_BUCKET")
-
-    # Try all possible extensions
-    extensions = ["png", "jpg", "webp"]
+    s3_keys = get_legacy_qr_keys(account_id, payment_method_name)
 
     try:
         s3 = _get_s3_client()
+        response = s3.delete_objects(
+            Bucket=bucket_name,
+            Delete={"Objects": [{"Key": key} for key in s3_keys], "Quiet": True},
+        )
 
-        for ext in extensions:  # pragma: no branch
-            s3_key = f"payment-qr-codes/{account_id}/{slug}.{ext}"
+        # Quiet mode only reports failures; missing keys are not failures
+        for error in response.get("Errors", []):
+            if error.get("Code") != "NoSuchKey":
+                logger.warning("Failed to delete QR code variant", s3_key=error.get("Key"), error=error.get("Message"))
 
-            try:
-                s3.delete_object(Bucket=bucket_name, Key=s3_key)
-                logger.info(
-                    "Deleted QR code from S3", account_id=account_id, payment_method=payment_method_name, s3_key=s3_key
-                )
-            except ClientError as e:
-                # Ignore 404 errors (file doesn't exist)
-                if e.response.get("Error", {}).get("Code") != "NoSuchKey":
-                    logger.warning("Failed to delete QR code variant", s3_key=s3_key, error=str(e))
+        logger.info("Deleted QR code from S3", account_id=account_id, payment_method=payment_method_name)
 
     except Exception as e:
         logger.error("Failed to delete QR code from S3", error=str(e))
@@ -616,7 +763,7 @@ def generate_presigned_get_url(
     Args:
         account_id: Account ID
         payment_method_name: Payment method name
-        s3_key: S3 key (if None, will attempt to find existing file)
+        s3_key: Stored S3 key (if None, falls back to a legacy slug-based lookup)
         expiry_seconds: URL expiry time in seconds (default: 900 = 15 minutes)
 
     Returns:
@@ -632,18 +779,9 @@ def generate_presigned_get_url(
     try:
         s3 = _get_s3_client()
 
-        # If no s3_key provided, try to find existing file
+        # If no s3_key provided, fall back to a single prefix lookup for legacy files
         if not s3_key:
-            extensions = ["png", "jpg", "webp"]
-
-            for ext in extensions:
-                test_key = get_qr_code_s3_key(account_id, payment_method_name, ext)
-                try:
-                    s3.head_object(Bucket=bucket_name, Key=test_key)
-                    s3_key = test_key
-                    break
-                except ClientError:
-                    continue
+            s3_key = find_legacy_qr_key(account_id, payment_method_name)
 
             if not s3_key:
                 return None  # No QR code found
@@ -0,0 +1,137 @@
+"""
+On-demand cProfile capture for Lambda handlers.
+
+Off by default. Set PROFILE_SAMPLE_RATE on a function to profile a fraction of
+its invocations (1 profiles every call, 0.05 about one in twenty), optionally
+limited to some handlers with PROFILE_HANDLERS (comma-separated names such as
+"campaign_reporting.get_unit_report"). Both are read once, when
+@handler_middleware wraps the handler, so a disabled profiler costs nothing
+per invocation.
+
+Each profile is uploaded as a pstats file to the exports bucket under
+profiles/<handler>/<date>/ and its key is logged. Render it locally with:
+    uv run python scripts/render_profile.py s3://<bucket>/<key> > stacks.txt
+"""
+
+import cProfile
+import marshal
+import os
+import pstats
+import random
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .aws_clients import get_s3_client
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_PREFIX = "profiles/"
+
+# Stack paths contributing less than this (in microseconds) are dropped when collapsing
+MIN_COLLAPSED_US = 1
+
+# (filename, line, function name) as used by pstats
+FunctionKey = Tuple[str, int, str]
+
+
+def profile_sample_rate(handler_name: str) -> float:
+    """Return the fraction of this handler's invocations to profile (0 when disabled)."""
+    try:
+        rate = float(os.getenv("PROFILE_SAMPLE_RATE", "0") or 0)
+    except ValueError:
+        logger.warning("Ignoring invalid PROFILE_SAMPLE_RATE", value=os.getenv("PROFILE_SAMPLE_RATE"))
+        return 0.0
+    handlers = {name.strip() for name in os.getenv("PROFILE_HANDLERS", "").split(",") if name.strip()}
+    if handlers and handler_name not in handlers:
+        return 0.0
+    return min(max(rate, 0.0), 1.0)
+
+
+def should_profile(rate: float) -> bool:
+    """Decide whether to profile this invocation."""
+    return random.random() < rate
+
+
+def profile_key(handler_name: str, correlation_id: str, now: Optional[datetime] = None) -> str:
+    """Build the S3 key for a profile."""
+    now = now or datetime.now(timezone.utc)
+    return f"{PROFILE_PREFIX}{handler_name}/{now:%Y-%m-%d}/{now:%H%M%S}-{correlation_id}.pstats"
+
+
+def upload_profile(profiler: cProfile.Profile, handler_name: str, correlation_id: str) -> Optional[str]:
+    """
+    Upload a finished profile to the exports bucket.
+
+    Returns:
+        The S3 key, or None if the profile could not be stored (never raises)
+    """
+    bucket = os.getenv("EXPORTS_BUCKET")
+    if not bucket:
+        logger.warning("Profile discarded: EXPORTS_BUCKET is not set", handler=handler_name)
+        return None
+    key = profile_key(handler_name, correlation_id)
+    try:
+        # Same format as pstats.Stats.dump_stats, without a temp file
+        body = marshal.dumps(pstats.Stats(profiler).stats)  # type: ignore[attr-defined]
+        get_s3_client().put_object(Bucket=bucket, Key=key, Body=body, ContentType="application/octet-stream")
+    except Exception as e:
+        logger.warning("Failed to upload profile", handler=handler_name, key=key, error=str(e))
+        return None
+    logger.info("Profile captured", handler=handler_name, bucket=bucket, key=key)
+    return key
+
+
+def run_profiled(handler_name: str, correlation_id: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Call func under cProfile and upload the profile, even if func raises."""
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        upload_profile(profiler, handler_name, correlation_id)
+
+
+def _frame_label(func: FunctionKey) -> str:
+    filename, line, name = func
+    # Built-ins are reported as ('~', 0, "<built-in method ...>")
+    label = name if filename == "~" else f"{os.path.basename(filename)}:{name}:{line}"
+    return label.replace(";", ":").replace(" ", "_")
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64) -> List[str]:
+    """
+    Convert pstats data to collapsed stacks ("a;b;c <microseconds>") for flamegraph tools.
+
+    cProfile only records caller/callee pairs, so full stacks are rebuilt by
+    walking from the root functions and splitting each callee's time between
+    its callers in proportion to the time recorded for that pair.
+    """
+    raw: Dict[FunctionKey, Tuple[int, int, float, float, Dict[FunctionKey, Tuple[int, int, float, float]]]]
+    raw = stats.stats  # type: ignore[attr-defined]
+    children: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, caller_stats in callers.items():
+            children[caller].append((func, caller_stats[3]))
+
+    totals: Dict[str, float] = defaultdict(float)
+
+    def walk(func: FunctionKey, path: Tuple[FunctionKey, ...], labels: Tuple[str, ...], share: float) -> None:
+        own_time = raw[func][2]
+        labels = labels + (_frame_label(func),)
+        totals[";".join(labels)] += own_time * share * 1_000_000
+        if len(labels) >= max_depth:
+            return
+        for child, pair_time in children.get(func, []):
+            child_total = raw[child][3]
+            child_share = pair_time * share / child_total if child_total > 0 else 0.0
+            # Skip recursion and paths too small to show up in a flame graph
+            if child in path or child_share * child_total * 1_000_000 < MIN_COLLAPSED_US:
+                continue
+            walk(child, path + (child,), labels, child_share)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, (func,), (), 1.0)
+
+    return [f"{stack} {round(us)}" for stack, us in sorted(totals.items()) if round(us) >= MIN_COLLAPSED_US]
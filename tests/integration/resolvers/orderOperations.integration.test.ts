@@ -55,6 +55,15 @@ const CREATE_CAMPAIGN = gql`
   }
 `;
 
+const UPDATE_CAMPAIGN = gql`
+  mutation UpdateCampaign($input: UpdateCampaignInput!) {
+    updateCampaign(input: $input) {
+      campaignId
+      catalogId
+    }
+  }
+`;
+
 const GET_CAMPAIGN = gql`
   query GetCampaign($campaignId: ID!) {
     getCampaign(campaignId: $campaignId) {
@@ -127,6 +136,21 @@ const DELETE_ORDER = gql`
   }
 `;
 
+const ORDERS_CHANGED_SINCE = gql`
+  query OrdersChangedSince($campaignId: ID!, $since: AWSDateTime!) {
+    ordersChangedSince(campaignId: $campaignId, since: $since) {
+      orders {
+        orderId
+        updatedAt
+      }
+      deletedOrderIds
+      nextToken
+      watermark
+      fullResyncRequired
+    }
+  }
+`;
+
 const DELETE_CAMPAIGN = gql`
   mutation DeleteCampaign($campaignId: ID!) {
     deleteCampaign(campaignId: $campaignId)
@@ -497,6 +521,54 @@ describe('Order Operations Integration Tests', () => {
         })
       ).rejects.toThrow(/not found|does not exist|invalid/i);
     }, 10000);
+
+    test('rejects order when the campaign catalog is missing', async () => {
+      // Campaigns only store the catalog reference, so point one at a catalog that does not exist
+      const { data: campaignData } = await ownerClient.mutate({
+        mutation: CREATE_CAMPAIGN,
+        variables: {
+          input: {
+            profileId: testProfileId,
+            campaignName: 'Missing Catalog Campaign',
+            campaignYear: 2025,
+            startDate: new Date('2025-06-01T00:00:00Z').toISOString(),
+            catalogId: testCatalogId,
+          },
+        },
+      });
+      const campaignId = campaignData.createCampaign.campaignId;
+      await ownerClient.mutate({
+        mutation: UPDATE_CAMPAIGN,
+        variables: { input: { campaignId, catalogId: 'CATALOG#non-existent-catalog-id' } },
+      });
+
+      // Wait a moment for GSI propagation
+      await new Promise(resolve => setTimeout(resolve, 500));
+
+      const input = {
+        profileId: testProfileId,
+        campaignId,
+        customerName: 'Test Customer',
+        orderDate: new Date().toISOString(),
+        paymentMethod: 'CASH',
+        lineItems: [
+          {
+            productId: testProductId,
+            quantity: 1,
+          },
+        ],
+      };
+
+      await expect(
+        ownerClient.mutate({
+          mutation: CREATE_ORDER,
+          variables: { input },
+        })
+      ).rejects.toThrow(/Catalog not found/);
+
+      // Cleanup
+      await ownerClient.mutate({ mutation: DELETE_CAMPAIGN, variables: { campaignId } });
+    }, 15000);
   });
 
   describe('updateOrder', () => {
@@ -761,6 +833,55 @@ describe('Order Operations Integration Tests', () => {
       expect(afterOrderIds).not.toContain(orderId);
     }, 15000);
 
+    test('Data Integrity: ordersChangedSince reports created and deleted orders', async () => {
+      const since = new Date(Date.now() - 60 * 60 * 1000).toISOString();
+      const { data: createData } = await ownerClient.mutate({
+        mutation: CREATE_ORDER,
+        variables: {
+          input: {
+            profileId: testProfileId,
+            campaignId: testCampaignId,
+            customerName: 'Delta Sync Test',
+            orderDate: new Date().toISOString(),
+            paymentMethod: 'CHECK',
+            lineItems: [{ productId: testProductId, quantity: 1 }],
+          },
+        },
+      });
+      const orderId = createData.createOrder.orderId;
+
+      // GSI reads are eventually consistent; give the index a moment
+      await new Promise((resolve) => setTimeout(resolve, 2000));
+      const { data: changedData }: any = await ownerClient.query({
+        query: ORDERS_CHANGED_SINCE,
+        variables: { campaignId: testCampaignId, since },
+        fetchPolicy: 'network-only',
+      });
+      expect(changedData.ordersChangedSince.fullResyncRequired).toBe(false);
+      expect(changedData.ordersChangedSince.orders.map((o: any) => o.orderId)).toContain(orderId);
+      expect(changedData.ordersChangedSince.watermark > since).toBe(true);
+
+      await ownerClient.mutate({ mutation: DELETE_ORDER, variables: { orderId } });
+
+      const { data: deletedData }: any = await ownerClient.query({
+        query: ORDERS_CHANGED_SINCE,
+        variables: { campaignId: testCampaignId, since },
+        fetchPolicy: 'network-only',
+      });
+      expect(deletedData.ordersChangedSince.deletedOrderIds).toContain(orderId);
+    }, 20000);
+
+    test('ordersChangedSince asks for a full resync past the tombstone retention', async () => {
+      const { data }: any = await ownerClient.query({
+        query: ORDERS_CHANGED_SINCE,
+        variables: { campaignId: testCampaignId, since: '2000-01-01T00:00:00Z' },
+        fetchPolicy: 'network-only',
+      });
+
+      expect(data.ordersChangedSince.fullResyncRequired).toBe(true);
+      expect(data.ordersChangedSince.orders).toEqual([]);
+    });
+
     test('Data Integrity: Concurrent deletion of same order (idempotent)', async () => {
       // Create an order first
       const createInput = {
@@ -214,6 +214,44 @@ const LIST_ORDERS_BY_PROFILE = gql`
   }
 `;
 
+const LIST_ORDERS_BY_CAMPAIGN_PAGE = gql`
+  query ListOrdersByCampaignPage($campaignId: ID!, $limit: Int, $nextToken: String) {
+    listOrdersByCampaignPage(campaignId: $campaignId, limit: $limit, nextToken: $nextToken) {
+      items {
+        orderId
+        campaignId
+        createdAt
+      }
+      nextToken
+    }
+  }
+`;
+
+const LIST_ORDERS_BY_PROFILE_PAGE = gql`
+  query ListOrdersByProfilePage(
+    $profileId: ID!
+    $limit: Int
+    $nextToken: String
+    $createdAfter: AWSDateTime
+    $createdBefore: AWSDateTime
+  ) {
+    listOrdersByProfilePage(
+      profileId: $profileId
+      limit: $limit
+      nextToken: $nextToken
+      createdAfter: $createdAfter
+      createdBefore: $createdBefore
+    ) {
+      items {
+        orderId
+        profileId
+        createdAt
+      }
+      nextToken
+    }
+  }
+`;
+
 describe('Order Query Operations Integration Tests', () => {
   const SUITE_ID = 'order-queries';
   
@@ -915,6 +953,94 @@ describe('Order Query Operations Integration Tests', () => {
     });
   });
 
+  // ========================================
+  // 5.12.3b: Paginated order lists
+  // ========================================
+
+  describe('5.12.3b: listOrdersByCampaignPage / listOrdersByProfilePage', () => {
+    test('Happy Path: Pages through a campaign one order at a time', async () => {
+      const { data: first }: any = await ownerClient.query({
+        query: LIST_ORDERS_BY_CAMPAIGN_PAGE,
+        variables: { campaignId: testCampaignId, limit: 1 },
+        fetchPolicy: 'network-only',
+      });
+
+      expect(first.listOrdersByCampaignPage.items).toHaveLength(1);
+      expect(first.listOrdersByCampaignPage.nextToken).toBeTruthy();
+
+      const { data: second }: any = await ownerClient.query({
+        query: LIST_ORDERS_BY_CAMPAIGN_PAGE,
+        variables: { campaignId: testCampaignId, limit: 1, nextToken: first.listOrdersByCampaignPage.nextToken },
+        fetchPolicy: 'network-only',
+      });
+
+      expect(second.listOrdersByCampaignPage.items).toHaveLength(1);
+      const orderIds = [
+        first.listOrdersByCampaignPage.items[0].orderId,
+        second.listOrdersByCampaignPage.items[0].orderId,
+      ];
+      expect(orderIds).toContain(testOrderId1);
+      expect(orderIds).toContain(testOrderId2);
+    });
+
+    test('Validation: A cursor cannot be replayed against another campaign', async () => {
+      const { data }: any = await ownerClient.query({
+        query: LIST_ORDERS_BY_CAMPAIGN_PAGE,
+        variables: { campaignId: testCampaignId, limit: 1 },
+        fetchPolicy: 'network-only',
+      });
+
+      const { errors }: any = await ownerClient.query({
+        query: LIST_ORDERS_BY_CAMPAIGN_PAGE,
+        variables: { campaignId: unsharedCampaignId, limit: 1, nextToken: data.listOrdersByCampaignPage.nextToken },
+        fetchPolicy: 'network-only',
+      });
+
+      expect(errors?.[0]?.message).toContain('Invalid nextToken');
+    });
+
+    test('Validation: Rejects a limit above the maximum', async () => {
+      const { errors }: any = await ownerClient.query({
+        query: LIST_ORDERS_BY_CAMPAIGN_PAGE,
+        variables: { campaignId: testCampaignId, limit: 1000 },
+        fetchPolicy: 'network-only',
+      });
+
+      expect(errors?.[0]?.message).toContain('limit must be between');
+    });
+
+    test('Happy Path: Filters profile orders by createdAt range', async () => {
+      const { data }: any = await ownerClient.query({
+        query: LIST_ORDERS_BY_PROFILE_PAGE,
+        variables: { profileId: testProfileId, createdAfter: '2999-01-01T00:00:00Z' },
+        fetchPolicy: 'network-only',
+      });
+      expect(data.listOrdersByProfilePage.items).toEqual([]);
+      expect(data.listOrdersByProfilePage.nextToken).toBeNull();
+
+      const { data: all }: any = await ownerClient.query({
+        query: LIST_ORDERS_BY_PROFILE_PAGE,
+        variables: { profileId: testProfileId, createdBefore: '2999-01-01T00:00:00Z' },
+        fetchPolicy: 'network-only',
+      });
+      const orderIds = all.listOrdersByProfilePage.items.map((o: any) => o.orderId);
+      expect(orderIds).toContain(testOrderId1);
+      expect(orderIds).toContain(testOrderId2);
+    });
+
+    test('Authorization: Non-shared user gets an empty page', async () => {
+      const { data }: any = await contributorClient.query({
+        query: LIST_ORDERS_BY_PROFILE_PAGE,
+        variables: { profileId: unsharedProfileId },
+        fetchPolicy: 'network-only',
+      });
+
+      expect(data.listOrdersByProfilePage).toEqual(
+        expect.objectContaining({ items: [], nextToken: null })
+      );
+    });
+  });
+
   // ========================================
   // 5.12.4: Order Edge Cases
   // ========================================
@@ -0,0 +1,152 @@
+"""
+Count and classify AWS calls made during a handler invocation.
+
+Used by call-budget tests to catch N+1 patterns (a per-profile auth check or a
+per-campaign get_item reintroduced by a refactor):
+
+    with count_aws_calls() as calls:
+        list_my_shares(event, None)
+    calls.assert_within(dynamodb=2, s3=0)
+
+Calls are observed through botocore `before-call` hooks on the default boto3
+session (API parameters are picked up at `before-parameter-build`). Clients
+copy the session's hooks when they are built, so the cached clients in
+utils.aws_clients are dropped on entry and exit; clients the handler creates
+inside the block are counted, clients built earlier (e.g. by fixtures seeding
+data) are not.
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import boto3
+
+from src.utils.aws_clients import reset_clients
+
+_HOOK_ID = "kernelworx-call-counter"
+
+DYNAMODB_KINDS = {
+    "GetItem": "point-read",
+    "BatchGetItem": "batch-read",
+    "TransactGetItems": "batch-read",
+    "Query": "query",
+    "Scan": "scan",
+    "PutItem": "write",
+    "UpdateItem": "write",
+    "DeleteItem": "write",
+    "BatchWriteItem": "batch-write",
+    "TransactWriteItems": "transaction",
+}
+
+S3_KINDS = {
+    "GetObject": "read",
+    "HeadObject": "read",
+    "PutObject": "write",
+    "CopyObject": "write",
+    "DeleteObject": "write",
+    "DeleteObjects": "write",
+    "ListObjects": "list",
+    "ListObjectsV2": "list",
+}
+
+
+@dataclass(frozen=True)
+class AwsCall:
+    """One AWS API call."""
+
+    service: str
+    operation: str
+    kind: str
+    # Tables (DynamoDB) or bucket (S3) the call touched
+    targets: Tuple[str, ...]
+
+    def __str__(self) -> str:
+        return f"{self.service}:{self.operation} [{self.kind}] {', '.join(self.targets)}"
+
+
+def _dynamodb_targets(params: Dict[str, Any]) -> Tuple[str, ...]:
+    if "TableName" in params:
+        return (params["TableName"],)
+    if "RequestItems" in params:
+        return tuple(sorted(params["RequestItems"]))
+    if "TransactItems" in params:
+        return tuple(sorted({action["TableName"] for item in params["TransactItems"] for action in item.values()}))
+    return ()
+
+
+def classify_call(service: str, operation: str, params: Dict[str, Any]) -> AwsCall:
+    """Describe a call from its service, operation name and API parameters."""
+    if service == "dynamodb":
+        return AwsCall(service, operation, DYNAMODB_KINDS.get(operation, "other"), _dynamodb_targets(params))
+    bucket = params.get("Bucket")
+    return AwsCall(service, operation, S3_KINDS.get(operation, "other"), (bucket,) if bucket else ())
+
+
+@dataclass
+class AwsCallLog:
+    """Calls recorded by count_aws_calls()."""
+
+    calls: List[AwsCall] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, call: AwsCall) -> None:
+        with self._lock:
+            self.calls.append(call)
+
+    def count(self, service: Optional[str] = None, kind: Optional[str] = None) -> int:
+        """Count calls, optionally restricted to a service and/or kind."""
+        return sum(
+            1
+            for call in self.calls
+            if (service is None or call.service == service) and (kind is None or call.kind == kind)
+        )
+
+    def breakdown(self) -> Counter[AwsCall]:
+        """Number of identical calls (same operation, kind and targets)."""
+        return Counter(self.calls)
+
+    def describe(self) -> str:
+        """Human-readable summary, most frequent calls first."""
+        lines = [f"{n:>4} x {call}" for call, n in self.breakdown().most_common()]
+        return "\n".join(lines) or "(no AWS calls)"
+
+    def assert_within(self, dynamodb: Optional[int] = None, s3: Optional[int] = None) -> None:
+        """Fail with a per-call breakdown when a service exceeds its budget."""
+        over = [
+            f"{service}: {self.count(service)} calls > budget {budget}"
+            for service, budget in (("dynamodb", dynamodb), ("s3", s3))
+            if budget is not None and self.count(service) > budget
+        ]
+        assert not over, "AWS call budget exceeded: " + "; ".join(over) + "\n" + self.describe()
+
+
+@contextmanager
+def count_aws_calls() -> Iterator[AwsCallLog]:
+    """Record every DynamoDB and S3 call made by clients created inside the block."""
+    log = AwsCallLog()
+    events = boto3._get_default_session().events
+
+    def on_parameters(params: Dict[str, Any], context: Dict[str, Any], **kwargs: Any) -> None:
+        context[_HOOK_ID] = params
+
+    def on_call(model: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+        # Presigned URLs build parameters too but never reach before-call
+        log.record(classify_call(model.service_model.endpoint_prefix, model.name, context.get(_HOOK_ID, {})))
+
+    registrations = [
+        (f"{event}.{service}", handler, f"{_HOOK_ID}-{event}-{service}")
+        for service in ("dynamodb", "s3")
+        for event, handler in (("before-parameter-build", on_parameters), ("before-call", on_call))
+    ]
+    for event_name, handler, unique_id in registrations:
+        events.register(event_name, handler, unique_id=unique_id)
+    reset_clients()
+    try:
+        yield log
+    finally:
+        for event_name, _, unique_id in registrations:
+            events.unregister(event_name, unique_id=unique_id)
+        reset_clients()
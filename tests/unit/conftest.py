@@ -5,15 +5,31 @@ Provides common test data and mocked AWS resources.
 """
 
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any, Dict, Generator
 
 import boto3
 import pytest
 from moto import mock_aws
 
+from src.utils.auth import reset_permission_cache
+from src.utils.aws_clients import reset_clients
+from src.utils.catalogs import reset_catalog_version_cache
 from tests.unit.table_schemas import create_all_tables
 
 
+@pytest.fixture(autouse=True)
+def fresh_aws_clients() -> Generator[None, None, None]:
+    """Drop cached boto3 clients (and cached access decisions and catalog versions) so mock_aws/patches take effect."""
+    reset_clients()
+    reset_permission_cache()
+    reset_catalog_version_cache()
+    yield
+    reset_clients()
+    reset_permission_cache()
+    reset_catalog_version_cache()
+
+
 @pytest.fixture
 def aws_credentials() -> None:
     """Set fake AWS credentials for moto."""
@@ -28,14 +44,17 @@ def aws_credentials() -> None:
     os.environ["TABLE_NAME"] = "PsmApp"  # Legacy - kept for backward compat
     os.environ["ACCOUNTS_TABLE_NAME"] = "kernelworx-accounts-ue1-dev"
     os.environ["CATALOGS_TABLE_NAME"] = "kernelworx-catalogs-ue1-dev"
+    os.environ["CATALOG_VERSIONS_TABLE_NAME"] = "kernelworx-catalog-versions-ue1-dev"
     os.environ["PROFILES_TABLE_NAME"] = "kernelworx-profiles-v2-ue1-dev"
     os.environ["CAMPAIGNS_TABLE_NAME"] = "kernelworx-campaigns-v2-ue1-dev"
     os.environ["ORDERS_TABLE_NAME"] = "kernelworx-orders-v2-ue1-dev"
     os.environ["SHARES_TABLE_NAME"] = "kernelworx-shares-ue1-dev"
     os.environ["INVITES_TABLE_NAME"] = "kernelworx-invites-ue1-dev"
     os.environ["SHARED_CAMPAIGNS_TABLE_NAME"] = "kernelworx-shared-campaigns-ue1-dev"
+    os.environ["CUSTOMER_INDEX_TABLE_NAME"] = "kernelworx-customer-index-ue1-dev"
     # S3 bucket names
     os.environ["EXPORTS_BUCKET"] = "kernelworx-exports-ue1-dev"
+    os.environ["STATIC_ASSETS_BUCKET"] = "kernelworx-static-ue1-dev"
 
 
 @pytest.fixture
@@ -182,6 +201,32 @@ def sample_campaign(dynamodb_table: Any, sample_profile_id: str, sample_campaign
     return campaign
 
 
+@pytest.fixture
+def order_setup(
+    dynamodb_table: Any, sample_profile: Dict[str, Any], sample_campaign: Dict[str, Any], sample_account_id: str
+) -> Dict[str, Any]:
+    """Catalog for the sample campaign and an owner account with a custom payment method."""
+    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+    dynamodb.Table("kernelworx-catalogs-ue1-dev").put_item(
+        Item={
+            "catalogId": "CATALOG#default",
+            "catalogName": "Default",
+            "products": [
+                {"productId": "P1", "productName": "Caramel Corn", "price": Decimal("20.00")},
+                {"productId": "P2", "productName": "Kettle Corn", "price": Decimal("15.50")},
+            ],
+        }
+    )
+    dynamodb.Table("kernelworx-accounts-ue1-dev").put_item(
+        Item={
+            "accountId": f"ACCOUNT#{sample_account_id}",
+            "email": "owner@example.com",
+            "preferences": {"paymentMethods": [{"name": "Venmo"}]},
+        }
+    )
+    return {"profileId": sample_profile["profileId"], "campaignId": sample_campaign["campaignId"]}
+
+
 @pytest.fixture
 def sample_order_id() -> str:  # pragma: no cover
     """Sample order ID."""
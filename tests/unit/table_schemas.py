@@ -58,7 +58,7 @@ def create_catalogs_table_schema() -> dict[str, Any]:
         "AttributeDefinitions": [
             {"AttributeName": "catalogId", "AttributeType": "S"},
             {"AttributeName": "ownerAccountId", "AttributeType": "S"},
-            {"AttributeName": "isPublic", "AttributeType": "S"},
+            {"AttributeName": "isPublicStr", "AttributeType": "S"},
             {"AttributeName": "createdAt", "AttributeType": "S"},
         ],
         "GlobalSecondaryIndexes": [
@@ -72,7 +72,7 @@ def create_catalogs_table_schema() -> dict[str, Any]:
             {
                 "IndexName": "isPublic-createdAt-index",
                 "KeySchema": [
-                    {"AttributeName": "isPublic", "KeyType": "HASH"},
+                    {"AttributeName": "isPublicStr", "KeyType": "HASH"},
                     {"AttributeName": "createdAt", "KeyType": "RANGE"},
                 ],
                 "Projection": {"ProjectionType": "ALL"},
@@ -82,6 +82,26 @@ def create_catalogs_table_schema() -> dict[str, Any]:
     }
 
 
+def create_catalog_versions_table_schema() -> dict[str, Any]:
+    """
+    Schema for the catalog versions table (see src/utils/catalogs.py).
+
+    Key structure: PK=catalogId, SK=version
+    """
+    return {
+        "TableName": "kernelworx-catalog-versions-ue1-dev",
+        "KeySchema": [
+            {"AttributeName": "catalogId", "KeyType": "HASH"},
+            {"AttributeName": "version", "KeyType": "RANGE"},
+        ],
+        "AttributeDefinitions": [
+            {"AttributeName": "catalogId", "AttributeType": "S"},
+            {"AttributeName": "version", "AttributeType": "S"},
+        ],
+        "BillingMode": "PAY_PER_REQUEST",
+    }
+
+
 def create_profiles_table_schema() -> dict[str, Any]:
     """
     Schema for profiles table (V2 multi-table design).
@@ -124,6 +144,7 @@ def create_campaigns_table_schema() -> dict[str, Any]:
     GSIs:
     - campaignId-index: direct campaign lookup
     - catalogId-index: find campaigns using a specific catalog
+    - unitCampaignKey-index: find campaigns for a unit+campaign (unit reports)
     """
     return {
         "TableName": "kernelworx-campaigns-v2-ue1-dev",
@@ -135,6 +156,7 @@ def create_campaigns_table_schema() -> dict[str, Any]:
             {"AttributeName": "profileId", "AttributeType": "S"},
             {"AttributeName": "campaignId", "AttributeType": "S"},
             {"AttributeName": "catalogId", "AttributeType": "S"},
+            {"AttributeName": "unitCampaignKey", "AttributeType": "S"},
         ],
         "GlobalSecondaryIndexes": [
             {
@@ -151,6 +173,13 @@ def create_campaigns_table_schema() -> dict[str, Any]:
                 ],
                 "Projection": {"ProjectionType": "ALL"},
             },
+            {
+                "IndexName": "unitCampaignKey-index",
+                "KeySchema": [
+                    {"AttributeName": "unitCampaignKey", "KeyType": "HASH"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
         ],
         "BillingMode": "PAY_PER_REQUEST",
     }
@@ -259,7 +288,7 @@ def create_shared_campaigns_table_schema() -> dict[str, Any]:
     """
     Schema for shared campaigns table (Phase 1).
 
-    Key structure: PK=sharedCampaignCode, SK=METADATA
+    Key structure: PK=sharedCampaignCode
     GSIs:
     - GSI1: createdBy + createdAt (list by creator)
     - GSI2: unitCampaignKey + sharedCampaignCode (discover by unit+campaign)
@@ -268,11 +297,9 @@ def create_shared_campaigns_table_schema() -> dict[str, Any]:
         "TableName": "kernelworx-shared-campaigns-ue1-dev",
         "KeySchema": [
             {"AttributeName": "sharedCampaignCode", "KeyType": "HASH"},
-            {"AttributeName": "SK", "KeyType": "RANGE"},
         ],
         "AttributeDefinitions": [
             {"AttributeName": "sharedCampaignCode", "AttributeType": "S"},
-            {"AttributeName": "SK", "AttributeType": "S"},
             {"AttributeName": "createdBy", "AttributeType": "S"},
             {"AttributeName": "createdAt", "AttributeType": "S"},
             {"AttributeName": "unitCampaignKey", "AttributeType": "S"},
@@ -299,6 +326,26 @@ def create_shared_campaigns_table_schema() -> dict[str, Any]:
     }
 
 
+def create_customer_index_table_schema() -> dict[str, Any]:
+    """
+    Schema for the customer search index table (see src/utils/customer_index.py).
+
+    Key structure: PK=profileId, SK=indexKey (SHARD#<c> or CUSTOMER#<key>)
+    """
+    return {
+        "TableName": "kernelworx-customer-index-ue1-dev",
+        "KeySchema": [
+            {"AttributeName": "profileId", "KeyType": "HASH"},
+            {"AttributeName": "indexKey", "KeyType": "RANGE"},
+        ],
+        "AttributeDefinitions": [
+            {"AttributeName": "profileId", "AttributeType": "S"},
+            {"AttributeName": "indexKey", "AttributeType": "S"},
+        ],
+        "BillingMode": "PAY_PER_REQUEST",
+    }
+
+
 def get_all_table_schemas() -> list[dict[str, Any]]:
     """
     Get all table schemas as a list.
@@ -309,12 +356,14 @@ def get_all_table_schemas() -> list[dict[str, Any]]:
     return [
         create_accounts_table_schema(),
         create_catalogs_table_schema(),
+        create_catalog_versions_table_schema(),
         create_profiles_table_schema(),
         create_campaigns_table_schema(),
         create_orders_table_schema(),
         create_shares_table_schema(),
         create_invites_table_schema(),
         create_shared_campaigns_table_schema(),
+        create_customer_index_table_schema(),
     ]
 
 
@@ -329,24 +378,28 @@ def create_all_tables(dynamodb_resource: Any) -> dict[str, Any]:
         Dictionary mapping table names to table objects:
         - accounts: Account table
         - catalogs: Catalogs table
+        - catalog_versions: Catalog versions table
         - profiles: Profiles V2 table
         - campaigns: Campaigns V2 table
         - orders: Orders V2 table
         - shares: Shares table
         - invites: Invites table
         - shared_campaigns: Shared campaigns table
+        - customer_index: Customer search index table
     """
     tables: dict[str, Any] = {}
 
     schema_creators = [
         ("accounts", create_accounts_table_schema),
         ("catalogs", create_catalogs_table_schema),
+        ("catalog_versions", create_catalog_versions_table_schema),
         ("profiles", create_profiles_table_schema),
         ("campaigns", create_campaigns_table_schema),
         ("orders", create_orders_table_schema),
         ("shares", create_shares_table_schema),
         ("invites", create_invites_table_schema),
         ("shared_campaigns", create_shared_campaigns_table_schema),
+        ("customer_index", create_customer_index_table_schema),
     ]
 
     for name, schema_creator in schema_creators:
@@ -360,10 +413,12 @@ def create_all_tables(dynamodb_resource: Any) -> dict[str, Any]:
 TABLE_NAMES = {
     "accounts": "kernelworx-accounts-ue1-dev",
     "catalogs": "kernelworx-catalogs-ue1-dev",
+    "catalog_versions": "kernelworx-catalog-versions-ue1-dev",
     "profiles": "kernelworx-profiles-v2-ue1-dev",
     "campaigns": "kernelworx-campaigns-v2-ue1-dev",
     "orders": "kernelworx-orders-v2-ue1-dev",
     "shares": "kernelworx-shares-ue1-dev",
     "invites": "kernelworx-invites-ue1-dev",
     "shared_campaigns": "kernelworx-shared-campaigns-ue1-dev",
+    "customer_index": "kernelworx-customer-index-ue1-dev",
 }
@@ -1,10 +1,12 @@
 """Tests for authorization utilities."""
 
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pytest
 
 from src.utils.auth import (
+    PermissionCache,
     check_profile_access,
     get_account,
     is_admin,
@@ -419,6 +421,135 @@ class TestCheckProfileAccess:
         assert result is False
 
 
+class TestPermissionCache:
+    """Tests for the warm-container permission cache."""
+
+    def test_hit_requires_matching_share_version(self) -> None:
+        """A decision is dropped once the profile's shareVersion moves on."""
+        cache = PermissionCache()
+        key = ("caller", "PROFILE#p", "READ")
+        cache.put(key, 1, True, ttl_seconds=30)
+
+        assert cache.get(key, 1) is True
+        assert cache.get(key, 2) is None
+        assert len(cache) == 0
+
+    def test_negative_decisions_are_cached(self) -> None:
+        """Denials are cached too."""
+        cache = PermissionCache()
+        cache.put(("caller", "PROFILE#p", "WRITE"), 0, False, ttl_seconds=30)
+
+        assert cache.get(("caller", "PROFILE#p", "WRITE"), 0) is False
+
+    def test_entries_expire(self) -> None:
+        """Entries are not returned after their TTL."""
+        cache = PermissionCache()
+        key = ("caller", "PROFILE#p", "READ")
+        with patch("src.utils.auth.time.monotonic", return_value=100.0):
+            cache.put(key, 0, True, ttl_seconds=30)
+        with patch("src.utils.auth.time.monotonic", return_value=131.0):
+            assert cache.get(key, 0) is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """The cache stays within max_entries, evicting the LRU entry."""
+        cache = PermissionCache(max_entries=2)
+        first, second, third = (("caller", f"PROFILE#{n}", "READ") for n in range(3))
+        cache.put(first, 0, True, ttl_seconds=30)
+        cache.put(second, 0, True, ttl_seconds=30)
+        cache.get(first, 0)
+        cache.put(third, 0, True, ttl_seconds=30)
+
+        assert len(cache) == 2
+        assert cache.get(second, 0) is None
+        assert cache.get(first, 0) is True
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestCheckProfileAccessCached:
+    """Tests for check_profile_access with PERMISSION_CACHE_TTL_SECONDS set."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PERMISSION_CACHE_TTL_SECONDS", "30")
+
+    def _share(self, shares_table: Any, profile_id: str, account_id: str, permissions: list) -> None:
+        shares_table.put_item(
+            Item={"profileId": profile_id, "targetAccountId": f"ACCOUNT#{account_id}", "permissions": permissions}
+        )
+
+    def test_owner_allowed(
+        self, dynamodb_table: Any, sample_profile: Any, sample_account_id: str, sample_profile_id: str
+    ) -> None:
+        """The owner is recognised from the index entry."""
+        assert check_profile_access(sample_account_id, sample_profile_id, "WRITE") is True
+
+    def test_revoked_share_seen_after_share_version_bump(
+        self,
+        dynamodb_table: Any,
+        shares_table: Any,
+        sample_profile: Any,
+        sample_account_id: str,
+        sample_profile_id: str,
+        another_account_id: str,
+    ) -> None:
+        """A cached grant is reused until the revoke pipeline bumps shareVersion."""
+        self._share(shares_table, sample_profile_id, another_account_id, ["READ"])
+        assert check_profile_access(another_account_id, sample_profile_id, "READ") is True
+
+        shares_table.delete_item(
+            Key={"profileId": sample_profile_id, "targetAccountId": f"ACCOUNT#{another_account_id}"}
+        )
+        # Still cached: nothing told this container the share changed
+        assert check_profile_access(another_account_id, sample_profile_id, "READ") is True
+
+        dynamodb_table.update_item(
+            Key={"ownerAccountId": f"ACCOUNT#{sample_account_id}", "profileId": sample_profile_id},
+            UpdateExpression="ADD shareVersion :one",
+            ExpressionAttributeValues={":one": 1},
+        )
+        assert check_profile_access(another_account_id, sample_profile_id, "READ") is False
+
+    def test_repeat_check_skips_shares_table(
+        self,
+        dynamodb_table: Any,
+        shares_table: Any,
+        sample_profile: Any,
+        sample_profile_id: str,
+        another_account_id: str,
+    ) -> None:
+        """A cached decision only needs the profile read."""
+        self._share(shares_table, sample_profile_id, another_account_id, ["READ", "WRITE"])
+        assert check_profile_access(another_account_id, sample_profile_id, "WRITE") is True
+
+        with patch("src.utils.auth._check_share_permissions") as share_check:
+            assert check_profile_access(another_account_id, sample_profile_id, "WRITE") is True
+        share_check.assert_not_called()
+
+    def test_missing_profile_falls_back_to_consistent_checks(self, dynamodb_table: Any, sample_account_id: str) -> None:
+        """A profile not visible in the index goes through the original checks."""
+        with pytest.raises(AppError) as exc_info:
+            check_profile_access(sample_account_id, "PROFILE#missing", "READ")
+
+        assert exc_info.value.error_code == ErrorCode.NOT_FOUND
+
+    def test_invalid_ttl_disables_cache(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        dynamodb_table: Any,
+        sample_profile: Any,
+        sample_account_id: str,
+        sample_profile_id: str,
+    ) -> None:
+        """A malformed TTL leaves the cache off."""
+        monkeypatch.setenv("PERMISSION_CACHE_TTL_SECONDS", "soon")
+
+        with patch("src.utils.auth._check_profile_access_cached") as cached_check:
+            assert check_profile_access(sample_account_id, sample_profile_id, "READ") is True
+        cached_check.assert_not_called()
+
+
 class TestRequireProfileAccess:
     """Tests for require_profile_access function."""
 
@@ -0,0 +1,68 @@
+"""Tests for the AWS call counter used by call-budget tests."""
+
+from typing import Any, Dict
+
+import pytest
+
+from tests.unit.aws_calls import AwsCall, AwsCallLog, classify_call, count_aws_calls
+
+
+class TestCountAwsCalls:
+    """Tests for the call counter itself."""
+
+    @pytest.mark.parametrize(
+        "service,operation,params,expected",
+        [
+            (
+                "dynamodb",
+                "GetItem",
+                {"TableName": "t", "Key": {}},
+                AwsCall("dynamodb", "GetItem", "point-read", ("t",)),
+            ),
+            (
+                "dynamodb",
+                "BatchGetItem",
+                {"RequestItems": {"b": {}, "a": {}}},
+                AwsCall("dynamodb", "BatchGetItem", "batch-read", ("a", "b")),
+            ),
+            (
+                "dynamodb",
+                "TransactWriteItems",
+                {"TransactItems": [{"Put": {"TableName": "t"}}, {"Update": {"TableName": "t"}}]},
+                AwsCall("dynamodb", "TransactWriteItems", "transaction", ("t",)),
+            ),
+            ("dynamodb", "DescribeTable", {}, AwsCall("dynamodb", "DescribeTable", "other", ())),
+            ("s3", "PutObject", {"Bucket": "b", "Key": "k"}, AwsCall("s3", "PutObject", "write", ("b",))),
+            ("s3", "ListBuckets", {}, AwsCall("s3", "ListBuckets", "other", ())),
+        ],
+    )
+    def test_classify_call(self, service: str, operation: str, params: Dict[str, Any], expected: AwsCall) -> None:
+        """Calls are classified by kind and the tables/bucket they touch."""
+        assert classify_call(service, operation, params) == expected
+
+    def test_counts_handler_clients_only_inside_block(self, dynamodb_table: Any) -> None:
+        """Clients from utils.aws_clients are counted inside the block and released afterwards."""
+        from src.utils.dynamodb import tables
+
+        with count_aws_calls() as calls:
+            tables.profiles.get_item(Key={"ownerAccountId": "ACCOUNT#a", "profileId": "PROFILE#p"})
+            tables.profiles.query(KeyConditionExpression="ownerAccountId = :o", ExpressionAttributeValues={":o": "x"})
+        tables.profiles.get_item(Key={"ownerAccountId": "ACCOUNT#a", "profileId": "PROFILE#p"})
+
+        assert calls.count("dynamodb") == 2
+        assert calls.count("dynamodb", kind="point-read") == 1
+        assert calls.count("s3") == 0
+
+    def test_assert_within_reports_breakdown(self) -> None:
+        """Exceeding a budget fails with the most frequent calls listed."""
+        with count_aws_calls() as calls:
+            pass
+        for _ in range(3):
+            calls.record(AwsCall("dynamodb", "Query", "query", ("orders",)))
+
+        calls.assert_within(dynamodb=3)
+        with pytest.raises(
+            AssertionError, match=r"dynamodb: 3 calls > budget 2[\s\S]*3 x dynamodb:Query \[query\] orders"
+        ):
+            calls.assert_within(dynamodb=2, s3=0)
+        assert AwsCallLog().describe() == "(no AWS calls)"
@@ -0,0 +1,64 @@
+"""Tests for cached boto3 clients."""
+
+import threading
+from typing import Any, List
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.utils import aws_clients
+from src.utils.aws_clients import get_dynamodb_client, get_dynamodb_service_resource, get_s3_client, reset_clients
+
+
+class TestCachedClients:
+    """Tests for per-container client reuse."""
+
+    def test_reused_across_calls(self, aws_credentials: None) -> None:
+        """Test each client/resource is built once and then reused."""
+        with mock_aws():
+            assert get_dynamodb_client() is get_dynamodb_client()
+            assert get_dynamodb_service_resource() is get_dynamodb_service_resource()
+            assert get_s3_client() is get_s3_client()
+            assert get_dynamodb_client() is not get_s3_client()
+
+    def test_endpoint_override_keys_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the endpoint env vars are passed through and keep separate cache entries."""
+        with patch.object(boto3, "client") as mock_client:
+            mock_client.side_effect = lambda *args, **kwargs: object()
+            default = get_s3_client()
+            monkeypatch.setenv("S3_ENDPOINT", "http://localhost:4566")
+            local = get_s3_client()
+
+        assert default is not local
+        assert mock_client.call_args_list[0].kwargs == {"endpoint_url": None}
+        assert mock_client.call_args_list[1].kwargs == {"endpoint_url": "http://localhost:4566"}
+
+    def test_reset_clients(self) -> None:
+        """Test reset drops cached clients."""
+        with patch.object(boto3, "resource") as mock_resource:
+            mock_resource.side_effect = lambda *args, **kwargs: object()
+            first = get_dynamodb_service_resource()
+            reset_clients()
+            assert get_dynamodb_service_resource() is not first
+
+    def test_cache_is_per_thread(self) -> None:
+        """Test worker threads build their own client (boto3 resources are not thread-safe)."""
+        seen: List[Any] = []
+        with patch.object(boto3, "resource") as mock_resource:
+            mock_resource.side_effect = lambda *args, **kwargs: object()
+            seen.append(get_dynamodb_service_resource())
+            worker = threading.Thread(target=lambda: seen.append(get_dynamodb_service_resource()))
+            worker.start()
+            worker.join()
+
+        assert seen[0] is not seen[1]
+
+    def test_hooks_installed_before_first_client(self) -> None:
+        """Test metrics hooks are registered before a client copies the session's handlers."""
+        with patch.object(aws_clients, "install_hooks") as mock_install, patch.object(boto3, "client"):
+            get_dynamodb_client()
+            get_dynamodb_client()
+
+        mock_install.assert_called_once()
@@ -0,0 +1,50 @@
+"""Tests for the benchmark baseline comparison."""
+
+from typing import Any, Dict
+
+from benchmarks.run import compare
+
+
+def _result(**overrides: Any) -> Dict[str, Any]:
+    result = {
+        "scenario": "get_unit_report",
+        "scale": "small",
+        "wallMs": 100.0,
+        "dynamodbCalls": 10,
+        "s3Calls": 0,
+        "peakKiB": 1000.0,
+    }
+    result.update(overrides)
+    return result
+
+
+class TestCompare:
+    """Tests for benchmarks.run.compare."""
+
+    def test_unchanged_run_passes(self) -> None:
+        """Identical results produce no changes."""
+        assert compare([_result()], [_result()]) == {"regressions": [], "improvements": []}
+
+    def test_extra_call_is_regression(self) -> None:
+        """Call counts are deterministic, so a single extra call fails the run."""
+        comparison = compare([_result(dynamodbCalls=11)], [_result()])
+
+        assert [c["metric"] for c in comparison["regressions"]] == ["dynamodbCalls"]
+
+    def test_wall_time_within_tolerance(self) -> None:
+        """Wall time only regresses beyond the relative tolerance and the absolute floor."""
+        assert compare([_result(wallMs=190.0)], [_result()])["regressions"] == []
+        assert compare([_result(wallMs=30.0)], [_result(wallMs=10.0)])["regressions"] == []
+
+        comparison = compare([_result(wallMs=250.0)], [_result()])
+        assert [c["metric"] for c in comparison["regressions"]] == ["wallMs"]
+
+    def test_improvements_and_new_scenarios(self) -> None:
+        """Fewer calls are reported as improvements; scenarios without a baseline are skipped."""
+        comparison = compare(
+            [_result(dynamodbCalls=5, peakKiB=500.0), _result(scenario="new")],
+            [_result()],
+        )
+
+        assert comparison["regressions"] == []
+        assert {c["metric"] for c in comparison["improvements"]} == {"dynamodbCalls", "peakKiB"}
@@ -0,0 +1,89 @@
+"""
+AWS round-trip budgets for Lambda handlers.
+
+Each benchmark scenario (benchmarks.run.scenarios) runs against a seeded unit
+at two scales and must stay within its DynamoDB and S3 call budget. Budgets
+are written as a fixed cost plus a per-seller cost, so a refactor that adds a
+lookup per profile, campaign or catalog fails here instead of in production.
+Lower a budget when a handler gets cheaper.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generator, Tuple
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from benchmarks.datasets import SCALES, Scale, UnitDataset, seed_unit
+from benchmarks.run import BENCHMARK_ENV, scenarios
+from tests.unit.aws_calls import count_aws_calls
+from tests.unit.table_schemas import create_all_tables
+
+
+@dataclass(frozen=True)
+class CallBudget:
+    """Maximum AWS calls for one invocation at a given scale."""
+
+    dynamodb: Callable[[Scale], int]
+    s3: int = 0
+
+
+CALL_BUDGETS: Dict[str, CallBudget] = {
+    # unitCampaignKey query, then per seller: access check (3) and orders query;
+    # the profile itself comes from the request read cache
+    "get_unit_report": CallBudget(lambda s: 1 + 4 * s.sellers),
+    # two unit queries, then per seller: access check (3) and catalog lookup
+    "list_unit_catalogs": CallBudget(lambda s: 2 + 4 * s.sellers),
+    "list_unit_campaign_catalogs": CallBudget(lambda s: 2 + 3 * s.sellers),
+    # shares index query + one batch_get_item for all shared profiles
+    "list_my_shares": CallBudget(lambda s: 2),
+    # account, owned profiles, shares, batch gets for shared profiles and catalogs,
+    # then one campaigns query per profile and one orders query per campaign
+    "get_my_dashboard": CallBudget(lambda s: 5 + s.sellers + s.sellers * s.seasons),
+    "request_campaign_report_xlsx": CallBudget(lambda s: 5, s3=1),
+    "request_campaign_report_csv": CallBudget(lambda s: 5, s3=1),
+    # one orders query per campaign, deletes in 25-item batches
+    "delete_profile_orders_cascade": CallBudget(
+        lambda s: s.seasons + math.ceil(s.seasons * s.orders_per_campaign / 25)
+    ),
+}
+
+BUDGET_SCALES = ("small", "medium")
+
+SCENARIOS = {scenario.name: scenario for scenario in scenarios()}
+
+
+@pytest.fixture(scope="module", params=BUDGET_SCALES)
+def seeded_unit(request: pytest.FixtureRequest) -> Generator[Tuple[Dict[str, Any], UnitDataset], None, None]:
+    """Seed one unit per scale in a moto account shared by the module's tests."""
+    with pytest.MonkeyPatch.context() as mp, mock_aws():
+        for name, value in BENCHMARK_ENV.items():
+            mp.setenv(name, value)
+        tables = create_all_tables(boto3.resource("dynamodb", region_name="us-east-1"))
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BENCHMARK_ENV["EXPORTS_BUCKET"])
+        yield tables, seed_unit(tables, SCALES[request.param])
+
+
+class TestHandlerCallBudgets:
+    """Per-handler DynamoDB/S3 call budgets."""
+
+    def test_every_scenario_has_a_budget(self) -> None:
+        """New benchmark scenarios must declare a budget."""
+        assert set(SCENARIOS) == set(CALL_BUDGETS)
+
+    @pytest.mark.parametrize("name", sorted(CALL_BUDGETS))
+    def test_within_budget(self, name: str, seeded_unit: Tuple[Dict[str, Any], UnitDataset]) -> None:
+        """The handler stays within its call budget at this scale."""
+        tables, dataset = seeded_unit
+        scenario = SCENARIOS[name]
+        budget = CALL_BUDGETS[name]
+
+        with count_aws_calls() as calls:
+            scenario.handler(scenario.event(dataset), None)
+        if scenario.restore is not None:
+            scenario.restore(tables, dataset)
+
+        assert calls.count() > 0
+        calls.assert_within(dynamodb=budget.dynamodb(dataset.scale), s3=budget.s3)
@@ -7,6 +7,7 @@ import pytest
 
 from src.handlers.campaign_operations import (
     _build_unit_campaign_key,
+    _DynamoClientProxy,
     _to_dynamo_value,
     create_campaign,
 )
@@ -101,6 +102,21 @@ class TestToDynamoValue:
         assert result == {"S": "custom_string"}
 
 
+class TestDynamoClientProxy:
+    """Tests for the lazily resolved DynamoDB client proxy."""
+
+    def test_resolves_shared_client_on_use(self) -> None:
+        """Test no client is built until the proxy is used, then calls go to the shared client."""
+        with patch("src.handlers.campaign_operations.get_dynamodb_client") as mock_get:
+            proxy = _DynamoClientProxy()
+            mock_get.assert_not_called()
+
+            proxy.transact_write_items(TransactItems=[])
+
+            mock_get.return_value.transact_write_items.assert_called_once_with(TransactItems=[])
+            assert proxy.exceptions is mock_get.return_value.exceptions
+
+
 class TestCreateCampaign:
     """Tests for create_campaign Lambda handler."""
 
@@ -0,0 +1,129 @@
+"""Tests for utils.catalogs and versioned order pricing."""
+
+from decimal import Decimal
+from typing import Any, Dict
+
+from src.handlers.order_operations import create_orders
+from src.utils.catalogs import CatalogVersionCache, catalog_products, get_catalog_version
+from src.utils.dynamodb import tables
+from src.utils.orders import load_campaign_context
+from tests.unit.aws_calls import count_aws_calls
+
+CATALOG_ID = "CATALOG#default"
+
+
+def _version(version: str, price: str) -> None:
+    products = [{"productId": "P1", "productName": "Caramel Corn", "price": Decimal(price)}]
+    tables.catalog_versions.put_item(
+        Item={
+            "catalogId": CATALOG_ID,
+            "version": version,
+            "catalogName": "Default",
+            "products": products,
+            "productsById": {product["productId"]: product for product in products},
+            "createdAt": "2025-09-01T00:00:00Z",
+        }
+    )
+
+
+def _point_catalog_at(version: str) -> None:
+    tables.catalogs.update_item(
+        Key={"catalogId": CATALOG_ID},
+        UpdateExpression="SET currentVersion = :version",
+        ExpressionAttributeValues={":version": version},
+    )
+
+
+class TestCatalogProducts:
+    """Tests for catalog_products and get_catalog_version."""
+
+    def test_versioned_catalog_prices_from_its_current_version(self, order_setup: Dict[str, Any]) -> None:
+        """Products come from the version the catalog points at, not the catalog item."""
+        _version("01J00000000000000000000001", "25.00")
+        _point_catalog_at("01J00000000000000000000001")
+
+        context = load_campaign_context(order_setup["campaignId"])
+
+        assert context.catalog_version == "01J00000000000000000000001"
+        assert context.products["P1"]["price"] == Decimal("25.00")
+
+    def test_versions_are_read_once_per_container(self, order_setup: Dict[str, Any]) -> None:
+        """A version never changes, so later loads only read the catalog to learn its current version."""
+        _version("01J00000000000000000000001", "25.00")
+        _point_catalog_at("01J00000000000000000000001")
+        load_campaign_context(order_setup["campaignId"])
+
+        with count_aws_calls() as calls:
+            load_campaign_context(order_setup["campaignId"])
+
+        assert calls.count("dynamodb") > 0
+        assert "catalog-versions" not in calls.describe()
+
+    def test_new_version_reprices_and_old_one_stays(self, order_setup: Dict[str, Any], sample_account_id: str) -> None:
+        """Orders record the version they were priced against, which stays readable after an update."""
+        _version("01J00000000000000000000001", "25.00")
+        _point_catalog_at("01J00000000000000000000001")
+        order = {
+            "profileId": order_setup["profileId"],
+            "campaignId": order_setup["campaignId"],
+            "customerName": "Pat Neighbor",
+            "paymentMethod": "Cash",
+            "lineItems": [{"productId": "P1", "quantity": 2}],
+        }
+        event = {"identity": {"sub": sample_account_id}, "arguments": {"input": [order]}}
+        [first] = create_orders(event, None)
+
+        _version("01J00000000000000000000002", "30.00")
+        _point_catalog_at("01J00000000000000000000002")
+        [second] = create_orders(event, None)
+
+        assert (first["order"]["catalogVersion"], first["order"]["totalAmount"]) == ("01J00000000000000000000001", 50.0)
+        assert (second["order"]["catalogVersion"], second["order"]["totalAmount"]) == (
+            "01J00000000000000000000002",
+            60.0,
+        )
+        old = get_catalog_version(CATALOG_ID, first["order"]["catalogVersion"])
+        assert old is not None
+        assert old["productsById"]["P1"]["price"] == Decimal("25.00")
+
+    def test_unversioned_catalog_uses_its_own_products(self, order_setup: Dict[str, Any]) -> None:
+        """Catalogs written before versioning (or pointing at a missing version) price from the catalog item."""
+        context = load_campaign_context(order_setup["campaignId"])
+        assert context.catalog_version is None
+        assert context.products["P2"]["price"] == Decimal("15.50")
+
+        catalog: Dict[str, Any] = {
+            "catalogId": CATALOG_ID,
+            "currentVersion": "01J0000000000000000000000X",
+            "products": [{"productId": "P1", "price": Decimal(1)}],
+        }
+        assert catalog_products(catalog) == (None, {"P1": {"productId": "P1", "price": Decimal(1)}})
+        # Missing versions are not cached, so a version written later is found
+        _version("01J0000000000000000000000X", "2.00")
+        assert catalog_products(catalog)[0] == "01J0000000000000000000000X"
+
+
+def test_version_cache_evicts_least_recently_used() -> None:
+    cache = CatalogVersionCache(max_entries=2)
+    cache.put(("C", "1"), {"version": "1"})
+    cache.put(("C", "2"), {"version": "2"})
+    assert cache.get(("C", "1")) == {"version": "1"}
+
+    cache.put(("C", "3"), {"version": "3"})
+
+    assert cache.get(("C", "2")) is None
+    assert len(cache) == 2
+
+
+def test_version_cache_hands_out_copies() -> None:
+    """Callers that modify a cached version do not change it for later callers."""
+    cache = CatalogVersionCache()
+    version = {"productsById": {"P1": {"price": Decimal(1)}}}
+    cache.put(("C", "1"), version)
+    version["productsById"]["P1"]["price"] = Decimal(2)
+
+    cached = cache.get(("C", "1"))
+    assert cached is not None
+    cached["productsById"]["P1"]["price"] = Decimal(3)
+
+    assert cache.get(("C", "1")) == {"productsById": {"P1": {"price": Decimal(1)}}}
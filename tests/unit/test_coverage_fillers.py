@@ -125,16 +125,9 @@ def test_report_generation_get_s3_client_default(monkeypatch):
 
     report_generation.s3_client = None
 
-    created: list[tuple[str, str | None]] = []
-
-    def fake_client(service_name: str, endpoint_url: str | None = None):
-        created.append((service_name, endpoint_url))
-        return SimpleNamespace()
-
-    monkeypatch.setattr(report_generation.boto3, "client", fake_client)
-    client = report_generation._get_s3_client()
-    assert created == [("s3", None)]
-    assert isinstance(client, SimpleNamespace)
+    shared_client = SimpleNamespace()
+    monkeypatch.setattr(report_generation, "get_s3_client", lambda: shared_client)
+    assert report_generation._get_s3_client() is shared_client
 
     # When module-level client set, return it directly
     sentinel_client = object()
@@ -233,6 +226,9 @@ def test_transfer_profile_ownership_success(monkeypatch):
     updated_profile = transfer_module.lambda_handler(event, None)
 
     assert updated_profile["ownerAccountId"] == "ACCOUNT#new456"
+    # shareVersion bumped so cached permission decisions are dropped
+    stored = profiles_table.get_item(Key={"ownerAccountId": "ACCOUNT#new456", "profileId": "PROFILE#abc"})["Item"]
+    assert stored["shareVersion"] == 1
     # Share removed
     assert "Item" not in shares_table.get_item(Key={"profileId": "PROFILE#abc", "targetAccountId": "ACCOUNT#new456"})
 
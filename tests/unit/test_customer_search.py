@@ -0,0 +1,285 @@
+"""Tests for the customer search index and the searchCustomers handlers."""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+
+from src.handlers.customer_search import index_customer_orders, search_customers
+from src.utils.customer_index import customer_key, index_order_change, order_tokens
+from src.utils.dynamodb import tables
+from src.utils.errors import AppError, ErrorCode
+from tests.unit.aws_calls import count_aws_calls
+
+PROFILE_ID = "PROFILE#abc-def-123"
+
+_serializer = TypeSerializer()
+
+
+def _order(
+    order_id: str, name: str = "Jane Smith", date: str = "2025-10-01T12:00:00Z", **fields: Any
+) -> Dict[str, Any]:
+    return {
+        "campaignId": "CAMPAIGN#campaign-123-abc",
+        "orderId": f"ORDER#{order_id}",
+        "profileId": PROFILE_ID,
+        "customerName": name,
+        "orderDate": date,
+        **fields,
+    }
+
+
+def _record(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    images = {}
+    if old:
+        images["OldImage"] = {k: _serializer.serialize(v) for k, v in old.items()}
+    if new:
+        images["NewImage"] = {k: _serializer.serialize(v) for k, v in new.items()}
+    return {"eventName": "MODIFY" if old and new else "INSERT" if new else "REMOVE", "dynamodb": images}
+
+
+def _write(*changes: tuple) -> None:
+    index_customer_orders({"Records": [_record(old, new) for old, new in changes]}, None)
+
+
+def _search(account_id: str, **arguments: Any) -> List[Dict[str, Any]]:
+    result: List[Dict[str, Any]] = search_customers(
+        {"identity": {"sub": account_id}, "arguments": {"profileId": PROFILE_ID, **arguments}}, None
+    )
+    return result
+
+
+def _index_items() -> List[Dict[str, Any]]:
+    response = tables.customer_index.query(
+        KeyConditionExpression="profileId = :p", ExpressionAttributeValues={":p": PROFILE_ID}
+    )
+    return response["Items"]
+
+
+class TestCustomerIndex:
+    """Tests for utils.customer_index."""
+
+    def test_tokens_and_key(self) -> None:
+        """Name, phone and address words are indexed; phone formatting does not split a customer."""
+        order = _order(
+            "1",
+            customerPhone="+1 (555) 123-4567",
+            customerAddress={"street": "12 Elm St", "city": "Springfield", "zipCode": "12345"},
+        )
+
+        assert order_tokens(order) == {
+            "jane",
+            "smith",
+            "5551234567",
+            "1234567",
+            "12",
+            "elm",
+            "st",
+            "springfield",
+            "12345",
+        }
+        assert customer_key(order) == customer_key(_order("2", name=" jane  SMITH ", customerPhone="555-123-4567"))
+        assert customer_key(_order("3", name="!!")) is None
+
+    def test_last_order_removes_customer_and_tokens(self, dynamodb_table: Any) -> None:
+        """Deleting a customer's only order leaves nothing searchable behind."""
+        order = _order("1")
+        _write((None, order))
+        assert {item["indexKey"] for item in _index_items()} == {
+            f"CUSTOMER#{customer_key(order)}",
+            "SHARD#ja",
+            "SHARD#sm",
+        }
+
+        _write((order, None))
+
+        assert all(item["indexKey"].startswith("SHARD#") and len(item) == 2 for item in _index_items())
+
+    def test_shards_hold_markers_not_orders(self, dynamodb_table: Any) -> None:
+        """Shard items do not grow with a customer's orders; order ids stay on the customer item."""
+        _write(*[(None, _order(str(n), date=f"2025-10-{n:02d}T00:00:00Z")) for n in range(1, 21)])
+
+        items = {item["indexKey"]: item for item in _index_items()}
+        key = customer_key(_order("1"))
+        assert items["SHARD#ja"] == {"profileId": PROFILE_ID, "indexKey": "SHARD#ja", f"jane|{key}": True}
+        assert len(items[f"CUSTOMER#{key}"]["t:jane"]) == 20
+
+    def test_removal_restores_a_marker_re_added_concurrently(self, dynamodb_table: Any) -> None:
+        """A token another order adds while its marker is being removed stays searchable."""
+        first, second = _order("1"), _order("2", date="2024-10-01T00:00:00Z")
+        _write((None, first))
+        table = tables.customer_index
+        real_update_item = table.update_item
+        raced: List[bool] = []
+
+        def update_item(**kwargs: Any) -> Any:
+            if kwargs["UpdateExpression"].startswith("REMOVE") and not raced:
+                # The other writer's whole update lands between our DELETE and our marker REMOVE
+                raced.append(True)
+                index_order_change(table, None, second)
+            return real_update_item(**kwargs)
+
+        with patch.object(table, "update_item", side_effect=update_item):
+            index_order_change(table, first, None)
+
+        shard = next(item for item in _index_items() if item["indexKey"] == "SHARD#ja")
+        assert shard[f"jane|{customer_key(second)}"] is True
+
+    def test_shared_tokens_are_reference_counted(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """A token another order of the customer still uses stays searchable."""
+        first = _order("1", customerAddress={"street": "12 Elm St"})
+        second = _order("2", customerAddress={"street": "9 Oak Ave"}, date="2024-10-01T12:00:00Z")
+        _write((None, first), (None, second))
+
+        _write((second, None))
+
+        assert _search(sample_account_id, prefix="elm")[0]["orderCount"] == 1
+        assert _search(sample_account_id, prefix="oak") == []
+        assert _search(sample_account_id, prefix="jane")[0]["orderYears"] == [2025]
+
+    def test_replayed_records_do_not_double_count(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """Stream retries re-apply records without changing the result."""
+        order = _order("1")
+        _write((None, order), (None, order), (order, None), (order, None), (None, order))
+
+        [customer] = _search(sample_account_id, prefix="jane")
+        assert customer["orderCount"] == 1
+
+    def test_edits_move_orders_between_customers(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """Renaming an order's customer moves it; a concurrent re-add keeps the old customer."""
+        order = _order("1")
+        renamed = _order("1", name="Jane Doe")
+        _write((None, order), (order, renamed))
+
+        assert [c["customerName"] for c in _search(sample_account_id, prefix="jane")] == ["Jane Doe"]
+
+        # Another order re-added the customer between the DELETE and the cleanup
+        table = tables.customer_index
+        conflict = table.meta.client.exceptions.ConditionalCheckFailedException(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "DeleteItem"
+        )
+        with patch.object(table, "delete_item", side_effect=conflict) as delete_item:
+            index_order_change(table, renamed, None)
+        delete_item.assert_called_once()
+
+    def test_detail_and_token_changes_of_the_same_order(
+        self, sample_profile: Dict[str, Any], sample_account_id: str
+    ) -> None:
+        """Same customer and ref: new tokens are added, dropped ones removed, details refreshed."""
+        order = _order("1", customerPhone="5551234567", customerAddress={"city": "Springfield"})
+        moved = _order("1", customerPhone="555-123-4567", customerAddress={"city": "Shelbyville"})
+        _write((None, order), (order, {**order, "notes": "porch"}), (order, moved))
+
+        [customer] = _search(sample_account_id, prefix="shel")
+        assert customer["customerPhone"] == "555-123-4567"
+        assert _search(sample_account_id, prefix="spring") == []
+
+    def test_token_only_added_or_still_used(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """Adding an address only adds tokens; removing an order whose tokens another order has removes none."""
+        order = _order("1")
+        with_street = _order("1", customerAddress={"street": "9 Oak Ave"})
+        _write((None, order), (None, _order("2")), (order, with_street))
+
+        assert [c["orderCount"] for c in _search(sample_account_id, prefix="oak")] == [2]
+
+        _write((_order("2"), None))
+
+        assert [c["orderCount"] for c in _search(sample_account_id, prefix="jane smith")] == [1]
+
+    def test_orders_without_date(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """An order with no date is searchable but counts toward no year."""
+        _write((None, _order("1", date="")))
+
+        [customer] = _search(sample_account_id, prefix="jane")
+        assert customer["orderYears"] == []
+        assert customer["lastOrderDate"] is None
+
+    def test_orders_without_customer_are_ignored(self, dynamodb_table: Any) -> None:
+        _write((None, _order("1", name="")), (None, {"campaignId": "CAMPAIGN#c", "orderId": "ORDER#2"}))
+
+        assert _index_items() == []
+
+
+class TestSearchCustomers:
+    """Tests for search_customers."""
+
+    def test_prefix_search(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """Every query word must prefix one of the customer's tokens."""
+        _write(
+            (None, _order("1", customerPhone="555-123-4567")),
+            (None, _order("2", name="John Smith", date="2024-09-01T00:00:00Z")),
+            (None, _order("3", name="Jane Doe", customerAddress={"street": "5 Smithfield Rd"})),
+        )
+
+        # Most recent order first
+        assert [c["customerName"] for c in _search(sample_account_id, prefix="sm")] == [
+            "Jane Smith",
+            "Jane Doe",
+            "John Smith",
+        ]
+        assert [c["customerName"] for c in _search(sample_account_id, prefix="ja smi")] == ["Jane Smith", "Jane Doe"]
+        [jane] = _search(sample_account_id, prefix="555")
+        assert jane["orders"] == [
+            {"orderDate": "2025-10-01T12:00:00Z", "campaignId": "CAMPAIGN#campaign-123-abc", "orderId": "ORDER#1"}
+        ]
+        assert jane["lastOrderDate"] == "2025-10-01T12:00:00Z"
+        assert _search(sample_account_id, prefix="zed") == []
+        assert len(_search(sample_account_id, prefix="j", limit=1)) == 1
+        # One-character words read every shard starting with that character
+        assert [c["customerName"] for c in _search(sample_account_id, prefix="j d")] == ["Jane Doe"]
+
+    def test_prefix_search_reads(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """A prefix search is two batch reads after the access check, however many customers there are."""
+        _write(*[(None, _order(str(n), name=f"Customer {n}")) for n in range(30)])
+
+        with count_aws_calls() as calls:
+            assert len(_search(sample_account_id, prefix="cust", limit=100)) == 30
+
+        assert calls.count("dynamodb", "batch-read") == 2
+        assert calls.count("dynamodb", "query") == 0
+
+    def test_lapsed_customers(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        """Last year's customers who have not ordered this year."""
+        _write(
+            (None, _order("1", name="Lapsed Larry", date="2024-10-01T00:00:00Z")),
+            (None, _order("2", name="Loyal Lucy", date="2024-10-01T00:00:00Z")),
+            (None, _order("3", name="Loyal Lucy", date="2025-10-01T00:00:00Z")),
+            (None, _order("4", name="New Ned", date="2025-10-01T00:00:00Z")),
+        )
+
+        assert [c["customerName"] for c in _search(sample_account_id, lapsedInYear=2025)] == ["Lapsed Larry"]
+        assert [c["customerName"] for c in _search(sample_account_id, prefix="l", lapsedInYear=2025)] == [
+            "Lapsed Larry"
+        ]
+
+    def test_lapsed_query_follows_pages(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        _write(*[(None, _order(str(n), name=f"Customer {n}", date="2024-10-01T00:00:00Z")) for n in range(3)])
+        table = tables.customer_index
+        real_query = table.query
+
+        with (
+            patch.object(type(tables), "customer_index", new=property(lambda self: table)),
+            patch.object(table, "query", side_effect=lambda **kwargs: real_query(Limit=1, **kwargs)),
+        ):
+            assert len(_search(sample_account_id, lapsedInYear=2025)) == 3
+
+    def test_requires_a_filter(self, sample_profile: Dict[str, Any], sample_account_id: str) -> None:
+        with pytest.raises(AppError) as exc_info:
+            _search(sample_account_id, prefix=" - ")
+        assert exc_info.value.error_code == ErrorCode.INVALID_INPUT
+
+        with pytest.raises(AppError) as exc_info:
+            search_customers({"identity": {"sub": sample_account_id}, "arguments": {"prefix": "a"}}, None)
+        assert exc_info.value.error_code == ErrorCode.INVALID_INPUT
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_rejects_limit_below_one(self, sample_profile: Dict[str, Any], sample_account_id: str, limit: int) -> None:
+        with pytest.raises(AppError) as exc_info:
+            _search(sample_account_id, prefix="jane", limit=limit)
+        assert exc_info.value.error_code == ErrorCode.INVALID_INPUT
+
+    def test_requires_read_access(self, sample_profile: Dict[str, Any], another_account_id: str) -> None:
+        with pytest.raises(AppError) as exc_info:
+            _search(another_account_id, prefix="jane")
+        assert exc_info.value.error_code == ErrorCode.FORBIDDEN
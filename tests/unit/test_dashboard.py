@@ -0,0 +1,171 @@
+"""Tests for the getMyDashboard handler."""
+
+from decimal import Decimal
+from typing import Any, Dict
+from unittest.mock import patch
+
+import boto3
+
+from src.handlers.dashboard import get_my_dashboard
+from src.utils.dynamodb import tables
+from tests.unit.aws_calls import count_aws_calls
+
+
+def _event(account_id: str) -> Dict[str, Any]:
+    return {"identity": {"sub": account_id}, "arguments": {}}
+
+
+def _table(name: str) -> Any:
+    return boto3.resource("dynamodb", region_name="us-east-1").Table(name)
+
+
+def _add_orders(campaign_id: str, *amounts: str) -> None:
+    for n, amount in enumerate(amounts):
+        tables.orders.put_item(
+            Item={"campaignId": campaign_id, "orderId": f"ORDER#{n}", "totalAmount": Decimal(amount)}
+        )
+
+
+def _share_profile(owner_account_id: str, target_account_id: str, profile_id: str, **profile: Any) -> None:
+    tables.profiles.put_item(
+        Item={
+            "ownerAccountId": f"ACCOUNT#{owner_account_id}",
+            "profileId": profile_id,
+            "sellerName": "Shared Scout",
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+            **profile,
+        }
+    )
+    tables.shares.put_item(
+        Item={
+            "profileId": profile_id,
+            "targetAccountId": f"ACCOUNT#{target_account_id}",
+            "ownerAccountId": f"ACCOUNT#{owner_account_id}",
+            "permissions": ["READ"],
+        }
+    )
+
+
+class TestGetMyDashboard:
+    """Tests for get_my_dashboard."""
+
+    def test_owned_profile_with_campaign_totals(
+        self, order_setup: Dict[str, Any], sample_account_id: str, sample_campaign: Dict[str, Any]
+    ) -> None:
+        """The owner sees their account, profile, campaign, catalog name and order totals."""
+        _add_orders(order_setup["campaignId"], "55.50", "20.00")
+
+        result = get_my_dashboard(_event(sample_account_id), None)
+
+        assert result["account"]["accountId"] == f"ACCOUNT#{sample_account_id}"
+        assert result["account"]["preferences"] == {"paymentMethods": [{"name": "Venmo"}]}
+        [profile] = result["profiles"]
+        assert profile["profileId"] == order_setup["profileId"]
+        assert profile["isOwner"] is True
+        assert profile["permissions"] == ["READ", "WRITE"]
+        [campaign] = profile["campaigns"]
+        assert campaign["campaignId"] == order_setup["campaignId"]
+        assert campaign["catalogName"] == "Default"
+        assert campaign["totalOrders"] == 2
+        assert campaign["totalRevenue"] == 75.5
+
+    def test_shared_profiles_follow_owned_ones(
+        self, order_setup: Dict[str, Any], sample_account_id: str, another_account_id: str
+    ) -> None:
+        """Shared profiles come after owned ones, with the share's permissions, once each."""
+        _share_profile(another_account_id, sample_account_id, "PROFILE#shared-b", sellerName="Beta")
+        _share_profile(another_account_id, sample_account_id, "PROFILE#shared-a", sellerName="Alpha")
+        # Incomplete profiles are skipped like listMyShares skips them
+        _share_profile(another_account_id, sample_account_id, "PROFILE#incomplete", updatedAt=None)
+        # A share of a profile the caller owns does not list it twice
+        tables.shares.put_item(
+            Item={
+                "profileId": order_setup["profileId"],
+                "targetAccountId": f"ACCOUNT#{sample_account_id}",
+                "ownerAccountId": f"ACCOUNT#{sample_account_id}",
+                "permissions": ["READ"],
+            }
+        )
+
+        result = get_my_dashboard(_event(sample_account_id), None)
+
+        assert [p["sellerName"] for p in result["profiles"]] == ["Test Scout", "Alpha", "Beta"]
+        assert [p["isOwner"] for p in result["profiles"]] == [True, False, False]
+        assert result["profiles"][1]["permissions"] == ["READ"]
+        assert result["profiles"][1]["campaigns"] == []
+
+    def test_campaigns_are_newest_first(self, dynamodb_table: Any, sample_profile: Dict[str, Any]) -> None:
+        """Campaigns are ordered by year, newest first; campaigns without a catalog have no name."""
+        campaigns = _table("kernelworx-campaigns-v2-ue1-dev")
+        for year in (2023, 2025, 2024):
+            campaigns.put_item(
+                Item={
+                    "profileId": sample_profile["profileId"],
+                    "campaignId": f"CAMPAIGN#{year}",
+                    "campaignName": f"Fall {year}",
+                    "campaignYear": year,
+                    "createdAt": f"{year}-09-01T00:00:00Z",
+                }
+            )
+
+        result = get_my_dashboard(_event(sample_profile["ownerAccountId"].removeprefix("ACCOUNT#")), None)
+
+        assert result["account"] is None
+        campaigns_out = result["profiles"][0]["campaigns"]
+        assert [c["campaignYear"] for c in campaigns_out] == [2025, 2024, 2023]
+        assert {c["catalogName"] for c in campaigns_out} == {None}
+        assert {c["totalOrders"] for c in campaigns_out} == {0}
+
+    def test_skips_profiles_without_created_at(self, dynamodb_table: Any, sample_account_id: str) -> None:
+        """Owned records without createdAt are filtered like listMyProfiles filters them."""
+        tables.profiles.put_item(Item={"ownerAccountId": f"ACCOUNT#{sample_account_id}", "profileId": "PROFILE#x"})
+
+        assert get_my_dashboard(_event(sample_account_id), None)["profiles"] == []
+
+    def test_profiles_with_null_seller_name_sort_first(self, dynamodb_table: Any, sample_account_id: str) -> None:
+        """A profile with a null sellerName does not break sorting the others."""
+        owner = f"ACCOUNT#{sample_account_id}"
+        tables.profiles.put_item(
+            Item={"ownerAccountId": owner, "profileId": "PROFILE#b", "sellerName": "Scout", "createdAt": "2025-01-01"}
+        )
+        tables.profiles.put_item(
+            Item={"ownerAccountId": owner, "profileId": "PROFILE#a", "sellerName": None, "createdAt": "2025-01-01"}
+        )
+
+        profiles = get_my_dashboard(_event(sample_account_id), None)["profiles"]
+
+        assert [p["profileId"] for p in profiles] == ["PROFILE#a", "PROFILE#b"]
+
+    def test_follows_query_pagination(self, order_setup: Dict[str, Any], sample_account_id: str) -> None:
+        """Every page of a partition is read."""
+        _add_orders(order_setup["campaignId"], "1", "2", "3")
+        orders = tables.orders
+        real_query = orders.query
+
+        def paged_query(**kwargs: Any) -> Dict[str, Any]:
+            return real_query(Limit=1, **kwargs)
+
+        with (
+            patch.object(type(tables), "orders", new=property(lambda self: orders)),
+            patch.object(orders, "query", side_effect=paged_query),
+        ):
+            result = get_my_dashboard(_event(sample_account_id), None)
+
+        assert result["profiles"][0]["campaigns"][0]["totalOrders"] == 3
+        assert result["profiles"][0]["campaigns"][0]["totalRevenue"] == 6.0
+
+    def test_read_count_does_not_grow_with_shares(
+        self, order_setup: Dict[str, Any], sample_account_id: str, another_account_id: str
+    ) -> None:
+        """Shared profiles and catalogs are fetched in one batch each, not one read per item."""
+        for n in range(5):
+            _share_profile(another_account_id, sample_account_id, f"PROFILE#shared-{n}")
+
+        with count_aws_calls() as calls:
+            result = get_my_dashboard(_event(sample_account_id), None)
+
+        assert len(result["profiles"]) == 6
+        assert calls.count("dynamodb", "batch-read") == 2
+        # account, owned profiles, shares, 2 batch gets, 6 campaign queries, 1 orders query
+        calls.assert_within(dynamodb=3 + 2 + 6 + 1)
@@ -1,21 +1,28 @@
 """Tests for src/utils/dynamodb.py - centralized table access utilities."""
 
 import os
-from typing import Generator
+from typing import Any, Dict, Generator, Optional
 from unittest.mock import MagicMock, patch
 
 import boto3
 import pytest
 from moto import mock_aws
 
+from src.utils import dynamodb as dynamodb_utils
 from src.utils.dynamodb import (
     TableAccessor,
     _get_dynamodb,
+    batch_get_items,
+    cached_get_item,
+    cached_query_first,
     clear_all_overrides,
     override_table,
+    request_read_cache,
     reset_singleton,
     tables,
 )
+from src.utils.errors import AppError, ErrorCode
+from src.utils.metrics import capture_metrics, track_metrics
 
 
 @pytest.fixture(autouse=True)
@@ -29,8 +36,10 @@ def reset_between_tests() -> Generator[None, None, None]:
         "ORDERS_TABLE_NAME",
         "SHARES_TABLE_NAME",
         "CATALOGS_TABLE_NAME",
+        "CATALOG_VERSIONS_TABLE_NAME",
         "INVITES_TABLE_NAME",
         "SHARED_CAMPAIGNS_TABLE_NAME",
+        "CUSTOMER_INDEX_TABLE_NAME",
     ]
     original_values = {k: os.environ.get(k) for k in table_env_vars}
 
@@ -303,6 +312,28 @@ class TestTableProperties:
                 table = tables.shared_campaigns
                 assert table.name == "custom-shared-campaigns"
 
+    def test_customer_index_table_missing_env_raises(self, aws_credentials: None) -> None:
+        """Test customer_index table raises ValueError when env var is missing."""
+        with pytest.raises(ValueError, match="Required environment variable 'CUSTOMER_INDEX_TABLE_NAME' is not set"):
+            _ = tables.customer_index
+
+    def test_customer_index_table_custom_name(self, aws_credentials: None) -> None:
+        """Test customer_index table uses custom name from env."""
+        with patch.dict(os.environ, {"CUSTOMER_INDEX_TABLE_NAME": "custom-customer-index"}):
+            reset_singleton()
+            assert tables.customer_index.name == "custom-customer-index"
+
+    def test_catalog_versions_table_missing_env_raises(self, aws_credentials: None) -> None:
+        """Test catalog_versions table raises ValueError when env var is missing."""
+        with pytest.raises(ValueError, match="Required environment variable 'CATALOG_VERSIONS_TABLE_NAME' is not set"):
+            _ = tables.catalog_versions
+
+    def test_catalog_versions_table_custom_name(self, aws_credentials: None) -> None:
+        """Test catalog_versions table uses custom name from env."""
+        with patch.dict(os.environ, {"CATALOG_VERSIONS_TABLE_NAME": "custom-catalog-versions"}):
+            reset_singleton()
+            assert tables.catalog_versions.name == "custom-catalog-versions"
+
 
 class TestTableOverrides:
     """Tests for table override functionality."""
@@ -403,3 +434,183 @@ class TestTableOverrides:
         assert tables.catalogs.name == "mock-catalogs"
         assert tables.invites.name == "mock-invites"
         assert tables.shared_campaigns.name == "mock-shared-campaigns"
+
+    def test_override_customer_index(self) -> None:
+        mock_customer_index = MagicMock()
+        override_table("customer_index", mock_customer_index)
+        assert tables.customer_index is mock_customer_index
+
+    def test_override_catalog_versions(self) -> None:
+        mock_catalog_versions = MagicMock()
+        override_table("catalog_versions", mock_catalog_versions)
+        assert tables.catalog_versions is mock_catalog_versions
+
+
+def _profiles_table(item: Optional[Dict[str, Any]] = None) -> MagicMock:
+    table = MagicMock()
+    table.name = "profiles"
+    table.get_item.return_value = {"Item": dict(item)} if item is not None else {}
+    table.query.return_value = {"Items": [dict(item)] if item is not None else []}
+    return table
+
+
+PROFILE = {"ownerAccountId": "ACCOUNT#owner", "profileId": "PROFILE#p1", "sellerName": "Scout"}
+PROFILE_KEY = {"ownerAccountId": "ACCOUNT#owner", "profileId": "PROFILE#p1"}
+
+
+class TestRequestReadCache:
+    """Tests for the request-scoped read cache."""
+
+    def test_reads_pass_through_outside_request(self) -> None:
+        """Without an open cache every read goes to DynamoDB."""
+        table = _profiles_table(PROFILE)
+
+        assert cached_get_item(table, PROFILE_KEY) == PROFILE
+        assert cached_get_item(table, PROFILE_KEY) == PROFILE
+        assert table.get_item.call_count == 2
+
+    def test_repeat_reads_served_from_memory(self) -> None:
+        """The same key is read once per request, and callers get independent copies."""
+        table = _profiles_table(PROFILE)
+
+        with request_read_cache() as cache:
+            first = cached_get_item(table, PROFILE_KEY)
+            assert first is not None
+            first["sellerName"] = "changed"
+            second = cached_get_item(table, dict(reversed(list(PROFILE_KEY.items()))))
+
+        assert second == PROFILE
+        assert table.get_item.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_missing_items_are_cached(self) -> None:
+        """A miss is remembered as well."""
+        table = _profiles_table(None)
+
+        with request_read_cache():
+            assert cached_get_item(table, PROFILE_KEY) is None
+            assert cached_query_first(table, "profileId-index", "profileId", "PROFILE#p1") is None
+            assert cached_get_item(table, PROFILE_KEY) is None
+            assert cached_query_first(table, "profileId-index", "profileId", "PROFILE#p1") is None
+
+        assert table.get_item.call_count == 1
+        assert table.query.call_count == 1
+
+    def test_index_alias_serves_later_query(self) -> None:
+        """An item found by primary key answers a later index lookup."""
+        table = _profiles_table(PROFILE)
+
+        with request_read_cache():
+            cached_get_item(table, PROFILE_KEY, index_aliases=[("profileId-index", "profileId")])
+            assert cached_query_first(table, "profileId-index", "profileId", "PROFILE#p1") == PROFILE
+
+        table.query.assert_not_called()
+
+    def test_query_first_parameters(self) -> None:
+        """Index lookups ask for a single item."""
+        table = _profiles_table(PROFILE)
+
+        assert cached_query_first(table, "profileId-index", "profileId", "PROFILE#p1") == PROFILE
+        table.query.assert_called_once_with(
+            IndexName="profileId-index",
+            KeyConditionExpression="profileId = :profileId",
+            ExpressionAttributeValues={":profileId": "PROFILE#p1"},
+            Limit=1,
+        )
+
+    def test_nested_requests_share_cache_and_nothing_leaks(self) -> None:
+        """Nested scopes reuse the outer cache; a new request starts empty."""
+        table = _profiles_table(PROFILE)
+
+        with request_read_cache() as outer:
+            with request_read_cache() as inner:
+                assert inner is outer
+                cached_get_item(table, PROFILE_KEY)
+            cached_get_item(table, PROFILE_KEY)
+        assert dynamodb_utils._request_cache is None
+
+        with request_read_cache():
+            cached_get_item(table, PROFILE_KEY)
+        assert table.get_item.call_count == 2
+
+    def test_saved_reads_are_reported_in_metrics(self) -> None:
+        """Each hit is counted as DynamoDBReadsSaved for the invocation."""
+        table = _profiles_table(PROFILE)
+
+        @track_metrics
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            with request_read_cache():
+                for _ in range(3):
+                    cached_get_item(table, PROFILE_KEY)
+
+        with capture_metrics() as records:
+            handler({}, None)
+
+        assert records[0]["DynamoDBReadsSaved"] == 2
+
+
+class TestBatchGetItems:
+    """Tests for batch_get_items."""
+
+    def _table(self) -> MagicMock:
+        table = MagicMock()
+        table.name = "catalogs"
+        return table
+
+    def test_chunks_dedupes_and_projects(self) -> None:
+        """Keys are sent once, 100 per request, with the projection on every request."""
+        resource = MagicMock()
+        resource.batch_get_item.side_effect = lambda RequestItems: {
+            "Responses": {"catalogs": [{"catalogId": k["catalogId"]} for k in RequestItems["catalogs"]["Keys"]]}
+        }
+        keys = [{"catalogId": f"CATALOG#{n}"} for n in range(150)]
+        with patch.object(dynamodb_utils, "_get_dynamodb", return_value=resource):
+            items = batch_get_items(self._table(), keys + keys[:10], attributes=("catalogId", "catalogName"))
+
+        assert len(items) == 150
+        requests = [c.kwargs["RequestItems"]["catalogs"] for c in resource.batch_get_item.call_args_list]
+        assert [len(r["Keys"]) for r in requests] == [100, 50]
+        assert requests[0]["ProjectionExpression"] == "#a0, #a1"
+        assert requests[0]["ExpressionAttributeNames"] == {"#a0": "catalogId", "#a1": "catalogName"}
+
+    def test_retries_unprocessed_keys(self) -> None:
+        """Unprocessed keys are requested again until DynamoDB returns them."""
+        resource = MagicMock()
+        resource.batch_get_item.side_effect = [
+            {
+                "Responses": {"catalogs": [{"catalogId": "a"}]},
+                "UnprocessedKeys": {"catalogs": {"Keys": [{"catalogId": "b"}]}},
+            },
+            {"Responses": {"catalogs": [{"catalogId": "b"}]}},
+        ]
+        with (
+            patch.object(dynamodb_utils, "_get_dynamodb", return_value=resource),
+            patch.object(dynamodb_utils.time, "sleep") as sleep,
+        ):
+            items = batch_get_items(self._table(), [{"catalogId": "a"}, {"catalogId": "b"}])
+
+        assert items == [{"catalogId": "a"}, {"catalogId": "b"}]
+        assert resource.batch_get_item.call_args_list[1].kwargs["RequestItems"]["catalogs"] == {
+            "Keys": [{"catalogId": "b"}]
+        }
+        sleep.assert_called_once()
+
+    def test_raises_after_max_attempts(self) -> None:
+        """Keys DynamoDB never returns fail the read instead of silently going missing."""
+        resource = MagicMock()
+        resource.batch_get_item.return_value = {"UnprocessedKeys": {"catalogs": {"Keys": [{"catalogId": "a"}]}}}
+        with (
+            patch.object(dynamodb_utils, "_get_dynamodb", return_value=resource),
+            patch.object(dynamodb_utils.time, "sleep"),
+            pytest.raises(AppError) as exc_info,
+        ):
+            batch_get_items(self._table(), [{"catalogId": "a"}])
+
+        assert exc_info.value.error_code == ErrorCode.DATABASE_ERROR
+        assert resource.batch_get_item.call_count == dynamodb_utils.BATCH_GET_MAX_ATTEMPTS
+
+    def test_no_keys_makes_no_request(self) -> None:
+        resource = MagicMock()
+        with patch.object(dynamodb_utils, "_get_dynamodb", return_value=resource):
+            assert batch_get_items(self._table(), []) == []
+        resource.batch_get_item.assert_not_called()
@@ -1,9 +1,22 @@
 """Tests for logging utilities."""
 
 import json
+from decimal import Decimal
 from typing import Any, Dict
+from unittest.mock import MagicMock
 
-from src.utils.logging import StructuredLogger, get_correlation_id
+import pytest
+
+from src.utils import logging as structured_logging
+from src.utils.logging import (
+    StructuredLogger,
+    buffered_logging,
+    flush_log_buffer,
+    get_correlation_id,
+    log_buffering_enabled,
+    set_correlation_id,
+    start_log_buffer,
+)
 
 
 class TestStructuredLogger:
@@ -63,8 +76,9 @@ class TestStructuredLogger:
         assert log_entry["message"] == "Error message"
         assert log_entry["error"] == "details"
 
-    def test_debug_logs_json(self, capsys: Any) -> None:
-        """Test debug logging outputs JSON."""
+    def test_debug_logs_json(self, capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test debug logging outputs JSON when LOG_LEVEL is DEBUG."""
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
         logger = StructuredLogger("test", "test-id")
 
         logger.debug("Debug message", data={"key": "value"})
@@ -87,6 +101,131 @@ class TestStructuredLogger:
         assert "value" not in log_entry
         assert log_entry["other"] == "present"
 
+    def test_debug_suppressed_at_default_level(self, capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test debug records are dropped when LOG_LEVEL is unset (INFO)."""
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        logger = StructuredLogger("test", "test-id")
+
+        logger.debug("Debug message")
+
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize("level", ["WARN", "warning"])
+    def test_warn_level_filters_info(self, level: str, capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test WARN (and lowercase names) suppress info but keep warnings and errors."""
+        monkeypatch.setenv("LOG_LEVEL", level)
+        logger = StructuredLogger("test", "test-id")
+
+        logger.info("Info message")
+        logger.warning("Warning message")
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert [json.loads(line)["level"] for line in lines] == ["WARNING"]
+
+    def test_error_level_filters_warning(self, capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test ERROR level suppresses warnings."""
+        monkeypatch.setenv("LOG_LEVEL", "ERROR")
+        logger = StructuredLogger("test", "test-id")
+
+        logger.warning("Warning message")
+        logger.error("Error message")
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert [json.loads(line)["level"] for line in lines] == ["ERROR"]
+
+    def test_unknown_level_defaults_to_info(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an unrecognised LOG_LEVEL falls back to INFO."""
+        monkeypatch.setenv("LOG_LEVEL", "VERBOSE")
+
+        assert StructuredLogger("test").level == 20
+
+    def test_lazy_args_formatted_when_enabled(self, capsys: Any) -> None:
+        """Test %-style arguments are interpolated into the message."""
+        logger = StructuredLogger("test", "test-id")
+
+        logger.info("Found %d orders for %s", 3, "PROFILE#1")
+
+        log_entry = json.loads(capsys.readouterr().out.strip())
+        assert log_entry["message"] == "Found 3 orders for PROFILE#1"
+
+    def test_lazy_args_not_formatted_when_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test disabled levels never stringify their arguments."""
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        logger = StructuredLogger("test", "test-id")
+        item = MagicMock()
+
+        logger.debug("Item: %s", item)
+
+        item.__str__.assert_not_called()
+
+    def test_non_json_values_serialized_as_strings(self, capsys: Any) -> None:
+        """Test Decimal and other non-JSON values do not break logging."""
+        logger = StructuredLogger("test", "test-id")
+
+        logger.info("Totals", total=Decimal("12.50"))
+
+        log_entry = json.loads(capsys.readouterr().out.strip())
+        assert log_entry["total"] == "12.50"
+
+
+class TestLogBuffer:
+    """Tests for per-invocation log buffering."""
+
+    def test_buffered_lines_written_once_at_end(self, capsys: Any) -> None:
+        """Test buffered lines are held until the block exits."""
+        logger = StructuredLogger("test", "test-id")
+
+        with buffered_logging():
+            logger.info("first")
+            StructuredLogger("other", "test-id").info("second")
+            assert capsys.readouterr().out == ""
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["first", "second"]
+        assert structured_logging._buffer is None
+
+    def test_buffer_flushed_on_exception(self, capsys: Any) -> None:
+        """Test buffered lines are written even when the handler raises."""
+        logger = StructuredLogger("test", "test-id")
+
+        with pytest.raises(ValueError), buffered_logging():
+            logger.error("about to fail")
+            raise ValueError("boom")
+
+        assert json.loads(capsys.readouterr().out.strip())["message"] == "about to fail"
+
+    def test_nested_block_leaves_flush_to_outermost(self, capsys: Any) -> None:
+        """Test an inner block does not end the outer block's buffering."""
+        logger = StructuredLogger("test", "test-id")
+
+        with buffered_logging():
+            with buffered_logging():
+                logger.info("inner")
+            logger.info("outer")
+            assert capsys.readouterr().out == ""
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["inner", "outer"]
+
+    def test_buffering_enabled_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test LOG_BUFFERING turns buffering on only when set to true."""
+        monkeypatch.delenv("LOG_BUFFERING", raising=False)
+        assert not log_buffering_enabled()
+        monkeypatch.setenv("LOG_BUFFERING", "False")
+        assert not log_buffering_enabled()
+        monkeypatch.setenv("LOG_BUFFERING", "TRUE")
+        assert log_buffering_enabled()
+
+    def test_start_is_idempotent_and_empty_flush_writes_nothing(self, capsys: Any) -> None:
+        """Test nested starts share one buffer and empty flushes are silent."""
+        start_log_buffer()
+        start_log_buffer()
+        flush_log_buffer()
+        flush_log_buffer()
+
+        assert capsys.readouterr().out == ""
+        assert structured_logging._buffer is None
+
 
 class TestGetCorrelationId:
     """Tests for get_correlation_id function."""
@@ -126,3 +265,22 @@ class TestGetCorrelationId:
         correlation_id = get_correlation_id(event)
 
         assert correlation_id == "appsync-123"
+
+
+class TestInvocationCorrelationId:
+    """Tests for the invocation-wide correlation ID."""
+
+    def test_explicit_id_wins_over_invocation_id(self) -> None:
+        """Test explicit IDs are kept and implicit ones follow the invocation."""
+        explicit = StructuredLogger("test", "explicit-id")
+        implicit = StructuredLogger("test")
+        fallback = implicit.correlation_id
+
+        set_correlation_id("invocation-id")
+        try:
+            assert explicit.correlation_id == "explicit-id"
+            assert implicit.correlation_id == "invocation-id"
+        finally:
+            set_correlation_id(None)
+
+        assert implicit.correlation_id == fallback
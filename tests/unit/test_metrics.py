@@ -0,0 +1,230 @@
+"""Tests for EMF metrics utilities."""
+
+import json
+from typing import Any, Dict, Generator
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.utils import metrics
+from src.utils.metrics import MetricsRecorder, capture_metrics, track_metrics
+from tests.unit.table_schemas import create_all_tables
+
+ACCOUNTS_TABLE = "kernelworx-accounts-ue1-dev"
+
+
+@pytest.fixture
+def aws_env(aws_credentials: None) -> Generator[Dict[str, Any], None, None]:
+    """Create mock tables and a bucket."""
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        tables = create_all_tables(dynamodb)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="metrics-test-bucket")
+        yield {"accounts": tables["accounts"], "s3": s3}
+
+
+@pytest.fixture(autouse=True)
+def warm_container(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test as a warm invocation unless it opts into a cold start."""
+    monkeypatch.setattr(metrics, "_cold_start", False)
+
+
+class TestTrackMetrics:
+    """Tests for the handler decorator."""
+
+    def test_counts_dynamodb_and_s3_calls(self, aws_env: Dict[str, Any]) -> None:
+        """Test AWS calls made inside the handler are counted per service and operation."""
+
+        @track_metrics
+        def handler(event: Dict[str, Any], context: Any) -> str:
+            table = boto3.resource("dynamodb", region_name="us-east-1").Table(ACCOUNTS_TABLE)
+            table.put_item(Item={"accountId": "ACCOUNT#1"})
+            table.put_item(Item={"accountId": "ACCOUNT#2"})
+            table.get_item(Key={"accountId": "ACCOUNT#1"})
+            table.scan()
+            boto3.client("s3", region_name="us-east-1").list_objects_v2(Bucket="metrics-test-bucket")
+            return "ok"
+
+        with capture_metrics() as records:
+            assert handler({}, None) == "ok"
+
+        summary = records[0]
+        assert summary["Handler"] == "test_metrics.handler"
+        assert summary["DynamoDBCalls"] == 4
+        assert summary["DynamoDBItemsRead"] == 3
+        assert summary["DynamoDBConsumedCapacity"] > 0
+        assert summary["S3Calls"] == 1
+        assert summary["ColdStart"] == 0
+        assert summary["Errors"] == 0
+        assert summary["Duration"] >= summary["DynamoDBLatency"]
+
+        operations = {(r["Service"], r["Operation"]): r["Calls"] for r in records[1:]}
+        assert operations == {
+            ("dynamodb", "GetItem"): 1,
+            ("dynamodb", "PutItem"): 2,
+            ("dynamodb", "Scan"): 1,
+            ("s3", "ListObjectsV2"): 1,
+        }
+        assert records[1]["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [["Handler", "Service", "Operation"]]
+
+    def test_calls_outside_handler_not_counted(self, aws_env: Dict[str, Any]) -> None:
+        """Test calls made between invocations do not leak into the next record."""
+
+        @track_metrics
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            return None
+
+        with capture_metrics() as records:
+            handler({}, None)
+            aws_env["accounts"].get_item(Key={"accountId": "ACCOUNT#1"})
+            handler({}, None)
+
+        assert [r["DynamoDBCalls"] for r in records] == [0, 0]
+
+    def test_first_invocation_is_cold(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test only the first invocation in a container reports a cold start."""
+        monkeypatch.setattr(metrics, "_cold_start", True)
+
+        @track_metrics
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            return None
+
+        with capture_metrics() as records:
+            handler({}, None)
+            handler({}, None)
+
+        assert [r["ColdStart"] for r in records] == [1, 0]
+
+    def test_error_recorded_and_reraised(self) -> None:
+        """Test handler exceptions are counted and propagate unchanged."""
+
+        @track_metrics
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            raise ValueError("boom")
+
+        with capture_metrics() as records, pytest.raises(ValueError, match="boom"):
+            handler({}, None)
+
+        assert records[0]["Errors"] == 1
+
+    def test_nested_handlers_report_once(self) -> None:
+        """Test a tracked handler called from another reports into the outer record."""
+
+        @track_metrics
+        def inner(event: Dict[str, Any], context: Any) -> None:
+            return None
+
+        @track_metrics
+        def outer(event: Dict[str, Any], context: Any) -> None:
+            inner(event, context)
+
+        with capture_metrics() as records:
+            outer({}, None)
+
+        assert [r["Handler"] for r in records] == ["test_metrics.outer"]
+
+    def test_emits_emf_json_to_stdout(self, capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test records are written as EMF JSON lines when not captured."""
+        monkeypatch.setenv("METRICS_NAMESPACE", "TestNamespace")
+
+        @track_metrics
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            return None
+
+        handler({}, None)
+
+        record = json.loads(capsys.readouterr().out.strip())
+        directive = record["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == "TestNamespace"
+        assert directive["Dimensions"] == [["Handler"]]
+        assert {"Name": "Duration", "Unit": "Milliseconds"} in directive["Metrics"]
+        assert {"Name": "DynamoDBCalls", "Unit": "Count"} in directive["Metrics"]
+        assert record["Handler"] == "test_metrics.handler"
+
+
+class TestHooks:
+    """Tests for the botocore hook callbacks."""
+
+    def test_consumed_capacity_requested_only_while_tracking(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test ReturnConsumedCapacity is added only inside a tracked handler and never overridden."""
+        model = MagicMock()
+        model.input_shape.members = {"ReturnConsumedCapacity": None}
+
+        idle: Dict[str, Any] = {}
+        metrics._request_consumed_capacity(idle, model)
+        assert idle == {}
+
+        monkeypatch.setattr(metrics, "_current", MetricsRecorder("h"))
+        params: Dict[str, Any] = {}
+        metrics._request_consumed_capacity(params, model)
+        explicit: Dict[str, Any] = {"ReturnConsumedCapacity": "INDEXES"}
+        metrics._request_consumed_capacity(explicit, model)
+        assert params == {"ReturnConsumedCapacity": "TOTAL"}
+        assert explicit == {"ReturnConsumedCapacity": "INDEXES"}
+
+    def test_before_call_idle_does_not_stamp(self) -> None:
+        """Test no start time is recorded outside a tracked handler."""
+        context: Dict[str, Any] = {}
+
+        metrics._before_call(context)
+
+        assert context == {}
+
+    def test_after_call_without_start_is_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test calls that began before the handler started are not recorded."""
+        recorder = MetricsRecorder("h")
+        monkeypatch.setattr(metrics, "_current", recorder)
+
+        metrics._after_call({}, MagicMock(), {})
+
+        assert recorder.operations == {}
+
+
+class TestMetricsRecorder:
+    """Tests for response accounting."""
+
+    @pytest.mark.parametrize(
+        ("operation", "parsed", "expected"),
+        [
+            ("Query", {"Count": 7}, 7),
+            ("GetItem", {"Item": {}}, 1),
+            ("GetItem", {}, 0),
+            ("BatchGetItem", {"Responses": {"a": [{}, {}], "b": [{}]}}, 3),
+            ("TransactGetItems", {"Responses": [{"Item": {}}, {}]}, 1),
+            ("PutItem", {}, 0),
+        ],
+    )
+    def test_items_read(self, operation: str, parsed: Dict[str, Any], expected: int) -> None:
+        """Test items read are derived from each response shape."""
+        recorder = MetricsRecorder("h")
+
+        recorder.record_call("dynamodb", operation, 1.0, parsed)
+
+        assert recorder.items_read == expected
+
+    def test_consumed_capacity_single_and_list(self) -> None:
+        """Test capacity is summed from single and per-table ConsumedCapacity values."""
+        recorder = MetricsRecorder("h")
+
+        recorder.record_call("dynamodb", "GetItem", 1.0, {"ConsumedCapacity": {"CapacityUnits": 0.5}})
+        recorder.record_call(
+            "dynamodb",
+            "BatchWriteItem",
+            1.0,
+            {"ConsumedCapacity": [{"CapacityUnits": 2}, {"TableName": "t"}]},
+        )
+
+        assert recorder.consumed_capacity == 2.5
+
+    def test_s3_responses_not_inspected(self) -> None:
+        """Test S3 calls only add call counts and latency."""
+        recorder = MetricsRecorder("h")
+
+        recorder.record_call("s3", "GetObject", 2.0, {"Count": 5})
+
+        assert recorder.items_read == 0
+        assert recorder.service_totals("s3") == {"Calls": 1, "Latency": 2.0}
+        assert recorder.service_totals("dynamodb") == {"Calls": 0, "Latency": 0.0}
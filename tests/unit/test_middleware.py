@@ -0,0 +1,242 @@
+"""Tests for the common handler middleware."""
+
+import json
+import logging
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils import metrics, middleware
+from src.utils.errors import AppError, ErrorCode
+from src.utils.logging import get_logger
+from src.utils.metrics import capture_metrics
+from src.utils.middleware import current_invocation, handler_middleware, has_time_remaining
+
+APPSYNC_EVENT: Dict[str, Any] = {"requestContext": {"requestId": "req-123"}, "arguments": {}}
+
+
+@pytest.fixture(autouse=True)
+def warm_container(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test as a warm invocation unless it opts into a cold start."""
+    monkeypatch.setattr(metrics, "_cold_start", False)
+
+
+def _log_lines(capsys: Any) -> List[Dict[str, Any]]:
+    """Parse structured log lines (skipping EMF records)."""
+    lines = [json.loads(line) for line in capsys.readouterr().out.strip().splitlines()]
+    return [line for line in lines if "_aws" not in line]
+
+
+def _lambda_context(remaining_ms: int) -> MagicMock:
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = remaining_ms
+    return context
+
+
+class TestHandlerMiddleware:
+    """Tests for the handler decorator."""
+
+    def test_sets_correlation_id_for_module_loggers(self, capsys: Any) -> None:
+        """Test loggers without an explicit ID use the event's request ID during the invocation."""
+        module_logger = get_logger("some.module")
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> str:
+            module_logger.info("inside")
+            return "ok"
+
+        assert handler(APPSYNC_EVENT, None) == "ok"
+        module_logger.info("after")
+
+        lines = _log_lines(capsys)
+        assert [line["message"] for line in lines] == ["inside", "after"]
+        assert lines[0]["correlationId"] == "req-123"
+        assert lines[1]["correlationId"] != "req-123"
+
+    def test_completion_logged_at_debug(self, capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the per-invocation completion line only appears at DEBUG."""
+        monkeypatch.setattr(middleware.logger, "level", logging.DEBUG)
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            return None
+
+        handler(APPSYNC_EVENT, None)
+
+        [line] = _log_lines(capsys)
+        assert line["level"] == "DEBUG"
+        assert line["message"] == "Handler completed"
+        assert line["handler"] == "test_middleware.handler"
+        assert line["duration_ms"] >= 0
+        assert line["cold_start"] is False
+
+    def test_first_invocation_is_cold(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test only the first invocation in a container is flagged cold."""
+        monkeypatch.setattr(metrics, "_cold_start", True)
+        flags: List[bool] = []
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            invocation = current_invocation()
+            assert invocation is not None
+            flags.append(invocation.cold_start)
+
+        handler({}, None)
+        handler({}, None)
+
+        assert flags == [True, False]
+        assert not metrics.is_cold_start()
+        assert current_invocation() is None
+
+    def test_records_metrics(self) -> None:
+        """Test the wrapped handler also emits EMF metrics."""
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            return None
+
+        with capture_metrics() as records:
+            handler({}, None)
+
+        assert records[0]["Handler"] == "test_middleware.handler"
+
+    def test_app_error_passes_through(self, capsys: Any) -> None:
+        """Test AppErrors are logged as warnings and re-raised unchanged."""
+
+        @handler_middleware(error_message="Failed to do the thing")
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            raise AppError(ErrorCode.NOT_FOUND, "Missing")
+
+        with pytest.raises(AppError) as exc_info:
+            handler(APPSYNC_EVENT, None)
+
+        assert exc_info.value.error_code == ErrorCode.NOT_FOUND
+        warning = _log_lines(capsys)[0]
+        assert warning["level"] == "WARNING"
+        assert warning["error_code"] == ErrorCode.NOT_FOUND
+
+    def test_unexpected_error_mapped_to_app_error(self, capsys: Any) -> None:
+        """Test unexpected exceptions become INTERNAL_ERROR with the configured message."""
+
+        @handler_middleware(error_message="Failed to do the thing")
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            raise RuntimeError("database exploded")
+
+        with pytest.raises(AppError) as exc_info:
+            handler(APPSYNC_EVENT, None)
+
+        assert exc_info.value.error_code == ErrorCode.INTERNAL_ERROR
+        assert exc_info.value.message == "Failed to do the thing"
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+        error = _log_lines(capsys)[0]
+        assert error["level"] == "ERROR"
+        assert error["error"] == "database exploded"
+        assert error["error_type"] == "RuntimeError"
+
+    def test_unexpected_error_propagates_without_message(self) -> None:
+        """Test exceptions propagate unchanged when no error message is configured."""
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError, match="bad input"):
+            handler({}, None)
+
+    def test_nested_invocation_restores_outer(self) -> None:
+        """Test a wrapped handler called from another restores the outer invocation."""
+
+        @handler_middleware
+        def inner(event: Dict[str, Any], context: Any) -> str:
+            invocation = current_invocation()
+            assert invocation is not None
+            return invocation.correlation_id
+
+        @handler_middleware
+        def outer(event: Dict[str, Any], context: Any) -> str:
+            inner_id = inner({"requestContext": {"requestId": "inner"}}, context)
+            invocation = current_invocation()
+            assert invocation is not None
+            return f"{inner_id}/{invocation.correlation_id}"
+
+        assert outer(APPSYNC_EVENT, None) == "inner/req-123"
+
+    def test_buffers_logs_when_enabled(self, capsys: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test LOG_BUFFERING holds the invocation's log lines until it ends, including on errors."""
+        monkeypatch.setenv("LOG_BUFFERING", "true")
+        module_logger = get_logger("some.module")
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> None:
+            module_logger.info("inside")
+            assert capsys.readouterr().out == ""
+            raise AppError(ErrorCode.NOT_FOUND, "Missing")
+
+        with pytest.raises(AppError):
+            handler(APPSYNC_EVENT, None)
+
+        assert [line["message"] for line in _log_lines(capsys)] == ["inside", "Handler failed"]
+
+    def test_profiles_sampled_invocations(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test handlers are run under the profiler only when sampling is enabled at wrap time."""
+        profiled: List[str] = []
+
+        def fake_run_profiled(handler_name: str, correlation_id: str, func: Any, *args: Any) -> Any:
+            profiled.append(correlation_id)
+            return func(*args)
+
+        monkeypatch.setattr(middleware, "run_profiled", fake_run_profiled)
+
+        @handler_middleware
+        def plain(event: Dict[str, Any], context: Any) -> str:
+            return "ok"
+
+        monkeypatch.setenv("PROFILE_SAMPLE_RATE", "1")
+
+        @handler_middleware
+        def sampled(event: Dict[str, Any], context: Any) -> str:
+            return "ok"
+
+        assert plain(APPSYNC_EVENT, None) == "ok"
+        assert sampled(APPSYNC_EVENT, None) == "ok"
+        assert profiled == ["req-123"]
+
+
+class TestHasTimeRemaining:
+    """Tests for the remaining-time budget helper."""
+
+    def test_true_outside_handler(self) -> None:
+        """Test the budget is unlimited outside a wrapped handler."""
+        assert has_time_remaining() is True
+
+    def test_true_without_lambda_context(self) -> None:
+        """Test a missing or mocked Lambda context never stops the loop."""
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> bool:
+            return has_time_remaining()
+
+        assert handler({}, None) is True
+        assert handler({}, MagicMock()) is True
+
+    def test_reflects_lambda_deadline(self) -> None:
+        """Test the helper compares remaining time against the reserve."""
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> List[bool]:
+            return [has_time_remaining(), has_time_remaining(reserve_ms=10_000)]
+
+        assert handler({}, _lambda_context(8000)) == [True, False]
+        assert handler({}, _lambda_context(1000)) == [False, False]
+
+    def test_elapsed_ms(self) -> None:
+        """Test the invocation reports elapsed time."""
+
+        @handler_middleware
+        def handler(event: Dict[str, Any], context: Any) -> float:
+            invocation = current_invocation()
+            assert invocation is not None
+            return invocation.elapsed_ms()
+
+        assert handler({}, None) >= 0
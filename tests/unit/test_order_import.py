@@ -0,0 +1,272 @@
+"""Tests for the CSV/XLSX order import handlers."""
+
+import json
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from openpyxl import Workbook
+
+from src.handlers import order_import
+from src.handlers.order_import import get_order_import_report, process_order_import, request_order_import
+from src.utils.dynamodb import tables
+from src.utils.errors import AppError, ErrorCode
+
+BUCKET = "kernelworx-exports-ue1-dev"
+IMPORT_ID = "0123456789abcdef0123456789abcdef"
+HEADER = "Customer Name,Phone,Street,City,State,Zip,Payment Method,Order Date,Caramel Corn,P2\n"
+
+
+@pytest.fixture
+def import_env(order_setup: Dict[str, Any], s3_bucket: Any) -> Any:
+    """Campaign with a catalog plus the exports bucket."""
+    return s3_bucket
+
+
+def _key(account_id: str, extension: str = "csv", campaign: str = "campaign-123-abc") -> str:
+    return f"order-imports/{account_id}/{campaign}/{IMPORT_ID}.{extension}"
+
+
+def _upload_and_process(s3: Any, key: str, body: bytes) -> Dict[str, Any]:
+    s3.put_object(Bucket=BUCKET, Key=key, Body=body)
+    event = {"Records": [{"s3": {"bucket": {"name": BUCKET}, "object": {"key": key.replace(" ", "+")}}}]}
+    assert process_order_import(event, None) == {"imported": 1}
+    account_id = key.split("/")[1]
+    report_key = f"order-import-reports/{account_id}/{IMPORT_ID}.json"
+    report: Dict[str, Any] = json.loads(s3.get_object(Bucket=BUCKET, Key=report_key)["Body"].read())
+    return report
+
+
+def _stored_orders() -> List[Dict[str, Any]]:
+    response = tables.orders.query(
+        KeyConditionExpression="campaignId = :c", ExpressionAttributeValues={":c": "CAMPAIGN#campaign-123-abc"}
+    )
+    return response["Items"]
+
+
+class TestRequestOrderImport:
+    """Tests for request_order_import."""
+
+    def test_returns_presigned_post(self, import_env: Any, sample_account_id: str) -> None:
+        """The upload key encodes the caller and campaign the worker will import into."""
+        result = request_order_import(
+            {"identity": {"sub": sample_account_id}, "arguments": {"campaignId": "campaign-123-abc", "format": "XLSX"}},
+            None,
+        )
+
+        assert result["s3Key"] == f"order-imports/{sample_account_id}/campaign-123-abc/{result['importId']}.xlsx"
+        assert result["fields"]["Content-Type"].endswith("spreadsheetml.sheet")
+        assert order_import.ORDER_IMPORT_KEY_PATTERN.match(result["s3Key"])
+
+    def test_rejects_unknown_format(self, import_env: Any, sample_account_id: str) -> None:
+        with pytest.raises(AppError) as exc_info:
+            request_order_import(
+                {"identity": {"sub": sample_account_id}, "arguments": {"campaignId": "c", "format": "PDF"}}, None
+            )
+        assert exc_info.value.error_code == ErrorCode.INVALID_INPUT
+
+    def test_requires_write_access(self, import_env: Any, another_account_id: str) -> None:
+        with pytest.raises(AppError) as exc_info:
+            request_order_import(
+                {
+                    "identity": {"sub": another_account_id},
+                    "arguments": {"campaignId": "campaign-123-abc", "format": "CSV"},
+                },
+                None,
+            )
+        assert exc_info.value.error_code == ErrorCode.FORBIDDEN
+
+    def test_requires_authentication(self) -> None:
+        with pytest.raises(AppError) as exc_info:
+            request_order_import({"arguments": {}}, None)
+        assert exc_info.value.error_code == ErrorCode.UNAUTHORIZED
+
+
+class TestProcessOrderImport:
+    """Tests for the S3-triggered import worker."""
+
+    def test_imports_csv_with_row_errors(self, import_env: Any, sample_account_id: str) -> None:
+        """Valid rows become priced orders; invalid rows are reported by spreadsheet row number."""
+        body = (
+            "﻿"
+            + HEADER
+            + "Pat Neighbor,(555) 123-4567,1 Main St,Springfield,IL,62701,Cash,10/01/2025,2,1\n"
+            + "Sam Street,,,,,,venmo,2025-10-02T10:00:00-05:00,,3\n"
+            + ",,,,,,,,,\n"
+            + "Bad Phone,12345,,,,,Cash,,1,\n"
+            + "Bad Zip,,1 Main St,Springfield,IL,ABCDE,Cash,,1,\n"
+            + "No Products,,,,,,Cash,,0,\n"
+            + "Half Bag,,,,,,Cash,,1.5,\n"
+            + "No Payment,,,,,,,,1,\n"
+            + "Bad Date,,,,,,Cash,someday,1,\n"
+            + ",,,,,,Cash,,1,\n"
+            + "Zelle Fan,,,,,,Zelle,,1,\n"
+            + "Lots,,,,,,Cash,,lots,\n"
+        )
+
+        report = _upload_and_process(import_env, _key(sample_account_id), body.encode("utf-8"))
+
+        assert report["status"] == "COMPLETED"
+        assert report["campaignId"] == "CAMPAIGN#campaign-123-abc"
+        assert (report["rowsProcessed"], report["ordersCreated"], report["rowsFailed"]) == (11, 2, 9)
+        assert [(e["row"], e["errorCode"]) for e in report["errors"]] == [
+            (5, ErrorCode.INVALID_PHONE),
+            (6, ErrorCode.INVALID_ADDRESS),
+            (7, ErrorCode.INVALID_INPUT),
+            (8, ErrorCode.INVALID_INPUT),
+            (9, ErrorCode.INVALID_INPUT),
+            (10, ErrorCode.INVALID_INPUT),
+            (11, ErrorCode.INVALID_INPUT),
+            (12, ErrorCode.INVALID_INPUT),
+            (13, ErrorCode.INVALID_INPUT),
+        ]
+
+        orders = {order["customerName"]: order for order in _stored_orders()}
+        pat = orders["Pat Neighbor"]
+        assert pat["customerPhone"] == "+15551234567"
+        assert pat["customerAddress"] == {
+            "street": "1 Main St",
+            "city": "Springfield",
+            "state": "IL",
+            "zipCode": "62701",
+        }
+        assert pat["orderDate"] == "2025-10-01T00:00:00.000Z"
+        assert str(pat["totalAmount"]) == "55.50"
+        assert orders["Sam Street"]["orderDate"] == "2025-10-02T15:00:00.000Z"
+        assert orders["Sam Street"]["lineItems"][0]["productId"] == "P2"
+        assert "customerPhone" not in orders["Sam Street"]
+
+    def test_redelivered_event_does_not_duplicate(self, import_env: Any, sample_account_id: str) -> None:
+        """Order IDs come from the key and row, so processing the same upload twice overwrites."""
+        body = (HEADER + "Pat Neighbor,,,,,,Cash,,2,\n").encode("utf-8")
+
+        _upload_and_process(import_env, _key(sample_account_id), body)
+        _upload_and_process(import_env, _key(sample_account_id), body)
+
+        assert len(_stored_orders()) == 1
+
+    def test_imports_xlsx(self, import_env: Any, sample_account_id: str) -> None:
+        """XLSX cells keep their types (numbers, dates) and are read like CSV text."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["customer_name", "Payment", "Date", "p1", "Notes", None])
+        sheet.append(["Pat Neighbor", "Check", datetime(2025, 10, 3), 3.0, "Porch", None])
+        sheet.append(["Sam Street", "Cash", None, 1, None, None])
+        sheet.append(["Half Bag", "Cash", None, 2.5, None, None])
+        buffer = BytesIO()
+        workbook.save(buffer)
+
+        report = _upload_and_process(import_env, _key(sample_account_id, "xlsx"), buffer.getvalue())
+
+        assert report["ordersCreated"] == 2
+        assert report["errors"][0]["message"] == "Quantity '2.5' for P1 must be a whole number"
+        orders = {order["customerName"]: order for order in _stored_orders()}
+        assert orders["Pat Neighbor"]["orderDate"] == "2025-10-03T00:00:00.000Z"
+        assert orders["Pat Neighbor"]["lineItems"][0]["quantity"] == 3
+        assert orders["Pat Neighbor"]["notes"] == "Porch"
+
+    @pytest.mark.parametrize(
+        ("body", "message"),
+        [
+            (b"", "File is empty"),
+            (b"Customer Name,Payment Method,Popcorn Balls\nPat,Cash,1\n", "Unknown column 'Popcorn Balls'"),
+            (b"Payment Method,P1\nCash,1\n", "Missing 'Customer Name' column"),
+            (b"Customer Name,Payment Method\nPat,Cash\n", "No product columns"),
+            (b"Name,Customer Name,P1\nPat,Pat,1\n", "are the same field"),
+            (b"Customer Name,Payment Method,P1\n\xff\xfe,Cash,1\n", "File could not be read"),
+        ],
+    )
+    def test_file_level_errors(self, import_env: Any, sample_account_id: str, body: bytes, message: str) -> None:
+        """Problems with the file as a whole fail the import with a row-less error."""
+        report = _upload_and_process(import_env, _key(sample_account_id), body)
+
+        assert report["status"] == "FAILED"
+        assert report["errors"][-1]["row"] is None
+        assert message in report["errors"][-1]["message"]
+        assert _stored_orders() == []
+
+    def test_caller_lost_access(self, import_env: Any, another_account_id: str) -> None:
+        """Access is checked again when the file is processed."""
+        report = _upload_and_process(import_env, _key(another_account_id), (HEADER + "Pat,,,,,,Cash,,1,\n").encode())
+
+        assert report["status"] == "FAILED"
+        assert report["errors"] == [
+            {"row": None, "errorCode": ErrorCode.FORBIDDEN, "message": report["errors"][0]["message"]}
+        ]
+        assert report["rowsProcessed"] == 0
+
+    def test_row_cap_keeps_imported_rows(self, import_env: Any, sample_account_id: str) -> None:
+        """Rows past the cap are skipped; rows before it stay imported."""
+        body = HEADER + "".join(f"Customer {n},,,,,,Cash,,1,\n" for n in range(5))
+        with patch.object(order_import, "MAX_IMPORT_ROWS", 3), patch.object(order_import, "IMPORT_WRITE_BUFFER", 2):
+            report = _upload_and_process(import_env, _key(sample_account_id), body.encode())
+
+        assert report["status"] == "FAILED"
+        assert report["ordersCreated"] == 3
+        assert "row 5 on were skipped" in report["errors"][0]["message"]
+        assert len(_stored_orders()) == 3
+
+    def test_stops_before_timeout(self, import_env: Any, sample_account_id: str) -> None:
+        with patch.object(order_import, "has_time_remaining", return_value=False):
+            report = _upload_and_process(import_env, _key(sample_account_id), (HEADER + "Pat,,,,,,Cash,,1,\n").encode())
+
+        assert report["status"] == "FAILED"
+        assert "time limit" in report["errors"][0]["message"]
+
+    def test_unwritten_rows_are_reported(self, import_env: Any, sample_account_id: str) -> None:
+        body = (HEADER + "Pat,,,,,,Cash,,1,\nSam,,,,,,Cash,,1,\n").encode()
+        with patch.object(order_import, "batch_put_items", side_effect=lambda table, items, workers: items[1:]):
+            report = _upload_and_process(import_env, _key(sample_account_id), body)
+
+        assert report["ordersCreated"] == 1
+        assert report["errors"] == [
+            {"row": 3, "errorCode": ErrorCode.DATABASE_ERROR, "message": "Order could not be saved"}
+        ]
+
+    def test_ignores_unexpected_keys(self) -> None:
+        event = {"Records": [{"s3": {"bucket": {"name": BUCKET}, "object": {"key": "order-imports/notes.txt"}}}]}
+        with patch.object(order_import, "get_s3_client", return_value=MagicMock()):
+            assert process_order_import(event, None) == {"imported": 0}
+
+
+class TestGetOrderImportReport:
+    """Tests for get_order_import_report."""
+
+    def test_pending_then_completed(self, import_env: Any, sample_account_id: str) -> None:
+        event = {"identity": {"sub": sample_account_id}, "arguments": {"importId": IMPORT_ID}}
+        assert get_order_import_report(event, None)["status"] == "PENDING"
+
+        _upload_and_process(import_env, _key(sample_account_id), (HEADER + "Pat,,,,,,Cash,,1,\n").encode())
+
+        report = get_order_import_report(event, None)
+        assert report["status"] == "COMPLETED"
+        assert report["ordersCreated"] == 1
+
+    def test_reports_are_per_account(self, import_env: Any, sample_account_id: str, another_account_id: str) -> None:
+        """Another account asking for the same importId only looks under its own prefix."""
+        _upload_and_process(import_env, _key(sample_account_id), (HEADER + "Pat,,,,,,Cash,,1,\n").encode())
+
+        event = {"identity": {"sub": another_account_id}, "arguments": {"importId": IMPORT_ID}}
+        assert get_order_import_report(event, None)["status"] == "PENDING"
+
+    def test_rejects_malformed_import_id(self, sample_account_id: str) -> None:
+        with pytest.raises(AppError) as exc_info:
+            get_order_import_report({"identity": {"sub": sample_account_id}, "arguments": {"importId": "../x"}}, None)
+        assert exc_info.value.error_code == ErrorCode.INVALID_INPUT
+
+    def test_requires_authentication(self) -> None:
+        with pytest.raises(AppError) as exc_info:
+            get_order_import_report({"arguments": {"importId": IMPORT_ID}}, None)
+        assert exc_info.value.error_code == ErrorCode.UNAUTHORIZED
+
+    def test_other_s3_errors_fail(self, sample_account_id: str) -> None:
+        s3 = MagicMock()
+        s3.get_object.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "GetObject")
+        with patch.object(order_import, "get_s3_client", return_value=s3), pytest.raises(AppError) as exc_info:
+            get_order_import_report(
+                {"identity": {"sub": sample_account_id}, "arguments": {"importId": IMPORT_ID}}, None
+            )
+        assert exc_info.value.error_code == ErrorCode.INTERNAL_ERROR
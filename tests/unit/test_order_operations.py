@@ -0,0 +1,286 @@
+"""Tests for the createOrders batch handler and utils.orders."""
+
+from decimal import Decimal
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+
+from src.handlers.order_operations import MAX_ORDERS_PER_REQUEST, create_orders
+from src.utils import orders as orders_module
+from src.utils.dynamodb import tables
+from src.utils.errors import AppError, ErrorCode
+from src.utils.orders import batch_put_items, load_campaign_context, order_timestamp
+from tests.unit.aws_calls import count_aws_calls
+
+
+def _order(setup: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+    order = {
+        "profileId": setup["profileId"],
+        "campaignId": setup["campaignId"],
+        "customerName": "Pat Neighbor",
+        "orderDate": "2025-10-01T12:00:00Z",
+        "paymentMethod": "Cash",
+        "lineItems": [{"productId": "P1", "quantity": 2}, {"productId": "P2", "quantity": 1}],
+    }
+    order.update(overrides)
+    return order
+
+
+def _event(account_id: str, order_inputs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"identity": {"sub": account_id}, "arguments": {"input": order_inputs}}
+
+
+def _stored_orders(campaign_id: str) -> List[Dict[str, Any]]:
+    response = tables.orders.query(
+        KeyConditionExpression="campaignId = :c", ExpressionAttributeValues={":c": campaign_id}
+    )
+    return response["Items"]
+
+
+class TestCreateOrders:
+    """Tests for create_orders."""
+
+    def test_creates_priced_orders(self, order_setup: Dict[str, Any], sample_account_id: str) -> None:
+        """Orders are priced from the catalog and stored like createOrder stores them."""
+        results = create_orders(
+            _event(sample_account_id, [_order(order_setup), _order(order_setup, paymentMethod="venmo", notes="Porch")]),
+            None,
+        )
+
+        assert [r["success"] for r in results] == [True, True]
+        order = results[0]["order"]
+        assert order["orderId"].startswith("ORDER#")
+        assert order["totalAmount"] == 55.5
+        assert order["lineItems"][0] == {
+            "productId": "P1",
+            "productName": "Caramel Corn",
+            "quantity": 2,
+            "pricePerUnit": 20.0,
+            "subtotal": 40.0,
+        }
+        assert order["createdAt"] == order["updatedAt"]
+        assert order["createdAt"].endswith("Z")
+        assert results[1]["order"]["notes"] == "Porch"
+
+        stored = _stored_orders(order_setup["campaignId"])
+        assert len(stored) == 2
+        assert {item["totalAmount"] for item in stored} == {Decimal("55.5")}
+
+    def test_invalid_orders_are_reported_individually(
+        self, order_setup: Dict[str, Any], sample_account_id: str
+    ) -> None:
+        """One bad order does not stop the others."""
+        results = create_orders(
+            _event(
+                sample_account_id,
+                [
+                    _order(order_setup, lineItems=[{"productId": "NOPE", "quantity": 1}]),
+                    _order(order_setup),
+                    _order(order_setup, paymentMethod="Zelle"),
+                    _order(order_setup, lineItems=[{"productId": "P1", "quantity": 0}]),
+                    _order(order_setup, lineItems=[]),
+                    _order(order_setup, campaignId=None),
+                ],
+            ),
+            None,
+        )
+
+        assert [r["index"] for r in results] == list(range(6))
+        assert [r["success"] for r in results] == [False, True, False, False, False, False]
+        assert "Product NOPE not found" in results[0]["errorMessage"]
+        assert "Zelle" in results[2]["errorMessage"]
+        assert "Quantity must be at least 1" in results[3]["errorMessage"]
+        assert "at least one line item" in results[4]["errorMessage"]
+        assert results[5]["errorCode"] == ErrorCode.INVALID_INPUT
+        assert len(_stored_orders(order_setup["campaignId"])) == 1
+
+    def test_checks_access_and_loads_campaign_once(self, order_setup: Dict[str, Any], sample_account_id: str) -> None:
+        """A queue of orders for one campaign costs a fixed number of reads and one write per 25 orders."""
+        with count_aws_calls() as calls:
+            results = create_orders(_event(sample_account_id, [_order(order_setup) for _ in range(30)]), None)
+
+        assert all(r["success"] for r in results)
+        assert calls.count("dynamodb", "batch-write") == 2
+        # owner check, campaign, catalog, profile, account (payment methods)
+        calls.assert_within(dynamodb=2 + 5)
+
+    def test_caller_without_access_is_rejected(self, order_setup: Dict[str, Any], another_account_id: str) -> None:
+        """Orders for a profile the caller cannot write are rejected."""
+        results = create_orders(_event(another_account_id, [_order(order_setup), _order(order_setup)]), None)
+
+        assert {r["errorCode"] for r in results} == {ErrorCode.FORBIDDEN}
+        assert _stored_orders(order_setup["campaignId"]) == []
+
+    def test_missing_profile_and_campaign(self, order_setup: Dict[str, Any], sample_account_id: str) -> None:
+        """Unknown profiles and campaigns are reported as NOT_FOUND."""
+        results = create_orders(
+            _event(
+                sample_account_id,
+                [
+                    _order(order_setup, profileId="PROFILE#missing"),
+                    _order(order_setup, campaignId="CAMPAIGN#missing"),
+                    _order(order_setup, campaignId="CAMPAIGN#missing"),
+                ],
+            ),
+            None,
+        )
+
+        assert [r["errorCode"] for r in results] == [ErrorCode.NOT_FOUND] * 3
+
+    def test_campaign_must_belong_to_profile(
+        self, order_setup: Dict[str, Any], dynamodb_table: Any, sample_account_id: str
+    ) -> None:
+        """An order cannot be written into another profile's campaign."""
+        dynamodb_table.put_item(Item={"ownerAccountId": f"ACCOUNT#{sample_account_id}", "profileId": "PROFILE#second"})
+
+        results = create_orders(_event(sample_account_id, [_order(order_setup, profileId="PROFILE#second")]), None)
+
+        assert "does not belong" in results[0]["errorMessage"]
+
+    def test_campaign_without_catalog(
+        self, order_setup: Dict[str, Any], sample_account_id: str, sample_profile_id: str
+    ) -> None:
+        """Campaigns without a catalog, or whose catalog is gone, cannot take orders."""
+        campaigns = boto3.resource("dynamodb", region_name="us-east-1").Table("kernelworx-campaigns-v2-ue1-dev")
+        campaigns.put_item(Item={"profileId": sample_profile_id, "campaignId": "CAMPAIGN#nocat"})
+        campaigns.put_item(
+            Item={"profileId": sample_profile_id, "campaignId": "CAMPAIGN#gone", "catalogId": "CATALOG#gone"}
+        )
+
+        results = create_orders(
+            _event(
+                sample_account_id,
+                [_order(order_setup, campaignId="CAMPAIGN#nocat"), _order(order_setup, campaignId="CAMPAIGN#gone")],
+            ),
+            None,
+        )
+
+        assert "no catalog" in results[0]["errorMessage"]
+        assert results[1]["errorCode"] == ErrorCode.NOT_FOUND
+
+    def test_unwritten_orders_are_reported(self, order_setup: Dict[str, Any], sample_account_id: str) -> None:
+        """Orders DynamoDB never accepted come back as failures the client can retry."""
+        with patch("src.handlers.order_operations.batch_put_items", side_effect=lambda table, items: items[:1]):
+            results = create_orders(_event(sample_account_id, [_order(order_setup), _order(order_setup)]), None)
+
+        assert [r["success"] for r in results] == [False, True]
+        assert results[0]["errorCode"] == ErrorCode.DATABASE_ERROR
+
+    def test_retried_batch_does_not_duplicate_orders(self, order_setup: Dict[str, Any], sample_account_id: str) -> None:
+        """A flush retried with the same idempotency keys returns the orders created the first time."""
+        queue = [
+            _order(order_setup, idempotencyKey="device-1#1"),
+            _order(order_setup, idempotencyKey="device-1#2", customerName="Sam Neighbor"),
+        ]
+        first = create_orders(_event(sample_account_id, queue), None)
+        retried = create_orders(_event(sample_account_id, [*queue, _order(order_setup)]), None)
+
+        assert all(r["success"] for r in retried)
+        assert [r["order"] for r in retried[:2]] == [r["order"] for r in first]
+        assert retried[1]["order"]["customerName"] == "Sam Neighbor"
+        assert len(_stored_orders(order_setup["campaignId"])) == 3
+
+    def test_repeated_key_in_one_batch_is_written_once(
+        self, order_setup: Dict[str, Any], sample_account_id: str
+    ) -> None:
+        results = create_orders(
+            _event(
+                sample_account_id, [_order(order_setup, idempotencyKey="k"), _order(order_setup, idempotencyKey="k")]
+            ),
+            None,
+        )
+
+        assert [r["success"] for r in results] == [True, True]
+        assert results[0]["order"]["orderId"] == results[1]["order"]["orderId"]
+        assert len(_stored_orders(order_setup["campaignId"])) == 1
+
+    def test_rejects_oversized_batches(self, sample_account_id: str) -> None:
+        """The whole request fails when it has too many orders."""
+        with pytest.raises(AppError) as exc_info:
+            create_orders(_event(sample_account_id, [{}] * (MAX_ORDERS_PER_REQUEST + 1)), None)
+
+        assert exc_info.value.error_code == ErrorCode.INVALID_INPUT
+
+    def test_empty_batch(self, sample_account_id: str) -> None:
+        assert create_orders(_event(sample_account_id, []), None) == []
+
+
+class TestBatchPutItems:
+    """Tests for utils.orders.batch_put_items."""
+
+    def _table(self) -> MagicMock:
+        table = MagicMock()
+        table.name = "orders"
+        return table
+
+    def test_retries_unprocessed_items(self) -> None:
+        """Unprocessed items are retried until DynamoDB takes them."""
+        resource = MagicMock()
+        resource.batch_write_item.side_effect = [
+            {"UnprocessedItems": {"orders": [{"PutRequest": {"Item": {"orderId": "b"}}}]}},
+            {"UnprocessedItems": {}},
+        ]
+        with (
+            patch.object(orders_module, "get_dynamodb_resource", return_value=resource),
+            patch.object(orders_module.time, "sleep") as sleep,
+        ):
+            failed = batch_put_items(self._table(), [{"orderId": "a"}, {"orderId": "b"}])
+
+        assert failed == []
+        assert resource.batch_write_item.call_count == 2
+        sleep.assert_called_once()
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        """Items still unprocessed after the last attempt are returned."""
+        resource = MagicMock()
+        resource.batch_write_item.return_value = {
+            "UnprocessedItems": {"orders": [{"PutRequest": {"Item": {"orderId": "a"}}}]}
+        }
+        with (
+            patch.object(orders_module, "get_dynamodb_resource", return_value=resource),
+            patch.object(orders_module.time, "sleep"),
+        ):
+            failed = batch_put_items(self._table(), [{"orderId": "a"}])
+
+        assert failed == [{"orderId": "a"}]
+        assert resource.batch_write_item.call_count == orders_module.BATCH_WRITE_MAX_ATTEMPTS
+
+    def test_parallel_chunks(self, dynamodb_table: Any) -> None:
+        """With several workers every chunk is still written exactly once."""
+        items = [{"campaignId": "CAMPAIGN#c", "orderId": f"ORDER#{n:03d}"} for n in range(60)]
+
+        assert batch_put_items(tables.orders, items, max_workers=4) == []
+        assert len(_stored_orders("CAMPAIGN#c")) == 60
+
+    def test_failed_request_returns_chunk(self) -> None:
+        """A chunk whose request errors is reported, later chunks are still written."""
+        resource = MagicMock()
+        resource.batch_write_item.side_effect = [RuntimeError("throttled"), {}]
+        items = [{"orderId": str(n)} for n in range(30)]
+        with patch.object(orders_module, "get_dynamodb_resource", return_value=resource):
+            failed = batch_put_items(self._table(), items)
+
+        assert failed == items[:25]
+        assert len(resource.batch_write_item.call_args_list[1].kwargs["RequestItems"]["orders"]) == 5
+
+
+def test_load_campaign_context_requires_profile(order_setup: Dict[str, Any]) -> None:
+    """A campaign whose profile is gone has no owner to take payment methods from."""
+    campaigns = boto3.resource("dynamodb", region_name="us-east-1").Table("kernelworx-campaigns-v2-ue1-dev")
+    campaigns.put_item(
+        Item={"profileId": "PROFILE#orphan", "campaignId": "CAMPAIGN#orphan", "catalogId": "CATALOG#default"}
+    )
+
+    with pytest.raises(AppError) as exc_info:
+        load_campaign_context("CAMPAIGN#orphan")
+
+    assert exc_info.value.error_code == ErrorCode.NOT_FOUND
+
+
+def test_order_timestamp_matches_appsync_format() -> None:
+    from datetime import datetime, timedelta, timezone
+
+    eastern = datetime(2025, 10, 1, 8, 30, 0, 123456, tzinfo=timezone(timedelta(hours=-4)))
+    assert order_timestamp(eastern) == "2025-10-01T12:30:00.123Z"
@@ -5,6 +5,7 @@ Tests request_qr_upload, confirm_qr_upload, and generate_presigned_urls function
 """
 
 import os
+from io import BytesIO
 from typing import Any, Dict, Generator
 from unittest.mock import MagicMock, patch
 
@@ -12,6 +13,7 @@ import boto3
 import pytest
 from botocore.exceptions import ClientError
 from moto import mock_aws
+from PIL import Image
 
 from src.handlers.payment_methods_handlers import (
     confirm_qr_upload,
@@ -177,6 +179,39 @@ class TestConfirmQRUpload:
         assert result["qrCodeUrl"] is not None
         assert result["qrCodeUrl"].startswith("http")  # Pre-signed URL
 
+    def test_confirm_upload_stores_optimized_copy(
+        self, dynamodb_tables: Dict[str, Any], s3_bucket: Any, sample_account: Dict[str, Any], sample_account_id: str
+    ) -> None:
+        """Test confirming a decodable upload stores and serves an optimized copy."""
+        create_payment_method(sample_account_id, "Venmo")
+
+        image = Image.new("RGB", (2000, 1500), "white")
+        image.paste("black", (850, 600, 1150, 900))
+        upload = BytesIO()
+        image.save(upload, format="PNG")
+
+        s3_key = f"payment-qr-codes/{sample_account_id}/abc123.png"
+        optimized_key = f"payment-qr-codes/{sample_account_id}/abc123-optimized.png"
+        bucket_name = os.environ.get("EXPORTS_BUCKET", "test-exports-bucket")
+        s3_bucket.put_object(Bucket=bucket_name, Key=s3_key, Body=upload.getvalue())
+
+        event = {
+            "identity": {"sub": sample_account_id},
+            "arguments": {"paymentMethodName": "Venmo", "s3Key": s3_key},
+        }
+
+        result = confirm_qr_upload(event, None)
+
+        assert "abc123-optimized.png" in result["qrCodeUrl"]
+        s3_bucket.head_object(Bucket=bucket_name, Key=optimized_key)
+
+        from src.utils.dynamodb import tables
+
+        account = tables.accounts.get_item(Key={"accountId": f"ACCOUNT#{sample_account_id}"})["Item"]
+        method = account["preferences"]["paymentMethods"][0]
+        assert method["qrCodeUrl"] == s3_key
+        assert method["qrCodeOptimizedKey"] == optimized_key
+
     def test_confirm_upload_nonexistent_s3_object(
         self, dynamodb_tables: Dict[str, Any], s3_bucket: Any, sample_account: Dict[str, Any], sample_account_id: str
     ) -> None:
@@ -347,6 +382,25 @@ class TestGeneratePresignedURLs:
         paypal = next(m for m in result["paymentMethods"] if m["name"] == "PayPal")
         assert paypal["qrCodeUrl"] is None
 
+    def test_generate_urls_prefers_optimized_key(self, s3_bucket: Any, sample_account_id: str) -> None:
+        """Test the optimized copy is served and the internal key is not returned."""
+        s3_key = f"payment-qr-codes/{sample_account_id}/abc123.png"
+        optimized_key = f"payment-qr-codes/{sample_account_id}/abc123-optimized.png"
+        event = {
+            "prev": {
+                "result": {
+                    "paymentMethods": [{"name": "Venmo", "qrCodeUrl": s3_key, "qrCodeOptimizedKey": optimized_key}],
+                    "ownerAccountId": sample_account_id,
+                }
+            }
+        }
+
+        result = generate_presigned_urls(event, None)
+
+        venmo = result["paymentMethods"][0]
+        assert "abc123-optimized.png" in venmo["qrCodeUrl"]
+        assert "qrCodeOptimizedKey" not in venmo
+
     def test_generate_urls_missing_owner_id(self) -> None:
         """Test generate URLs without owner account ID."""
         event = {"prev": {"result": {"paymentMethods": []}}}
@@ -422,6 +476,54 @@ class TestDeleteQRCode:
         with pytest.raises(ClientError):
             s3_bucket.head_object(Bucket=bucket_name, Key=s3_key)
 
+    def test_delete_qr_removes_optimized_copy(
+        self, dynamodb_tables: Dict[str, Any], s3_bucket: Any, sample_account: Dict[str, Any], sample_account_id: str
+    ) -> None:
+        """Test deleting a QR code also removes its optimized copy and clears the stored key."""
+        s3_key = f"payment-qr-codes/{sample_account_id}/abc123.png"
+        optimized_key = f"payment-qr-codes/{sample_account_id}/abc123-optimized.png"
+        bucket_name = os.environ.get("EXPORTS_BUCKET", "test-exports-bucket")
+        s3_bucket.put_object(Bucket=bucket_name, Key=s3_key, Body=b"fake-qr-data")
+        s3_bucket.put_object(Bucket=bucket_name, Key=optimized_key, Body=b"fake-optimized")
+        dynamodb_tables["accounts"].put_item(
+            Item={
+                "accountId": f"ACCOUNT#{sample_account_id}",
+                "preferences": {
+                    "paymentMethods": [{"name": "Venmo", "qrCodeUrl": s3_key, "qrCodeOptimizedKey": optimized_key}]
+                },
+            }
+        )
+
+        event = {"identity": {"sub": sample_account_id}, "arguments": {"paymentMethodName": "Venmo"}}
+        assert delete_qr_code(event, None) is True
+
+        assert "Contents" not in s3_bucket.list_objects_v2(Bucket=bucket_name)
+        account = dynamodb_tables["accounts"].get_item(Key={"accountId": f"ACCOUNT#{sample_account_id}"})["Item"]
+        assert account["preferences"]["paymentMethods"] == [{"name": "Venmo", "qrCodeUrl": None}]
+
+    def test_delete_qr_optimized_copy_delete_fails(
+        self, dynamodb_tables: Dict[str, Any], sample_account: Dict[str, Any], sample_account_id: str
+    ) -> None:
+        """Test failure deleting the optimized copy is logged, not raised."""
+        dynamodb_tables["accounts"].put_item(
+            Item={
+                "accountId": f"ACCOUNT#{sample_account_id}",
+                "preferences": {
+                    "paymentMethods": [
+                        {
+                            "name": "Venmo",
+                            "qrCodeUrl": f"payment-qr-codes/{sample_account_id}/abc123.png",
+                            "qrCodeOptimizedKey": f"payment-qr-codes/{sample_account_id}/abc123-optimized.png",
+                        }
+                    ]
+                },
+            }
+        )
+
+        with patch("src.handlers.payment_methods_handlers.delete_qr_by_key", side_effect=Exception("S3 delete failed")):
+            event = {"identity": {"sub": sample_account_id}, "arguments": {"paymentMethodName": "Venmo"}}
+            assert delete_qr_code(event, None) is True
+
     def test_delete_qr_no_qr_exists(
         self, dynamodb_tables: Dict[str, Any], sample_account: Dict[str, Any], sample_account_id: str
     ) -> None:
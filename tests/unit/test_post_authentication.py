@@ -4,14 +4,18 @@ Tests for Post-Authentication Lambda trigger
 Updated for multi-table design (accounts table).
 """
 
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import boto3
 import pytest
+from botocore.exceptions import ClientError
 
 from src.handlers.post_authentication import lambda_handler
 
+ACCOUNT_KEY = "ACCOUNT#a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+
 
 @pytest.fixture
 def cognito_event() -> dict[str, Any]:
@@ -176,7 +180,7 @@ def test_dynamodb_error_does_not_block_auth(cognito_event: dict[str, Any], lambd
     # Mock boto3.resource to simulate DynamoDB error
     with patch("boto3.resource") as mock_resource:
         mock_table = MagicMock()
-        mock_table.get_item.side_effect = Exception("DynamoDB error")
+        mock_table.update_item.side_effect = Exception("DynamoDB error")
         mock_resource.return_value.Table.return_value = mock_table
 
         result = lambda_handler(cognito_event, lambda_context)
@@ -185,6 +189,142 @@ def test_dynamodb_error_does_not_block_auth(cognito_event: dict[str, Any], lambd
         assert result == cognito_event
 
 
+def test_new_account_defaults_created(
+    cognito_event: dict[str, Any],
+    lambda_context: MagicMock,
+    dynamodb_table: Any,
+    monkeypatch: Any,
+) -> None:
+    """Test the single upsert writes all account defaults for a first login"""
+    monkeypatch.setenv("ACCOUNTS_TABLE_NAME", "kernelworx-accounts-ue1-dev")
+    cognito_event["request"]["userAttributes"]["given_name"] = "Jane"
+    cognito_event["request"]["userAttributes"]["family_name"] = "Doe"
+
+    lambda_handler(cognito_event, lambda_context)
+
+    account = get_accounts_table().get_item(Key={"accountId": ACCOUNT_KEY})["Item"]
+    assert account["givenName"] == "Jane"
+    assert account["familyName"] == "Doe"
+    assert account["city"] == ""
+    assert account["state"] == ""
+    assert account["unitType"] == ""
+    assert account["preferences"] == {"paymentMethods": []}
+    assert account["createdAt"] == account["updatedAt"]
+
+
+def test_existing_account_fields_preserved(
+    cognito_event: dict[str, Any],
+    lambda_context: MagicMock,
+    dynamodb_table: Any,
+    monkeypatch: Any,
+) -> None:
+    """Test defaults never overwrite values the user already set"""
+    monkeypatch.setenv("ACCOUNTS_TABLE_NAME", "kernelworx-accounts-ue1-dev")
+    accounts_table = get_accounts_table()
+    accounts_table.put_item(
+        Item={
+            "accountId": ACCOUNT_KEY,
+            "email": "user@example.com",
+            "givenName": "Jane",
+            "state": "CO",
+            "preferences": {"paymentMethods": [{"name": "Venmo"}]},
+            "createdAt": "2024-01-01T00:00:00+00:00",
+            "updatedAt": "2024-01-01T00:00:00+00:00",
+        }
+    )
+
+    lambda_handler(cognito_event, lambda_context)
+
+    account = accounts_table.get_item(Key={"accountId": ACCOUNT_KEY})["Item"]
+    assert account["givenName"] == "Jane"
+    assert account["state"] == "CO"
+    assert account["preferences"] == {"paymentMethods": [{"name": "Venmo"}]}
+    assert account["updatedAt"] > "2024-01-01T00:00:00+00:00"
+
+
+def test_recent_login_skips_write(
+    cognito_event: dict[str, Any],
+    lambda_context: MagicMock,
+    dynamodb_table: Any,
+    monkeypatch: Any,
+) -> None:
+    """Test a re-login within the refresh window leaves the account untouched"""
+    monkeypatch.setenv("ACCOUNTS_TABLE_NAME", "kernelworx-accounts-ue1-dev")
+    recent = datetime.now(timezone.utc).isoformat()
+    accounts_table = get_accounts_table()
+    accounts_table.put_item(
+        Item={"accountId": ACCOUNT_KEY, "email": "user@example.com", "createdAt": recent, "updatedAt": recent}
+    )
+
+    result = lambda_handler(cognito_event, lambda_context)
+
+    assert result == cognito_event
+    account = accounts_table.get_item(Key={"accountId": ACCOUNT_KEY})["Item"]
+    assert account["updatedAt"] == recent
+    assert "preferences" not in account
+
+
+def test_recent_login_with_new_email_still_writes(
+    cognito_event: dict[str, Any],
+    lambda_context: MagicMock,
+    dynamodb_table: Any,
+    monkeypatch: Any,
+) -> None:
+    """Test an email change is applied even inside the refresh window"""
+    monkeypatch.setenv("ACCOUNTS_TABLE_NAME", "kernelworx-accounts-ue1-dev")
+    recent = datetime.now(timezone.utc).isoformat()
+    accounts_table = get_accounts_table()
+    accounts_table.put_item(
+        Item={"accountId": ACCOUNT_KEY, "email": "old@example.com", "createdAt": recent, "updatedAt": recent}
+    )
+
+    lambda_handler(cognito_event, lambda_context)
+
+    account = accounts_table.get_item(Key={"accountId": ACCOUNT_KEY})["Item"]
+    assert account["email"] == "user@example.com"
+
+
+def test_refresh_window_configurable(
+    cognito_event: dict[str, Any],
+    lambda_context: MagicMock,
+    dynamodb_table: Any,
+    monkeypatch: Any,
+) -> None:
+    """Test a zero window refreshes updatedAt on every login"""
+    monkeypatch.setenv("ACCOUNTS_TABLE_NAME", "kernelworx-accounts-ue1-dev")
+    monkeypatch.setenv("ACCOUNT_REFRESH_WINDOW_SECONDS", "0")
+    recent = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+    accounts_table = get_accounts_table()
+    accounts_table.put_item(
+        Item={"accountId": ACCOUNT_KEY, "email": "user@example.com", "createdAt": recent, "updatedAt": recent}
+    )
+
+    lambda_handler(cognito_event, lambda_context)
+
+    account = accounts_table.get_item(Key={"accountId": ACCOUNT_KEY})["Item"]
+    assert account["updatedAt"] > recent
+
+
+def test_single_dynamodb_call_per_login(cognito_event: dict[str, Any], lambda_context: MagicMock) -> None:
+    """Test login costs exactly one update_item and no reads"""
+    with patch("src.handlers.post_authentication.tables") as mock_tables:
+        lambda_handler(cognito_event, lambda_context)
+
+    mock_tables.accounts.update_item.assert_called_once()
+    mock_tables.accounts.get_item.assert_not_called()
+    mock_tables.accounts.put_item.assert_not_called()
+
+
+def test_unexpected_client_error_does_not_block_auth(cognito_event: dict[str, Any], lambda_context: MagicMock) -> None:
+    """Test non-conditional ClientErrors are logged and auth continues"""
+    error = ClientError({"Error": {"Code": "ProvisionedThroughputExceededException"}}, "UpdateItem")
+    with patch("src.handlers.post_authentication.tables") as mock_tables:
+        mock_tables.accounts.update_item.side_effect = error
+        result = lambda_handler(cognito_event, lambda_context)
+
+    assert result == cognito_event
+
+
 def test_email_gsi_available(
     cognito_event: dict[str, Any],
     lambda_context: MagicMock,
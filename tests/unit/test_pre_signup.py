@@ -4,14 +4,25 @@ Tests for Pre-Signup Lambda trigger
 Tests automatic linking of federated identities to existing users.
 """
 
-from typing import Any
+from typing import Any, Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.handlers import pre_signup
 from src.handlers.pre_signup import lambda_handler
 
 
+@pytest.fixture(autouse=True)
+def reset_warm_state() -> Generator[None, None, None]:
+    """Clear the shared Cognito client and lookup cache between tests"""
+    pre_signup.cognito_client = None
+    pre_signup._negative_cache.clear()
+    yield
+    pre_signup.cognito_client = None
+    pre_signup._negative_cache.clear()
+
+
 @pytest.fixture
 def federated_signup_event() -> dict[str, Any]:
     """Sample Cognito Pre-Sign-Up event for federated (Google) user"""
@@ -302,3 +313,106 @@ class TestErrorHandling:
 
             # Should return event (can't parse provider)
             assert result == federated_signup_event
+
+
+class TestWarmContainerReuse:
+    """Tests for the shared Cognito client and negative lookup cache"""
+
+    def test_client_created_once_with_adaptive_retries(
+        self,
+        federated_signup_event: dict[str, Any],
+        lambda_context: MagicMock,
+    ) -> None:
+        """The cognito-idp client should be built once and reused"""
+        with patch("boto3.client") as mock_client:
+            mock_client.return_value.list_users.return_value = {"Users": []}
+
+            lambda_handler(dict(federated_signup_event, response={}), lambda_context)
+            federated_signup_event["request"]["userAttributes"]["email"] = "other@example.com"
+            lambda_handler(federated_signup_event, lambda_context)
+
+        mock_client.assert_called_once()
+        config = mock_client.call_args.kwargs["config"]
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+        assert mock_client.return_value.list_users.call_count == 2
+
+    def test_repeat_signup_skips_list_users(
+        self,
+        federated_signup_event: dict[str, Any],
+        lambda_context: MagicMock,
+    ) -> None:
+        """A retried sign-up for the same identity should use the cached lookup"""
+        with patch("boto3.client") as mock_client:
+            mock_client.return_value.list_users.return_value = {"Users": []}
+
+            lambda_handler(dict(federated_signup_event, response={}), lambda_context)
+            result = lambda_handler(federated_signup_event, lambda_context)
+
+        mock_client.return_value.list_users.assert_called_once()
+        assert result["response"]["autoConfirmUser"] is True
+        assert result["response"]["autoVerifyEmail"] is True
+
+    def test_other_provider_for_same_email_rechecks(
+        self,
+        federated_signup_event: dict[str, Any],
+        lambda_context: MagicMock,
+    ) -> None:
+        """A second provider for a cached email must look up the user again"""
+        with patch("boto3.client") as mock_client:
+            mock_client.return_value.list_users.return_value = {"Users": []}
+            lambda_handler(dict(federated_signup_event, response={}), lambda_context)
+
+            federated_signup_event["userName"] = "Facebook_987654321"
+            lambda_handler(federated_signup_event, lambda_context)
+
+        assert mock_client.return_value.list_users.call_count == 2
+
+    def test_expired_entry_rechecks(
+        self,
+        federated_signup_event: dict[str, Any],
+        lambda_context: MagicMock,
+    ) -> None:
+        """Cached lookups should expire after the TTL"""
+        with patch("boto3.client") as mock_client, patch("src.handlers.pre_signup.time") as mock_time:
+            mock_client.return_value.list_users.return_value = {"Users": []}
+            mock_time.monotonic.return_value = 1000.0
+            lambda_handler(dict(federated_signup_event, response={}), lambda_context)
+
+            mock_time.monotonic.return_value = 1000.0 + pre_signup.DEFAULT_NEGATIVE_CACHE_SECONDS
+            lambda_handler(federated_signup_event, lambda_context)
+
+        assert mock_client.return_value.list_users.call_count == 2
+
+    def test_cache_disabled_with_zero_ttl(
+        self,
+        federated_signup_event: dict[str, Any],
+        lambda_context: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A zero TTL should disable the negative cache"""
+        monkeypatch.setenv("PRE_SIGNUP_NEGATIVE_CACHE_SECONDS", "0")
+        with patch("boto3.client") as mock_client:
+            mock_client.return_value.list_users.return_value = {"Users": []}
+            lambda_handler(dict(federated_signup_event, response={}), lambda_context)
+            lambda_handler(federated_signup_event, lambda_context)
+
+        assert mock_client.return_value.list_users.call_count == 2
+        assert pre_signup._negative_cache == {}
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The cache should evict expired entries first, then the oldest live entry"""
+        monkeypatch.setattr(pre_signup, "NEGATIVE_CACHE_MAX_ENTRIES", 2)
+        with patch("src.handlers.pre_signup.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            pre_signup._remember_new_user("a@example.com", "Google_a")
+            mock_time.monotonic.return_value = 30.0
+            pre_signup._remember_new_user("b@example.com", "Google_b")
+
+            # a@ has expired by now, so it is pruned
+            mock_time.monotonic.return_value = 61.0
+            pre_signup._remember_new_user("c@example.com", "Google_c")
+            assert set(pre_signup._negative_cache) == {"b@example.com", "c@example.com"}
+
+            # Both remaining entries are live, so the oldest is dropped
+            pre_signup._remember_new_user("d@example.com", "Google_d")
+            assert set(pre_signup._negative_cache) == {"c@example.com", "d@example.com"}
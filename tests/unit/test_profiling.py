@@ -0,0 +1,175 @@
+"""Tests for on-demand handler profiling."""
+
+import cProfile
+import marshal
+import pstats
+from datetime import datetime, timezone
+from typing import Any, Dict, Generator
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.utils import profiling
+from src.utils.profiling import (
+    collapsed_stacks,
+    profile_key,
+    profile_sample_rate,
+    run_profiled,
+    should_profile,
+    upload_profile,
+)
+
+BUCKET = "kernelworx-exports-ue1-dev"
+
+
+@pytest.fixture
+def exports_bucket(aws_credentials: None) -> Generator[Any, None, None]:
+    """Create the mock exports bucket."""
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+        yield s3
+
+
+def _leaf(n: int) -> int:
+    return sum(range(n))
+
+
+def _middle() -> int:
+    return _leaf(20_000) + _leaf(10_000)
+
+
+def _profile(func: Any) -> cProfile.Profile:
+    profiler = cProfile.Profile()
+    profiler.runcall(func)
+    return profiler
+
+
+class TestSampling:
+    """Tests for enabling profiling."""
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No env var means no profiling."""
+        monkeypatch.delenv("PROFILE_SAMPLE_RATE", raising=False)
+        assert profile_sample_rate("campaign_reporting.get_unit_report") == 0.0
+
+    @pytest.mark.parametrize("value,expected", [("1", 1.0), ("0.05", 0.05), ("7", 1.0), ("-1", 0.0), ("", 0.0)])
+    def test_rate_is_clamped(self, monkeypatch: pytest.MonkeyPatch, value: str, expected: float) -> None:
+        """Rates outside 0..1 are clamped."""
+        monkeypatch.setenv("PROFILE_SAMPLE_RATE", value)
+        assert profile_sample_rate("any.handler") == expected
+
+    def test_invalid_rate_disables(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A typo in the env var never breaks the handler."""
+        monkeypatch.setenv("PROFILE_SAMPLE_RATE", "often")
+        assert profile_sample_rate("any.handler") == 0.0
+
+    def test_handler_filter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """PROFILE_HANDLERS limits profiling to the listed handlers."""
+        monkeypatch.setenv("PROFILE_SAMPLE_RATE", "1")
+        monkeypatch.setenv("PROFILE_HANDLERS", "campaign_reporting.get_unit_report, profile_sharing.list_my_shares")
+
+        assert profile_sample_rate("campaign_reporting.get_unit_report") == 1.0
+        assert profile_sample_rate("report_generation.request_campaign_report") == 0.0
+
+    def test_should_profile(self) -> None:
+        """Sampling compares a random draw against the rate."""
+        with patch.object(profiling.random, "random", return_value=0.3):
+            assert should_profile(0.5) is True
+            assert should_profile(0.2) is False
+
+
+class TestUpload:
+    """Tests for storing profiles."""
+
+    def test_profile_key(self) -> None:
+        """Keys are grouped by handler and day."""
+        now = datetime(2025, 10, 3, 14, 5, 9, tzinfo=timezone.utc)
+        assert (
+            profile_key("campaign_reporting.get_unit_report", "req-1", now)
+            == "profiles/campaign_reporting.get_unit_report/2025-10-03/140509-req-1.pstats"
+        )
+
+    def test_run_profiled_uploads_pstats(self, exports_bucket: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The handler result is returned and a loadable pstats file lands under profiles/."""
+        monkeypatch.setenv("EXPORTS_BUCKET", BUCKET)
+
+        result = run_profiled("test.handler", "req-42", lambda event, context: event["value"] * 2, {"value": 21}, None)
+
+        assert result == 42
+        keys = [obj["Key"] for obj in exports_bucket.list_objects_v2(Bucket=BUCKET, Prefix="profiles/")["Contents"]]
+        assert len(keys) == 1
+        assert keys[0].startswith("profiles/test.handler/") and keys[0].endswith("-req-42.pstats")
+        body = exports_bucket.get_object(Bucket=BUCKET, Key=keys[0])["Body"].read()
+        assert marshal.loads(body)
+
+    def test_run_profiled_uploads_when_handler_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Failed invocations are often the interesting ones."""
+        upload = MagicMock()
+        monkeypatch.setattr(profiling, "upload_profile", upload)
+
+        def handler() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            run_profiled("test.handler", "req-1", handler)
+        upload.assert_called_once()
+
+    def test_upload_without_bucket(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without EXPORTS_BUCKET the profile is dropped."""
+        monkeypatch.delenv("EXPORTS_BUCKET", raising=False)
+        assert upload_profile(_profile(_middle), "test.handler", "req-1") is None
+
+    def test_upload_failure_is_swallowed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """S3 errors never fail the invocation."""
+        monkeypatch.setenv("EXPORTS_BUCKET", BUCKET)
+        client = MagicMock()
+        client.put_object.side_effect = RuntimeError("AccessDenied")
+        monkeypatch.setattr(profiling, "get_s3_client", lambda: client)
+
+        assert upload_profile(_profile(_middle), "test.handler", "req-1") is None
+
+
+class TestCollapsedStacks:
+    """Tests for flamegraph output."""
+
+    def test_rebuilds_call_stacks(self) -> None:
+        """Callees appear under their callers with positive integer weights."""
+        lines = collapsed_stacks(pstats.Stats(_profile(_middle)))
+
+        assert any(
+            line.startswith("test_profiling.py:_middle:") and ";test_profiling.py:_leaf:" in line for line in lines
+        )
+        for line in lines:
+            stack, weight = line.rsplit(" ", 1)
+            assert int(weight) >= 1
+            assert " " not in stack
+
+    def test_recursion_and_depth_limit(self) -> None:
+        """Recursive calls do not loop forever and stacks stop at max_depth."""
+
+        def recurse(n: int) -> int:
+            return _leaf(5_000) + (recurse(n - 1) if n else 0)
+
+        lines = collapsed_stacks(pstats.Stats(_profile(lambda: recurse(5))), max_depth=2)
+
+        assert lines
+        assert all(len(line.rsplit(" ", 1)[0].split(";")) <= 2 for line in lines)
+
+    def test_builtin_labels(self) -> None:
+        """Built-in functions use their own name."""
+        assert profiling._frame_label(("~", 0, "<built-in method builtins.sum>")) == "<built-in_method_builtins.sum>"
+        assert profiling._frame_label(("/var/task/utils/auth.py", 69, "check")) == "auth.py:check:69"
+
+    def test_zero_time_callee(self) -> None:
+        """Callees with no recorded time are skipped instead of dividing by zero."""
+        stats = MagicMock()
+        root = ("a.py", 1, "root")
+        child = ("a.py", 2, "child")
+        stats.stats = {
+            root: (1, 1, 0.001, 0.001, {}),
+            child: (1, 1, 0.0, 0.0, {root: (1, 1, 0.0, 0.0)}),
+        }
+        assert collapsed_stacks(stats) == ["a.py:root:1 1000"]
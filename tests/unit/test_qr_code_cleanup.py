@@ -0,0 +1,233 @@
+"""Unit tests for the orphaned QR code cleanup job."""
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.handlers import qr_code_cleanup
+from src.handlers.qr_code_cleanup import collect_referenced_keys, lambda_handler
+from tests.unit.table_schemas import create_all_tables
+
+ACCOUNT_ID = "acc-123"
+PREFIX = f"payment-qr-codes/{ACCOUNT_ID}"
+
+
+@pytest.fixture
+def aws_env() -> Generator[Dict[str, Any], None, None]:
+    """Create mock accounts table and exports bucket."""
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+    os.environ["ACCOUNTS_TABLE_NAME"] = "kernelworx-accounts-ue1-dev"
+    os.environ["EXPORTS_BUCKET"] = "test-exports-bucket"
+
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        tables = create_all_tables(dynamodb)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-exports-bucket")
+        yield {"accounts": tables["accounts"], "s3": s3}
+
+
+def _put_methods(accounts_table: Any, methods: List[Dict[str, Any]], account_id: str = ACCOUNT_ID) -> None:
+    accounts_table.put_item(
+        Item={"accountId": f"ACCOUNT#{account_id}", "preferences": {"paymentMethods": methods}},
+    )
+
+
+def _put_objects(s3: Any, keys: List[str]) -> None:
+    for key in keys:
+        s3.put_object(Bucket="test-exports-bucket", Key=key, Body=b"qr")
+
+
+def _remaining_keys(s3: Any) -> List[str]:
+    response = s3.list_objects_v2(Bucket="test-exports-bucket")
+    return sorted(obj["Key"] for obj in response.get("Contents", []))
+
+
+class TestCollectReferencedKeys:
+    """Tests for the parallel accounts scan."""
+
+    def test_collects_stored_optimized_and_legacy_keys(self, aws_env: Dict[str, Any]) -> None:
+        """Test stored, optimized, and legacy slug-based keys are all protected."""
+        _put_methods(
+            aws_env["accounts"],
+            [
+                {
+                    "name": "Venmo",
+                    "qrCodeUrl": f"{PREFIX}/abc.png",
+                    "qrCodeOptimizedKey": f"{PREFIX}/abc-optimized.png",
+                },
+                {"name": "Zelle Pay", "qrCodeUrl": "https://example.com/legacy.png"},
+                {"name": "PayPal", "qrCodeUrl": None},
+            ],
+        )
+        _put_methods(aws_env["accounts"], [], account_id="acc-456")
+
+        keys = collect_referenced_keys(total_segments=3)
+
+        assert keys == {
+            f"{PREFIX}/abc.png",
+            f"{PREFIX}/abc-optimized.png",
+            f"{PREFIX}/zelle-pay.png",
+            f"{PREFIX}/zelle-pay.jpg",
+            f"{PREFIX}/zelle-pay.webp",
+        }
+
+    def test_paginates_each_segment(self) -> None:
+        """Test each scan segment follows LastEvaluatedKey."""
+        mock_table = MagicMock()
+        mock_table.scan.side_effect = [
+            {
+                "Items": [
+                    {
+                        "accountId": "ACCOUNT#a",
+                        "preferences": {"paymentMethods": [{"qrCodeUrl": "payment-qr-codes/a/1.png"}]},
+                    }
+                ],
+                "LastEvaluatedKey": {"accountId": "ACCOUNT#a"},
+            },
+            {
+                "Items": [
+                    {
+                        "accountId": "ACCOUNT#b",
+                        "preferences": {"paymentMethods": [{"qrCodeUrl": "payment-qr-codes/b/2.png"}]},
+                    }
+                ]
+            },
+        ]
+
+        with patch.object(qr_code_cleanup, "tables") as mock_tables:
+            mock_tables.accounts = mock_table
+            keys = collect_referenced_keys(total_segments=1)
+
+        assert keys == {"payment-qr-codes/a/1.png", "payment-qr-codes/b/2.png"}
+        assert mock_table.scan.call_args_list[1].kwargs["ExclusiveStartKey"] == {"accountId": "ACCOUNT#a"}
+
+
+class TestLambdaHandler:
+    """Tests for the cleanup Lambda handler."""
+
+    def test_deletes_only_unreferenced_objects(self, aws_env: Dict[str, Any]) -> None:
+        """Test unreferenced QR objects are deleted and everything else is kept."""
+        _put_methods(aws_env["accounts"], [{"name": "Venmo", "qrCodeUrl": f"{PREFIX}/keep.png"}])
+        _put_objects(aws_env["s3"], [f"{PREFIX}/keep.png", f"{PREFIX}/orphan1.png", f"{PREFIX}/orphan2.png"])
+        _put_objects(aws_env["s3"], ["reports/other.xlsx"])
+
+        result = lambda_handler({"graceHours": 0}, None)
+
+        assert result["objectsScanned"] == 3
+        assert result["orphansFound"] == 2
+        assert result["objectsDeleted"] == 2
+        assert result["deleteErrors"] == 0
+        assert result["bytesReclaimed"] == 4
+        assert result["dryRun"] is False
+        assert result["truncated"] is False
+        assert _remaining_keys(aws_env["s3"]) == [f"{PREFIX}/keep.png", "reports/other.xlsx"]
+
+    def test_dry_run_deletes_nothing(self, aws_env: Dict[str, Any]) -> None:
+        """Test dry run reports orphans without deleting them."""
+        _put_objects(aws_env["s3"], [f"{PREFIX}/orphan.png"])
+
+        result = lambda_handler({"graceHours": 0, "dryRun": True}, None)
+
+        assert result["orphansFound"] == 1
+        assert result["objectsDeleted"] == 0
+        assert _remaining_keys(aws_env["s3"]) == [f"{PREFIX}/orphan.png"]
+
+    def test_dry_run_false_string_deletes(self, aws_env: Dict[str, Any]) -> None:
+        """Test a "false" string in the event is not treated as a dry run."""
+        _put_objects(aws_env["s3"], [f"{PREFIX}/orphan.png"])
+
+        result = lambda_handler({"graceHours": 0, "dryRun": "false"}, None)
+
+        assert result["dryRun"] is False
+        assert _remaining_keys(aws_env["s3"]) == []
+
+    def test_keeps_keys_confirmed_after_the_scan(self, aws_env: Dict[str, Any]) -> None:
+        """Test an old upload confirmed while the job runs is re-checked and kept."""
+        _put_methods(aws_env["accounts"], [{"name": "Venmo", "qrCodeUrl": f"{PREFIX}/confirmed.png"}])
+        _put_objects(aws_env["s3"], [f"{PREFIX}/confirmed.png", f"{PREFIX}/orphan.png", "payment-qr-codes/stray.png"])
+
+        # The accounts scan ran before the upload was confirmed
+        with patch.object(qr_code_cleanup, "collect_referenced_keys", return_value=set()):
+            result = lambda_handler({"graceHours": 0}, None)
+
+        assert result["orphansFound"] == 3
+        assert result["objectsDeleted"] == 2
+        assert result["referencedSinceScan"] == 1
+        assert result["bytesReclaimed"] == 4
+        assert _remaining_keys(aws_env["s3"]) == [f"{PREFIX}/confirmed.png"]
+
+    def test_dry_run_from_environment(self, aws_env: Dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test dry run and grace period can be configured by environment."""
+        monkeypatch.setenv("QR_CLEANUP_DRY_RUN", "true")
+        monkeypatch.setenv("QR_CLEANUP_GRACE_HOURS", "0")
+        _put_objects(aws_env["s3"], [f"{PREFIX}/orphan.png"])
+
+        result = lambda_handler({}, None)
+
+        assert result["dryRun"] is True
+        assert _remaining_keys(aws_env["s3"]) == [f"{PREFIX}/orphan.png"]
+
+    def test_grace_period_protects_recent_uploads(self, aws_env: Dict[str, Any]) -> None:
+        """Test objects younger than the default grace period are kept."""
+        _put_objects(aws_env["s3"], [f"{PREFIX}/fresh.png"])
+
+        result = lambda_handler(None, None)  # type: ignore[arg-type]
+
+        assert result["graceHours"] == 24
+        assert result["orphansFound"] == 0
+        assert _remaining_keys(aws_env["s3"]) == [f"{PREFIX}/fresh.png"]
+
+    def test_flushes_full_batches_while_streaming(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test deletes are flushed in delete_objects-sized batches and failures are counted."""
+        monkeypatch.setenv("EXPORTS_BUCKET", "test-exports-bucket")
+        monkeypatch.setattr(qr_code_cleanup, "DELETE_BATCH_SIZE", 2)
+        old = datetime.now(timezone.utc) - timedelta(days=30)
+        page = [{"Key": f"{PREFIX}/{i}.png", "LastModified": old, "Size": 10} for i in range(5)]
+
+        mock_s3 = MagicMock()
+        mock_s3.get_paginator.return_value.paginate.return_value = [{"Contents": page}, {}]
+        mock_s3.delete_objects.side_effect = [
+            {},
+            {"Errors": [{"Key": f"{PREFIX}/2.png", "Code": "AccessDenied", "Message": "Access Denied"}]},
+            {},
+        ]
+
+        monkeypatch.setattr(qr_code_cleanup, "s3_client", mock_s3)
+        with (
+            patch.object(qr_code_cleanup, "collect_referenced_keys", return_value=set()),
+            patch.object(qr_code_cleanup, "_referenced_now", return_value=set()),
+        ):
+            result = lambda_handler({}, None)
+
+        assert mock_s3.delete_objects.call_count == 3
+        batch_sizes = [len(call.kwargs["Delete"]["Objects"]) for call in mock_s3.delete_objects.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+        assert result["objectsDeleted"] == 4
+        assert result["deleteErrors"] == 1
+        assert result["objectsPerSecond"] > 0
+
+    def test_stops_listing_when_time_runs_low(self, aws_env: Dict[str, Any]) -> None:
+        """Test the job stops before the Lambda timeout and reports a truncated run."""
+        _put_objects(aws_env["s3"], [f"{PREFIX}/orphan.png"])
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 1000
+
+        result = lambda_handler({"graceHours": 0}, context)
+
+        assert result["truncated"] is True
+        assert result["objectsScanned"] == 0
+        assert _remaining_keys(aws_env["s3"]) == [f"{PREFIX}/orphan.png"]
+
+    def test_get_s3_client_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the shared cached client is used when no override is set."""
+        monkeypatch.setattr(qr_code_cleanup, "s3_client", None)
+        with patch.object(qr_code_cleanup, "get_s3_client") as mock_get:
+            assert qr_code_cleanup._get_s3_client() is mock_get.return_value
@@ -1,5 +1,3 @@
-import boto3
-
 from src.handlers import scout_operations as so
 
 
@@ -9,8 +7,8 @@ class DummyDynamoClient:
 
 
 def test_create_seller_profile_invalid_unit_number(monkeypatch):
-    # Patch boto3.client to avoid real AWS calls
-    monkeypatch.setattr(boto3, "client", lambda service: DummyDynamoClient())
+    # Patch the DynamoDB client to avoid real AWS calls
+    monkeypatch.setattr(so, "get_dynamodb_client", lambda: DummyDynamoClient())
 
     event = {"arguments": {"input": {"sellerName": "Joe", "unitNumber": "not-an-int"}}, "identity": {"sub": "acct-1"}}
     result = so.create_seller_profile(event, None)
@@ -0,0 +1,166 @@
+"""Tests for the public snapshot publisher."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+from unittest.mock import patch
+
+import boto3
+import pytest
+
+from src.handlers.snapshot_publisher import MANIFEST_KEY, publish_snapshots, publish_snapshots_now
+from src.utils.dynamodb import tables
+from tests.unit.aws_calls import count_aws_calls
+
+BUCKET = "kernelworx-static-ue1-dev"
+NOW = datetime(2025, 9, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def static_bucket(dynamodb_table: Any) -> Any:
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket=BUCKET)
+    return s3
+
+
+def _catalog(catalog_id: str, created_at: str, **fields: Any) -> None:
+    tables.catalogs.put_item(
+        Item={
+            "catalogId": catalog_id,
+            "catalogName": f"Catalog {catalog_id}",
+            "catalogType": "PUBLIC",
+            "ownerAccountId": "ACCOUNT#owner",
+            "isPublic": True,
+            "isPublicStr": "true",
+            "products": [{"productId": "PRODUCT#1", "productName": "Caramel", "price": Decimal("12.5"), "sku": "x"}],
+            "createdAt": created_at,
+            "updatedAt": created_at,
+            **fields,
+        }
+    )
+
+
+def _shared_campaign(code: str, **fields: Any) -> None:
+    tables.shared_campaigns.put_item(
+        Item={
+            "sharedCampaignCode": code,
+            "catalogId": "CATALOG#a",
+            "campaignName": "Fall",
+            "campaignYear": 2025,
+            "unitType": "Pack",
+            "unitNumber": 42,
+            "city": "Springfield",
+            "state": "IL",
+            "createdBy": "ACCOUNT#creator",
+            "createdByName": "Pat Leader",
+            "isActive": True,
+            "createdAt": "2025-08-01T00:00:00Z",
+            **fields,
+        }
+    )
+
+
+def _read(s3: Any, key: str) -> Any:
+    response = s3.get_object(Bucket=BUCKET, Key=key)
+    return response["CacheControl"], json.loads(response["Body"].read())
+
+
+class TestPublishSnapshots:
+    """Tests for publish_snapshots."""
+
+    def test_publishes_public_catalogs_only(self, static_bucket: Any) -> None:
+        """The snapshot holds what listPublicCatalogs returns, without account ids; shared campaigns stay private."""
+        _catalog("CATALOG#a", "2025-01-01T00:00:00Z")
+        _catalog("CATALOG#b", "2025-02-01T00:00:00Z")
+        _catalog("CATALOG#deleted", "2025-03-01T00:00:00Z", isDeleted=True)
+        _catalog("CATALOG#private", "2025-03-01T00:00:00Z", isPublic=False, isPublicStr="false")
+        _shared_campaign("PACK42-FALL-IL-25")
+
+        assert publish_snapshots({"Records": [{}]}, None) == {"written": 1, "deleted": 0}
+
+        cache_control, manifest = _read(static_bucket, MANIFEST_KEY)
+        assert cache_control == "public, max-age=60"
+        assert set(manifest) == {"publicCatalogs", "retired", "generatedAt"}
+        listed = static_bucket.list_objects_v2(Bucket=BUCKET)["Contents"]
+        assert {obj["Key"] for obj in listed} == {MANIFEST_KEY, manifest["publicCatalogs"]}
+
+        cache_control, catalogs = _read(static_bucket, manifest["publicCatalogs"])
+        assert cache_control == "public, max-age=31536000, immutable"
+        assert [c["catalogId"] for c in catalogs] == ["CATALOG#b", "CATALOG#a"]
+        assert "ownerAccountId" not in catalogs[0]
+        assert catalogs[0]["products"] == [
+            {"productId": "PRODUCT#1", "productName": "Caramel", "description": None, "price": 12.5, "sortOrder": None}
+        ]
+
+    def test_unchanged_content_is_not_rewritten(self, static_bucket: Any) -> None:
+        """A rebuild with nothing changed reads the tables but writes nothing."""
+        _catalog("CATALOG#a", "2025-01-01T00:00:00Z")
+        publish_snapshots_now(BUCKET, NOW)
+
+        with count_aws_calls() as calls:
+            assert publish_snapshots_now(BUCKET, NOW) == {"written": 0, "deleted": 0}
+
+        # manifest get, no puts
+        calls.assert_within(s3=1)
+
+    def test_changed_files_get_new_keys_and_old_ones_retire(self, static_bucket: Any) -> None:
+        """Edits publish new immutable files; superseded ones are deleted once RETIRE_AFTER has passed."""
+        _catalog("CATALOG#a", "2025-01-01T00:00:00Z")
+        publish_snapshots_now(BUCKET, NOW)
+        _, first = _read(static_bucket, MANIFEST_KEY)
+
+        tables.catalogs.update_item(
+            Key={"catalogId": "CATALOG#a"},
+            UpdateExpression="SET catalogName = :name",
+            ExpressionAttributeValues={":name": "Renamed"},
+        )
+        assert publish_snapshots_now(BUCKET, NOW + timedelta(minutes=5)) == {"written": 1, "deleted": 0}
+
+        _, second = _read(static_bucket, MANIFEST_KEY)
+        assert list(second["retired"]) == [first["publicCatalogs"]]
+        # Still readable by anyone holding the old manifest
+        assert _read(static_bucket, first["publicCatalogs"])[1][0]["catalogName"] == "Catalog CATALOG#a"
+
+        assert publish_snapshots_now(BUCKET, NOW + timedelta(hours=2)) == {"written": 0, "deleted": 1}
+
+        _, third = _read(static_bucket, MANIFEST_KEY)
+        assert third["retired"] == {}
+        listed = static_bucket.list_objects_v2(Bucket=BUCKET)["Contents"]
+        assert first["publicCatalogs"] not in {obj["Key"] for obj in listed}
+
+    def test_reverted_content_is_unretired(self, static_bucket: Any) -> None:
+        """A file that becomes current again is not deleted later."""
+        _catalog("CATALOG#a", "2025-01-01T00:00:00Z")
+        publish_snapshots_now(BUCKET, NOW)
+        _, first = _read(static_bucket, MANIFEST_KEY)
+        _catalog("CATALOG#b", "2025-02-01T00:00:00Z")
+        publish_snapshots_now(BUCKET, NOW)
+        tables.catalogs.delete_item(Key={"catalogId": "CATALOG#b"})
+
+        publish_snapshots_now(BUCKET, NOW + timedelta(hours=2))
+
+        _, manifest = _read(static_bucket, MANIFEST_KEY)
+        assert manifest["publicCatalogs"] == first["publicCatalogs"]
+        assert first["publicCatalogs"] not in manifest["retired"]
+        assert _read(static_bucket, first["publicCatalogs"])[1][0]["catalogId"] == "CATALOG#a"
+
+    def test_follows_pages(self, static_bucket: Any) -> None:
+        for n in range(3):
+            _catalog(f"CATALOG#{n}", f"2025-01-0{n + 1}T00:00:00Z")
+        catalogs = tables.catalogs
+        real_query = catalogs.query
+
+        with (
+            patch.object(type(tables), "catalogs", new=property(lambda self: catalogs)),
+            patch.object(catalogs, "query", side_effect=lambda **kwargs: real_query(Limit=1, **kwargs)),
+        ):
+            publish_snapshots_now(BUCKET, NOW)
+
+        _, manifest = _read(static_bucket, MANIFEST_KEY)
+        assert len(_read(static_bucket, manifest["publicCatalogs"])[1]) == 3
+
+    def test_missing_bucket_is_an_error(self, dynamodb_table: Any) -> None:
+        """Failures other than a missing manifest propagate so the stream batch is retried."""
+        with pytest.raises(Exception, match="NoSuchBucket"):
+            publish_snapshots_now(BUCKET, NOW)
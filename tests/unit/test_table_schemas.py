@@ -7,7 +7,9 @@ from tests.unit.table_schemas import (
     create_accounts_table_schema,
     create_all_tables,
     create_campaigns_table_schema,
+    create_catalog_versions_table_schema,
     create_catalogs_table_schema,
+    create_customer_index_table_schema,
     create_invites_table_schema,
     create_orders_table_schema,
     create_profiles_table_schema,
@@ -187,11 +189,10 @@ class TestSharedCampaignsTableSchema:
         assert schema["TableName"] == "kernelworx-shared-campaigns-ue1-dev"
 
     def test_key_schema(self):
-        """Schema has composite key (sharedCampaignCode, SK)."""
+        """Schema is keyed by sharedCampaignCode alone, like the deployed table."""
         schema = create_shared_campaigns_table_schema()
         assert schema["KeySchema"] == [
             {"AttributeName": "sharedCampaignCode", "KeyType": "HASH"},
-            {"AttributeName": "SK", "KeyType": "RANGE"},
         ]
 
     def test_has_gsi1_and_gsi2(self):
@@ -202,13 +203,39 @@ class TestSharedCampaignsTableSchema:
         assert "GSI2" in gsi_names
 
 
+class TestCatalogVersionsTableSchema:
+    """Tests for catalog versions table schema."""
+
+    def test_key_schema(self):
+        """Schema has composite key (catalogId, version)."""
+        schema = create_catalog_versions_table_schema()
+        assert schema["TableName"] == "kernelworx-catalog-versions-ue1-dev"
+        assert schema["KeySchema"] == [
+            {"AttributeName": "catalogId", "KeyType": "HASH"},
+            {"AttributeName": "version", "KeyType": "RANGE"},
+        ]
+
+
+class TestCustomerIndexTableSchema:
+    """Tests for customer index table schema."""
+
+    def test_key_schema(self):
+        """Schema has composite key (profileId, indexKey)."""
+        schema = create_customer_index_table_schema()
+        assert schema["TableName"] == "kernelworx-customer-index-ue1-dev"
+        assert schema["KeySchema"] == [
+            {"AttributeName": "profileId", "KeyType": "HASH"},
+            {"AttributeName": "indexKey", "KeyType": "RANGE"},
+        ]
+
+
 class TestGetAllTableSchemas:
     """Tests for get_all_table_schemas function."""
 
-    def test_returns_all_eight_schemas(self):
-        """Function returns all 8 table schemas."""
+    def test_returns_all_ten_schemas(self):
+        """Function returns all 10 table schemas."""
         schemas = get_all_table_schemas()
-        assert len(schemas) == 8
+        assert len(schemas) == 10
 
     def test_all_schemas_have_table_name(self):
         """All schemas have a TableName key."""
@@ -233,16 +260,18 @@ class TestTableNames:
     """Tests for TABLE_NAMES constant."""
 
     def test_has_all_tables(self):
-        """TABLE_NAMES includes all 8 tables."""
+        """TABLE_NAMES includes all 10 tables."""
         expected_keys = {
             "accounts",
             "catalogs",
+            "catalog_versions",
             "profiles",
             "campaigns",
             "orders",
             "shares",
             "invites",
             "shared_campaigns",
+            "customer_index",
         }
         assert set(TABLE_NAMES.keys()) == expected_keys
 
@@ -257,9 +286,9 @@ class TestCreateAllTables:
     """Tests for create_all_tables function."""
 
     def test_creates_all_tables(self, aws_credentials, dynamodb_resource):
-        """Function creates all 8 tables."""
+        """Function creates all 10 tables."""
         tables = create_all_tables(dynamodb_resource)
-        assert len(tables) == 8
+        assert len(tables) == 10
 
     def test_returns_dict_with_correct_keys(self, aws_credentials, dynamodb_resource):
         """Function returns dict with expected table keys."""
@@ -267,12 +296,14 @@ class TestCreateAllTables:
         expected_keys = {
             "accounts",
             "catalogs",
+            "catalog_versions",
             "profiles",
             "campaigns",
             "orders",
             "shares",
             "invites",
             "shared_campaigns",
+            "customer_index",
         }
         assert set(tables.keys()) == expected_keys
 